@@ -0,0 +1,118 @@
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import argparse
+import time
+
+import torch
+
+import cutlass
+import cutlass.cute as cute
+from cutlass.cute.runtime import from_dlpack
+from cutlass.cutlass_dsl import CuTeDSL
+
+
+"""Benchmark of the host overhead of calling a ``@cute.jit`` function.
+
+Calling a ``@cute.jit`` function directly (without ``cute.compile``) looks up the compiled
+kernel in the JIT cache. By default, every call re-traces the function body to
+generate the MLIR module and hashes its bytecode to find the cache entry. With fast dispatch,
+the compiled function is found from a fingerprint of the call signature instead, so the
+function body is only traced on the first call.
+
+This example reports the host time per call, in microseconds, with fast dispatch disabled
+(the previous behavior) and enabled, on a tiny kernel where host overhead dominates.
+
+To run this example:
+
+.. code-block:: bash
+
+    python examples/cute/jit_dispatch_overhead.py --iterations 1000
+
+Fast dispatch is opt-in and is enabled globally with ``CUTE_DSL_ENABLE_FAST_DISPATCH=1``.
+"""
+
+
+@cute.kernel
+def scale_kernel(gX: cute.Tensor, gY: cute.Tensor, factor: cutlass.Constexpr):
+    tidx, _, _ = cute.arch.thread_idx()
+    gY[tidx] = gX[tidx] * factor
+
+
+@cute.jit
+def scale(mX: cute.Tensor, mY: cute.Tensor, factor: cutlass.Constexpr = 2.0):
+    scale_kernel(mX, mY, factor).launch(grid=(1, 1, 1), block=(mX.shape[0], 1, 1))
+
+
+def measure_us_per_call(fn, args, iterations, warmup_iterations):
+    for _ in range(warmup_iterations):
+        fn(*args)
+    torch.cuda.synchronize()
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(*args)
+    torch.cuda.synchronize()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run(n: int, iterations: int, warmup_iterations: int):
+    x = torch.randn(n, dtype=torch.float32, device="cuda")
+    y = torch.empty_like(x)
+    args = (from_dlpack(x), from_dlpack(y))
+
+    dsl = CuTeDSL._get_dsl()
+    results = {}
+    for enable_fast_dispatch in (False, True):
+        dsl.envar.enable_fast_dispatch = enable_fast_dispatch
+        dsl.jit_dispatch_cache.clear()
+        results[enable_fast_dispatch] = measure_us_per_call(
+            scale, args, iterations, warmup_iterations
+        )
+    torch.testing.assert_close(y, x * 2.0)
+
+    print(f"Re-trace on every call : {results[False]:10.2f} us/call")
+    print(f"Fast dispatch          : {results[True]:10.2f} us/call")
+    print(f"Speedup                : {results[False] / results[True]:10.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the host overhead of calling a @cute.jit function"
+    )
+    parser.add_argument("--n", default=128, type=int)
+    parser.add_argument("--warmup_iterations", default=10, type=int)
+    parser.add_argument("--iterations", default=1000, type=int)
+
+    args = parser.parse_args()
+
+    if not torch.cuda.is_available():
+        raise RuntimeError("A GPU is required to run this example!")
+
+    run(args.n, args.iterations, args.warmup_iterations)
+    print("\nPASS")
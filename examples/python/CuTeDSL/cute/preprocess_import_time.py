@@ -0,0 +1,144 @@
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+
+"""Benchmark of the import time of a module with many ``@cute.jit`` functions.
+
+The AST preprocessor rewrites every ``@cute.jit`` and ``@cute.kernel`` function when it is
+decorated, which is usually when its module is imported. The transformed code objects are
+cached in the file cache directory, so later imports of an unchanged module skip the
+transformation. Lazy preprocessing defers the transformation of each function to its first call.
+
+This example generates a module with many ``@cute.jit`` functions and reports the time to
+import it in a fresh interpreter:
+
+* with the preprocessor cache disabled (the previous behavior),
+* with a cold and a warm preprocessor cache,
+* with lazy preprocessing.
+
+No GPU is required, the functions are never called.
+
+To run this example:
+
+.. code-block:: bash
+
+    python examples/cute/preprocess_import_time.py --num_functions 150
+"""
+
+
+FUNCTION_TEMPLATE = """
+@cute.jit
+def function_{index}(a: cute.Tensor, n: cutlass.Int32):
+    acc = cutlass.Float32(0.0)
+    for i in cutlass.range(n):
+        if i % 2 == 0:
+            acc = acc + a[i]
+        else:
+            acc = acc - a[i]
+    while acc > 1.0:
+        acc = acc * 0.5
+    a[0] = acc
+"""
+
+
+def write_module(path: str, num_functions: int):
+    with open(path, "w") as f:
+        f.write("import cutlass\nimport cutlass.cute as cute\n")
+        for index in range(num_functions):
+            f.write(FUNCTION_TEMPLATE.format(index=index))
+
+
+def measure_import_seconds(module_dir: str, env: dict):
+    # Importing cutlass itself is measured separately, so that only the
+    # preprocessing of the generated module is reported
+    script = textwrap.dedent(
+        """
+        import sys, time
+        import cutlass, cutlass.cute
+        start = time.perf_counter()
+        import generated_functions
+        print(time.perf_counter() - start)
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=module_dir,
+        env={**os.environ, **env},
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def run(num_functions: int):
+    with tempfile.TemporaryDirectory() as work_dir:
+        write_module(os.path.join(work_dir, "generated_functions.py"), num_functions)
+        cache_dir = os.path.join(work_dir, "cache")
+        env = {"CUTE_DSL_CACHE_DIR": cache_dir}
+
+        results = {
+            "Preprocessor cache disabled": measure_import_seconds(
+                work_dir, {**env, "CUTE_DSL_DISABLE_PREPROCESSOR_CACHING": "1"}
+            ),
+            "Cold preprocessor cache": measure_import_seconds(work_dir, env),
+            "Warm preprocessor cache": measure_import_seconds(work_dir, env),
+            "Lazy preprocessing": measure_import_seconds(
+                work_dir,
+                {
+                    **env,
+                    "CUTE_DSL_DISABLE_PREPROCESSOR_CACHING": "1",
+                    "CUTE_DSL_LAZY_PREPROCESS": "1",
+                },
+            ),
+        }
+
+    print(f"Import time of {num_functions} @cute.jit functions:")
+    baseline = results["Preprocessor cache disabled"]
+    for name, seconds in results.items():
+        print(f"{name:30s}: {seconds * 1e3:10.2f} ms ({baseline / seconds:6.2f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the import time of a module with many @cute.jit functions"
+    )
+    parser.add_argument("--num_functions", default=150, type=int)
+
+    args = parser.parse_args()
+
+    run(args.num_functions)
+    print("\nPASS")
@@ -14,10 +14,10 @@ This module provides MLIR Dialect helper functions
 """
 
 from . import arith
-from .lru_cache_ir import lru_cache_ir
+from .lru_cache_ir import lru_cache_ir, lru_cache_static
 from .op import dsl_user_op
 
-__all__ = ["arith", "lru_cache_ir", "dsl_user_op"]
+__all__ = ["arith", "lru_cache_ir", "lru_cache_static", "dsl_user_op"]
 
 try:
     from . import gpu
@@ -10,22 +10,37 @@
 # is strictly prohibited.
 
 """
-This module provides @lru_cache_ir
-It extends functools.lru_cache with IR Context awareness.
+This module provides @lru_cache_ir and @lru_cache_static
+
+@lru_cache_ir extends functools.lru_cache with IR Context awareness, for operations
+producing IR values.
+
+@lru_cache_static memoizes user-facing operations on fully static arguments, whose
+results are plain Python values that don't depend on the IR Context.
 
 Example usage:
 from cutlass import ir
-from lru_cache_ir import lru_cache_ir
+from lru_cache_ir import lru_cache_ir, lru_cache_static
 
 @lru_cache_ir(ir, maxsize=128, typed=False)
 def make_layout(...):
 ...
 
+@lru_cache_static()
+@dsl_user_op
+def shape_div(...):
+...
+
 """
 
+import inspect
+import threading
+from collections import OrderedDict
 from functools import lru_cache, wraps
+from typing import NamedTuple
 
 from ..._mlir import ir  # type: ignore
+from .op import get_user_loc
 
 
 def get_ir_context(func):
@@ -61,11 +76,14 @@ def lru_cache_ir(maxsize=128, typed=True):
 
         @wraps(func)
         def wrapper(*args, **kwargs):
+            context = get_ir_context(func)
             try:
-                # Call the cached function with the context
-                return cached_func(get_ir_context(func), *args, **kwargs)
-            except (RuntimeError, TypeError):
+                hash((context, args, tuple(kwargs.values())))
+            except TypeError:
+                # Unhashable arguments can't be cached
                 return func(*args, **kwargs)
+            # Call the cached function with the context
+            return cached_func(context, *args, **kwargs)
 
         # Expose cache-related methods for introspection
         wrapper.cache_clear = cached_func.cache_clear
@@ -73,3 +91,113 @@ def lru_cache_ir(maxsize=128, typed=True):
         return wrapper
 
     return decorator
+
+
+class StaticCacheInfo(NamedTuple):
+    """Statistics of a function decorated with @lru_cache_static."""
+
+    hits: int
+    misses: int
+    bypassed: int
+    maxsize: int
+    currsize: int
+
+
+# Functions decorated with @lru_cache_static, by qualified name
+_static_caches = {}
+
+
+def is_static_value(x) -> bool:
+    """
+    Returns whether `x` is a plain static value: an int, None, or a tuple of static values.
+
+    bool is excluded, as True and 1 would share a cache entry.
+    """
+    if type(x) is int or x is None:
+        return True
+    if type(x) is tuple:
+        return all(is_static_value(a) for a in x)
+    return False
+
+
+def lru_cache_static(maxsize=4096):
+    """
+    Applies a bounded LRU cache to a user-facing operation, for calls on static values only.
+
+    Calls whose arguments are all static values (see `is_static_value`) are keyed on
+    these values alone, independently of the IR Context and InsertionPoint, and their
+    result is cached if it is a static value too. Other calls, and the `loc` and `ip`
+    arguments, bypass the cache. Exceptions are never cached nor suppressed.
+
+    The decorator is meant to be applied on top of @dsl_user_op, so that a cache hit
+    doesn't compute the source location of the call.
+
+    :param maxsize: Max number of cached results
+    """
+
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        stats = {"hits": 0, "misses": 0, "bypassed": 0}
+
+        def call(caller, args, kwargs):
+            # Locate the IR generated for the call at the caller, as @dsl_user_op would
+            if kwargs.get("loc") is None:
+                kwargs["loc"] = get_user_loc(caller)
+            return func(*args, **kwargs)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key_kwargs = {
+                k: v for k, v in kwargs.items() if k != "loc" and k != "ip"
+            }
+            if not (
+                is_static_value(args) and is_static_value(tuple(key_kwargs.values()))
+            ):
+                with lock:
+                    stats["bypassed"] += 1
+                return call(inspect.currentframe().f_back, args, kwargs)
+
+            key = (args, tuple(sorted(key_kwargs.items())))
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    stats["hits"] += 1
+                    return cache[key]
+                stats["misses"] += 1
+
+            result = call(inspect.currentframe().f_back, args, kwargs)
+            if is_static_value(result):
+                with lock:
+                    cache[key] = result
+                    if len(cache) > maxsize:
+                        cache.popitem(last=False)
+            return result
+
+        def cache_info():
+            with lock:
+                return StaticCacheInfo(maxsize=maxsize, currsize=len(cache), **stats)
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+                stats.update(hits=0, misses=0, bypassed=0)
+
+        # Expose cache-related methods for introspection
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_info = cache_info
+        _static_caches[f"{func.__module__}.{func.__qualname__}"] = wrapper
+        return wrapper
+
+    return decorator
+
+
+def static_cache_info() -> dict:
+    """Returns the StaticCacheInfo of every function decorated with @lru_cache_static, by name."""
+    return {name: f.cache_info() for name, f in _static_caches.items()}
+
+
+def static_cache_clear() -> None:
+    """Clears the caches of every function decorated with @lru_cache_static."""
+    for f in _static_caches.values():
+        f.cache_clear()
@@ -19,6 +19,38 @@ from functools import wraps
 from ..._mlir import ir
 
 
+def get_user_loc(frame) -> ir.Location:
+    """
+    Returns the source location of the user code executing in `frame`.
+
+    :param frame: The frame of the user code calling a user-facing API.
+    :return: A named location of the calling source line.
+    :rtype: ir.Location
+    """
+    frameInfo = inspect.getframeinfo(frame)
+    # In Python < 3.11, getframeinfo returns a NamedTuple without positions
+    if not hasattr(frameInfo, "positions"):
+        file_loc = ir.Location.file(
+            frameInfo.filename,
+            frameInfo.lineno,
+            0,
+        )
+    else:
+        file_loc = ir.Location.file(
+            frameInfo.filename,
+            frameInfo.positions.lineno,
+            frameInfo.positions.col_offset,
+        )
+    return ir.Location.name(
+        (
+            "".join([c.strip() for c in frameInfo.code_context])
+            if frameInfo.code_context
+            else frameInfo.function
+        ),
+        childLoc=file_loc,
+    )
+
+
 def dsl_user_op(opFunc):
     """
     This is a decorator that needs to be used in each user-facing API to
@@ -34,29 +66,7 @@ def dsl_user_op(opFunc):
     def wrapper(*args, **kwargs):
         loc = kwargs.pop("loc", None)
         if loc is None:
-            frame = inspect.currentframe().f_back
-            frameInfo = inspect.getframeinfo(frame)
-            # In Python < 3.11, getframeinfo returns a NamedTuple without positions
-            if not hasattr(frameInfo, "positions"):
-                file_loc = ir.Location.file(
-                    frameInfo.filename,
-                    frameInfo.lineno,
-                    0,
-                )
-            else:
-                file_loc = ir.Location.file(
-                    frameInfo.filename,
-                    frameInfo.positions.lineno,
-                    frameInfo.positions.col_offset,
-                )
-            loc = ir.Location.name(
-                (
-                    "".join([c.strip() for c in frameInfo.code_context])
-                    if frameInfo.code_context
-                    else frameInfo.function
-                ),
-                childLoc=file_loc,
-            )
+            loc = get_user_loc(inspect.currentframe().f_back)
         res_or_list = opFunc(*args, **kwargs, loc=loc)
         return res_or_list
 
@@ -34,6 +34,7 @@ to generate dialect-specific operations for `for` and `if` statements.
 
 import ast
 import contextlib
+import hashlib
 import importlib
 import inspect
 import os
@@ -45,6 +46,7 @@ from typing import List, Set, Dict, Any, Callable, Optional
 from types import ModuleType
 from collections import OrderedDict
 from copy import deepcopy
+from functools import lru_cache
 
 from .common import *
 from .utils.logger import log
@@ -95,6 +97,22 @@ class OrderedSet:
         return result
 
 
+@lru_cache(maxsize=1)
+def get_preprocessor_fingerprint():
+    """
+    Fingerprint of the preprocessor implementation and of the Python interpreter.
+
+    Code objects transformed by a different version of this module, or compiled by a
+    different interpreter, must not be reused.
+    """
+    h = hashlib.sha256()
+    with open(__file__, "rb") as f:
+        h.update(f.read())
+    h.update(sys.implementation.cache_tag.encode())
+    h.update(sys.version.encode())
+    return h.hexdigest()
+
+
 @dataclass
 class ImportInfo:
     """
@@ -197,6 +215,9 @@ class DSLPreprocessor(ast.NodeTransformer):
         self.function_globals = None
         self.client_module_name = client_module_name
         self.import_top_module = False
+        # Imports of the modules containing preprocessed functions, keyed by module name
+        # and file, along with the modification stamp of the file they were parsed from
+        self.module_imports = {}
 
     def _create_module_attribute(
         self,
@@ -313,6 +334,14 @@ class DSLPreprocessor(ast.NodeTransformer):
 
         # Get the module containing the decorated function
         if module := inspect.getmodule(decorated_func):
+            # The module source is parsed once for all the functions it contains, and
+            # parsed again when its file changes, e.g. before an importlib.reload
+            file_name = getattr(module, "__file__", None)
+            cache_key = (module.__name__, file_name)
+            stamp = self._get_file_stamp(file_name)
+            cached = self.module_imports.get(cache_key)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
             try:
                 # Get the module source code
                 source = inspect.getsource(module)
@@ -321,9 +350,19 @@ class DSLPreprocessor(ast.NodeTransformer):
                 imports = self._get_imports_from_ast(module_ast, module)
             except (IOError, TypeError):
                 pass
+            self.module_imports[cache_key] = (stamp, imports)
 
         return imports
 
+    @staticmethod
+    def _get_file_stamp(file_name):
+        """Modification time and size of a file, or None if it cannot be accessed."""
+        try:
+            stat = os.stat(file_name)
+        except (OSError, TypeError):
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def try_import_first_and_then_local_import(self, module_path):
         @contextlib.contextmanager
         def local_import(module_path):
@@ -630,6 +669,83 @@ class DSLPreprocessor(ast.NodeTransformer):
                 return func.attr, False, len(iter_node.keywords) != 0
         return None, None, None
 
+    def get_state(self):
+        """
+        Snapshot of the state carried from one transformed function to the next,
+        which affects the transformation of the next function.
+        """
+        return (
+            self.counter,
+            self.function_counter,
+            self.import_top_module,
+            frozenset(self.local_closures),
+        )
+
+    def get_state_delta(self, original_function, state):
+        """
+        Changes of the preprocessor state since `state` was taken by `get_state`,
+        in a form that can be marshalled with the transformed code.
+        """
+        counter, function_counter, _, local_closures = state
+        return {
+            "counter": self.counter - counter,
+            "function_counter": self.function_counter - function_counter,
+            "import_top_module": self.import_top_module,
+            "local_closures": sorted(self.local_closures - local_closures),
+            "processed": original_function in self.processed_functions,
+        }
+
+    def apply_state_delta(self, original_function, delta):
+        """
+        Replay the state changes of a transformation loaded from the cache, so that the
+        functions transformed afterwards are identical to an uncached run.
+        """
+        self.counter += delta["counter"]
+        self.function_counter += delta["function_counter"]
+        self.import_top_module = delta["import_top_module"]
+        self.local_closures.update(delta["local_closures"])
+        if delta["processed"]:
+            self.processed_functions.add(original_function)
+
+    def get_cache_key(self, original_function, exec_globals):
+        """
+        Key of the transformed code of `original_function` in the preprocessor cache.
+
+        The key covers the source of the function and its location, the preprocessor
+        version, the globals the transformation depends on (MLIR dialect modules) and the
+        preprocessor state. Returns None when the function cannot be cached.
+        """
+        if original_function in self.processed_functions:
+            return None
+        try:
+            file_name = inspect.getsourcefile(original_function)
+            lines, start_line = inspect.getsourcelines(original_function)
+        except (OSError, TypeError):
+            return None
+
+        dialect_globals = sorted(
+            (name, value.__name__)
+            for name, value in exec_globals.items()
+            if isinstance(value, ModuleType)
+            and (value.__package__ or "").endswith("._mlir.dialects")
+        )
+        h = hashlib.sha256()
+        for part in (
+            get_preprocessor_fingerprint(),
+            self.client_module_name,
+            file_name,
+            start_line,
+            "".join(lines),
+            original_function.__code__.co_freevars,
+            dialect_globals,
+            self.counter,
+            self.import_top_module,
+            sorted(self.local_closures),
+        ):
+            h.update(repr(part).encode())
+            h.update(b"\0")
+        return h.hexdigest()
+
     def transform(self, original_function, exec_globals):
         """
         Transforms the provided function using the preprocessor.
@@ -25,7 +25,17 @@ from pathlib import Path
 import hashlib
 from functools import lru_cache
 import zlib
-
+import json
+import shutil
+import ctypes
+import marshal
+import subprocess
+import threading
+import argparse
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from .common import DSLRuntimeError
 from .utils.logger import log
 from .jit_executor import JitCompiledFunction
 
@@ -119,6 +129,21 @@ def read_bytecode_and_check_crc32(f):
     return ir.Module.parse(bytecode)
 
 
+def compute_file_crc32(file_path):
+    """Compute the crc32 checksum of a file.
+
+    :param file_path: The path to the file.
+    :type file_path: str
+    :return: The crc32 checksum of the file content.
+    :rtype: int
+    """
+    crc = 0
+    with open(file_path, "rb") as f:
+        while chunk := f.read(1024**2):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
 def load_ir(file, asBytecode=False, bytecode_reader=None):
     """Load generated IR from a file.
 
@@ -215,11 +240,196 @@ def save_ir(
     return save_fname
 
 
+# Version of the file cache layout, bumped whenever the layout of the manifest or
+# of the artifacts it refers to changes.
+CACHE_FORMAT_VERSION = 1
+
+
+def _get_cache_file_stem(dsl_name, file):
+    return f"{dsl_name.lower()}_{file}"
+
+
+def _write_file_atomically(file_path, content, mode="wb"):
+    """Write a file through a temporary file and an atomic rename, so that concurrent
+    readers never see a partial write."""
+    temp_path = f"{file_path}.tmp.pid_{os.getpid()}_{uuid.uuid4()}"
+    try:
+        with open(temp_path, mode) as f:
+            f.write(content)
+        os.replace(temp_path, file_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+class CacheManifest:
+    """Describes the compiled artifacts stored in the file cache for one module hash.
+
+    The manifest is written last, so an entry is only visible once all of its artifacts
+    are complete. It records the toolchain the artifacts were built with, so that
+    artifacts from another toolchain, arch or pipeline are never loaded.
+
+    :param toolchain_version: Hash of the DSL sources and shared libraries.
+    :type toolchain_version: str
+    :param arch: The GPU architecture the artifacts were compiled for.
+    :type arch: str
+    :param pipeline: The compilation pipeline string.
+    :type pipeline: str
+    :param function_name: The name of the host entry function.
+    :type function_name: str
+    :param artifacts: Map from artifact kind to its file name, size and crc32 checksum.
+    :type artifacts: dict, optional
+    """
+
+    def __init__(
+        self, toolchain_version, arch, pipeline, function_name, artifacts=None
+    ):
+        self.toolchain_version = toolchain_version
+        self.arch = arch
+        self.pipeline = pipeline
+        self.function_name = function_name
+        self.artifacts = artifacts if artifacts is not None else {}
+
+    def add_artifact(self, kind, file_path):
+        """Record an artifact file along with its size and crc32 checksum."""
+        self.artifacts[kind] = {
+            "file": os.path.basename(file_path),
+            "size": os.path.getsize(file_path),
+            "crc32": compute_file_crc32(file_path),
+        }
+
+    def check_artifact(self, kind, path):
+        """Return the path to an artifact if it exists and matches its crc32 checksum, otherwise None."""
+        artifact = self.artifacts.get(kind)
+        if artifact is None:
+            return None
+        file_path = os.path.join(path, artifact["file"])
+        if (
+            not os.path.exists(file_path)
+            or os.path.getsize(file_path) != artifact["size"]
+            or compute_file_crc32(file_path) != artifact["crc32"]
+        ):
+            log().warning(f"JIT cache : corrupted artifact {file_path}, ignoring it.")
+            return None
+        return file_path
+
+    def is_compatible(self, other):
+        """Check if the artifacts were built with the same toolchain, arch and pipeline."""
+        return (
+            self.toolchain_version == other.toolchain_version
+            and self.arch == other.arch
+            and self.pipeline == other.pipeline
+            and self.function_name == other.function_name
+        )
+
+    def to_json(self):
+        return json.dumps(
+            {
+                "format_version": CACHE_FORMAT_VERSION,
+                "toolchain_version": self.toolchain_version,
+                "arch": self.arch,
+                "pipeline": self.pipeline,
+                "function_name": self.function_name,
+                "artifacts": self.artifacts,
+            },
+            indent=2,
+        )
+
+    @staticmethod
+    def from_json(content):
+        data = json.loads(content)
+        if data.get("format_version") != CACHE_FORMAT_VERSION:
+            return None
+        return CacheManifest(
+            data["toolchain_version"],
+            data["arch"],
+            data["pipeline"],
+            data["function_name"],
+            data["artifacts"],
+        )
+
+
+class SharedLibraryEngine:
+    """Execution engine backed by a host shared library loaded from the file cache.
+
+    It provides the lookup interface of the MLIR execution engine over the packed
+    function wrappers already compiled into the shared library, so no host code
+    generation is needed when loading it.
+
+    :param library_path: The path to the shared library.
+    :type library_path: str
+    """
+
+    def __init__(self, library_path):
+        self.library_path = library_path
+        self.library = ctypes.CDLL(library_path)
+
+    def raw_lookup(self, name):
+        """Return the address of the packed wrapper of a function, or None if not found."""
+        try:
+            return ctypes.cast(
+                getattr(self.library, f"_mlir_{name}"), ctypes.c_void_p
+            ).value
+        except AttributeError:
+            return None
+
+    def lookup(self, name):
+        """Return a ctypes callable for a function emitted with `llvm.emit_c_interface`."""
+        func = self.raw_lookup(f"_mlir_ciface_{name}")
+        if not func:
+            raise RuntimeError("Unknown function " + name)
+        prototype = ctypes.CFUNCTYPE(None, ctypes.c_void_p)
+        return prototype(func)
+
+
+def link_host_library(engine, library_path, shared_libs=()):
+    """Dump the host object code of an execution engine and link it into a shared library.
+
+    The host C compiler (``$CC``, defaulting to ``cc``) is used as linker. Linking is best
+    effort: it returns False if no linker is available or linking fails.
+
+    :param engine: The execution engine holding the compiled host code.
+    :type engine: object
+    :param library_path: The path to the shared library to create.
+    :type library_path: str
+    :param shared_libs: The shared libraries the host code depends on.
+    :type shared_libs: list[str]
+    :return: Whether the shared library has been created.
+    :rtype: bool
+    """
+    linker = shutil.which(os.environ.get("CC", "cc"))
+    if linker is None or not hasattr(engine, "dump_to_object_file"):
+        return False
+
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(library_path)) as temp_dir:
+        object_file = os.path.join(temp_dir, "host.o")
+        temp_library = os.path.join(temp_dir, os.path.basename(library_path))
+        try:
+            engine.dump_to_object_file(object_file)
+            cmd = [linker, "-shared", "-o", temp_library, object_file]
+            for lib in shared_libs:
+                cmd += [lib, f"-Wl,-rpath,{os.path.dirname(os.path.abspath(lib))}"]
+            subprocess.run(cmd, check=True, capture_output=True)
+        except Exception as e:
+            log().info(f"JIT cache : failed to link host library {library_path}: {e}")
+            return False
+        os.replace(temp_library, library_path)
+    return True
+
+
 def load_cache_from_path(
-    dsl_name, file, path=default_generated_ir_path, bytecode_reader=None
+    dsl_name,
+    file,
+    path=default_generated_ir_path,
+    bytecode_reader=None,
+    manifest=None,
 ):
     """Load cache from a directory path.
 
+    If a manifest is given, the cache entry is only loaded if its own manifest was built
+    with a compatible toolchain, arch and pipeline. The host shared library, if present
+    and valid, is then loaded as the execution engine of the returned function.
+
     :param dsl_name: The name of the DSL.
     :type dsl_name: str
     :param file: The name of the file to load.
@@ -228,21 +438,42 @@ def load_cache_from_path(
     :type path: str, optional
     :param bytecode_reader: The bytecode reader to use, defaults to None
     :type bytecode_reader: callable, optional
+    :param manifest: The manifest describing the expected artifacts, defaults to None
+    :type manifest: CacheManifest, optional
     :return: The cache
     :rtype: dict
     """
     if not os.path.exists(path):
         return None
     ret = None
+    stem = _get_cache_file_stem(dsl_name, file)
     try:
-        file = f"{dsl_name.lower()}_{file}.mlir"
+        cached_manifest = None
+        if manifest is not None:
+            manifest_file = os.path.join(path, f"{stem}.json")
+            if not os.path.exists(manifest_file):
+                return None
+            with open(manifest_file, "r") as f:
+                cached_manifest = CacheManifest.from_json(f.read())
+            if cached_manifest is None or not cached_manifest.is_compatible(manifest):
+                log().info("JIT cache : incompatible manifest %s", manifest_file)
+                return None
+
+        file = f"{stem}.mlir"
         if os.path.exists(os.path.join(path, file)):
             _, module = load_ir(
                 os.path.join(path, file),
                 asBytecode=True,
                 bytecode_reader=bytecode_reader,
             )
-            ret = JitCompiledFunction(module, None, None, None, None, [], False, None)
+            engine = None
+            if cached_manifest is not None:
+                library_path = cached_manifest.check_artifact("host_library", path)
+                if library_path is not None:
+                    engine = SharedLibraryEngine(library_path)
+                # Mark the entry as recently used for file cache eviction
+                os.utime(manifest_file)
+            ret = JitCompiledFunction(module, engine, None, None, None, [], False, None)
     except Exception as e:
         log().warning(
             f"{dsl_name} failed with loading generated IR cache for {file}.", e
@@ -256,9 +487,15 @@ def dump_cache_to_path(
     file,
     path=default_generated_ir_path,
     bytecode_writer=None,
+    manifest=None,
+    shared_libs=(),
 ):
     """Dump the cache to a directory path.
 
+    If a manifest is given, the host code of the function's execution engine is linked
+    into a shared library next to the compiled module, and the manifest listing both
+    artifacts with their crc32 checksums is written last.
+
     :param dsl_name: The name of the DSL.
     :type dsl_name: str
     :param jit_function: The JitCompiledFunction to dump.
@@ -269,13 +506,17 @@ def dump_cache_to_path(
     :type path: str, optional
     :param bytecode_writer: The bytecode writer to use, defaults to None
     :type bytecode_writer: callable, optional
+    :param manifest: The manifest describing the artifacts, defaults to None
+    :type manifest: CacheManifest, optional
+    :param shared_libs: The shared libraries the host code depends on, defaults to ()
+    :type shared_libs: list[str], optional
     """
     log().info("JIT cache : dumping [%s] file=[%s]", dsl_name, file)
     if not path:
         path = default_generated_ir_path
     os.makedirs(path, exist_ok=True)
     try:
-        save_ir(
+        module_file = save_ir(
             dsl_name,
             jit_function.ir_module,
             file,
@@ -283,7 +524,423 @@ def dump_cache_to_path(
             as_bytecode=True,
             bytecode_writer=bytecode_writer,
         )
+        if manifest is not None:
+            stem = _get_cache_file_stem(dsl_name, file)
+            manifest.add_artifact("mlir", module_file)
+            library_path = os.path.join(path, f"{stem}.so")
+            if jit_function.engine is not None and link_host_library(
+                jit_function.engine, library_path, shared_libs
+            ):
+                manifest.add_artifact("host_library", library_path)
+            _write_file_atomically(
+                os.path.join(path, f"{stem}.json"), manifest.to_json(), mode="w"
+            )
     except Exception as e:
         log().warning(
             f"{dsl_name} failed with dumping generated IR cache for {file}: {e}"
         )
+
+
+# =============================================================================
+# Preprocessor Cache
+# =============================================================================
+
+
+def get_preprocessor_cache_path(dsl_name, path=default_generated_ir_path):
+    """Return the directory of the code objects cached by the AST preprocessor."""
+    return os.path.join(path, f"{dsl_name.lower()}_preprocessed")
+
+
+def load_preprocessed_code(path, key):
+    """Load a transformed code object from the preprocessor cache.
+
+    :param path: The preprocessor cache directory
+    :type path: str
+    :param key: The cache key of the function, see `DSLPreprocessor.get_cache_key`
+    :type key: str
+    :return: A tuple of the code object and the preprocessor state delta, or None on a miss.
+    :rtype: tuple[types.CodeType, dict] or None
+    """
+    try:
+        with open(os.path.join(path, f"{key}.marshal"), "rb") as f:
+            code_object, state_delta = marshal.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log().warning(f"Failed to load preprocessed code {key}: {e}")
+        return None
+    return code_object, state_delta
+
+
+def dump_preprocessed_code(path, key, code_object, state_delta):
+    """Store a transformed code object into the preprocessor cache.
+
+    :param path: The preprocessor cache directory
+    :type path: str
+    :param key: The cache key of the function, see `DSLPreprocessor.get_cache_key`
+    :type key: str
+    :param code_object: The code object compiled from the transformed AST
+    :type code_object: types.CodeType
+    :param state_delta: The preprocessor state delta, see `DSLPreprocessor.get_state_delta`
+    :type state_delta: dict
+    """
+    try:
+        os.makedirs(path, exist_ok=True)
+        _write_file_atomically(
+            os.path.join(path, f"{key}.marshal"),
+            marshal.dumps((code_object, state_delta)),
+        )
+    except Exception as e:
+        log().warning(f"Failed to dump preprocessed code {key}: {e}")
+
+
+# =============================================================================
+# Jit Cache Eviction
+# =============================================================================
+
+
+@dataclass
+class JitCacheStats:
+    """Statistics of a JIT cache tier."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+def get_jit_function_size(jit_function):
+    """Estimate the memory held by a compiled function from the size of its module bytecode."""
+    if jit_function.ir_module is None:
+        return 0
+    s = io.BytesIO()
+    jit_function.ir_module.operation.write_bytecode(s)
+    return len(s.getvalue())
+
+
+class _JitCacheEntry:
+    __slots__ = ["value", "size", "inserted_at", "hits"]
+
+    def __init__(self, value, size):
+        self.value = value
+        self.size = size
+        self.inserted_at = time.monotonic()
+        self.hits = 0
+
+
+class JitCache:
+    """In-memory cache of compiled functions bounded by entry count, bytes and age.
+
+    When a limit is exceeded, entries are evicted in least recently used (``lru``) or
+    least frequently used (``lfu``) order. Evicted functions are only dereferenced, so
+    their device modules are unloaded once no caller holds them any more. A limit of 0
+    means unlimited.
+
+    :param max_entries: The maximum number of entries, defaults to 0
+    :type max_entries: int, optional
+    :param max_bytes: The maximum total size of the module bytecode of all entries, defaults to 0
+    :type max_bytes: int, optional
+    :param max_age: The maximum age of an entry in seconds, defaults to 0
+    :type max_age: int, optional
+    :param policy: The eviction policy, either ``lru`` or ``lfu``, defaults to ``lru``
+    :type policy: str, optional
+    """
+
+    def __init__(self, max_entries=0, max_bytes=0, max_age=0, policy="lru"):
+        if policy not in ("lru", "lfu"):
+            raise DSLRuntimeError(
+                f"Unknown JIT cache eviction policy `{policy}`",
+                suggestion="Use `lru` or `lfu`.",
+            )
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.policy = policy
+        # Callbacks invoked with (key, value) for every evicted entry
+        self.eviction_callbacks = []
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.RLock()
+
+    def _is_expired(self, entry):
+        return self.max_age > 0 and time.monotonic() - entry.inserted_at > self.max_age
+
+    def _evict(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        self._evictions += 1
+        log().info("JIT cache : evicting key=[%s]", key)
+        for callback in self.eviction_callbacks:
+            callback(key, entry.value)
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is not None and self._is_expired(entry):
+            self._evict(key)
+            return None
+        return entry
+
+    def _select_victim(self, keep):
+        candidates = (k for k in self._entries if k != keep)
+        if self.policy == "lfu":
+            # Ties are broken in least recently used order
+            return min(candidates, key=lambda k: self._entries[k].hits)
+        return next(candidates)
+
+    def _enforce_limits(self, keep):
+        for key in [k for k, e in self._entries.items() if self._is_expired(e)]:
+            self._evict(key)
+        # The most recently inserted entry is always kept
+        while len(self._entries) > 1 and (
+            (self.max_entries > 0 and len(self._entries) > self.max_entries)
+            or (self.max_bytes > 0 and self._bytes > self.max_bytes)
+        ):
+            self._evict(self._select_victim(keep))
+
+    def get(self, key, default=None):
+        """Look up an entry, counting a hit or a miss."""
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            self._hits += 1
+            entry.hits += 1
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def __contains__(self, key):
+        with self._lock:
+            return self._lookup(key) is not None
+
+    def __getitem__(self, key):
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                raise KeyError(key)
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            size = get_jit_function_size(value) if self.max_bytes > 0 else 0
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self._bytes -= old_entry.size
+            entry = _JitCacheEntry(value, size)
+            if old_entry is not None:
+                entry.hits = old_entry.hits
+            self._entries[key] = entry
+            self._bytes += size
+            self._enforce_limits(keep=key)
+
+    def __delitem__(self, key):
+        with self._lock:
+            entry = self._entries.pop(key)
+            self._bytes -= entry.size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def keys(self):
+        return list(self._entries.keys())
+
+    def values(self):
+        return [entry.value for entry in self._entries.values()]
+
+    def items(self):
+        return [(key, entry.value) for key, entry in self._entries.items()]
+
+    def clear(self):
+        """Evict all entries."""
+        with self._lock:
+            for key in list(self._entries.keys()):
+                self._evict(key)
+
+    def stats(self) -> JitCacheStats:
+        """Return the statistics of the cache."""
+        with self._lock:
+            return JitCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+
+# Maximum age of temporary files left by interrupted writes before they are pruned
+_STALE_TEMP_FILE_AGE = 3600
+
+
+def _collect_file_cache_entries(path, dsl_name=None):
+    """Group the files of the cache directory by cache entry.
+
+    :return: A tuple of a map from entry stem to its file paths, and the list of stale temporary paths.
+    :rtype: tuple[dict[str, list[str]], list[str]]
+    """
+    entries = {}
+    stale_temp_paths = []
+    if not os.path.isdir(path):
+        return entries, stale_temp_paths
+    prefix = f"{dsl_name.lower()}_" if dsl_name else ""
+    now = time.time()
+    for name in os.listdir(path):
+        file_path = os.path.join(path, name)
+        if name.startswith("tmp.pid_") or ".tmp.pid_" in name:
+            try:
+                if now - os.path.getmtime(file_path) > _STALE_TEMP_FILE_AGE:
+                    stale_temp_paths.append(file_path)
+            except OSError:
+                pass
+            continue
+        stem, ext = os.path.splitext(name)
+        if ext not in (".mlir", ".so", ".json") or not stem.startswith(prefix):
+            continue
+        entries.setdefault(stem, []).append(file_path)
+    return entries, stale_temp_paths
+
+
+def _get_files_size_and_mtime(file_paths):
+    size, mtime = 0, 0.0
+    for file_path in file_paths:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            continue
+        size += stat.st_size
+        mtime = max(mtime, stat.st_mtime)
+    return size, mtime
+
+
+def get_file_cache_stats(path=default_generated_ir_path, dsl_name=None) -> JitCacheStats:
+    """Return the number of entries and bytes of the file cache.
+
+    :param path: The path to the cache directory, defaults to default_generated_ir_path
+    :type path: str, optional
+    :param dsl_name: Only account for entries of this DSL, defaults to all DSLs
+    :type dsl_name: str, optional
+    :return: The statistics of the file cache.
+    :rtype: JitCacheStats
+    """
+    entries, _ = _collect_file_cache_entries(path, dsl_name)
+    total_bytes = sum(
+        _get_files_size_and_mtime(file_paths)[0] for file_paths in entries.values()
+    )
+    return JitCacheStats(entries=len(entries), bytes=total_bytes)
+
+
+def prune_file_cache(
+    path=default_generated_ir_path,
+    dsl_name=None,
+    max_entries=0,
+    max_bytes=0,
+    max_age=0,
+    remove_all=False,
+):
+    """Evict file cache entries in least recently used order until the limits are met.
+
+    Entries older than ``max_age`` seconds are always evicted, as well as temporary files
+    left by interrupted writes. A limit of 0 means unlimited. The manifest of an entry is
+    removed first, so concurrent readers never load a partially removed entry.
+
+    :param path: The path to the cache directory, defaults to default_generated_ir_path
+    :type path: str, optional
+    :param dsl_name: Only prune entries of this DSL, defaults to all DSLs
+    :type dsl_name: str, optional
+    :param max_entries: The maximum number of entries to keep, defaults to 0
+    :type max_entries: int, optional
+    :param max_bytes: The maximum total size of entries to keep, defaults to 0
+    :type max_bytes: int, optional
+    :param max_age: The maximum age of an entry in seconds since its last use, defaults to 0
+    :type max_age: int, optional
+    :param remove_all: Whether to evict all entries regardless of the limits, defaults to False
+    :type remove_all: bool, optional
+    :return: The number of evicted entries.
+    :rtype: int
+    """
+    entries, stale_temp_paths = _collect_file_cache_entries(path, dsl_name)
+    for temp_path in stale_temp_paths:
+        if os.path.isdir(temp_path):
+            shutil.rmtree(temp_path, ignore_errors=True)
+        else:
+            _remove_file(temp_path)
+
+    # Least recently used entries first
+    entries = sorted(
+        (
+            (*_get_files_size_and_mtime(file_paths), file_paths)
+            for file_paths in entries.values()
+        ),
+        key=lambda entry: entry[1],
+    )
+    total_bytes = sum(size for size, _, _ in entries)
+    now = time.time()
+    evicted = 0
+    for i, (size, mtime, file_paths) in enumerate(entries):
+        remaining = len(entries) - i
+        if not (
+            remove_all
+            or (max_age > 0 and now - mtime > max_age)
+            or (max_entries > 0 and remaining > max_entries)
+            or (max_bytes > 0 and total_bytes > max_bytes)
+        ):
+            continue
+        for file_path in sorted(file_paths, key=lambda p: not p.endswith(".json")):
+            _remove_file(file_path)
+        total_bytes -= size
+        evicted += 1
+    if evicted:
+        log().info("JIT cache : pruned %d entries from %s", evicted, path)
+    return evicted
+
+
+def _remove_file(file_path):
+    try:
+        os.remove(file_path)
+    except OSError:
+        pass
+
+
+def main(argv=None):
+    """Command line interface to inspect and prune the file cache.
+
+    .. code-block:: bash
+
+        python -m cutlass.base_dsl.cache_helpers stats
+        python -m cutlass.base_dsl.cache_helpers prune --max-bytes 1000000000 --max-age 604800
+    """
+    parser = argparse.ArgumentParser(description="Inspect and prune the JIT file cache.")
+    parser.add_argument("command", choices=["stats", "prune"])
+    parser.add_argument(
+        "--path", default=default_generated_ir_path, help="Cache directory."
+    )
+    parser.add_argument(
+        "--dsl", default=None, help="Only handle entries of this DSL, e.g. CUTE_DSL."
+    )
+    parser.add_argument("--max-entries", type=int, default=0)
+    parser.add_argument("--max-bytes", type=int, default=0)
+    parser.add_argument("--max-age", type=int, default=0, help="In seconds.")
+    parser.add_argument("--all", action="store_true", help="Remove all entries.")
+    args = parser.parse_args(argv)
+
+    if args.command == "prune":
+        evicted = prune_file_cache(
+            args.path,
+            args.dsl,
+            max_entries=args.max_entries,
+            max_bytes=args.max_bytes,
+            max_age=args.max_age,
+            remove_all=args.all,
+        )
+        print(f"Pruned {evicted} entries")
+    stats = get_file_cache_stats(args.path, args.dsl)
+    print(f"{args.path}: {stats.entries} entries, {stats.bytes} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -363,7 +363,19 @@ class BaseDSL(metaclass=DSLSingletonMeta):
         self.envar = self._env_class(self.name)
         self.enable_preprocessor = preprocess
         # This cache uses hash of original ir and env as key, allows dump/load to/from file. Enabled by default
-        self.jit_cache = dict()
+        self.jit_cache = JitCache(
+            max_entries=self.envar.jit_cache_max_entries,
+            max_bytes=self.envar.jit_cache_max_bytes,
+            max_age=self.envar.jit_cache_max_age,
+            policy=self.envar.jit_cache_policy,
+        )
+        self.jit_cache.eviction_callbacks.append(self._on_jit_cache_eviction)
+        self.file_cache_stats = JitCacheStats()
+        # This table maps a cheap fingerprint of the call signature to the compiled function,
+        # so that repeated calls with the same signature skip IR generation entirely.
+        self.jit_dispatch_cache = dict()
+        # Per-thread MLIR context used to compute argument types on the fast dispatch path
+        self._dispatch_local = threading.local()
 
         self.host_jit_decorator_name = f"@{BaseDSL.jit.__name__}"
         self.device_jit_decorator_name = f"@{BaseDSL.kernel.__name__}"
@@ -414,6 +426,38 @@ class BaseDSL(metaclass=DSLSingletonMeta):
 
             atexit.register(restore_excepthook, origin_excepthook)
 
+    def _on_jit_cache_eviction(self, module_hash, jit_function):
+        """Drop the fast dispatch entries of a compiled function evicted from the JIT cache."""
+        for key in [k for k, v in self.jit_dispatch_cache.items() if v is jit_function]:
+            del self.jit_dispatch_cache[key]
+
+    def get_cache_stats(self) -> dict:
+        """
+        Get the statistics of the in-memory and file JIT caches.
+
+        :return: A dict with the `memory` and `file` cache statistics.
+        :rtype: dict[str, JitCacheStats]
+        """
+        file_stats = get_file_cache_stats(dsl_name=self.name)
+        file_stats.hits = self.file_cache_stats.hits
+        file_stats.misses = self.file_cache_stats.misses
+        file_stats.evictions = self.file_cache_stats.evictions
+        return {"memory": self.jit_cache.stats(), "file": file_stats}
+
+    def prune_file_cache(self):
+        """Evict file cache entries of this DSL exceeding the configured limits."""
+        if (
+            self.envar.file_cache_max_entries
+            or self.envar.file_cache_max_bytes
+            or self.envar.file_cache_max_age
+        ):
+            self.file_cache_stats.evictions += prune_file_cache(
+                dsl_name=self.name,
+                max_entries=self.envar.file_cache_max_entries,
+                max_bytes=self.envar.file_cache_max_bytes,
+                max_age=self.envar.file_cache_max_age,
+            )
+
     @lru_cache(maxsize=1)
     def print_warning_once(self, message):
         log().warning(f"Warning: {message}")
@@ -457,6 +501,9 @@ class BaseDSL(metaclass=DSLSingletonMeta):
                 )
         return fcn_ptr
 
+    # Serializes the preprocessing of functions deferred to their first call
+    _lazy_preprocess_lock = threading.Lock()
+
     @staticmethod
     def _preprocess_and_replace_code(func):
         """
@@ -467,8 +514,8 @@ class BaseDSL(metaclass=DSLSingletonMeta):
             # If the function ptr is already materialized, use the existing one
             func._dsl_object.preprocess_session_data = func._preprocess_session_data
             func._dsl_object.decorator_location = func._decorator_location
-            transformed_ast = func._dsl_object.run_preprocessor(func)
-            fcn_ptr = func._dsl_object.get_function_ptr(func, transformed_ast)
+            code_object = func._dsl_object.preprocess_function(func)
+            fcn_ptr = func._dsl_object.get_function_ptr(func, code_object=code_object)
             func.__code__ = (
                 fcn_ptr.__code__
                 if not isinstance(fcn_ptr, staticmethod)
@@ -476,6 +523,25 @@ class BaseDSL(metaclass=DSLSingletonMeta):
             )
         return func
 
+    @staticmethod
+    def _preprocess_on_first_call(func):
+        """
+        Run the ast transformation deferred by lazy preprocessing, if it did not run yet.
+
+        The first call may happen while another function is traced, so the preprocessing
+        state of the DSL object is restored afterwards.
+        """
+        with BaseDSL._lazy_preprocess_lock:
+            if not func._preprocess_pending:
+                return
+            dsl = func._dsl_object
+            saved_state = (dsl.preprocess_session_data, dsl.decorator_location)
+            try:
+                BaseDSL._preprocess_and_replace_code(func)
+            finally:
+                dsl.preprocess_session_data, dsl.decorator_location = saved_state
+            func._preprocess_pending = False
+
     @staticmethod
     def jit_runner(cls, executor_name, frame, *dargs, **dkwargs):
         """
@@ -487,6 +553,7 @@ class BaseDSL(metaclass=DSLSingletonMeta):
             # Run preprocessor that alters AST
             func._dsl_object = cls._get_dsl()
             func._decorator_location = BaseDSL.get_location_from_frame(frame)
+            func._preprocess_pending = False
             if (
                 func._dsl_object.enable_preprocessor
                 and func._dsl_object._can_preprocess(**dkwargs)
@@ -496,10 +563,15 @@ class BaseDSL(metaclass=DSLSingletonMeta):
                 func._preprocess_session_data = PreprocessSessionData(
                     decorator_globals=frame.f_globals,
                 )
-                BaseDSL._preprocess_and_replace_code(func)
+                if func._dsl_object.envar.lazy_preprocess:
+                    func._preprocess_pending = True
+                else:
+                    BaseDSL._preprocess_and_replace_code(func)
 
             @wraps(func)
             def jit_wrapper(*args, **kwargs):
+                if func._preprocess_pending:
+                    BaseDSL._preprocess_on_first_call(func)
                 return getattr(func._dsl_object, executor_name)(func, *args, **kwargs)
 
             def set_name_prefix(name: str):
@@ -1267,15 +1339,25 @@ class BaseDSL(metaclass=DSLSingletonMeta):
         log().debug(f"Using pipeline = {pipeline}")
         shared_libs = self.get_shared_libs()
         profiler = timer(enable=self.envar.jit_time_profiling)
+        # The manifest guards the file cache against artifacts built by another toolchain
+        cache_manifest = CacheManifest(
+            self.get_version().hexdigest(), compile_gpu_arch, pipeline, function_name
+        )
         # try load the file cache
         load_from_file_cache = False
         if not no_cache:
             fn = load_cache_from_path(
-                self.name, module_hash, bytecode_reader=read_bytecode_and_check_crc32
+                self.name,
+                module_hash,
+                bytecode_reader=read_bytecode_and_check_crc32,
+                manifest=cache_manifest,
             )
             if fn is not None:
                 load_from_file_cache = True
+                self.file_cache_stats.hits += 1
                 self.jit_cache[module_hash] = fn
+            else:
+                self.file_cache_stats.misses += 1
 
         if (
             no_cache
@@ -1302,11 +1384,12 @@ class BaseDSL(metaclass=DSLSingletonMeta):
                 module_hash,
             )
             module = self.jit_cache[module_hash].ir_module
-            engine = (
-                self.compiler_provider.jit(module, shared_libs=shared_libs)
-                if gen_jit_engine
-                else None
-            )
+            engine = None
+            if gen_jit_engine:
+                # Reuse the host library loaded from the file cache, if any, to skip host code generation
+                engine = self.jit_cache[module_hash].engine or profiler(
+                    self.compiler_provider.jit
+                )(module, shared_libs=shared_libs)
         capi_func = profiler(engine.lookup)(function_name) if engine else None
 
         fn = func_type(
@@ -1339,7 +1422,10 @@ class BaseDSL(metaclass=DSLSingletonMeta):
                     bytecode_writer=lambda f: write_bytecode_with_crc32(
                         f, fn.ir_module
                     ),
+                    manifest=cache_manifest,
+                    shared_libs=shared_libs,
                 )
+                self.prune_file_cache()
 
         return fn
 
@@ -1397,6 +1483,7 @@ class BaseDSL(metaclass=DSLSingletonMeta):
         no_cache,
         compile_only,
         location=None,
+        dispatch_key=None,
     ):
         """Generate MLIR module and compile iself.T_provider."""
         with ir.Context(), self.get_ir_location(location):
@@ -1428,11 +1515,8 @@ class BaseDSL(metaclass=DSLSingletonMeta):
                 if self.envar.dryrun:
                     return result
 
-                if (
-                    no_cache
-                    or module_hash not in self.jit_cache
-                    or self.jit_cache[module_hash].capi_func is None
-                ):
+                cached_function = None if no_cache else self.jit_cache.get(module_hash)
+                if cached_function is None or cached_function.capi_func is None:
                     # no cache or cache miss, do ir generation/compilation/jit engine
                     jit_function = self.compile_and_cache(
                         module,
@@ -1454,7 +1538,16 @@ class BaseDSL(metaclass=DSLSingletonMeta):
                         function_name,
                         module_hash,
                     )
-                    jit_function = self.jit_cache[module_hash]
+                    jit_function = cached_function
+
+                # Register the compiled function for fast dispatch. Functions returning a value
+                # at trace time need to be traced on every call.
+                if (
+                    dispatch_key is not None
+                    and result is None
+                    and jit_function.capi_func is not None
+                ):
+                    self.jit_dispatch_cache[dispatch_key] = jit_function
 
             finally:
                 self.post_compilation_cleanup()
@@ -1484,14 +1577,55 @@ class BaseDSL(metaclass=DSLSingletonMeta):
             return transformed_ast
         return None
 
-    def get_function_ptr(self, original_function, transformed_ast):
+    def preprocess_function(self, funcBody):
+        """
+        Run the preprocessor on `funcBody` and return the code object of the transformed function.
+
+        Unless disabled, the code object is loaded from the preprocessor cache when the source
+        of the function, the preprocessor version and the globals it depends on are unchanged,
+        and stored into it otherwise.
+        """
+        cache_path = key = None
+        if not (
+            self.envar.disable_preprocessor_caching
+            or self.envar.print_after_preprocessor
+            or hasattr(funcBody, "_preprocessed")
+        ):
+            cache_path = get_preprocessor_cache_path(self.name)
+            key = self.preprocessor.get_cache_key(funcBody, self._get_globals())
+
+        if key is not None:
+            if (cached := load_preprocessed_code(cache_path, key)) is not None:
+                code_object, state_delta = cached
+                log().info("Loaded preprocessed [%s] from cache", funcBody.__name__)
+                self.preprocessor.apply_state_delta(funcBody, state_delta)
+                funcBody._preprocessed = True
+                return code_object
+
+        state = self.preprocessor.get_state()
+        transformed_ast = self.run_preprocessor(funcBody)
+        code_object = self.compile_transformed_ast(funcBody, transformed_ast)
+        if key is not None:
+            dump_preprocessed_code(
+                cache_path,
+                key,
+                code_object,
+                self.preprocessor.get_state_delta(funcBody, state),
+            )
+        return code_object
+
+    def compile_transformed_ast(self, original_function, transformed_ast):
         file_name = inspect.getsourcefile(original_function)
-        code_object = compile(
+        return compile(
             transformed_ast,
             filename=file_name,
             mode="exec",
         )
 
+    def get_function_ptr(self, original_function, transformed_ast=None, code_object=None):
+        if code_object is None:
+            code_object = self.compile_transformed_ast(original_function, transformed_ast)
+
         return self.preprocessor.exec(
             original_function.__name__,
             original_function,
@@ -1553,6 +1687,132 @@ class BaseDSL(metaclass=DSLSingletonMeta):
 
         return sig
 
+    def _get_dispatch_context(self):
+        """
+        Get the MLIR context of the current thread used by the fast dispatch path.
+        The context is long-lived, so argument types are uniqued across calls.
+        """
+        context = getattr(self._dispatch_local, "context", None)
+        if context is None:
+            context = ir.Context()
+            self._dispatch_local.context = context
+        return context
+
+    @staticmethod
+    def _get_arg_fingerprint(arg, is_constexpr):
+        """
+        Get a hashable fingerprint of an argument for the fast dispatch key.
+
+        Constexpr arguments are baked into the generated IR, so their value is part of the
+        fingerprint. Dynamic arguments only contribute through their MLIR types, which are
+        added separately, so only their Python type is recorded here.
+
+        Returns None if the argument may carry compile-time state not reflected in the key,
+        e.g. an object hashed by identity whose attributes may change between calls.
+        """
+        if isinstance(arg, (tuple, list)):
+            fingerprints = []
+            for x in arg:
+                fingerprint = BaseDSL._get_arg_fingerprint(x, is_constexpr)
+                if fingerprint is None:
+                    return None
+                fingerprints.append(fingerprint)
+            return (type(arg), tuple(fingerprints))
+
+        if is_constexpr:
+            if arg is None or isinstance(arg, type):
+                return arg
+            # Objects hashed by identity may be mutated between calls
+            if type(arg).__hash__ in (None, object.__hash__):
+                return None
+            return (type(arg), arg)
+
+        if (
+            isinstance(arg, (int, float, bool, t.Numeric))
+            or hasattr(arg, "__c_pointers__")
+            or JitArgAdapterRegistry.get_registered_adapter(type(arg)) is not None
+        ):
+            return type(arg)
+        return None
+
+    def get_dispatch_key(
+        self, funcBody, function_name, args, kwargs, args_spec, pipeline, gpu_module_attrs
+    ):
+        """
+        Compute the fast dispatch key of a call, without MLIR types of its dynamic arguments.
+
+        The key covers the function identity, its mangled name, a fingerprint of every argument,
+        compile options and environment settings. Returns None if any argument cannot be
+        fingerprinted, in which case the call always goes through IR generation.
+        """
+        fingerprints = []
+        input_args = [*args, *kwargs.values()]
+        input_arg_names = [*args_spec.args, *kwargs.keys()]
+        for i, (arg_name, arg) in enumerate(zip(input_arg_names, input_args)):
+            is_constexpr = is_argument_constexpr(
+                arg, args_spec.annotations.get(arg_name, None), arg_name, i, funcBody
+            )
+            fingerprint = self._get_arg_fingerprint(arg, is_constexpr)
+            if fingerprint is None:
+                log().debug(
+                    "Fast dispatch disabled for function=[%s] due to argument [%s]",
+                    function_name,
+                    arg_name,
+                )
+                return None
+            fingerprints.append(fingerprint)
+
+        envar_fingerprint = tuple(
+            (attr, str(value))
+            for attr, value in self.envar.__dict__.items()
+            if value is not None
+        )
+        return (
+            funcBody,
+            function_name,
+            tuple(fingerprints),
+            pipeline,
+            str(gpu_module_attrs),
+            self.compile_options.to_str(),
+            envar_fingerprint,
+        )
+
+    def _try_fast_dispatch(
+        self, funcBody, function_name, args, kwargs, args_spec, pipeline, gpu_module_attrs
+    ):
+        """
+        Run the compiled function previously registered for the same call signature.
+
+        :return: A tuple of the complete dispatch key (None if the call cannot be dispatched)
+                 and a flag telling whether the compiled function has been executed.
+        """
+        try:
+            dispatch_key = self.get_dispatch_key(
+                funcBody, function_name, args, kwargs, args_spec, pipeline, gpu_module_attrs
+            )
+            if dispatch_key is None:
+                return None, False
+
+            # Only argument types are generated, the function body is not traced
+            with self._get_dispatch_context(), ir.Location.unknown():
+                exe_args, func_types, adapted_args = self.generate_mlir_function_types(
+                    funcBody, function_name, args, kwargs, args_spec
+                )
+                dispatch_key += (tuple(str(ty) for ty in func_types),)
+        except Exception:
+            self.post_compilation_cleanup()
+            raise
+
+        jit_function = self.jit_dispatch_cache.get(dispatch_key)
+        if jit_function is None:
+            log().info("JIT dispatch miss function=[%s]", function_name)
+            return dispatch_key, False
+
+        log().info("JIT dispatch hit function=[%s]", function_name)
+        self.post_compilation_cleanup()
+        jit_function.run_compiled_program(exe_args)
+        return dispatch_key, True
+
     def _func(self, funcBody, *args, **kwargs):
         """Decorator for MLIR functions.
         It cuts the boilerplate code, does the following:
@@ -1563,6 +1823,10 @@ class BaseDSL(metaclass=DSLSingletonMeta):
             5. Operator overloading (a + b --> arith.addi a, b)
             6. Generates GPU kernel function with GPU module and kernel attributes baked
         """
+        # `cute.compile` calls this method without going through the jit wrapper
+        if getattr(funcBody, "_preprocess_pending", False):
+            BaseDSL._preprocess_on_first_call(funcBody)
+
         if ir.Context.current is None:
             pass
         elif ir.InsertionPoint.current is not None:
@@ -1608,6 +1872,21 @@ class BaseDSL(metaclass=DSLSingletonMeta):
         if not self.compile_options.generate_line_info:
             self.decorator_location = None
 
+        # Skip IR generation if the same call signature has already been compiled
+        dispatch_key = None
+        if self.envar.enable_fast_dispatch and not (no_cache or self.envar.dryrun):
+            dispatch_key, dispatched = self._try_fast_dispatch(
+                funcBody,
+                function_name,
+                canonicalized_args,
+                canonicalized_kwargs,
+                args_spec,
+                pipeline,
+                gpu_module_attrs,
+            )
+            if dispatched:
+                return None
+
         # Generate MLIR Context and start generating IR
         log().debug(f"Generating MLIR for function '{function_name}'")
         result = self.generate_mlir(
@@ -1621,6 +1900,7 @@ class BaseDSL(metaclass=DSLSingletonMeta):
             no_cache,
             compile_only,
             location=self.decorator_location,
+            dispatch_key=dispatch_key,
         )
         return result
 
@@ -311,6 +311,16 @@ class EnvironmentVarManager(LogEnvironmentManager):
     - [DSL_NAME]_ENABLE_OPTIMIZATION_WARNINGS: Enable warnings of optimization warnings (default: False)
     - [DSL_NAME]_JIT_TIME_PROFILING: Whether or not to profile the IR generation/compilation/execution time (default: False)
     - [DSL_NAME]_DISABLE_FILE_CACHING: Disable file caching (default: False)
+    - [DSL_NAME]_JIT_CACHE_MAX_ENTRIES: Maximum number of compiled functions kept in memory, 0 for unlimited (default: 0)
+    - [DSL_NAME]_JIT_CACHE_MAX_BYTES: Maximum size of module bytecode kept in memory, 0 for unlimited (default: 0)
+    - [DSL_NAME]_JIT_CACHE_MAX_AGE: Maximum age in seconds of compiled functions kept in memory, 0 for unlimited (default: 0)
+    - [DSL_NAME]_JIT_CACHE_POLICY: Eviction policy of the in-memory cache, `lru` or `lfu` (default: "lru")
+    - [DSL_NAME]_FILE_CACHE_MAX_ENTRIES: Maximum number of entries in the file cache, 0 for unlimited (default: 0)
+    - [DSL_NAME]_FILE_CACHE_MAX_BYTES: Maximum size in bytes of the file cache, 0 for unlimited (default: 0)
+    - [DSL_NAME]_FILE_CACHE_MAX_AGE: Maximum age in seconds since last use of file cache entries, 0 for unlimited (default: 0)
+    - [DSL_NAME]_ENABLE_FAST_DISPATCH: Dispatch calls with an already seen signature to the compiled function without re-tracing (default: False)
+    - [DSL_NAME]_DISABLE_PREPROCESSOR_CACHING: Disable the file cache of code objects transformed by the AST preprocessor (default: False)
+    - [DSL_NAME]_LAZY_PREPROCESS: Preprocess decorated functions on their first call instead of at decoration time (default: False)
     - [DSL_NAME]_LIBS: Path to dependent shared libraries (default: None)
     - [DSL_NAME]_ENABLE_TVM_FFI: Enable TVM-FFI or not (default: False)
     """
@@ -349,6 +359,28 @@ class EnvironmentVarManager(LogEnvironmentManager):
         self.disable_file_caching = get_bool_env_var(
             f"{prefix}_DISABLE_FILE_CACHING", False
         )
+        # JIT cache limits
+        self.jit_cache_max_entries = get_int_env_var(
+            f"{prefix}_JIT_CACHE_MAX_ENTRIES", 0
+        )
+        self.jit_cache_max_bytes = get_int_env_var(f"{prefix}_JIT_CACHE_MAX_BYTES", 0)
+        self.jit_cache_max_age = get_int_env_var(f"{prefix}_JIT_CACHE_MAX_AGE", 0)
+        self.jit_cache_policy = get_str_env_var(f"{prefix}_JIT_CACHE_POLICY", "lru")
+        self.file_cache_max_entries = get_int_env_var(
+            f"{prefix}_FILE_CACHE_MAX_ENTRIES", 0
+        )
+        self.file_cache_max_bytes = get_int_env_var(
+            f"{prefix}_FILE_CACHE_MAX_BYTES", 0
+        )
+        self.file_cache_max_age = get_int_env_var(f"{prefix}_FILE_CACHE_MAX_AGE", 0)
+        self.enable_fast_dispatch = get_bool_env_var(
+            f"{prefix}_ENABLE_FAST_DISPATCH", False
+        )
+        # AST preprocessor options
+        self.disable_preprocessor_caching = get_bool_env_var(
+            f"{prefix}_DISABLE_PREPROCESSOR_CACHING", False
+        )
+        self.lazy_preprocess = get_bool_env_var(f"{prefix}_LAZY_PREPROCESS", False)
         # set cuda
         self.cuda_toolkit = get_cuda_toolkit_path()
 
@@ -10,11 +10,25 @@
 # is strictly prohibited.
 
 from .c_header_generator import CHeaderGenerator
-from .export import get_export_module, dump_to_object, export_to_c
+from .dispatch import Constraint, Specialization, KernelRegistry
+from .export import (
+    get_export_module,
+    dump_to_object,
+    export_to_c,
+    merge_export_modules,
+    generate_batch_header,
+    export_batch_to_c,
+)
 
 __all__ = [
     "CHeaderGenerator",
+    "Constraint",
+    "Specialization",
+    "KernelRegistry",
     "get_export_module",
     "dump_to_object",
     "export_to_c",
+    "merge_export_modules",
+    "generate_batch_header",
+    "export_batch_to_c",
 ]
@@ -31,7 +31,7 @@ from ..common import DSLRuntimeError
 from ..jit_executor import ExecutionArgs
 from ..._mlir import ir
 
-from typing import Type, List, Any, Dict
+from typing import Type, List, Any, Dict, Tuple
 from inspect import isclass
 import cuda.bindings.driver as cuda
 
@@ -265,7 +265,15 @@ extern const unsigned char {varname}[];
 """
         return binary
 
-    def __call__(
+    def generate_preamble(self, dsl_name: str, with_error_check: bool = True) -> str:
+        """
+        Generate the includes and error check macro shared by every function in a header.
+        """
+        if with_error_check:
+            return self.includes + self._generate_check_cuda(dsl_name)
+        return self.includes
+
+    def generate_body(
         self,
         symbol_prefix: str,
         export_module: ir.Module,
@@ -276,14 +284,15 @@ extern const unsigned char {varname}[];
         dynamic_kwargs: dict,
         dsl_name: str,
     ) -> str:
+        """
+        Generate the per-function part of the header: binary declaration, kernel metadata and wrapper.
+        """
         if len(kernel_info) > 0:
-            check_cuda = self._generate_check_cuda(dsl_name)
             kernel_metadata = self._generate_kernel_metadata(
                 symbol_prefix, kernel_info, dsl_name
             )
             binary = self._generate_binary_declaration(symbol_prefix)
         else:
-            check_cuda = ""
             kernel_metadata = ""
             binary = ""
         function = self._generate_wrapper_function(
@@ -294,8 +303,79 @@ extern const unsigned char {varname}[];
             dynamic_args,
             dynamic_kwargs,
         )
-        header = self.includes + check_cuda + binary + kernel_metadata + function
-        return header
+        return binary + kernel_metadata + function
+
+    def generate_dispatch_table(
+        self, header_prefix: str, specializations: List[Tuple[str, str, str]]
+    ) -> str:
+        """
+        Generate a dispatch table over the exported specializations of a batch header.
+
+        Every host entry shares the `void (void **, int32_t)` packed-argument signature, so a
+        specialization can be selected by id or by name and invoked through the table.
+
+        :param header_prefix: The prefix of the generated enum/table/lookup symbols.
+        :param specializations: ``(name, symbol_prefix, function_name)`` for each specialization, in table order.
+        """
+        enum_values = []
+        entries = []
+        for idx, (name, symbol_prefix, function_name) in enumerate(specializations):
+            capi_function_name = f"_mlir_{symbol_prefix}__mlir_ciface_{function_name}"
+            enum_values.append(f"{header_prefix}_{name}_ID = {idx},")
+            entries.append(f'{{"{name}", {capi_function_name}}},')
+        enum_values_str = "\n    ".join(enum_values)
+        entries_str = "\n    ".join(entries)
+        return f"""
+#include <string.h>
+
+typedef enum {{
+    {enum_values_str}
+    {header_prefix}_NUM_SPECIALIZATIONS = {len(specializations)}
+}} {header_prefix}_Specialization_t;
+
+typedef struct {{
+    const char *name;
+    void (*entry)(void **args, int32_t num_args);
+}} {header_prefix}_Dispatch_Entry_t;
+
+static const {header_prefix}_Dispatch_Entry_t {header_prefix}_dispatch_table[{len(specializations)}] = {{
+    {entries_str}
+}};
+
+// Returns the specialization id for `name`, or -1 if it was not exported.
+static inline int {header_prefix}_find_specialization(const char *name) {{
+    for (int i = 0; i < {header_prefix}_NUM_SPECIALIZATIONS; i++) {{
+        if (strcmp({header_prefix}_dispatch_table[i].name, name) == 0) {{
+            return i;
+        }}
+    }}
+    return -1;
+}}
+"""
+
+    def __call__(
+        self,
+        symbol_prefix: str,
+        export_module: ir.Module,
+        args_spec: ExecutionArgs,
+        function_name: str,
+        kernel_info: Dict[str, List],
+        dynamic_args: list,
+        dynamic_kwargs: dict,
+        dsl_name: str,
+    ) -> str:
+        preamble = self.generate_preamble(dsl_name, len(kernel_info) > 0)
+        body = self.generate_body(
+            symbol_prefix,
+            export_module,
+            args_spec,
+            function_name,
+            kernel_info,
+            dynamic_args,
+            dynamic_kwargs,
+            dsl_name,
+        )
+        return preamble + body
 
 
 # =============================================================================
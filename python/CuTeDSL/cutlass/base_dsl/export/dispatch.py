@@ -0,0 +1,245 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: LicenseRef-NvidiaProprietary
+#
+# Use of this software is governed by the terms and conditions of the
+# NVIDIA End User License Agreement (EULA), available at:
+# https://docs.nvidia.com/cutlass/media/docs/pythonDSL/license.html
+#
+# Any use, reproduction, disclosure, or distribution of this software
+# and related documentation outside the scope permitted by the EULA
+# is strictly prohibited.
+
+
+"""
+Kernel registry that selects an exported specialization from runtime shape classes.
+
+Every specialization declares constraints on named runtime keys (problem sizes, pointer
+addresses, ...). The distinct atomic predicates of all constraints (``key % d == 0``,
+``key == v``, ``key >= v``, ``key <= v``) are evaluated once per query into a bitmask, the
+"shape class" of the problem, and the first specialization whose required predicates are all
+set is selected. The same selection is available from Python (`KernelRegistry.select`) and as
+generated C code (`KernelRegistry.generate_c_dispatch`), so a C/C++ host can pick a kernel
+without Python.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ..common import DSLRuntimeError
+
+# (key, op, value) with op in "div", "eq", "ge", "le"
+Predicate = Tuple[str, str, int]
+
+_c_predicate_formats = {
+    "div": "keys[{idx}] % {value} == 0",
+    "eq": "keys[{idx}] == {value}",
+    "ge": "keys[{idx}] >= {value}",
+    "le": "keys[{idx}] <= {value}",
+}
+
+# The shape class is a 64-bit mask in the generated C code
+MAX_PREDICATES = 64
+
+_c_identifier = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _check_predicate(op: str, key_value: int, value: int) -> bool:
+    if op == "div":
+        return key_value % value == 0
+    if op == "eq":
+        return key_value == value
+    if op == "ge":
+        return key_value >= value
+    return key_value <= value
+
+
+@dataclass(frozen=True)
+class Constraint:
+    """A constraint of a specialization on one runtime key.
+
+    :param key: The name of the runtime key, e.g. ``"M"`` or ``"a_ptr"``.
+    :param divisible_by: The key must be a multiple of this value. For a pointer key this is its alignment in bytes.
+    :param equals: The key must equal this value, e.g. a static mode of the compiled tensor.
+    :param min_value: The key must be greater than or equal to this value.
+    :param max_value: The key must be less than or equal to this value.
+    """
+
+    key: str
+    divisible_by: int = 1
+    equals: Optional[int] = None
+    min_value: Optional[int] = None
+    max_value: Optional[int] = None
+
+    def __post_init__(self):
+        if self.divisible_by < 1:
+            raise DSLRuntimeError(
+                f"divisible_by must be positive, got {self.divisible_by} for `{self.key}`"
+            )
+
+    def predicates(self) -> List[Predicate]:
+        """The atomic predicates that must all hold for this constraint."""
+        predicates = []
+        if self.divisible_by > 1:
+            predicates.append((self.key, "div", self.divisible_by))
+        if self.equals is not None:
+            predicates.append((self.key, "eq", self.equals))
+        if self.min_value is not None:
+            predicates.append((self.key, "ge", self.min_value))
+        if self.max_value is not None:
+            predicates.append((self.key, "le", self.max_value))
+        return predicates
+
+    def check(self, value: int) -> bool:
+        return all(_check_predicate(op, value, v) for _, op, v in self.predicates())
+
+
+@dataclass(frozen=True)
+class Specialization:
+    """An exported specialization and the constraints under which it may be selected."""
+
+    name: str
+    constraints: Tuple[Constraint, ...]
+    payload: Any = field(default=None, compare=False)
+
+
+class KernelRegistry:
+    """Maps runtime shape classes to specializations.
+
+    Specializations are tried in registration order, so register the most constrained ones
+    first and a generic fallback (no constraints) last.
+
+    .. code-block:: python
+
+        registry = KernelRegistry(["M", "N", "K"])
+        registry.add("tile_128x128", [Constraint("M", 128), Constraint("N", 128)])
+        registry.add("generic", [])
+        registry.select(M=256, N=512, K=64).name  # "tile_128x128"
+
+    :param keys: The names of the runtime keys, in the order of the ``keys`` array of the generated C code.
+    """
+
+    def __init__(self, keys: Sequence[str]):
+        if len(set(keys)) != len(keys):
+            raise DSLRuntimeError(f"Duplicate dispatch keys: {list(keys)}")
+        for key in keys:
+            if not _c_identifier.fullmatch(key):
+                raise DSLRuntimeError(f"Dispatch key `{key}` is not a valid C identifier")
+        self.keys = tuple(keys)
+        self._specializations: List[Specialization] = []
+        self._predicates: Dict[Predicate, int] = {}
+        self._required: List[int] = []
+        self._class_cache: Dict[int, Optional[Specialization]] = {}
+
+    def __len__(self):
+        return len(self._specializations)
+
+    def __iter__(self):
+        return iter(self._specializations)
+
+    @property
+    def names(self) -> List[str]:
+        return [s.name for s in self._specializations]
+
+    @property
+    def predicates(self) -> List[Predicate]:
+        """The distinct atomic predicates, in shape class bit order."""
+        return list(self._predicates)
+
+    def add(
+        self, name: str, constraints: Sequence[Constraint], payload: Any = None
+    ) -> Specialization:
+        """Register a specialization.
+
+        :param name: The name of the specialization, as passed to the batch exporter.
+        :param constraints: The constraints on the runtime keys.
+        :param payload: Optional object returned with the specialization, e.g. the compiled function.
+        """
+        if name in self.names:
+            raise DSLRuntimeError(f"Specialization `{name}` is already registered")
+        required = 0
+        for constraint in constraints:
+            if constraint.key not in self.keys:
+                raise DSLRuntimeError(
+                    f"Unknown dispatch key `{constraint.key}` in specialization `{name}`, "
+                    f"expected one of {list(self.keys)}"
+                )
+            for predicate in constraint.predicates():
+                bit = self._predicates.get(predicate)
+                if bit is None:
+                    bit = len(self._predicates)
+                    if bit >= MAX_PREDICATES:
+                        raise DSLRuntimeError(
+                            f"Too many distinct dispatch predicates (max {MAX_PREDICATES})"
+                        )
+                    self._predicates[predicate] = bit
+                required |= 1 << bit
+        specialization = Specialization(name, tuple(constraints), payload)
+        self._specializations.append(specialization)
+        self._required.append(required)
+        self._class_cache.clear()
+        return specialization
+
+    def shape_class(self, **keys: int) -> int:
+        """The bitmask of the predicates that hold for the given runtime keys."""
+        shape_class = 0
+        for bit, (key, op, value) in enumerate(self._predicates):
+            if _check_predicate(op, keys[key], value):
+                shape_class |= 1 << bit
+        return shape_class
+
+    def select(self, **keys: int) -> Optional[Specialization]:
+        """Select the first registered specialization accepting the runtime keys, or None."""
+        shape_class = self.shape_class(**keys)
+        try:
+            return self._class_cache[shape_class]
+        except KeyError:
+            pass
+        selected = None
+        for specialization, required in zip(self._specializations, self._required):
+            if shape_class & required == required:
+                selected = specialization
+                break
+        self._class_cache[shape_class] = selected
+        return selected
+
+    def generate_c_dispatch(
+        self, header_prefix: str, ids: Optional[Mapping[str, int]] = None
+    ) -> str:
+        """Generate the C equivalent of `select`.
+
+        Emits a ``<header_prefix>_Dispatch_Key_t`` enum indexing the ``keys`` array and a
+        ``<header_prefix>_select(const int64_t *keys)`` function returning the id of the selected
+        specialization or -1.
+
+        :param header_prefix: The prefix of the generated symbols.
+        :param ids: The ids returned for each specialization, e.g. its index in the batch dispatch table. Defaults to the registration order.
+        """
+        if ids is None:
+            ids = {name: idx for idx, name in enumerate(self.names)}
+        key_index = {key: idx for idx, key in enumerate(self.keys)}
+        key_values = "\n    ".join(
+            f"{header_prefix}_KEY_{key} = {idx}," for key, idx in key_index.items()
+        )
+        shape_class = "\n    ".join(
+            f"if ({_c_predicate_formats[op].format(idx=key_index[key], value=value)}) shape_class |= 1ull << {bit};"
+            for bit, (key, op, value) in enumerate(self._predicates)
+        )
+        candidates = "\n    ".join(
+            f"if ((shape_class & 0x{required:x}ull) == 0x{required:x}ull) return {ids[s.name]}; // {s.name}"
+            for s, required in zip(self._specializations, self._required)
+        )
+        return f"""
+typedef enum {{
+    {key_values}
+    {header_prefix}_NUM_KEYS = {len(self.keys)}
+}} {header_prefix}_Dispatch_Key_t;
+
+// Returns the id of the first specialization accepting `keys`, or -1.
+static inline int {header_prefix}_select(const int64_t *keys) {{
+    uint64_t shape_class = 0;
+    {shape_class}
+    {candidates}
+    return -1;
+}}
+"""
@@ -11,8 +11,10 @@
 
 import io
 import os
+import re
 import array
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 from ..common import DSLRuntimeError
 from ..jit_executor import JitCompiledFunction, get_escaped_cubin_bytes
@@ -22,18 +24,31 @@ from ..._mlir import ir
 from ..._mlir.dialects import llvm
 
 from .c_header_generator import CHeaderGenerator
+from .dispatch import KernelRegistry
 
-from typing import Union
+from typing import Dict, Optional, Sequence, Tuple, Union
 
 cubin_suffix = "cubin"
 
-def get_export_module(ir_module: ir.Module, symbol_prefix: str, *, preserve_symbols = None):
+_local_linkages = ("#llvm.linkage<internal>", "#llvm.linkage<private>")
+
+
+def get_export_module(
+    ir_module: ir.Module,
+    symbol_prefix: str,
+    *,
+    preserve_symbols=None,
+    context: Optional[ir.Context] = None,
+    rename_globals: bool = False,
+):
     """Get the export module which is cloned from the original compiled ir module, and add the prefix
     to avoid the symbol conflict.
 
     @param ir_module: The original compiled ir module. Comes from the JitCompiledFunction.ir_module.
     @param symbol_prefix: The prefix name of the function. This is the unique identifier name of the function to avoid symbol conflict in the generated object file.
     @param preserve_symbols: Optional symbols to preserve in the export module.
+    @param context: Optional context to clone the module into. Modules must share a context to be merged.
+    @param rename_globals: Also prefix internal/private `llvm.mlir.global` definitions.
     @return: The export module of the function.
     """
     # Add prefix for symbol names to avoid conflict with other functions
@@ -57,6 +72,19 @@ def get_export_module(ir_module: ir.Module, symbol_prefix: str, *, preserve_symb
             op.attributes["sym_name"] = ir.StringAttr.get(
                 symbol_prefix + "_" + func_name
             )
+        elif (
+            rename_globals
+            and op.name == "llvm.mlir.global"
+            and "linkage" in op.attributes
+            and str(op.attributes["linkage"]) in _local_linkages
+        ):
+            global_name = op.attributes["sym_name"].value
+            if global_name in preserve_symbols:
+                return ir.WalkResult.ADVANCE
+            defined_symbols.add(global_name)
+            op.attributes["sym_name"] = ir.StringAttr.get(
+                symbol_prefix + "_" + global_name
+            )
         return ir.WalkResult.ADVANCE
 
     def walk_llvm_references(op):
@@ -98,7 +126,7 @@ def get_export_module(ir_module: ir.Module, symbol_prefix: str, *, preserve_symb
                 op.attributes["dtors"] = ir.ArrayAttr.get(renamed_dtors)
         return ir.WalkResult.ADVANCE
 
-    with ir.Context():
+    with context or ir.Context():
         export_module = ir.Module.parse(str(ir_module))
         # First pass: collect and rename function definitions
         export_module.operation.walk(walk_llvm_func_op)
@@ -125,36 +153,53 @@ def dump_to_object(
     @return: The bytes object of the function.
     """
     if use_gpu_dialect:
-        cubin_data = None
-
-        def strip_gpu_binary_op(op):
-            if op.name == "gpu.binary":
-                s = io.BytesIO()
-                op.operation.write_bytecode(s)
-                nonlocal cubin_data
-                cubin_data = s.getvalue()
-                cubin_data = cubin_data.split(b'bin = "')[1].split(b'">')[0]
-                cubin_data = get_escaped_cubin_bytes(cubin_data)
-                op.erase()
-                return ir.WalkResult.ADVANCE
+        _strip_gpu_binary(prefix_name, export_module)
+    return _dump_module_to_object(
+        export_module, dsl, ["_".join([prefix_name, jit_function.function_name])]
+    )
+
+
+def _strip_gpu_binary(prefix_name: str, export_module: ir.Module):
+    """Replace the `gpu.binary` op of the export module by an external `<prefix_name>_cubin` global."""
+    cubin_data = None
+
+    def strip_gpu_binary_op(op):
+        if op.name == "gpu.binary":
+            s = io.BytesIO()
+            op.operation.write_bytecode(s)
+            nonlocal cubin_data
+            cubin_data = s.getvalue()
+            cubin_data = cubin_data.split(b'bin = "')[1].split(b'">')[0]
+            cubin_data = get_escaped_cubin_bytes(cubin_data)
+            op.erase()
             return ir.WalkResult.ADVANCE
+        return ir.WalkResult.ADVANCE
 
-        # Strip gpu related to avoid the object file generating builtin module load/unload functions
-        export_module.operation.walk(strip_gpu_binary_op)
+    # Strip gpu related to avoid the object file generating builtin module load/unload functions
+    export_module.operation.walk(strip_gpu_binary_op)
 
-        cubin_array = array.array("b", cubin_data)
-        with (
-            export_module.context,
-            ir.Location.unknown(),
-            ir.InsertionPoint(export_module.body),
-        ):
-            new_binary_global_op = llvm.GlobalOp(
-                sym_name="_".join([prefix_name, cubin_suffix]),
-                global_type=ir.Type.parse(f"!llvm.array<{len(cubin_array)} x i8>"),
-                linkage=ir.Attribute.parse("#llvm.linkage<external>"),
-                value=ir.DenseIntElementsAttr.get(cubin_array),
-                constant=True,
-            )
+    cubin_array = array.array("b", cubin_data)
+    with (
+        export_module.context,
+        ir.Location.unknown(),
+        ir.InsertionPoint(export_module.body),
+    ):
+        new_binary_global_op = llvm.GlobalOp(
+            sym_name="_".join([prefix_name, cubin_suffix]),
+            global_type=ir.Type.parse(f"!llvm.array<{len(cubin_array)} x i8>"),
+            linkage=ir.Attribute.parse("#llvm.linkage<external>"),
+            value=ir.DenseIntElementsAttr.get(cubin_array),
+            constant=True,
+        )
+
+
+def _dump_module_to_object(
+    export_module: ir.Module, dsl: BaseDSL, entry_symbols: Sequence[str]
+) -> bytes:
+    """JIT the export module once and dump it to an ELF object.
+
+    @param entry_symbols: Host entry functions that must be present in the object.
+    """
     if "gpu.container_module" in export_module.operation.attributes:
         del export_module.operation.attributes["gpu.container_module"]
     # Generate the object file
@@ -162,13 +207,11 @@ def dump_to_object(
         export_module, shared_libs=dsl.get_shared_libs()
     )
     # This lookup is necessary to make sure the compilation is done.
-    entry_func = export_engine.raw_lookup(
-        "_".join([prefix_name, jit_function.function_name])
-    )
-    if not entry_func:
-        raise DSLRuntimeError(
-            f"Execution engine cannot find the entry function {prefix_name}_{jit_function.function_name}"
-        )
+    for entry_symbol in entry_symbols:
+        if not export_engine.raw_lookup(entry_symbol):
+            raise DSLRuntimeError(
+                f"Execution engine cannot find the entry function {entry_symbol}"
+            )
     try:
         with tempfile.NamedTemporaryFile() as tmp_object_file:
             export_engine.dump_to_object_file(tmp_object_file.name)
@@ -239,3 +282,210 @@ def export_to_c(
         raise DSLRuntimeError(f"Error writing object file: {e}") from e
 
 
+
+
+def _symbol_name(op) -> Optional[str]:
+    if "sym_name" in op.attributes:
+        return op.attributes["sym_name"].value
+    return None
+
+
+def _is_declaration(op) -> bool:
+    return op.name == "llvm.func" and (
+        len(op.regions) == 0 or len(op.regions[0].blocks) == 0
+    )
+
+
+def merge_export_modules(export_modules: Sequence[ir.Module]) -> ir.Module:
+    """Merge prefixed export modules into a single module.
+
+    The modules must have been created in the same context (see the `context` argument of
+    `get_export_module`). Top level operations are moved into the merged module; external
+    declarations shared by several modules (runtime glue) are kept once, while conflicting
+    definitions raise an error.
+
+    @param export_modules: The export modules to merge. They are consumed by the merge.
+    @return: The merged export module.
+    """
+    if len(export_modules) == 0:
+        raise DSLRuntimeError("No export module to merge")
+    context = export_modules[0].context
+    with context, ir.Location.unknown():
+        merged_module = ir.Module.create()
+    symbols = {}
+    for export_module in export_modules:
+        if export_module.context != context:
+            raise DSLRuntimeError(
+                "Export modules must share one context to be merged"
+            )
+        for named_attr in export_module.operation.attributes:
+            if named_attr.name not in merged_module.operation.attributes:
+                merged_module.operation.attributes[named_attr.name] = named_attr.attr
+        for op in list(export_module.body.operations):
+            op = op.operation
+            sym_name = _symbol_name(op)
+            if sym_name is not None and sym_name in symbols:
+                if _is_declaration(op):
+                    continue
+                if not _is_declaration(symbols[sym_name]):
+                    raise DSLRuntimeError(
+                        f"Symbol `{sym_name}` is defined by more than one exported function"
+                    )
+                # Replace the earlier declaration by this definition
+                symbols[sym_name].erase()
+            merged_module.body.append(op)
+            if sym_name is not None:
+                symbols[sym_name] = op
+    return merged_module
+
+
+_c_identifier = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def generate_batch_header(
+    file_name: str,
+    specializations: Sequence[Tuple[str, str, JitCompiledFunction]],
+    dsl_name: str,
+    c_header_generator: CHeaderGenerator,
+    *,
+    max_workers: Optional[int] = None,
+    registry: Optional[KernelRegistry] = None,
+) -> str:
+    """Generate a single C header for a batch of exported functions.
+
+    The per-function sections are generated in parallel and concatenated in the order of
+    `specializations`, followed by a dispatch table keyed by specialization name and, with a
+    `registry`, a `<file_name>_select` function picking a specialization from runtime keys.
+
+    @param file_name: The prefix of the dispatch table symbols.
+    @param specializations: ``(name, symbol_prefix, jit_function)`` for each exported function.
+    @param dsl_name: The name of the dsl, used for the error check macro.
+    @param c_header_generator: The c header generator used for each function.
+    @param max_workers: The maximum number of header generation threads.
+    @param registry: Optional registry of the constraints of the specializations.
+    @return: The content of the header file.
+    """
+
+    def generate_body(specialization):
+        _, symbol_prefix, jit_function = specialization
+        return c_header_generator.generate_body(
+            symbol_prefix,
+            None,
+            jit_function.args_spec,
+            jit_function.function_name,
+            jit_function.kernel_info,
+            jit_function.dynamic_args,
+            jit_function.dynamic_kwargs,
+            dsl_name,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        bodies = list(pool.map(generate_body, specializations))
+
+    with_error_check = any(len(fn.kernel_info) > 0 for _, _, fn in specializations)
+    dispatch_table = c_header_generator.generate_dispatch_table(
+        file_name,
+        [(name, prefix, fn.function_name) for name, prefix, fn in specializations],
+    )
+    if registry is not None:
+        ids = {name: idx for idx, (name, _, _) in enumerate(specializations)}
+        unknown = [name for name in registry.names if name not in ids]
+        if unknown:
+            raise DSLRuntimeError(
+                f"Registry specializations {unknown} are not exported"
+            )
+        dispatch_table += registry.generate_c_dispatch(file_name, ids)
+    return (
+        c_header_generator.generate_preamble(dsl_name, with_error_check)
+        + "".join(bodies)
+        + dispatch_table
+    )
+
+
+def export_batch_to_c(
+    jit_functions: Union[
+        Dict[str, JitCompiledFunction], Sequence[Tuple[str, JitCompiledFunction]]
+    ],
+    file_path: str,
+    file_name: str,
+    dsl: BaseDSL,
+    c_header_generator: CHeaderGenerator,
+    use_gpu_dialect: bool,
+    *,
+    max_workers: Optional[int] = None,
+    registry: Optional[KernelRegistry] = None,
+):
+    """Exports many jit-compiled functions to a single C header and a single object file.
+
+    Each specialization is exported under the symbol prefix `<file_name>_<name>`, so its wrapper
+    is `<file_name>_<name>_wrapper` exactly as if it had been exported alone by `export_to_c`.
+    All export modules are merged and compiled by one execution engine, so shared runtime
+    declarations are emitted once. The header additionally contains a
+    `<file_name>_dispatch_table` indexed by the `<file_name>_Specialization_t` enum, and a
+    `<file_name>_find_specialization` lookup by name. When a `registry` is given, the header
+    also contains `<file_name>_select(const int64_t *keys)`, which selects a specialization from
+    runtime keys exactly like `KernelRegistry.select`.
+
+    @param jit_functions: Mapping (or sequence of pairs) from specialization name to the jit-compiled function from `cute.compile`. Names must be valid C identifiers.
+    @param file_path: The path to the directory where the header and object files will be saved.
+    @param file_name: The name of the generated files, and the prefix of all generated symbols.
+    @param dsl: The dsl object. This is the dsl object to get the compiler provider and shared libs.
+    @param c_header_generator: The c header generator. This is the c header generator to generate the c header file.
+    @param max_workers: The maximum number of header generation threads.
+    @param registry: Optional registry of the constraints of the exported specializations.
+    """
+    if isinstance(jit_functions, dict):
+        jit_functions = list(jit_functions.items())
+    if len(jit_functions) == 0:
+        raise DSLRuntimeError("No jit-compiled function to export")
+    specializations = []
+    seen_names = set()
+    for name, jit_function in jit_functions:
+        if not _c_identifier.fullmatch(name):
+            raise DSLRuntimeError(
+                f"Specialization name `{name}` is not a valid C identifier"
+            )
+        if name in seen_names:
+            raise DSLRuntimeError(f"Duplicate specialization name `{name}`")
+        seen_names.add(name)
+        specializations.append((name, f"{file_name}_{name}", jit_function))
+
+    # Generate the c header file
+    header_file_content = generate_batch_header(
+        file_name,
+        specializations,
+        dsl.name,
+        c_header_generator,
+        max_workers=max_workers,
+        registry=registry,
+    )
+    try:
+        with open(os.path.join(file_path, file_name + ".h"), "w") as f:
+            f.write(header_file_content)
+    except Exception as e:
+        raise DSLRuntimeError(f"Error writing header file: {e}") from e
+
+    # Generate the object file from one merged module
+    context = ir.Context()
+    export_modules = []
+    for _, symbol_prefix, jit_function in specializations:
+        export_module = get_export_module(
+            jit_function.ir_module,
+            symbol_prefix,
+            context=context,
+            rename_globals=True,
+        )
+        if use_gpu_dialect:
+            _strip_gpu_binary(symbol_prefix, export_module)
+        export_modules.append(export_module)
+    merged_module = merge_export_modules(export_modules)
+    object_file_content = _dump_module_to_object(
+        merged_module,
+        dsl,
+        [f"{prefix}_{fn.function_name}" for _, prefix, fn in specializations],
+    )
+    try:
+        with open(os.path.join(file_path, file_name + ".o"), "wb") as f:
+            f.write(object_file_content)
+    except Exception as e:
+        raise DSLRuntimeError(f"Error writing object file: {e}") from e
@@ -141,6 +141,91 @@ class KwargsWrapperSpec(NamedTuple):
     kwonly_defaults: dict[str, Any]
 
 
+# Placeholder of an argument slot that has not been provided and has no default
+_MISSING = object()
+
+
+class LaunchPlan:
+    """Argument marshalling of a runtime function signature, built once and reused for every launch.
+
+    Runtime arguments and keyword-only arguments are assigned fixed slots, in declaration
+    order. How an argument is converted to c pointers only depends on its slot and on its
+    type, so the conversion is resolved once per (slot, type) and cached.
+    """
+
+    def __init__(self, args_spec: inspect.FullArgSpec):
+        self.arg_names = list(args_spec.args) + list(args_spec.kwonlyargs)
+        self.num_args = len(args_spec.args)
+        self.slot_index = {name: i for i, name in enumerate(self.arg_names)}
+
+        # Default of each slot, or _MISSING if it must be provided
+        self.defaults = [_MISSING] * len(self.arg_names)
+        if args_spec.defaults:
+            first = self.num_args - len(args_spec.defaults)
+            self.defaults[first : self.num_args] = args_spec.defaults
+        for name, value in (args_spec.kwonlydefaults or {}).items():
+            if name in self.slot_index:
+                self.defaults[self.slot_index[name]] = value
+
+        self.annotations = [args_spec.annotations.get(name, None) for name in self.arg_names]
+        self._converters = {}
+        self._num_adapters = len(JitArgAdapterRegistry.jit_arg_adapter_registry)
+
+    def assign_slots(self, args, kwargs):
+        """Returns the runtime arguments in slot order, or None if they don't match the signature."""
+        if len(args) > self.num_args:
+            return None
+        values = list(args)
+        values.extend(self.defaults[len(args) :])
+        slot_index = self.slot_index
+        for k, v in kwargs.items():
+            idx = slot_index.get(k)
+            if idx is None:
+                return None
+            values[idx] = v
+        if any(v is _MISSING for v in values):
+            return None
+        return values
+
+    def get_converter(self, idx, ty):
+        """Returns the function converting an argument of type ``ty`` in slot ``idx`` to
+        a tuple of (c pointers, adapted argument or None)."""
+        # Adapters are registered at most once per type, a new registration may
+        # change the conversion of types that had no adapter before
+        num_adapters = len(JitArgAdapterRegistry.jit_arg_adapter_registry)
+        if num_adapters != self._num_adapters:
+            self._converters.clear()
+            self._num_adapters = num_adapters
+
+        converter = self._converters.get((idx, ty))
+        if converter is None:
+            converter = self._make_converter(self.annotations[idx], ty)
+            self._converters[(idx, ty)] = converter
+        return converter
+
+    @staticmethod
+    def _make_converter(arg_type, ty):
+        # short-cut for args already converted
+        if hasattr(ty, "__c_pointers__"):
+            return lambda arg: (arg.__c_pointers__(), None)
+
+        # Implicit cast to NumericMeta
+        if isinstance(arg_type, t.NumericMeta):
+            return lambda arg: (get_c_pointers(t.cast(arg, arg_type)), None)
+
+        # If not any known type, try registered adapter to do the conversion
+        adapter = JitArgAdapterRegistry.get_registered_adapter(ty)
+        if adapter:
+
+            def convert(arg):
+                arg = adapter(arg)
+                return get_c_pointers(arg), arg
+
+            return convert
+
+        return lambda arg: (get_c_pointers(arg), None)
+
+
 class ExecutionArgs:
     """Helper that wraps the function signature spec to filter exeuction and compile time arguments."""
 
@@ -150,78 +235,51 @@ class ExecutionArgs:
         if spec is not None:
             self.args_spec = self.filter_runtime_arg_spec(spec)
         self.original_args_spec = spec
+        self._launch_plan = None
+
+    @property
+    def launch_plan(self) -> LaunchPlan:
+        """The launch plan of the runtime signature, built on first use."""
+        if self._launch_plan is None:
+            self._launch_plan = LaunchPlan(self.args_spec)
+        return self._launch_plan
 
     def get_rectified_args(self, args, kwargs):
         """
         This function is used to rectify the args and kwargs to a final runtime argument list according to the args_spec.
         """
-        args_spec = self.args_spec
-        # Process positional arguments with defaults
-        rectified_args = list(args)
-        if args_spec.defaults and len(args) < len(args_spec.args):
-            rectified_args.extend(args_spec.defaults[len(args) - len(args_spec.args) :])
-        for k, v in kwargs.items():
-            if k in args_spec.args:
-                idx = args_spec.args.index(k)
-                if idx < len(rectified_args):
-                    rectified_args[idx] = v
-                else:
-                    rectified_args.append(v)
-
-        # Process keyword arguments
-        rectified_kwargs = collections.OrderedDict(
-            (k, v) for k, v in kwargs.items() if k not in args_spec.args
-        )
-        if args_spec.kwonlydefaults and len(rectified_kwargs) < len(
-            args_spec.kwonlyargs
-        ):
-            rectified_kwargs.update(args_spec.kwonlydefaults)
-
-        # args/kwargs must match arg_specs
-        if len(rectified_args) != len(args_spec.args) or len(rectified_kwargs) != len(
-            args_spec.kwonlyargs
-        ):
+        rectified_args = self.launch_plan.assign_slots(args, kwargs)
+        if rectified_args is None:
+            args_spec = self.args_spec
             raise DSLRuntimeError(
                 "input args/kwargs length does not match runtime function signature!",
                 context={
-                    "input args length": len(rectified_args),
-                    "input kwargs length": len(rectified_kwargs),
+                    "input args length": len(args)
+                    + sum(1 for k in kwargs if k in args_spec.args),
+                    "input kwargs length": sum(
+                        1 for k in kwargs if k not in args_spec.args
+                    ),
                     "function signature args length": len(args_spec.args),
                     "function signature kwonlyargs length": len(args_spec.kwonlyargs),
                 },
             )
-        return rectified_args + list(rectified_kwargs.values())
+        return rectified_args
 
     def generate_execution_args(self, args, kwargs):
         """
         This function is the prune version of `generate_mlir_function_types` which only generates execution args
         to get rid of mlir context.
         """
-        args_spec = self.args_spec
+        plan = self.launch_plan
 
         exe_args = []
         adapted_args = []
         input_args = self.get_rectified_args(args, kwargs)
-        input_arg_names = args_spec.args + args_spec.kwonlyargs
-        for arg, arg_name in zip(input_args, input_arg_names):
-            # short-cut for args already converted
-            if hasattr(arg, "__c_pointers__"):
-                exe_args.extend(arg.__c_pointers__())
-                continue
-
-            arg_type = args_spec.annotations.get(arg_name, None)
-
-            # Implicit cast to NumericMeta
-            if isinstance(arg_type, t.NumericMeta):
-                arg = t.cast(arg, arg_type)
-            else:
-                # If not any known type, try registered adapter to do the conversion
-                adapter = JitArgAdapterRegistry.get_registered_adapter(type(arg))
-                if adapter:
-                    arg = adapter(arg)
-                    adapted_args.append(arg)
-
-            exe_args.extend(get_c_pointers(arg))
+        for idx, arg in enumerate(input_args):
+            c_pointers, adapted_arg = plan.get_converter(idx, type(arg))(arg)
+            exe_args.extend(c_pointers)
+            if adapted_arg is not None:
+                adapted_args.append(adapted_arg)
 
         return exe_args, adapted_args
 
@@ -538,6 +596,7 @@ class JitExecutor:
         # are garbage collected.
         self.jit_module = jit_module
         self.exec_context = exec_context
+        self.jit_time_profiling = jit_time_profiling
         self.profiler = timer(enable=jit_time_profiling)
 
         # Get the cuda result type from the capi function.
@@ -545,15 +604,28 @@ class JitExecutor:
         cuda_result_type = self.jit_module.capi_func.restype
         self.cuda_result = cuda_result_type() if cuda_result_type is not None else None
 
-    # Assume each execution args has type `c_void_p` to reduce the overhead of `ctypes.cast`.
-    def _get_invoke_packed_args(self, exe_args):
-        # If expecting a cuda result, add a pointer to exe_args
+        # Arguments appended after the execution args, the same for every launch
+        self._trailing_args = []
         if self.cuda_result is not None:
-            exe_args.append(ctypes.addressof(self.cuda_result))
+            self._trailing_args.append(ctypes.addressof(self.cuda_result))
         if self.exec_context is not None:
-            exe_args += self.exec_context.kernel_functions_ptrs
-        packed_args = (ctypes.c_void_p * len(exe_args))()
-        for argNum in range(len(exe_args)):
+            self._trailing_args += self.exec_context.kernel_functions_ptrs
+
+        # Packed args buffer reused by launches with the same number of args, per thread
+        self._packed_args = threading.local()
+
+    # Assume each execution args has type `c_void_p` to reduce the overhead of `ctypes.cast`.
+    def _get_invoke_packed_args(self, exe_args):
+        num_args = len(exe_args)
+        packed_args = getattr(self._packed_args, "buffer", None)
+        if packed_args is None or len(packed_args) != num_args + len(self._trailing_args):
+            packed_args = (ctypes.c_void_p * (num_args + len(self._trailing_args)))()
+            for argNum, arg in enumerate(self._trailing_args, num_args):
+                packed_args[argNum] = arg
+            self._packed_args.buffer = packed_args
+
+        # Only the execution args change between launches
+        for argNum in range(num_args):
             arg = exe_args[argNum]
             if isinstance(arg, ctypes.c_void_p):
                 packed_args[argNum] = arg
@@ -566,8 +638,12 @@ class JitExecutor:
 
     def run_compiled_program(self, exe_args):
         try:
-            packed_args = self.profiler(self._get_invoke_packed_args)(exe_args)
-            self.profiler(self.jit_module.capi_func)(packed_args)
+            if self.jit_time_profiling:
+                packed_args = self.profiler(self._get_invoke_packed_args)(exe_args)
+                self.profiler(self.jit_module.capi_func)(packed_args)
+            else:
+                packed_args = self._get_invoke_packed_args(exe_args)
+                self.jit_module.capi_func(packed_args)
             if self.cuda_result is not None:
                 if self.cuda_result.value != 0:
                     error_code = self.cuda_result.value
@@ -36,6 +36,7 @@ from cutlass.cutlass_dsl import (
     extract_mlir_values,
     is_dynamic_expression,
     lru_cache_ir,
+    lru_cache_static,
     not_,
 )
 
@@ -2412,6 +2413,7 @@ def filter(input, *, loc=None, ip=None):
         return _cute_ir.filter(input, loc=loc, ip=ip)
 
 
+@lru_cache_static()
 @dsl_user_op
 def size(
     a: Union[IntTuple, Shape, Layout, ComposedLayout, Tensor],
@@ -2458,6 +2460,7 @@ def size(
     return _unpack_x_tuple(res, loc=loc, ip=ip)  # type: ignore
 
 
+@lru_cache_static()
 @dsl_user_op
 def shape_div(lhs: Shape, rhs: Shape, *, loc=None, ip=None) -> Shape:
     """Perform element-wise division of shapes.
@@ -2481,6 +2484,7 @@ def shape_div(lhs: Shape, rhs: Shape, *, loc=None, ip=None) -> Shape:
     return _unpack_x_tuple(res, loc=loc, ip=ip)
 
 
+@lru_cache_static()
 @dsl_user_op
 def ceil_div(input: Shape, tiler: Tiler, *, loc=None, ip=None) -> Shape:
     """
@@ -2910,6 +2914,7 @@ def coalesce(input, *, target_profile: Coord = None, loc=None, ip=None):
     )
 
 
+@lru_cache_static()
 @dsl_user_op
 def crd2idx(coord: Coord, layout, *, loc=None, ip=None):
     """
@@ -2963,6 +2968,7 @@ def idx2crd(idx: Int, shape: Int, *, loc=None, ip=None) -> Int: ...
 def idx2crd(idx: IntTuple, shape: Tuple, *, loc=None, ip=None) -> Tuple: ...
 
 
+@lru_cache_static()
 @dsl_user_op
 def idx2crd(idx, shape, *, loc=None, ip=None):
     """
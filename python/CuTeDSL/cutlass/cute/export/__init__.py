@@ -10,11 +10,15 @@
 # is strictly prohibited.
 
 from .c_header_generator import CuteCHeaderGenerator
+from .dispatch import constraints_from_args
 
 from ...base_dsl.export import (
     get_export_module,
     dump_to_object as _dump_to_object,
     export_to_c as _export_to_c,
+    export_batch_to_c as _export_batch_to_c,
+    Constraint,
+    KernelRegistry,
 )
 from ...cutlass_dsl import CuTeDSL
 from functools import partial as _partial
@@ -30,9 +34,19 @@ export_to_c = _partial(
     c_header_generator=CuteCHeaderGenerator(),
     use_gpu_dialect=False,
 )
+export_batch_to_c = _partial(
+    _export_batch_to_c,
+    dsl=CuTeDSL._get_dsl(),
+    c_header_generator=CuteCHeaderGenerator(),
+    use_gpu_dialect=False,
+)
 __all__ = [
     "CuteCHeaderGenerator",
     "get_export_module",
     "dump_to_object",
     "export_to_c",
+    "export_batch_to_c",
+    "Constraint",
+    "KernelRegistry",
+    "constraints_from_args",
 ]
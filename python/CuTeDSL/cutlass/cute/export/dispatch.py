@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: LicenseRef-NvidiaProprietary
+#
+# Use of this software is governed by the terms and conditions of the
+# NVIDIA End User License Agreement (EULA), available at:
+# https://docs.nvidia.com/cutlass/media/docs/pythonDSL/license.html
+#
+# Any use, reproduction, disclosure, or distribution of this software
+# and related documentation outside the scope permitted by the EULA
+# is strictly prohibited.
+
+
+from typing import List, Mapping, Tuple, Union
+
+from cutlass.base_dsl.common import DSLRuntimeError
+from cutlass.base_dsl.export import Constraint
+from ..runtime import Tensor, Pointer
+
+
+def _assumed_align(arg) -> int:
+    align = getattr(arg, "_assumed_align", None)
+    if align is None:
+        dtype = arg.element_type if isinstance(arg, Tensor) else arg.dtype
+        align = max(1, dtype.width // 8)
+    return align
+
+
+def constraints_from_args(
+    jit_function, keys: Mapping[str, Tuple[str, Union[int, str]]]
+) -> List[Constraint]:
+    """Derive the dispatch constraints of a compiled function from its compile-time arguments.
+
+    Each dispatch key is bound to an argument of the compiled function:
+
+    * ``(arg_name, mode)`` binds the key to a mode of a tensor's shape. A static mode must be
+      equal to the compiled extent; a dynamic mode must be a multiple of its divisibility, as
+      marked by ``mark_compact_shape_dynamic`` or ``sym_int(divisibility=...)``.
+    * ``(arg_name, "align")`` binds the key to the data address of a tensor or pointer, which
+      must be aligned to the assumed alignment of the compiled argument.
+
+    .. code-block:: python
+
+        a = from_dlpack(a_torch).mark_compact_shape_dynamic(mode=0, divisibility=16)
+        compiled = cute.compile(gemm, a, b, c)
+        constraints = constraints_from_args(
+            compiled, {"M": ("a", 0), "K": ("a", 1), "a_ptr": ("a", "align")}
+        )
+
+    :param jit_function: The jit-compiled function from `cute.compile`.
+    :param keys: Mapping from dispatch key to the argument (and mode) it is bound to.
+    :return: The constraints to register with a `KernelRegistry`.
+    """
+    args_spec = jit_function.args_spec
+    input_arg_names = args_spec.args_spec.args + args_spec.args_spec.kwonlyargs
+    rectified_args = args_spec.get_rectified_args(
+        jit_function.dynamic_args, jit_function.dynamic_kwargs
+    )
+    args = dict(zip(input_arg_names, rectified_args))
+
+    constraints = []
+    for key, (arg_name, mode) in keys.items():
+        if arg_name not in args:
+            raise DSLRuntimeError(
+                f"Dispatch key `{key}` is bound to unknown runtime argument `{arg_name}`"
+            )
+        arg = args[arg_name]
+        if mode == "align":
+            if not isinstance(arg, (Tensor, Pointer)):
+                raise DSLRuntimeError(
+                    f"Dispatch key `{key}` needs a tensor or pointer, got {type(arg)}"
+                )
+            constraints.append(Constraint(key, divisible_by=_assumed_align(arg)))
+        elif isinstance(arg, Tensor):
+            if arg.dynamic_shapes_mask[mode]:
+                divisibility = arg.shape_divisibility[mode]
+                if divisibility > 1:
+                    constraints.append(Constraint(key, divisible_by=divisibility))
+            else:
+                constraints.append(Constraint(key, equals=arg.shape[mode]))
+        else:
+            raise DSLRuntimeError(
+                f"Dispatch key `{key}` needs a tensor for mode {mode}, got {type(arg)}"
+            )
+    return constraints
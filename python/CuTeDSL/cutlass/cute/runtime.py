@@ -151,6 +151,7 @@ class _Tensor(Tensor):
         self._memref_desc = None
         self._dtype = None
         self._use_32bit_stride = use_32bit_stride
+        self._shape_divisibility = {}
 
     @property
     def __class__(self) -> Type[Tensor]:
@@ -194,6 +195,7 @@ class _Tensor(Tensor):
         :rtype: _Tensor
         """
         self._dltensor_wrapper.mark_layout_dynamic(leading_dim)
+        self._shape_divisibility.clear()
         return self
 
     @lazily_load_dltensor
@@ -235,6 +237,7 @@ class _Tensor(Tensor):
         self._dltensor_wrapper.mark_compact_shape_dynamic(
             mode, stride_order, divisibility
         )
+        self._shape_divisibility[mode] = divisibility
         return self
     @property
     @lazily_load_dltensor
@@ -372,6 +375,11 @@ class _Tensor(Tensor):
         """Get the mask of dynamic strides in the tensor."""
         return self._dltensor_wrapper.get_dynamic_strides_mask()
 
+    @property
+    def shape_divisibility(self):
+        """Get the divisibility of each mode of the shape, as marked by `mark_compact_shape_dynamic`."""
+        return tuple(self._shape_divisibility.get(i, 1) for i in range(len(self.shape)))
+
     @lazily_load_dltensor
     def __c_pointers__(self):
         self._memref_desc = self._dltensor_wrapper.build_memref_desc(
@@ -488,6 +496,10 @@ class _FakeCompactTensor(Tensor):
     def dynamic_strides_mask(self):
         return tuple(1 if isinstance(e, SymInt) else 0 for e in self._stride)
 
+    @property
+    def shape_divisibility(self):
+        return tuple(e.divisibility if isinstance(e, SymInt) else 1 for e in self._shape)
+
     def fill(self, value: Numeric):
         raise DSLRuntimeError("runtime._FakeCompactTensor is not writable")
 
@@ -597,6 +609,10 @@ class _FakeTensor(Tensor):
     def dynamic_strides_mask(self):
         return tuple(1 if isinstance(e, SymInt) else 0 for e in self._stride)
 
+    @property
+    def shape_divisibility(self):
+        return tuple(e.divisibility if isinstance(e, SymInt) else 1 for e in self._shape)
+
     def fill(self, value: Numeric):
         raise DSLRuntimeError("runtime._FakeTensor is not writable")
 
@@ -9,11 +9,20 @@
 # and related documentation outside the scope permitted by the EULA
 # is strictly prohibited.
 
+import contextlib
 import functools
+import hashlib
 import inspect
+import json
 import logging
+import math
 import os
-from itertools import product
+import random
+import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, product
 from time import time
 from typing import Type, Union, Callable, Optional, Dict, List, Any
 
@@ -22,6 +31,7 @@ import cuda.bindings.runtime as cuda_runtime
 
 import cutlass
 import cutlass.base_dsl.jit_executor
+from cutlass.base_dsl.cache_helpers import default_generated_ir_path
 from cutlass.cutlass_dsl import Constexpr, CuTeDSL, T, dsl_user_op
 
 from .typing import Numeric, Int8, Boolean
@@ -714,6 +724,545 @@ def _benchmark_for_autotune(
     return time_us
 
 
+# The DSL keeps per-compilation state on its singleton instance, so candidates are compiled
+# one at a time. The compile workers overlap compilation with benchmarking instead.
+_autotune_compile_lock = threading.Lock()
+
+
+def _get_autotune_compile_workers(compile_workers: Optional[int]) -> int:
+    """Number of threads compiling candidates ahead of benchmarking, 0 to compile inline."""
+    if compile_workers is None:
+        compile_workers = int(os.environ.get("CUTE_DSL_AUTOTUNE_COMPILE_WORKERS", 1))
+    return max(compile_workers, 0)
+
+
+def _compile_ahead(compile_fn: Callable, configs, compile_workers: int):
+    """Compiles configurations ahead of their consumer.
+
+    Yields a ``(config, compiled, error)`` tuple for each configuration, in order. With compile workers,
+    the next configurations are compiled in a thread pool while the caller benchmarks the current one.
+    At most ``compile_workers + 1`` compiled candidates are kept alive at any time.
+
+    :param compile_fn: Function compiling one configuration
+    :type compile_fn: Callable
+    :param configs: Iterable of configurations
+    :param compile_workers: Number of compile threads, 0 to compile inline
+    :type compile_workers: int
+    """
+    if compile_workers == 0:
+        for config in configs:
+            try:
+                yield config, compile_fn(config), None
+            except Exception as e:
+                yield config, None, e
+        return
+
+    # Compile workers need the CUDA context of the caller, if any, to load modules
+    err, context = cuda_driver.cuCtxGetCurrent()
+    if err != cuda_driver.CUresult.CUDA_SUCCESS:
+        context = None
+
+    def set_context():
+        if context is not None and int(context) != 0:
+            _cuda_success(cuda_driver.cuCtxSetCurrent(context), "Error on setting context")
+
+    configs = iter(configs)
+    pending = deque()
+    with ThreadPoolExecutor(
+        max_workers=compile_workers,
+        thread_name_prefix="cute_autotune_compile",
+        initializer=set_context,
+    ) as executor:
+
+        def submit_next():
+            for config in configs:
+                pending.append((config, executor.submit(compile_fn, config)))
+                return
+
+        try:
+            for _ in range(compile_workers + 1):
+                submit_next()
+            while pending:
+                config, future = pending.popleft()
+                try:
+                    compiled, error = future.result(), None
+                except Exception as e:
+                    compiled, error = None, e
+                yield config, compiled, error
+                submit_next()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def _get_stable_repr(value: Any) -> str:
+    """Representation of a value that is stable across processes.
+
+    Tensors are represented by their type, shape and dtype rather than by their content.
+    """
+    if isinstance(value, (tuple, list)):
+        return f"{type(value).__name__}({', '.join(_get_stable_repr(v) for v in value)})"
+    if hasattr(value, "shape") and hasattr(value, "dtype"):
+        return f"{type(value).__name__}(shape={tuple(value.shape)}, dtype={value.dtype})"
+    return repr(value)
+
+
+def _get_search_space_repr(params_dict, strategy, constraints) -> str:
+    """Representation of a search space, with the strategy and constraints exploring it."""
+    constraint_names = [getattr(c, "__qualname__", repr(c)) for c in constraints]
+    return f"{_get_stable_repr(params_dict)} {strategy!r} {constraint_names}"
+
+
+def _get_function_identity(func: Callable) -> str:
+    """Identity of a function in the tuning database.
+
+    It changes whenever the source of the function or of its module changes, so that edits to the helpers
+    and kernels the function calls in its module invalidate its entries too.
+    """
+    identity = f"{func.__module__}.{func.__qualname__}"
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        return identity
+    digest = hashlib.sha256(source.encode())
+    module = inspect.getmodule(func)
+    if module is not None:
+        try:
+            digest.update(inspect.getsource(module).encode())
+        except (OSError, TypeError):
+            pass
+    return f"{identity}:{digest.hexdigest()}"
+
+
+@functools.lru_cache(maxsize=None)
+def _get_device_name(device: int) -> str:
+    err, name = cuda_driver.cuDeviceGetName(256, cuda_driver.CUdevice(device))
+    _cuda_success(err, "Error on getting device name")
+    return name.split(b"\0", 1)[0].decode()
+
+
+def _get_device_fingerprint():
+    """Name of the current device and version of the CUDA toolkit and driver."""
+    err, device = cuda_runtime.cudaGetDevice()
+    _cuda_success(err, "Error on getting device")
+    err, runtime_version = cuda_runtime.cudaRuntimeGetVersion()
+    _cuda_success(err, "Error on getting runtime version")
+    err, driver_version = cuda_driver.cuDriverGetVersion()
+    _cuda_success(err, "Error on getting driver version")
+    return _get_device_name(int(device)), f"{runtime_version}/{driver_version}"
+
+
+class TuningDatabase:
+    """On-disk database of the best configurations found by ``autotune_jit``.
+
+    Entries are keyed by the identity and source of the tuned function and its module, its search space, the
+    tuning key, the device name and the CUDA toolkit version, so that a restarted process reuses them without
+    tuning again. Changes to functions called from other modules are not detected, call ``clear`` after them.
+    Configurations are stored by the ``repr`` of their values and resolved against the search space when loaded.
+
+    The database is stored at ``CUTE_DSL_AUTOTUNE_DB`` if set, otherwise in the cache directory.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize the tuning database.
+
+        :param path: Path of the database file, defaults to ``CUTE_DSL_AUTOTUNE_DB`` or ``autotune.db`` in the cache directory
+        :type path: str, optional
+        """
+        self.path = (
+            path
+            or os.environ.get("CUTE_DSL_AUTOTUNE_DB")
+            or os.path.join(default_generated_ir_path, "autotune.db")
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=60)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS tuning_results ("
+            "function TEXT, search_space TEXT, tuning_key TEXT, device TEXT, toolkit TEXT, "
+            "config TEXT, time_us REAL, "
+            "PRIMARY KEY (function, search_space, tuning_key, device, toolkit))"
+        )
+        return connection
+
+    def lookup(
+        self, function: str, search_space: str, tuning_key: str, device: str, toolkit: str
+    ) -> Optional[tuple]:
+        """Look up the best configuration of a function.
+
+        :return: The configuration, as a map from parameter name to the ``repr`` of its value, and its execution time in microseconds, or None.
+        :rtype: Optional[Tuple[Dict[str, str], float]]
+        """
+        with contextlib.closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT config, time_us FROM tuning_results WHERE function=? AND search_space=? "
+                "AND tuning_key=? AND device=? AND toolkit=?",
+                (function, search_space, tuning_key, device, toolkit),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def store(
+        self,
+        function: str,
+        search_space: str,
+        tuning_key: str,
+        device: str,
+        toolkit: str,
+        config: Dict[str, Any],
+        time_us: float,
+    ):
+        """Store the best configuration of a function, replacing any previous entry."""
+        config = json.dumps({name: repr(value) for name, value in config.items()})
+        with contextlib.closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO tuning_results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (function, search_space, tuning_key, device, toolkit, config, time_us),
+            )
+
+    def clear(self):
+        """Remove all entries."""
+        with contextlib.closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM tuning_results")
+
+    @staticmethod
+    def resolve_config(
+        stored_config: Dict[str, str], params_dict: Dict[str, List[Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Map a stored configuration back to values of the search space, or None if one is missing."""
+        config = {}
+        for name, values in params_dict.items():
+            for value in values:
+                if repr(value) == stored_config.get(name):
+                    config[name] = value
+                    break
+            else:
+                return None
+        return config
+
+
+class _TuningSession:
+    """Compiles and benchmarks configurations of a search space on behalf of a search strategy.
+
+    Configurations are identified by the tuple of the indices of their values in the search space. Each
+    configuration is compiled at most once, and configurations rejected by a constraint are never compiled.
+    Compilation of the next configurations overlaps with benchmarking, see ``_compile_ahead``.
+
+    The best configuration is the fastest one measured with the full number of iterations.
+    """
+
+    def __init__(
+        self,
+        params_dict: Dict[str, List[Any]],
+        compile_fn: Callable,
+        benchmark_fn: Callable,
+        warmup_iterations: int,
+        iterations: int,
+        compile_workers: int,
+        constraints: Optional[List[Callable[[Dict[str, Any]], bool]]] = None,
+    ):
+        """Initialize the tuning session.
+
+        :param params_dict: Dictionary containing parameter names and their possible values
+        :type params_dict: Dict[str, List[Any]]
+        :param compile_fn: Function compiling a configuration
+        :type compile_fn: Callable
+        :param benchmark_fn: Function ``(config, compiled, error, warmup_iterations, iterations)`` returning the
+            execution time of a configuration in microseconds, or raising to abort tuning
+        :type benchmark_fn: Callable
+        :param warmup_iterations: Number of warmup iterations
+        :type warmup_iterations: int
+        :param iterations: Number of benchmark iterations of a full measurement
+        :type iterations: int
+        :param compile_workers: Number of compile threads, 0 to compile inline
+        :type compile_workers: int
+        :param constraints: Predicates a configuration must satisfy to be compiled, defaults to None
+        :type constraints: List[Callable[[Dict[str, Any]], bool]], optional
+        """
+        self.names = list(params_dict.keys())
+        self.values = list(params_dict.values())
+        self.compile_fn = compile_fn
+        self.benchmark_fn = benchmark_fn
+        self.warmup_iterations = warmup_iterations
+        self.iterations = iterations
+        self.compile_workers = compile_workers
+        self.constraints = list(constraints or [])
+        # Execution time of the full measurements
+        self.times = {}
+        # Compiled configurations retained for further measurements
+        self.compiled = {}
+        self.num_compiled = 0
+        self.num_benchmarks = 0
+        # Tuple of execution time, index and compiled function of the best configuration
+        self.best = None
+
+    @property
+    def size(self) -> int:
+        """Number of configurations of the search space, including invalid ones."""
+        return math.prod(len(values) for values in self.values)
+
+    def config(self, index: tuple) -> Dict[str, Any]:
+        return {name: values[i] for name, values, i in zip(self.names, self.values, index)}
+
+    def index(self, config: Dict[str, Any]) -> Optional[tuple]:
+        """Index of a configuration, or None if one of its values is not in the search space."""
+        index = []
+        for name, values in zip(self.names, self.values):
+            matches = [i for i, value in enumerate(values) if value == config.get(name)]
+            if not matches:
+                return None
+            index.append(matches[0])
+        return tuple(index)
+
+    def is_valid(self, index: tuple) -> bool:
+        config = self.config(index)
+        return all(constraint(config) for constraint in self.constraints)
+
+    def valid_indices(self):
+        """Valid configurations in the order of the Cartesian product of the search space."""
+        for index in product(*(range(len(values)) for values in self.values)):
+            if self.is_valid(index):
+                yield index
+
+    def sample_indices(self, rng: random.Random):
+        """Valid configurations in random order, without repetition."""
+        size = self.size
+        seen = set()
+        while len(seen) < size:
+            flat = rng.randrange(size)
+            if flat in seen:
+                continue
+            seen.add(flat)
+            index = []
+            for values in reversed(self.values):
+                flat, i = divmod(flat, len(values))
+                index.append(i)
+            index = tuple(reversed(index))
+            if self.is_valid(index):
+                yield index
+
+    def neighbours(self, index: tuple, dim: int) -> List[tuple]:
+        """Valid configurations differing from `index` in the value of parameter `dim` only."""
+        neighbours = []
+        for i in range(len(self.values[dim])):
+            neighbour = index[:dim] + (i,) + index[dim + 1 :]
+            if i != index[dim] and self.is_valid(neighbour):
+                neighbours.append(neighbour)
+        return neighbours
+
+    def measure(self, indices, iterations: Optional[int] = None, retain: bool = False):
+        """Compile and benchmark configurations.
+
+        :param indices: Configurations to measure
+        :param iterations: Number of benchmark iterations, defaults to a full measurement
+        :type iterations: int, optional
+        :param retain: Whether to keep the compiled configurations for further measurements, defaults to False
+        :type retain: bool, optional
+        :return: The execution time of each configuration in microseconds
+        :rtype: List[float]
+        """
+        iterations = iterations or self.iterations
+        indices = list(dict.fromkeys(indices))
+        to_compile = [index for index in indices if index not in self.compiled]
+        self.num_compiled += len(to_compile)
+        compiled_stream = _compile_ahead(
+            lambda index: self.compile_fn(self.config(index)),
+            to_compile,
+            self.compile_workers,
+        )
+
+        times = []
+        for index in indices:
+            if index in self.compiled:
+                compiled, error = self.compiled[index], None
+            else:
+                _, compiled, error = next(compiled_stream)
+            cur_time = self.benchmark_fn(
+                self.config(index), compiled, error, self.warmup_iterations, iterations
+            )
+            self.num_benchmarks += 1
+            times.append(cur_time)
+            if retain and error is None:
+                self.compiled[index] = compiled
+            if iterations >= self.iterations:
+                self.times[index] = cur_time
+                if cur_time < (self.best[0] if self.best else float("inf")):
+                    self.best = (cur_time, index, compiled)
+        return times
+
+    def release(self, indices):
+        """Drop the compiled configurations retained by `measure`."""
+        for index in indices:
+            self.compiled.pop(index, None)
+
+    def remaining(self, budget: Optional[int]) -> float:
+        """Number of configurations that can still be compiled within `budget`."""
+        return float("inf") if budget is None else max(budget - self.num_compiled, 0)
+
+
+class SearchStrategy:
+    """Base class of the search strategies of ``autotune_jit`` and ``tune``.
+
+    A strategy decides which configurations of the search space are compiled and benchmarked. The budget of a
+    strategy is the maximum number of distinct configurations it compiles.
+    """
+
+    def search(self, session: _TuningSession):
+        """Measure configurations of the session. The best configuration is recorded by the session."""
+        raise NotImplementedError
+
+    def __repr__(self):
+        params = ", ".join(f"{k}={v!r}" for k, v in vars(self).items())
+        return f"{type(self).__name__}({params})"
+
+
+class ExhaustiveSearch(SearchStrategy):
+    """Measures every valid configuration of the search space."""
+
+    def search(self, session: _TuningSession):
+        session.measure(session.valid_indices())
+
+
+class RandomSearch(SearchStrategy):
+    """Measures valid configurations drawn at random, without repetition, until the budget is spent."""
+
+    def __init__(self, budget: int, seed: Optional[int] = None):
+        """
+        :param budget: Maximum number of configurations to compile
+        :type budget: int
+        :param seed: Seed of the random generator, defaults to None
+        :type seed: int, optional
+        """
+        self.budget = budget
+        self.seed = seed
+
+    def search(self, session: _TuningSession):
+        rng = random.Random(self.seed)
+        session.measure(islice(session.sample_indices(rng), self.budget))
+
+
+class SuccessiveHalving(SearchStrategy):
+    """Measures many configurations with few iterations, then the best ones with more iterations.
+
+    Each round keeps the fastest ``1 / eta`` of the candidates and multiplies the number of iterations by ``eta``,
+    until one candidate is left and measured with the full number of iterations. Candidates are drawn at random
+    when a budget is given, and are all valid configurations otherwise.
+    """
+
+    def __init__(
+        self,
+        budget: Optional[int] = None,
+        eta: int = 2,
+        min_iterations: int = 1,
+        seed: Optional[int] = None,
+    ):
+        """
+        :param budget: Maximum number of configurations to compile, defaults to all valid configurations
+        :type budget: int, optional
+        :param eta: Reduction factor of the candidates of each round, defaults to 2
+        :type eta: int, optional
+        :param min_iterations: Minimum number of iterations of a measurement, defaults to 1
+        :type min_iterations: int, optional
+        :param seed: Seed of the random generator, defaults to None
+        :type seed: int, optional
+        """
+        if eta < 2:
+            raise ValueError(f"eta must be at least 2, got {eta}")
+        self.budget = budget
+        self.eta = eta
+        self.min_iterations = min_iterations
+        self.seed = seed
+
+    def search(self, session: _TuningSession):
+        if self.budget is None:
+            candidates = list(session.valid_indices())
+        else:
+            rng = random.Random(self.seed)
+            candidates = list(islice(session.sample_indices(rng), self.budget))
+
+        num_rounds = 0
+        while self.eta**num_rounds < len(candidates):
+            num_rounds += 1
+        for round_idx in range(num_rounds):
+            iterations = max(
+                self.min_iterations,
+                session.iterations // self.eta ** (num_rounds - round_idx),
+            )
+            times = session.measure(candidates, iterations, retain=True)
+            ranked = [
+                index for _, _, index in sorted(zip(times, range(len(candidates)), candidates))
+            ]
+            num_survivors = -(-len(candidates) // self.eta)
+            session.release(ranked[num_survivors:])
+            candidates = ranked[:num_survivors]
+
+        session.measure(candidates)
+        session.release(candidates)
+
+
+class CoordinateDescent(SearchStrategy):
+    """Greedy neighbourhood search, changing the value of one parameter at a time.
+
+    Starting from ``start``, each step measures the configurations that differ from the current one in a single
+    parameter, and moves to the fastest one if it improves. The search stops when no single parameter change
+    improves, after ``max_rounds`` passes over the parameters, or when the budget is spent.
+    """
+
+    def __init__(
+        self,
+        budget: Optional[int] = None,
+        start: Optional[Dict[str, Any]] = None,
+        max_rounds: Optional[int] = None,
+    ):
+        """
+        :param budget: Maximum number of configurations to compile, defaults to unlimited
+        :type budget: int, optional
+        :param start: Starting configuration, defaults to the first valid configuration
+        :type start: Dict[str, Any], optional
+        :param max_rounds: Maximum number of passes over the parameters, defaults to unlimited
+        :type max_rounds: int, optional
+        """
+        self.budget = budget
+        self.start = start
+        self.max_rounds = max_rounds
+
+    def search(self, session: _TuningSession):
+        current = None
+        if self.start is not None:
+            current = session.index({**session.config((0,) * len(session.names)), **self.start})
+            if current is not None and not session.is_valid(current):
+                current = None
+        if current is None:
+            current = next(session.valid_indices(), None)
+        if current is None or session.remaining(self.budget) == 0:
+            return
+        (current_time,) = session.measure([current])
+
+        round_idx = 0
+        improved = True
+        while improved and (self.max_rounds is None or round_idx < self.max_rounds):
+            improved = False
+            round_idx += 1
+            for dim in range(len(session.names)):
+                neighbours = [
+                    index
+                    for index in session.neighbours(current, dim)
+                    if index not in session.times
+                ]
+                remaining = session.remaining(self.budget)
+                if remaining != float("inf"):
+                    neighbours = neighbours[: int(remaining)]
+                if not neighbours:
+                    continue
+                times = session.measure(neighbours)
+                best_time, best_index = min(zip(times, neighbours))
+                if best_time < current_time:
+                    current, current_time = best_index, best_time
+                    improved = True
+
+
 class autotune_jit:
     """Auto-tuning tool supporting both dictionary and parameterized decorator styles.
     The autotune_jit class can be used as a decorator or a function.
@@ -765,7 +1314,16 @@ class autotune_jit:
 
     @classmethod
     def _create_tuning_wrapper(
-        cls, func, warmup_iterations, iterations, autotune_update_params
+        cls,
+        func,
+        warmup_iterations,
+        iterations,
+        autotune_update_params,
+        compile_workers=None,
+        tuning_db=None,
+        benchmark_fn=None,
+        strategy=None,
+        constraints=None,
     ):
         """Create a wrapper function that performs auto-tuning
 
@@ -783,6 +1341,11 @@ class autotune_jit:
             func._autotune_update_params = autotune_update_params
             func._best_kernel = dict()
             func._best_config = dict()
+            func._compile_workers = compile_workers
+            func._tuning_db = tuning_db
+            func._benchmark_fn = benchmark_fn or _benchmark_for_autotune
+            func._strategy = strategy or ExhaustiveSearch()
+            func._constraints = list(constraints or [])
 
             # Create wrapper function for auto-tuning
             @functools.wraps(func)
@@ -805,29 +1368,48 @@ class autotune_jit:
 
                 # Get all parameter configurations
                 params_dict = func._autotune_params
-                keys = list(params_dict.keys())
-                values = list(params_dict.values())
 
-                min_time = float("inf")
-
-                best_kernel = None
-                # Record start time
-                start = time()
-
-                # Iterate through all possible configuration combinations
-                for config_values in product(*values):
-                    # Build current configuration
-                    current_config = dict(zip(keys, config_values))
+                def compile_config(current_config):
+                    # Call the original function, using current configuration to replace default parameters
+                    # For example, if current_config contains "cluster_shape_mn": (2, 1)
+                    # It will override func's default parameter value
+                    merged_kwargs = {**kwargs, **current_config}
+                    with _autotune_compile_lock:
+                        return cute.compile(func._original_func, *args, **merged_kwargs)
+
+                # Look up the best configuration found by a previous process
+                db_key = None
+                if func._tuning_db is not None:
+                    db_key = (
+                        _get_function_identity(func._original_func),
+                        _get_search_space_repr(
+                            params_dict, func._strategy, func._constraints
+                        ),
+                        _get_stable_repr(tuning_key),
+                        *_get_device_fingerprint(),
+                    )
+                    entry = func._tuning_db.lookup(*db_key)
+                    best_config = entry and TuningDatabase.resolve_config(
+                        entry[0], params_dict
+                    )
+                    if best_config:
+                        cls.logger.info(
+                            f"Using best configuration from tuning database: {best_config}, execution time: {entry[1]} us"
+                        )
+                        best_kernel = compile_config(best_config)
+                        func._best_kernel[tuning_key] = best_kernel
+                        func._best_config[tuning_key] = best_config
+                        return best_kernel(*args, **kwargs)
+
+                def benchmark_config(
+                    current_config, compiled_func, error, warmup_iterations, iterations
+                ):
                     cls.logger.info(f"Tuning configuration: {current_config}")
 
                     try:
-                        # Call the original function, using current configuration to replace default parameters
-                        # For example, if current_config contains "cluster_shape_mn": (2, 1)
-                        # It will override func's default parameter value
+                        if error is not None:
+                            raise error
                         merged_kwargs = {**kwargs, **current_config}
-                        compiled_func = cute.compile(
-                            func._original_func, *args, **merged_kwargs
-                        )
 
                         # Detect which constexpr arguments we need to remove from args and merged_kwargs
                         # This is done because after compiling our function signature will change, removing all constexpr arguments.
@@ -850,7 +1432,7 @@ class autotune_jit:
                             del args_no_constexpr[index]
 
                         # Benchmark the compiled function
-                        cur_time = _benchmark_for_autotune(
+                        cur_time = func._benchmark_fn(
                             compiled_func,
                             *args_no_constexpr,
                             warmup_iterations=warmup_iterations,
@@ -861,12 +1443,7 @@ class autotune_jit:
                         )
 
                         cls.logger.info(f"   Execution time: {cur_time} us")
-
-                        # Update best results
-                        if cur_time < min_time:
-                            min_time = cur_time
-                            best_kernel = compiled_func
-                            best_config = current_config
+                        return cur_time
 
                     except NotImplementedError as e:
                         cls.logger.info(
@@ -876,24 +1453,44 @@ class autotune_jit:
                     except (ValueError, TypeError) as e:
                         cls.logger.info(f"   Configuration parameter skipping: {e}")
                         raise e
-                        continue
                     except Exception as e:
                         cls.logger.info(f"   Execution error skipping: {e}")
                         raise e
-                        continue
+
+                # Record start time
+                start = time()
+
+                # Search the configurations chosen by the strategy, compiling the
+                # next configurations while the current one is benchmarked
+                session = _TuningSession(
+                    params_dict,
+                    compile_config,
+                    benchmark_config,
+                    warmup_iterations,
+                    iterations,
+                    _get_autotune_compile_workers(func._compile_workers),
+                    func._constraints,
+                )
+                func._strategy.search(session)
 
                 end = time()
                 tuning_time = end - start
 
-                if best_kernel is None:
+                if session.best is None:
                     raise ValueError("No best kernel found")
+                min_time, best_index, best_kernel = session.best
+                best_config = session.config(best_index)
 
                 cls.logger.info(
                     f"Best configuration: {best_config}, execution time: {min_time} us"
                 )
-                cls.logger.info(f"Total tuning time: {tuning_time} s")
+                cls.logger.info(
+                    f"Total tuning time: {tuning_time} s, compiled {session.num_compiled} of {session.size} configurations"
+                )
                 func._best_kernel[tuning_key] = best_kernel
                 func._best_config[tuning_key] = best_config
+                if db_key is not None:
+                    func._tuning_db.store(*db_key, best_config, min_time)
                 return best_kernel(*args, **kwargs)
 
             # Append autotune wrapper to not conflict with the jit kernel names
@@ -910,6 +1507,11 @@ class autotune_jit:
         update_on_change: List[str] = None,
         warmup_iterations=10,
         iterations=100,
+        compile_workers: Optional[int] = None,
+        tuning_db: Union["TuningDatabase", str, bool, None] = None,
+        benchmark_fn: Optional[Callable[..., float]] = None,
+        strategy: Optional[SearchStrategy] = None,
+        constraints: Optional[List[Callable[[Dict[str, Any]], bool]]] = None,
     ):
         """Initialize the autotune_jit decorator.
 
@@ -921,6 +1523,20 @@ class autotune_jit:
         :type warmup_iterations: int, optional
         :param iterations: Number of benchmark iterations, defaults to 100
         :type iterations: int, optional
+        :param compile_workers: Number of threads compiling configurations ahead of benchmarking, 0 to compile
+            inline, defaults to ``CUTE_DSL_AUTOTUNE_COMPILE_WORKERS`` or 1
+        :type compile_workers: int, optional
+        :param tuning_db: Database persisting the best configurations, or its path, or True for a ``TuningDatabase``
+            at its default path, defaults to a ``TuningDatabase`` if ``CUTE_DSL_AUTOTUNE_DB`` is set, otherwise none
+        :type tuning_db: Union[TuningDatabase, str, bool], optional
+        :param benchmark_fn: Function measuring a compiled configuration in microseconds, with the signature of
+            ``_benchmark_for_autotune``, defaults to timing with CUDA events
+        :type benchmark_fn: Callable[..., float], optional
+        :param strategy: Strategy choosing the configurations to measure, defaults to ``ExhaustiveSearch``
+        :type strategy: SearchStrategy, optional
+        :param constraints: Predicates taking a configuration dictionary, configurations for which one returns
+            False are not compiled, defaults to None
+        :type constraints: List[Callable[[Dict[str, Any]], bool]], optional
         """
         # Initialize logger
         self._initialize_logger()
@@ -933,6 +1549,19 @@ class autotune_jit:
         self.warmup_iterations = warmup_iterations
         self.iterations = iterations
 
+        # Save compilation, persistence and benchmarking settings
+        self.compile_workers = compile_workers
+        if tuning_db is None:
+            tuning_db = bool(os.environ.get("CUTE_DSL_AUTOTUNE_DB"))
+        if tuning_db is True:
+            tuning_db = TuningDatabase()
+        elif isinstance(tuning_db, str):
+            tuning_db = TuningDatabase(tuning_db)
+        self.tuning_db = tuning_db or None
+        self.benchmark_fn = benchmark_fn
+        self.strategy = strategy
+        self.constraints = constraints
+
     def __call__(self, func):
         """Called when class instance is used as a decorator.
 
@@ -943,7 +1572,15 @@ class autotune_jit:
         """
         # Create wrapper function
         decorated_func = self._create_tuning_wrapper(
-            func, self.warmup_iterations, self.iterations, self.update_on_change
+            func,
+            self.warmup_iterations,
+            self.iterations,
+            self.update_on_change,
+            self.compile_workers,
+            self.tuning_db,
+            self.benchmark_fn,
+            self.strategy,
+            self.constraints,
         )
 
         # Use the wrapper if it exists, otherwise use the original function
@@ -965,6 +1602,10 @@ def tune(
     warmup_iterations=10,
     iterations=100,
     stream: Optional[cuda_driver.CUstream] = None,
+    compile_workers: Optional[int] = None,
+    benchmark_fn: Optional[Callable[..., float]] = None,
+    strategy: Optional[SearchStrategy] = None,
+    constraints: Optional[List[Callable[[Dict[str, Any]], bool]]] = None,
 ) -> Dict[str, Any]:
     """Tuning tool to suport arbitrary functions. The user must provide a function that returns a callable, which
     takes no arguments to be tuned over.
@@ -990,6 +1631,17 @@ def tune(
     :type iterations: int, optional
     :param stream: Stream kernel is launched in, defaults to CUDA stream default
     :type stream: CUstream, None
+    :param compile_workers: Number of threads calling `func` on configurations ahead of benchmarking, 0 to call
+        it inline, defaults to ``CUTE_DSL_AUTOTUNE_COMPILE_WORKERS`` or 1
+    :type compile_workers: int, optional
+    :param benchmark_fn: Function measuring a callable in microseconds, with the signature of
+        ``_benchmark_for_autotune``, defaults to timing with CUDA events
+    :type benchmark_fn: Callable[..., float], optional
+    :param strategy: Strategy choosing the configurations to measure, defaults to ``ExhaustiveSearch``
+    :type strategy: SearchStrategy, optional
+    :param constraints: Predicates taking a configuration dictionary, configurations for which one returns
+        False are not compiled, defaults to None
+    :type constraints: List[Callable[[Dict[str, Any]], bool]], optional
     :return: Best configuration
     :rtype: Dict[str, Any]
     """
@@ -1009,29 +1661,23 @@ def tune(
 
     if stream is None:
         stream = cuda_driver.CUstream(cuda_driver.CUstream_flags.CU_STREAM_DEFAULT)
+    benchmark_fn = benchmark_fn or _benchmark_for_autotune
 
-    # Get all parameter configurations
-    keys = list(params_dict.keys())
-    values = list(params_dict.values())
-
-    min_time = float("inf")
-
-    best_config = None
-    # Record start time
-    start = time()
+    def compile_config(current_config):
+        merged_kwargs = {**kernel_arguments.kwargs, **current_config}
+        with _autotune_compile_lock:
+            return func(*kernel_arguments.args, **merged_kwargs)
 
-    # Iterate through all possible configuration combinations
-    for config_values in product(*values):
-        # Build current configuration
-        current_config = dict(zip(keys, config_values))
+    def benchmark_config(
+        current_config, compiled_func, error, warmup_iterations, iterations
+    ):
         logger.info(f"Tuning configuration: {current_config}")
 
         try:
-            merged_kwargs = {**kernel_arguments.kwargs, **current_config}
-
-            compiled_func = func(*kernel_arguments.args, **merged_kwargs)
+            if error is not None:
+                raise error
             # Benchmark the compiled function
-            cur_time = _benchmark_for_autotune(
+            cur_time = benchmark_fn(
                 compiled_func,
                 warmup_iterations=warmup_iterations,
                 iterations=iterations,
@@ -1041,30 +1687,46 @@ def tune(
             )
 
             logger.info(f"   Execution time: {cur_time} us")
-
-            # Update best results
-            if cur_time < min_time:
-                min_time = cur_time
-                best_config = current_config
+            return cur_time
 
         except NotImplementedError as e:
             logger.info(f"   Encountered unimplemented error, abort execution: {e}")
             raise e
         except (ValueError, TypeError, CantImplementError) as e:
             logger.info(f"   Configuration parameter skipping: {e}")
-            continue
+            return float("inf")
         except Exception as e:
             logger.info(f"   Execution error skipping: {e}")
-            continue
+            return float("inf")
+
+    # Record start time
+    start = time()
+
+    # Search the configurations chosen by the strategy, compiling the
+    # next configurations while the current one is benchmarked
+    session = _TuningSession(
+        params_dict,
+        compile_config,
+        benchmark_config,
+        warmup_iterations,
+        iterations,
+        _get_autotune_compile_workers(compile_workers),
+        constraints,
+    )
+    (strategy or ExhaustiveSearch()).search(session)
 
     end = time()
     tuning_time = end - start
 
-    if best_config is None:
+    if session.best is None:
         raise ValueError("No best kernel found")
+    min_time, best_index, _ = session.best
+    best_config = session.config(best_index)
 
     logger.info(f"Best configuration: {best_config}, execution time: {min_time} us")
-    logger.info(f"Total tuning time: {tuning_time} s")
+    logger.info(
+        f"Total tuning time: {tuning_time} s, compiled {session.num_compiled} of {session.size} configurations"
+    )
     return best_config
 
 
@@ -13,7 +13,7 @@ from inspect import signature
 from itertools import chain
 from typing import Any, Callable, Union, Tuple, List, Iterable
 
-from cutlass.cutlass_dsl import is_dynamic_expression, dsl_user_op
+from cutlass.cutlass_dsl import is_dynamic_expression, dsl_user_op, lru_cache_static
 from cutlass._mlir import ir
 import cutlass._mlir.dialects.cute as _cute_ir
 
@@ -87,6 +87,7 @@ def unflatten(
     return transform_leaf(lambda _: next(xs), profile)
 
 
+@lru_cache_static()
 @dsl_user_op
 def product(a: Union[IntTuple, Shape], *, loc=None, ip=None):
     # Local import to avoid circular dependency
@@ -150,6 +151,7 @@ def product_like(a: IntTuple, target_profile: XTuple, *, loc=None, ip=None) -> I
     return tuple(product_like(x, g, loc=loc, ip=ip) for x, g in zip(a, target_profile))
 
 
+@lru_cache_static()
 @dsl_user_op
 def product_each(a: IntTuple, *, loc=None, ip=None) -> IntTuple:
     from .core import _pack_int_tuple, _unpack_x_tuple
@@ -31,7 +31,6 @@ import functools
 import pkgutil
 from dataclasses import is_dataclass, fields
 from math import ceil
-from itertools import chain
 from pathlib import Path
 from collections.abc import Sequence
 import builtins
@@ -171,44 +170,63 @@ def _build_kernel_attrs(config) -> dict:
     return kernel_attrs
 
 
+# Per-type c-pointer extraction functions, see _make_c_pointers_plan
+_c_pointers_plans = {}
+
+
 def _get_c_pointers_cutlass(obj):
     """
-    This is an extended version of `get_c_pointers` that supports dataclasses, SimpleNamespace, and dict.
+    This is an extended version of `get_c_pointers` that supports dataclasses, SimpleNamespace, dict and namedtuple.
+    """
+    plan = _c_pointers_plans.get(type(obj))
+    if plan is None:
+        plan = _make_c_pointers_plan(obj)
+        _c_pointers_plans[type(obj)] = plan
+    return plan(obj)
+
+
+def _c_pointers_of_values(values):
+    c_pointers = []
+    for x in values:
+        c_pointers.extend(_get_c_pointers_cutlass(x))
+    return c_pointers
+
+
+def _c_pointers_of_adapted(obj):
+    # Adapters may be registered after the first lookup, so look them up on each call
+    adapter = JitArgAdapterRegistry.get_registered_adapter(type(obj))
+    if adapter is not None:
+        return _get_c_pointers_cutlass(adapter(obj))
+    return []
+
+
+def _c_pointers_of_set(obj):
+    raise DSLRuntimeError(
+        "Sets are not supported in get_c_pointers to ensure order preservation",
+        context="The DSL attempted to generate JIT function argument(s) for an argument of type set but failed.",
+        suggestion="Consider using a list or tuple instead",
+    )
+
+
+def _make_c_pointers_plan(obj):
+    """
+    Build, once per type, the function extracting the c pointers of objects of the type of obj.
     """
     if hasattr(obj, "__c_pointers__"):
-        return obj.__c_pointers__()
+        return lambda obj: obj.__c_pointers__()
     elif isinstance(obj, (tuple, list)):
-        return list(chain.from_iterable(_get_c_pointers_cutlass(x) for x in obj))
+        return _c_pointers_of_values
     elif isinstance(obj, SimpleNamespace):
-        return list(
-            chain.from_iterable(
-                _get_c_pointers_cutlass(x) for x in obj.__dict__.values()
-            )
-        )
+        return lambda obj: _c_pointers_of_values(obj.__dict__.values())
     elif isinstance(obj, dict):
-        return list(
-            chain.from_iterable(_get_c_pointers_cutlass(x) for x in obj.values())
-        )
+        return lambda obj: _c_pointers_of_values(obj.values())
     elif is_dataclass(obj):
-        return list(
-            chain.from_iterable(
-                _get_c_pointers_cutlass(getattr(obj, f.name))
-                for f in fields(obj)
-                if not is_constexpr_field(f)
-            )
-        )
+        names = [f.name for f in fields(obj) if not is_constexpr_field(f)]
+        return lambda obj: _c_pointers_of_values(getattr(obj, name) for name in names)
     elif isinstance(obj, set):
-        raise DSLRuntimeError(
-            "Sets are not supported in get_c_pointers to ensure order preservation",
-            context="The DSL attempted to generate JIT function argument(s) for an argument of type set but failed.",
-            suggestion="Consider using a list or tuple instead",
-        )
+        return _c_pointers_of_set
     else:
-        # Try get adapter
-        adapter = JitArgAdapterRegistry.get_registered_adapter(type(obj))
-        if adapter is not None:
-            return _get_c_pointers_cutlass(adapter(obj))
-    return []
+        return _c_pointers_of_adapted
 
 
 class CutlassBaseDSL(BaseDSL):
@@ -180,7 +180,37 @@ class Leaf:
 # =============================================================================
 
 
-def extract_dataclass_members(x: Any) -> tuple[list[str], list[Any]]:
+# Per-class (field names, dynamic field names, constexpr field names) of dataclasses
+_dataclass_plans: dict[type, tuple[frozenset, list[str], list[str]]] = {}
+
+
+def get_dataclass_plan(cls: type) -> tuple[frozenset, list[str], list[str]]:
+    """
+    Get the fields of a dataclass type, split into dynamic and constexpr fields.
+
+    The result is computed once per class and shared, it must not be modified.
+
+    Args:
+        cls: A dataclass type
+
+    Returns:
+        tuple: (all_fields, fields, constexpr_fields) where all_fields is the set of
+               all field names, and fields and constexpr_fields list the names of the
+               non-constexpr and constexpr fields in declaration order
+    """
+    plan = _dataclass_plans.get(cls)
+    if plan is None:
+        all_fields = dataclasses.fields(cls)
+        plan = (
+            frozenset(field.name for field in all_fields),
+            [field.name for field in all_fields if not is_constexpr_field(field)],
+            [field.name for field in all_fields if is_constexpr_field(field)],
+        )
+        _dataclass_plans[cls] = plan
+    return plan
+
+
+def extract_dataclass_members(x: Any) -> tuple[list[str], list[Any], list[str]]:
     """
     Extract non-method, non-function attributes from a dataclass instance.
 
@@ -188,38 +218,28 @@ def extract_dataclass_members(x: Any) -> tuple[list[str], list[Any]]:
         x: A dataclass instance
 
     Returns:
-        tuple: (field_names, field_values) lists
+        tuple: (field_names, field_values, constexpr_field_names) lists
     """
-    fields = [field.name for field in dataclasses.fields(x)]
+    all_fields, fields, constexpr_fields = get_dataclass_plan(type(x))
 
     # If the dataclass has extra fields, raise an error
     for k in x.__dict__.keys():
-        if k not in fields:
+        if k not in all_fields:
             raise DSLTreeFlattenError(
                 f"`{x}` has extra field `{k}`",
                 type_str=get_fully_qualified_class_name(x),
             )
 
-    if not fields:
-        return [], []
-
-    # record constexpr fields
-    members = []
-    constexpr_fields = []
-    for field in dataclasses.fields(x):
-        if is_constexpr_field(field):
-            constexpr_fields.append(field.name)
-            fields.remove(field.name)
-            v = getattr(x, field.name)
-            if is_dynamic_expression(v):
-                raise DSLTreeFlattenError(
-                    f"`{x}` has dynamic expression field `{field.name}` with a Constexpr type annotation `{field.type}`",
-                    type_str=get_fully_qualified_class_name(x),
-                )
-        else:
-            members.append(getattr(x, field.name))
+    # constexpr fields are recorded, but not extracted
+    for name in constexpr_fields:
+        if is_dynamic_expression(getattr(x, name)):
+            field = next(f for f in dataclasses.fields(x) if f.name == name)
+            raise DSLTreeFlattenError(
+                f"`{x}` has dynamic expression field `{name}` with a Constexpr type annotation `{field.type}`",
+                type_str=get_fully_qualified_class_name(x),
+            )
 
-    return fields, members, constexpr_fields
+    return fields, [getattr(x, name) for name in fields], constexpr_fields
 
 
 def default_dataclass_to_iterable(x: Any) -> tuple[SimpleNamespace, list[Any]]:
@@ -373,12 +393,44 @@ def default_dict_from_iterable(
     return instance
 
 
+def default_namedtuple_to_iterable(x: Any) -> tuple[SimpleNamespace, list[Any]]:
+    """
+    Convert a namedtuple to iterable form.
+    """
+    return (
+        SimpleNamespace(
+            type_str=get_fully_qualified_class_name(x),
+            original_obj=x,
+            fields=list(x._fields),
+        ),
+        list(x),
+    )
+
+
+def default_namedtuple_from_iterable(
+    metadata: SimpleNamespace, children: Iterable[Any]
+) -> Any:
+    """
+    Reconstruct a namedtuple from iterable form.
+    """
+    return type(metadata.original_obj)._make(children)
+
+
 # =============================================================================
 # Register pytree nodes
 # =============================================================================
 
 _node_types: dict[type, NodeType] = {}
 
+# Per-type flatten functions, see _make_flatten_plan
+_flatten_plans: dict[type, Callable] = {}
+
+# Canonical leaves and tree definitions of structures without per-object metadata,
+# keyed by structure, so that an unchanged structure yields the same PyTreeDef
+_leaf_cache: dict[tuple, "Leaf"] = {}
+_treedef_cache: dict[tuple, "PyTreeDef"] = {}
+_STRUCTURE_CACHE_SIZE = 4096
+
 
 def register_pytree_node(ty: type, to_iter: Callable, from_iter: Callable) -> NodeType:
     """
@@ -394,6 +446,9 @@ def register_pytree_node(ty: type, to_iter: Callable, from_iter: Callable) -> No
     """
     nt = NodeType(str(ty), to_iter, from_iter)
     _node_types[ty] = nt
+    # Plans and cached tree definitions may refer to the previous node type
+    _flatten_plans.clear()
+    _treedef_cache.clear()
     return nt
 
 
@@ -425,6 +480,13 @@ def register_default_node_types() -> None:
     for ty, to_iter, from_iter in default_registrations:
         register_pytree_node(ty, to_iter, from_iter)
 
+    _sequence_node_types.clear()
+    _sequence_node_types.update((ty, _node_types[ty]) for ty in (tuple, list))
+
+
+# Node types of tuple and list whose metadata only holds the length
+_sequence_node_types: dict[type, NodeType] = {}
+
 
 # Initialize default registrations
 register_default_node_types()
@@ -512,8 +574,9 @@ def tree_flatten(x: Any) -> tuple[list[Any], PyTreeDef]:
         >>> tree_flatten([1, [2, 3], 4])
         ([1, 2, 3, 4], PyTreeDef(...))
     """
-    children_iter, treedef = _tree_flatten(x)
-    return list(children_iter), treedef
+    flat_values = []
+    treedef, _ = _flatten_into(x, flat_values)
+    return flat_values, treedef
 
 
 def get_registered_node_types_or_insert(x: Any) -> Union[NodeType, None]:
@@ -524,6 +587,7 @@ def get_registered_node_types_or_insert(x: Any) -> Union[NodeType, None]:
     If not, it automatically registers the type based on its characteristics:
     - Dynamic expressions get registered with dynamic expression handlers
     - Dataclasses get registered with default dataclass handlers
+    - Namedtuples get registered with default namedtuple handlers
 
     Args:
         x: The object to get or register a node type for
@@ -544,6 +608,10 @@ def get_registered_node_types_or_insert(x: Any) -> Union[NodeType, None]:
         return register_pytree_node(
             type(x), default_dataclass_to_iterable, default_dataclass_from_iterable
         )
+    elif isinstance(x, tuple) and hasattr(type(x), "_fields"):
+        return register_pytree_node(
+            type(x), default_namedtuple_to_iterable, default_namedtuple_from_iterable
+        )
     else:
         return None
 
@@ -580,10 +648,6 @@ def _tree_flatten(x: Any) -> tuple[Iterable[Any], Union[PyTreeDef, Leaf]]:
     """
     Internal function to flatten a tree structure.
 
-    This is the core implementation of tree flattening that handles different
-    types of objects including None, ArithValue, ir.Value, Numeric types,
-    and registered pytree node types.
-
     Args:
         x: The object to flatten
 
@@ -594,52 +658,129 @@ def _tree_flatten(x: Any) -> tuple[Iterable[Any], Union[PyTreeDef, Leaf]]:
     Raises:
         DSLTreeFlattenError: If the object type is not supported
     """
-    if x is None:
-        return [], create_leaf_for_value(x, is_none=True)
+    return tree_flatten(x)
 
-    elif isinstance(x, ArithValue) and is_dynamic_expression(x):
-        v = x.__extract_mlir_values__()
-        return v, create_leaf_for_value(
-            x,
-            node_metadata=SimpleNamespace(is_dynamic_expression=1, original_obj=x),
-            ir_type_str=str(v[0].type),
-        )
 
-    elif isinstance(x, ArithValue):
-        return [x], create_leaf_for_value(x, is_numeric=True)
+def _flatten_into(x: Any, out: list[Any]) -> tuple[Union[PyTreeDef, Leaf], Any]:
+    """
+    Append the flattened values of x to out, using the flatten plan of its type.
 
-    elif isinstance(x, ir.Value):
-        return [x], create_leaf_for_value(x)
+    Returns:
+        tuple: (treedef, key) where key identifies the structure of treedef, or is
+               None when treedef holds per-object metadata
+    """
+    plan = _flatten_plans.get(type(x))
+    if plan is None:
+        plan = _make_flatten_plan(x)
+        _flatten_plans[type(x)] = plan
+    return plan(x, out)
+
+
+def _make_flatten_plan(x: Any) -> Callable:
+    """
+    Build the flatten function of the type of x.
 
+    This selects, once per type, how objects are flattened, handling None,
+    ArithValue, ir.Value, Numeric types, and registered pytree node types.
+    Types that are none of these are converted to numeric values on each call.
+    """
+    if x is None:
+        return _flatten_none
+    elif isinstance(x, ArithValue) and is_dynamic_expression(x):
+        return _flatten_dynamic_leaf
+    elif isinstance(x, ArithValue):
+        return _flatten_arith_value
+    elif isinstance(x, ir.Value):
+        return _flatten_ir_value
     elif isinstance(x, Numeric):
-        v = x.__extract_mlir_values__()
-        return v, create_leaf_for_value(
-            x,
-            node_metadata=SimpleNamespace(is_dynamic_expression=1, original_obj=x),
-            ir_type_str=str(v[0].type),
-        )
+        return _flatten_dynamic_leaf
 
+    node_type = get_registered_node_types_or_insert(x)
+    if node_type is None:
+        return _flatten_as_numeric
+    elif _sequence_node_types.get(type(x)) is node_type:
+        return lambda x, out: _flatten_sequence(node_type, x, out)
     else:
-        node_type = get_registered_node_types_or_insert(x)
-        if node_type:
-            node_metadata, children = node_type.to_iterable(x)
-            if children is None:
-                # Flatten should not return None, it should return an empty list for real empty cases
-                raise DSLTreeFlattenError(
-                    "Flatten Error: children is None", get_fully_qualified_class_name(x)
-                )
-            children_flat, child_trees = unzip2(map(_tree_flatten, children))
-            flattened = it.chain.from_iterable(children_flat)
-            return flattened, PyTreeDef(node_type, node_metadata, tuple(child_trees))
-
-        # Try to convert to numeric
-        try:
-            nval = as_numeric(x).ir_value()
-            return [nval], create_leaf_for_value(nval, is_numeric=True)
-        except Exception:
-            raise DSLTreeFlattenError(
-                "Flatten Error", get_fully_qualified_class_name(x)
-            )
+        return lambda x, out: _flatten_node(node_type, x, out)
+
+
+def _static_leaf(is_numeric: bool, ir_type_str: str) -> tuple[Leaf, Leaf]:
+    """Get the canonical leaf without metadata, which is also its structure key."""
+    key = (is_numeric, ir_type_str)
+    leaf = _leaf_cache.get(key)
+    if leaf is None:
+        if len(_leaf_cache) >= _STRUCTURE_CACHE_SIZE:
+            _leaf_cache.clear()
+        leaf = _leaf_cache[key] = Leaf(is_numeric=is_numeric, ir_type_str=ir_type_str)
+    return leaf, leaf
+
+
+_none_leaf = Leaf(is_none=True)
+
+
+def _flatten_none(x: None, out: list[Any]) -> tuple[Leaf, Leaf]:
+    return _none_leaf, _none_leaf
+
+
+def _flatten_arith_value(x: ArithValue, out: list[Any]) -> tuple[Leaf, Leaf]:
+    out.append(x)
+    return _static_leaf(True, str(x.type))
+
+
+def _flatten_ir_value(x: ir.Value, out: list[Any]) -> tuple[Leaf, Leaf]:
+    out.append(x)
+    return _static_leaf(False, str(x.type))
+
+
+def _flatten_dynamic_leaf(x: Any, out: list[Any]) -> tuple[Leaf, None]:
+    v = x.__extract_mlir_values__()
+    out.extend(v)
+    leaf = create_leaf_for_value(
+        x,
+        node_metadata=SimpleNamespace(is_dynamic_expression=1, original_obj=x),
+        ir_type_str=str(v[0].type),
+    )
+    return leaf, None
+
+
+def _flatten_as_numeric(x: Any, out: list[Any]) -> tuple[Leaf, Leaf]:
+    # Try to convert to numeric
+    try:
+        nval = as_numeric(x).ir_value()
+    except Exception:
+        raise DSLTreeFlattenError("Flatten Error", get_fully_qualified_class_name(x))
+    out.append(nval)
+    return _static_leaf(True, str(nval.type))
+
+
+def _flatten_node(node_type: NodeType, x: Any, out: list[Any]) -> tuple[PyTreeDef, None]:
+    node_metadata, children = node_type.to_iterable(x)
+    if children is None:
+        # Flatten should not return None, it should return an empty list for real empty cases
+        raise DSLTreeFlattenError(
+            "Flatten Error: children is None", get_fully_qualified_class_name(x)
+        )
+    child_trees = tuple(_flatten_into(child, out)[0] for child in children)
+    return PyTreeDef(node_type, node_metadata, child_trees), None
+
+
+def _flatten_sequence(
+    node_type: NodeType, x: Union[tuple, list], out: list[Any]
+) -> tuple[PyTreeDef, Any]:
+    child_trees, child_keys = unzip2(_flatten_into(child, out) for child in x)
+    if any(key is None for key in child_keys):
+        return PyTreeDef(node_type, SimpleNamespace(length=len(x)), tuple(child_trees)), None
+
+    # Reuse the tree definition of an identical structure
+    key = (node_type, tuple(child_keys))
+    treedef = _treedef_cache.get(key)
+    if treedef is None:
+        if len(_treedef_cache) >= _STRUCTURE_CACHE_SIZE:
+            _treedef_cache.clear()
+        treedef = _treedef_cache[key] = PyTreeDef(
+            node_type, SimpleNamespace(length=len(x)), tuple(child_trees)
+        )
+    return treedef, key
 
 
 def tree_unflatten(treedef: PyTreeDef, xs: list[Any]) -> Any:
@@ -680,12 +821,12 @@ def _tree_unflatten(treedef: Union[PyTreeDef, Leaf], xs: Iterator[Any]) -> Any:
         The reconstructed object
     """
     if isinstance(treedef, Leaf):
-        if getattr(treedef, "is_none", False):
+        if treedef.is_none:
             return None
-        metadata = getattr(treedef, "node_metadata", None)
-        if metadata and getattr(metadata, "is_dynamic_expression", False):
+        metadata = treedef.node_metadata
+        if metadata is not None and getattr(metadata, "is_dynamic_expression", False):
             return metadata.original_obj.__new_from_mlir_values__([next(xs)])
-        if getattr(treedef, "is_numeric", False):
+        if treedef.is_numeric:
             return as_numeric(next(xs))
         return next(xs)
     elif isinstance(treedef, PyTreeDef):
@@ -707,7 +848,9 @@ def _check_tree_equal(lhs: Union[PyTreeDef, Leaf], rhs: Union[PyTreeDef, Leaf])
     Returns:
         bool: True if the trees are structurally equal, False otherwise
     """
-    if isinstance(lhs, Leaf) and isinstance(rhs, Leaf):
+    if lhs is rhs:
+        return True
+    elif isinstance(lhs, Leaf) and isinstance(rhs, Leaf):
         return lhs.is_none == rhs.is_none and lhs.ir_type_str == rhs.ir_type_str
     elif isinstance(lhs, PyTreeDef) and isinstance(rhs, PyTreeDef):
         lhs_metadata = lhs.node_metadata
@@ -30,12 +30,20 @@
 #
 #################################################################################################
 
+import contextlib
 import ctypes
+import functools
+import hashlib
 import json
 import os
+import socket
 import sqlite3
 import subprocess
 import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 from cutlass_cppgen.utils.lazy_import import lazy_import
 cuda = lazy_import("cuda.cuda")
@@ -124,33 +132,336 @@ def convertToBinaryData(filename):
 
 
 def CDLLBin(host_binary):
-    tempfile.tempdir = "./"
-    temp_so = tempfile.NamedTemporaryFile(prefix="host_func", suffix=".so", delete=True)
+    temp_so = tempfile.NamedTemporaryFile(prefix="host_func", suffix=".so", dir="./", delete=True)
     with open(temp_so.name, "wb") as file:
         file.write(host_binary)
     host_lib = ctypes.CDLL(temp_so.name)
     return host_lib
 
 
+# Version of the cache layout, stored as the SQLite user_version
+CACHE_SCHEMA_VERSION = 2
+
+# Length of a hashed operation key (hex digest of SHA-256)
+OPERATION_KEY_LENGTH = 64
+
+
+@functools.lru_cache(maxsize=None)
+def include_tree_fingerprint(include_paths: tuple) -> str:
+    """
+    Returns a digest of the contents of every file under ``include_paths``
+
+    The result is memoized for the lifetime of the process, as headers are not expected to change
+    while kernels are being compiled.
+
+    :param include_paths: directories to fingerprint. Those that do not exist are skipped.
+    :type include_paths: tuple
+
+    :return: hex digest
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    for include_path in include_paths:
+        if not os.path.isdir(include_path):
+            continue
+        for root, dirs, files in os.walk(include_path):
+            dirs.sort()
+            for file in sorted(files):
+                path = os.path.join(root, file)
+                digest.update(os.path.relpath(path, include_path).encode())
+                with open(path, "rb") as f:
+                    digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def operation_cache_key(source: str, backend: str, compile_options, host_compile_options) -> str:
+    """
+    Returns the content-addressed cache key of an operation
+
+    The key covers the emitted source, the backend, the device and host compilation options
+    (which include the target architecture), the contents of the CUTLASS include trees and the
+    toolkit version. The CUDA include directory is represented by the toolkit version rather
+    than by its contents.
+
+    :param source: emitted source of the operation, including its procedural name
+    :type source: str
+    :param backend: compiler backend ("nvcc" or "nvrtc")
+    :type backend: str
+    :param compile_options: options used for the device compilation
+    :type compile_options: CompilationOptions
+    :param host_compile_options: options used for the host compilation
+    :type host_compile_options: CompilationOptions
+
+    :return: hex digest of length ``OPERATION_KEY_LENGTH``
+    :rtype: str
+    """
+    cuda_include = cuda_install_path() + "/include"
+    include_paths = tuple(
+        path for path in compile_options.include_paths + host_compile_options.include_paths
+        if path != cuda_include
+    )
+    digest = hashlib.sha256()
+    for part in [
+        source,
+        backend,
+        compile_options.get_str(),
+        host_compile_options.get_str(),
+        include_tree_fingerprint(include_paths),
+        cutlass_cppgen.nvcc_version(),
+        str(compile_options.arch),
+    ]:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class CompiledOperationCache:
+    """
+    SQLite-backed store of compiled operations that can be shared by several processes.
+
+    Each thread of each process keeps one pooled connection to the database, which is opened
+    in WAL mode so that readers never block on a writer. Compilation of an operation is
+    coordinated through a lease table: the first process to lease an ``op_key`` compiles it,
+    while the others wait for the result to be published. Results are published and leases
+    released in a single transaction, so a reader either sees a complete row or nothing.
+
+    Leases expire after ``lease_timeout`` seconds so that a crashed process cannot block others
+    indefinitely. Should a lease expire while its owner is still compiling, the operation may be
+    compiled twice; the first published result wins.
+
+    :param path: path to the SQLite database
+    :type path: str
+    :param busy_timeout: seconds to wait on a locked database before raising
+    :type busy_timeout: float
+    :param lease_timeout: seconds after which a compile lease may be taken over by another process
+    :type lease_timeout: float
+    :param poll_interval: seconds between checks while waiting for another process to publish
+    :type poll_interval: float
+    """
+
+    LEASE_ACQUIRED = "acquired"
+    LEASE_BUSY = "busy"
+    COMPILED = "compiled"
+
+    def __init__(self, path: str = CACHE_FILE, busy_timeout: float = None,
+                 lease_timeout: float = None, poll_interval: float = 0.05) -> None:
+        self.path = path
+        if busy_timeout is None:
+            busy_timeout = float(os.getenv("CUTLASS_CACHE_BUSY_TIMEOUT", 60))
+        if lease_timeout is None:
+            lease_timeout = float(os.getenv("CUTLASS_CACHE_LEASE_TIMEOUT", 900))
+        self.busy_timeout = busy_timeout
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+        self._local = threading.local()
+
+        with self._transaction() as cursor:
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS compiled_operations(op_key TEXT NOT NULL UNIQUE,
+                                                            cubin BLOB NOT NULL,
+                                                            hostbin BLOB NOT NULL,
+                                                            op_name TEXT NOT NULL,
+                                                            op_attrs TEXT NOT NULL)
+            """)
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS compile_leases(op_key TEXT NOT NULL PRIMARY KEY,
+                                                      owner TEXT NOT NULL,
+                                                      expires REAL NOT NULL)
+            """)
+            # Caches written before keys were hashed hold the full emitted source as op_key. Those
+            # rows are re-keyed on first use by adopt_legacy(), after which the version is bumped.
+            cursor.execute("PRAGMA user_version")
+            version = cursor.fetchone()[0]
+            self._has_legacy_keys = False
+            if version < CACHE_SCHEMA_VERSION:
+                cursor.execute("SELECT COUNT(*) FROM compiled_operations WHERE length(op_key) != ?",
+                               (OPERATION_KEY_LENGTH,))
+                self._has_legacy_keys = cursor.fetchone()[0] > 0
+                if not self._has_legacy_keys:
+                    cursor.execute(f"PRAGMA user_version = {CACHE_SCHEMA_VERSION}")
+
+    @property
+    def owner(self) -> str:
+        """
+        Identifier of the lease holder for the calling thread
+        """
+        return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}:{self._local_state().token}"
+
+    def _local_state(self):
+        # Connections must not cross a fork, so the pool is keyed on the process id as well
+        state = self._local
+        if getattr(state, "pid", None) != os.getpid():
+            state.pid = os.getpid()
+            state.token = uuid.uuid4().hex[:8]
+            state.connection = None
+        return state
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Returns the pooled connection of the calling thread, opening it on first use
+        """
+        state = self._local_state()
+        if state.connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout * 1000)}")
+            # WAL is unavailable on some network file systems, in which case SQLite keeps the
+            # rollback journal and the cache remains correct, only less concurrent.
+            mode = connection.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            if mode.lower() != "wal":
+                logger.info(f"Compilation cache {self.path} is using journal mode '{mode}'")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            state.connection = connection
+        return state.connection
+
+    def close(self) -> None:
+        """
+        Closes the pooled connection of the calling thread
+        """
+        state = self._local_state()
+        if state.connection is not None:
+            state.connection.close()
+            state.connection = None
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        connection = self.connection()
+        # IMMEDIATE takes the write lock up front, so that two processes cannot both
+        # observe a missing lease and then race to insert it.
+        connection.execute("BEGIN IMMEDIATE")
+        cursor = connection.cursor()
+        try:
+            yield cursor
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        else:
+            connection.execute("COMMIT")
+        finally:
+            cursor.close()
+
+    def fetch(self, op_key: str):
+        """
+        Returns the row ``(op_key, cubin, hostbin, op_name, op_attrs)`` stored for ``op_key``,
+        or None if it has not been published
+        """
+        cursor = self.connection().execute(
+            "SELECT op_key, cubin, hostbin, op_name, op_attrs FROM compiled_operations WHERE op_key = ?",
+            (op_key,))
+        row = cursor.fetchone()
+        cursor.close()
+        return row
+
+    def acquire(self, op_key: str) -> str:
+        """
+        Attempts to lease ``op_key`` for compilation
+
+        :return: ``COMPILED`` if a result has already been published, ``LEASE_ACQUIRED`` if the caller
+            now holds the lease and should compile, or ``LEASE_BUSY`` if another process holds it
+        :rtype: str
+        """
+        now = time.time()
+        owner = self.owner
+        with self._transaction() as cursor:
+            cursor.execute("SELECT 1 FROM compiled_operations WHERE op_key = ?", (op_key,))
+            if cursor.fetchone() is not None:
+                return CompiledOperationCache.COMPILED
+            cursor.execute("DELETE FROM compile_leases WHERE op_key = ? AND (expires < ? OR owner = ?)",
+                           (op_key, now, owner))
+            cursor.execute("INSERT OR IGNORE INTO compile_leases (op_key, owner, expires) VALUES (?, ?, ?)",
+                           (op_key, owner, now + self.lease_timeout))
+            if cursor.rowcount == 1:
+                return CompiledOperationCache.LEASE_ACQUIRED
+        return CompiledOperationCache.LEASE_BUSY
+
+    def release(self, op_keys) -> None:
+        """
+        Releases leases held by the caller without publishing a result
+        """
+        owner = self.owner
+        with self._transaction() as cursor:
+            cursor.executemany("DELETE FROM compile_leases WHERE op_key = ? AND owner = ?",
+                               [(key, owner) for key in op_keys])
+
+    def publish(self, rows) -> None:
+        """
+        Stores compiled operations and releases the caller's leases on them in one transaction
+
+        :param rows: iterable of ``(op_key, cubin, hostbin, op_name, op_attrs)`` with ``op_attrs``
+            a JSON-serializable object
+        """
+        owner = self.owner
+        rows = [(key, cubin, hostbin, name, json.dumps(attrs)) for key, cubin, hostbin, name, attrs in rows]
+        with self._transaction() as cursor:
+            cursor.executemany(
+                "INSERT OR IGNORE INTO compiled_operations (op_key, cubin, hostbin, op_name, op_attrs) VALUES (?, ?, ?, ?, ?)",
+                rows)
+            cursor.executemany("DELETE FROM compile_leases WHERE op_key = ? AND owner = ?",
+                               [(row[0], owner) for row in rows])
+
+    def adopt_legacy(self, legacy_key: str, op_key: str) -> bool:
+        """
+        Re-keys a row written under the pre-hashing key format to ``op_key``
+
+        Legacy keys did not cover compilation options, headers or toolkit version, so the row is
+        assumed to have been built with the current ones, exactly as the legacy lookup would have.
+
+        :return: whether a row was adopted
+        :rtype: bool
+        """
+        if not self._has_legacy_keys:
+            return False
+        with self._transaction() as cursor:
+            cursor.execute("UPDATE OR IGNORE compiled_operations SET op_key = ? WHERE op_key = ?", (op_key, legacy_key))
+            adopted = cursor.rowcount == 1
+            cursor.execute("DELETE FROM compiled_operations WHERE op_key = ?", (legacy_key,))
+            cursor.execute("SELECT COUNT(*) FROM compiled_operations WHERE length(op_key) != ?",
+                           (OPERATION_KEY_LENGTH,))
+            if cursor.fetchone()[0] == 0:
+                cursor.execute(f"PRAGMA user_version = {CACHE_SCHEMA_VERSION}")
+                self._has_legacy_keys = False
+        return adopted
+
+    def purge_legacy(self) -> int:
+        """
+        Deletes all rows written under the pre-hashing key format
+
+        :return: number of rows deleted
+        :rtype: int
+        """
+        with self._transaction() as cursor:
+            cursor.execute("DELETE FROM compiled_operations WHERE length(op_key) != ?", (OPERATION_KEY_LENGTH,))
+            count = cursor.rowcount
+            cursor.execute(f"PRAGMA user_version = {CACHE_SCHEMA_VERSION}")
+        self._has_legacy_keys = False
+        return count
+
+    def wait(self, op_key: str):
+        """
+        Waits for another process to publish ``op_key``
+
+        :return: the published row, or None if the lease was released or expired without a result,
+            in which case the caller should try to acquire the lease itself
+        """
+        connection = self.connection()
+        while True:
+            row = self.fetch(op_key)
+            if row is not None:
+                return row
+            cursor = connection.execute("SELECT expires FROM compile_leases WHERE op_key = ?", (op_key,))
+            lease = cursor.fetchone()
+            cursor.close()
+            if lease is None or lease[0] < time.time():
+                return self.fetch(op_key)
+            time.sleep(self.poll_interval)
+
+
 class ArtifactManager:
     """
     Artifact manager
     """
 
     def __init__(self) -> None:
-        connection = sqlite3.connect(CACHE_FILE)
-        cursor = connection.cursor()
-        # Create the table if it does not already exist
-        sqlite_create_table_query = """
-        CREATE TABLE IF NOT EXISTS compiled_operations(op_key TEXT NOT NULL UNIQUE,
-                                                        cubin BLOB NOT NULL,
-                                                        hostbin BLOB NOT NULL,
-                                                        op_name TEXT NOT NULL,
-                                                        op_attrs TEXT NOT NULL)
-        """
-        cursor.execute(sqlite_create_table_query)
-        connection.commit()
-        cursor.close()
+        self.cache = CompiledOperationCache(CACHE_FILE)
 
         self._nvrtc_compile_options = ["-std=c++17", "-default-device"]
         self._nvcc_compile_options = [
@@ -162,6 +473,9 @@ class ArtifactManager:
         self.compiled_cache_device = {}
         self.compiled_cache_host = {}
 
+        # Number of shards compiled concurrently when several operations are pending
+        self.num_compile_workers = int(os.getenv("CUTLASS_COMPILE_WORKERS", min(8, os.cpu_count() or 1)))
+
     def nvrtc(self):
         self.backend = "nvrtc"
         self.default_compile_options = self._nvrtc_compile_options
@@ -171,66 +485,62 @@ class ArtifactManager:
         self.default_compile_options = self._nvcc_compile_options
 
     def insert_operation(self, op_key, cubin, hostfile, op_name, op_attrs):
-        connection = sqlite3.connect(CACHE_FILE)
-        cursor = connection.cursor()
-        sqlite_insert_blob_query = """ INSERT OR IGNORE INTO compiled_operations (op_key, cubin, hostbin, op_name, op_attrs) VALUES (?, ?, ?, ?, ?)"""
-
         hostbin = convertToBinaryData(hostfile)
+        self.cache.publish([(op_key, cubin, hostbin, op_name, op_attrs)])
 
-        data_tuple = (op_key, cubin, hostbin, op_name, json.dumps(op_attrs))
-
-        cursor.execute(sqlite_insert_blob_query, data_tuple)
-        connection.commit()
-        cursor.close()
-
-    def load_operation(self, op_key, extra_funcs):
-        connection = sqlite3.connect(CACHE_FILE)
-        cursor = connection.cursor()
-        sqlite_fetch_blob_query = """SELECT * from compiled_operations where op_key = ?"""
-        cursor.execute(sqlite_fetch_blob_query, (op_key,))
-        record = cursor.fetchall()
-        if len(record) == 0:
+    def load_operation(self, op_key, extra_funcs, record=None):
+        if record is None:
+            record = self.cache.fetch(op_key)
+        if record is None:
             return False
-        for row in record:
-            key, cubin_image, host_binary, operation_name, op_attr = row
-            op_attr = json.loads(op_attr)
-            err, module = cuda.cuModuleLoadData(cubin_image)
-            if err != cuda.CUresult.CUDA_SUCCESS:
-                raise RuntimeError("Cuda Error: {}".format(err))
-
-            err, kernel = cuda.cuModuleGetFunction(module, bytes(str.encode(operation_name)))
-            self.compiled_cache_device[key] = kernel
-
-            compiled_host_fns = {}
-            host_lib = CDLLBin(host_binary)
-
-            func_name = operation_name + "_get_params"
-            func = getattr(host_lib, func_name)
-            func.restype = ctypes.POINTER(ctypes.c_char * op_attr[0])
-            compiled_host_fns["get_args"] = func
-
-            func_name = operation_name + "_shared_memory_size"
-            func = getattr(host_lib, func_name)
-            compiled_host_fns["shared_memory_capacity"] = func()
-
-            for attr in op_attr:
-                if isinstance(attr, str):
-                    func_name = operation_name + "_" + attr
-                    func = getattr(host_lib, func_name)
+        key, cubin_image, host_binary, operation_name, op_attr = record
+        op_attr = json.loads(op_attr)
+        err, module = cuda.cuModuleLoadData(cubin_image)
+        if err != cuda.CUresult.CUDA_SUCCESS:
+            raise RuntimeError("Cuda Error: {}".format(err))
+
+        err, kernel = cuda.cuModuleGetFunction(module, bytes(str.encode(operation_name)))
+        self.compiled_cache_device[key] = kernel
+
+        compiled_host_fns = {}
+        host_lib = CDLLBin(host_binary)
+
+        func_name = operation_name + "_get_params"
+        func = getattr(host_lib, func_name)
+        func.restype = ctypes.POINTER(ctypes.c_char * op_attr[0])
+        compiled_host_fns["get_args"] = func
+
+        func_name = operation_name + "_shared_memory_size"
+        func = getattr(host_lib, func_name)
+        compiled_host_fns["shared_memory_capacity"] = func()
+
+        for attr in op_attr:
+            if isinstance(attr, str):
+                func_name = operation_name + "_" + attr
+                func = getattr(host_lib, func_name)
 
-                    # Set the return type of the function
-                    if attr in extra_funcs and extra_funcs[attr] != None:
-                        func.restype = extra_funcs[attr]
+                # Set the return type of the function
+                if attr in extra_funcs and extra_funcs[attr] != None:
+                    func.restype = extra_funcs[attr]
 
-                    compiled_host_fns[attr] = func
+                compiled_host_fns[attr] = func
 
-            self.compiled_cache_host[key] = compiled_host_fns
+        self.compiled_cache_host[key] = compiled_host_fns
         return True
 
     def emit_compile_(self, operation_list, compilation_options, host_compilation_options):
         """
         Compile a list of kernels and store them into database
         """
+        source_buffer_device, source_buffer_host = self.emit_sources_(operation_list)
+        cubin_image = self.compile_device_(source_buffer_device, compilation_options)
+        host_lib, temp_dst = self.compile_host_(source_buffer_host, host_compilation_options)
+        return cubin_image, host_lib, temp_dst
+
+    def emit_sources_(self, operation_list):
+        """
+        Emit the device and host sources for a list of kernels
+        """
         source_buffer_device = ""
         source_buffer_host = ""
         # 1. include
@@ -267,6 +577,13 @@ class ArtifactManager:
             )
             source_buffer_host += SubstituteTemplate(operation.HostTemplate, values)
 
+        return source_buffer_device, source_buffer_host
+
+    def compile_device_(self, source_buffer_device, compilation_options,
+                        error_file="./cutlass_python_compilation_device_error.txt"):
+        """
+        Compile the device source into a cubin image
+        """
         if self.backend == "nvrtc":
             # 3. compile
             err, program = nvrtc.nvrtcCreateProgram(
@@ -308,11 +625,10 @@ class ArtifactManager:
 
         else:  # with nvcc backend
             # emit code
-            tempfile.tempdir = "./"
             temp_cu = tempfile.NamedTemporaryFile(
-                prefix="kernel", suffix=".cu", delete=True)
+                prefix="kernel", suffix=".cu", dir="./", delete=True)
             temp_cubin = tempfile.NamedTemporaryFile(
-                prefix="kernel", suffix=".cubin", delete=True)
+                prefix="kernel", suffix=".cubin", dir="./", delete=True)
             with open(temp_cu.name, "w") as file:
                 file.write(source_buffer_device)
 
@@ -325,22 +641,28 @@ class ArtifactManager:
                 "tarfile": temp_cubin.name,
             }
             cmd = SubstituteTemplate(cmd_template, values)
-            compile_with_nvcc(cmd.split(" "), source_buffer_device, "./cutlass_python_compilation_device_error.txt")
+            compile_with_nvcc(cmd.split(" "), source_buffer_device, error_file)
 
             # load the cubin image
             with open(temp_cubin.name, "rb") as file:
                 cubin_image = file.read()
 
-        tempfile.tempdir = "./"
+        return cubin_image
+
+    def compile_host_(self, source_buffer_host, host_compilation_options,
+                      error_file="./cutlass_python_compilation_host_error.txt"):
+        """
+        Compile the host source into a shared library and load it
+        """
         temp_src = tempfile.NamedTemporaryFile(
-            prefix="host_src", suffix=".cu", delete=True)
+            prefix="host_src", suffix=".cu", dir="./", delete=True)
 
         # Write the host source
         with open(temp_src.name, "w") as outfile:
             outfile.write(source_buffer_host)
 
         temp_dst = tempfile.NamedTemporaryFile(
-            prefix="host_func", suffix=".so", delete=True)
+            prefix="host_func", suffix=".so", dir="./", delete=True)
 
         # Set up host compilation arguments
         cmd = []
@@ -350,10 +672,10 @@ class ArtifactManager:
         cmd.extend(["-shared", "-o", temp_dst.name, temp_src.name, "-lcudart", "-lcuda"])
 
         # Comile and load the library
-        compile_with_nvcc( cmd, source_buffer_host, error_file="./cutlass_python_compilation_host_error.txt")
+        compile_with_nvcc( cmd, source_buffer_host, error_file=error_file)
         host_lib = ctypes.CDLL(temp_dst.name)
 
-        return cubin_image, host_lib, temp_dst
+        return host_lib, temp_dst
 
     def add_module(self, operations, compile_options=None, bypass_cache=False):
         """
@@ -375,88 +697,166 @@ class ArtifactManager:
             compile_options = CompilationOptions(
                 self.default_compile_options, arch, include_paths)
         # save the cubin
-        operation_key = []
-        operation_list = []
+        pending = []
         for operation in operations:
-            # step 1: get kernel string as key
-            key = operation.rt_module.emit() + operation.procedural_name() + self.backend
+            # step 1: get the content-addressed key of the kernel
+            source = operation.rt_module.emit() + operation.procedural_name()
+            key = operation_cache_key(source, self.backend, compile_options, host_compile_options)
             # step 1: check if the operation is in cache
             compiled_kernel = self.compiled_cache_device.get(key)
 
             if compiled_kernel is None and not bypass_cache:
-                hit = self.load_operation(key, getattr( operation.rt_module, "extra_funcs", {}))
+                extra_funcs = getattr( operation.rt_module, "extra_funcs", {})
+                hit = self.load_operation(key, extra_funcs)
+                if not hit and self.cache.adopt_legacy(source + self.backend, key):
+                    hit = self.load_operation(key, extra_funcs)
                 if hit:
                     compiled_kernel = self.compiled_cache_device.get(key)
                     assert compiled_kernel is not None
             if compiled_kernel is not None:
-                operation.rt_module.kernel = compiled_kernel
-                compiled_host_fns = self.compiled_cache_host.get(key)
-                assert compiled_host_fns is not None
-                for key in compiled_host_fns.keys():
-                    setattr(operation.rt_module, key, compiled_host_fns[key])
-                operation.rt_module.initialize()
+                self._bind_cached(operation.rt_module, key)
             else:
-                operation_list.append(operation.rt_module)
-                operation_key.append(key)
+                pending.append((operation.rt_module, key))
+
+        # step 2: compile the operations leased by this process, and wait for those that are
+        # being compiled by another process. If another process gives up its lease without
+        # publishing, the operation is leased again on the next round.
+        while len(pending) > 0:
+            operation_list = []
+            operation_key = []
+            waiting = []
+            for operation, key in pending:
+                state = CompiledOperationCache.LEASE_ACQUIRED if bypass_cache else self.cache.acquire(key)
+                if state == CompiledOperationCache.LEASE_BUSY:
+                    waiting.append((operation, key))
+                elif state == CompiledOperationCache.COMPILED and self.load_operation(
+                        key, getattr(operation, "extra_funcs", {})):
+                    self._bind_cached(operation, key)
+                else:
+                    operation_list.append(operation)
+                    operation_key.append(key)
+
+            if len(operation_list) > 0:
+                try:
+                    self._compile_and_publish(operation_list, operation_key, compile_options, host_compile_options)
+                except BaseException:
+                    self.cache.release(operation_key)
+                    raise
+
+            pending = []
+            for operation, key in waiting:
+                record = self.cache.wait(key)
+                if record is not None and self.load_operation(key, getattr(operation, "extra_funcs", {}), record):
+                    self._bind_cached(operation, key)
+                else:
+                    pending.append((operation, key))
+
+    def _bind_cached(self, operation, key):
+        """
+        Attach the cached device kernel and host functions for ``key`` to ``operation``
+        """
+        operation.kernel = self.compiled_cache_device[key]
+        compiled_host_fns = self.compiled_cache_host.get(key)
+        assert compiled_host_fns is not None
+        for name in compiled_host_fns.keys():
+            setattr(operation, name, compiled_host_fns[name])
+        operation.initialize()
+
+    def _compile_and_publish(self, operation_list, operation_key, compile_options, host_compile_options):
+        """
+        Compile ``operation_list``, bind the results and publish them to the cache
 
-        if len(operation_list) > 0:
+        Operations are split into up to ``num_compile_workers`` shards, each compiled into its own
+        module. The device and host compilations of every shard are submitted to a thread pool, which
+        suffices for concurrency because the compilers run in subprocesses. Each shard reports compilation
+        errors to its own file. Modules are loaded on the calling thread, which owns the CUDA context,
+        and each shard is published as soon as it is ready.
+        """
+        num_shards = max(1, min(self.num_compile_workers, len(operation_list)))
+        if num_shards == 1:
             cubin_image, host_lib, host_file = self.emit_compile_(
                 operation_list, compile_options, host_compile_options)
+            self._bind_compiled(operation_list, operation_key, cubin_image, host_lib, host_file)
+            return
+
+        shards = [(operation_list[i::num_shards], operation_key[i::num_shards]) for i in range(num_shards)]
+        with ThreadPoolExecutor(max_workers=self.num_compile_workers) as pool:
+            jobs = []
+            for shard, (shard_list, shard_key) in enumerate(shards):
+                source_device, source_host = self.emit_sources_(shard_list)
+                device_job = pool.submit(self.compile_device_, source_device, compile_options,
+                                         f"./cutlass_python_compilation_device_error_{shard}.txt")
+                host_job = pool.submit(self.compile_host_, source_host, host_compile_options,
+                                       f"./cutlass_python_compilation_host_error_{shard}.txt")
+                jobs.append((shard_list, shard_key, device_job, host_job))
+
+            for shard_list, shard_key, device_job, host_job in jobs:
+                host_lib, host_file = host_job.result()
+                self._bind_compiled(shard_list, shard_key, device_job.result(), host_lib, host_file)
+
+    def _bind_compiled(self, operation_list, operation_key, cubin_image, host_lib, host_file):
+        """
+        Load a freshly compiled module, bind its kernels and host functions to ``operation_list``
+        and publish them to the cache
+        """
+        err, module = cuda.cuModuleLoadData(cubin_image)
+        if err != cuda.CUresult.CUDA_SUCCESS:
+            raise RuntimeError("Cuda Error: {}".format(err))
+
+        operation_name = []
+        operation_attr = []
+        for operation, key in zip(operation_list, operation_key):
+            # get device kernels
+            err, operation.kernel = cuda.cuModuleGetFunction(
+                module,
+                bytes(str.encode(operation.name()))
+            )
+            operation_name.append(operation.name())
+            self.compiled_cache_device[key] = operation.kernel
+            # get host functions
+            compiled_host_fns = {}
+            op_attr = []
 
-            err, module = cuda.cuModuleLoadData(cubin_image)
-            if err != cuda.CUresult.CUDA_SUCCESS:
-                raise RuntimeError("Cuda Error: {}".format(err))
-
-            operation_name = []
-            operation_attr = []
-            for operation, key in zip(operation_list, operation_key):
-                # get device kernels
-                err, operation.kernel = cuda.cuModuleGetFunction(
-                    module,
-                    bytes(str.encode(operation.name()))
-                )
-                operation_name.append(operation.name())
-                self.compiled_cache_device[key] = operation.kernel
-                # get host functions
-                compiled_host_fns = {}
-                op_attr = []
-
-                # get param size
-                func_name = operation.name() + "_get_param_size"
-                func = getattr(host_lib, func_name)
-                param_size = func()
+            # get param size
+            func_name = operation.name() + "_get_param_size"
+            func = getattr(host_lib, func_name)
+            param_size = func()
 
-                func_name = operation.name() + "_get_params"
-                func = getattr(host_lib, func_name)
-                func.argtype = operation.argtype
-                func.restype = ctypes.POINTER(ctypes.c_char * param_size)
-                setattr(operation, "get_args", func)
-                compiled_host_fns["get_args"] = func
+            func_name = operation.name() + "_get_params"
+            func = getattr(host_lib, func_name)
+            func.argtype = operation.argtype
+            func.restype = ctypes.POINTER(ctypes.c_char * param_size)
+            setattr(operation, "get_args", func)
+            compiled_host_fns["get_args"] = func
 
-                # set shared memory size
-                func_name = operation.name() + "_shared_memory_size"
-                func = getattr(host_lib, func_name)
-                setattr(operation, "shared_memory_capacity", func())
-                compiled_host_fns["shared_memory_capacity"] = func()
-                # set the maximum dynamic shared size
-                operation.initialize()
-
-                # get extra functions
-                op_attr.append(param_size)
-
-                if hasattr(operation, "extra_funcs"):
-                    for suffix, ret_type  in operation.extra_funcs.items():
-                        func_name = operation.name() + "_" + suffix
-                        func = getattr(host_lib, func_name)
-                        if ret_type is not None:
-                            func.restype = ret_type
-                        setattr(operation, suffix, func)
-                        compiled_host_fns[suffix] = func
-                        op_attr.append(suffix)
-
-                operation_attr.append(op_attr)
-                self.compiled_cache_host[key] = compiled_host_fns
-
-            for (key, operation_name, operation_attr,) in zip(operation_key, operation_name, operation_attr):
-                self.insert_operation(
-                    key, cubin_image, host_file.name, operation_name, operation_attr)
+            # set shared memory size
+            func_name = operation.name() + "_shared_memory_size"
+            func = getattr(host_lib, func_name)
+            setattr(operation, "shared_memory_capacity", func())
+            compiled_host_fns["shared_memory_capacity"] = func()
+            # set the maximum dynamic shared size
+            operation.initialize()
+
+            # get extra functions
+            op_attr.append(param_size)
+
+            if hasattr(operation, "extra_funcs"):
+                for suffix, ret_type  in operation.extra_funcs.items():
+                    func_name = operation.name() + "_" + suffix
+                    func = getattr(host_lib, func_name)
+                    if ret_type is not None:
+                        func.restype = ret_type
+                    setattr(operation, suffix, func)
+                    compiled_host_fns[suffix] = func
+                    op_attr.append(suffix)
+
+            operation_attr.append(op_attr)
+            self.compiled_cache_host[key] = compiled_host_fns
+
+        # Publish all operations of the module at once, so that processes waiting on any of
+        # them never observe a partially written module
+        hostbin = convertToBinaryData(host_file.name)
+        self.cache.publish([
+            (key, cubin_image, hostbin, name, attr)
+            for key, name, attr in zip(operation_key, operation_name, operation_attr)
+        ])
@@ -0,0 +1,358 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Selection of the kernel with which to run a problem of a given shape
+
+Candidate operations for a data type, layout, and alignment combination are scored with an analytic
+model of wave quantization and occupancy. The threadblock tile and stage count of each candidate
+determine how many CTAs fit on an SM (``SharedMemPerCC`` and the per-SM thread limit) and, with the
+device's SM count, how many waves are needed to cover the problem. Measurements persisted in a
+``ProfilingTable`` take precedence over the model for problem shapes that have been profiled.
+"""
+
+import json
+import math
+import os
+
+from cutlass_library import OperationKind, SharedMemPerCC
+
+from cutlass_cppgen.backend.utils.device import device_sm_count
+from cutlass_cppgen.utils import check, datatypes
+
+
+# Maximum number of resident threads per SM. Compute capabilities not listed support 2048.
+_MaxThreadsPerSM = {
+    75: 1024,
+    86: 1536,
+    87: 1536,
+    89: 1536,
+    120: 1536,
+    121: 1536,
+}
+
+_MaxCtasPerSM = 32
+
+# Cost, in multiply-accumulates, attributed to loading one element of A or B into a CTA. Weighing
+# loads against math makes tiles with higher arithmetic intensity preferable when the number of
+# waves is otherwise equal.
+_MacsPerLoadedElement = 64
+
+
+def ctas_per_sm(td, cc: int) -> int:
+    """
+    Returns the number of CTAs with tile description ``td`` that can be resident on one SM of a
+    device of compute capability ``cc``
+
+    Kernels whose stage count is determined automatically (a stage count of 0 or None) are assumed
+    to use all of the shared memory of the SM, as the CUTLASS 3.x collective builders do. The same
+    is assumed for devices whose shared memory capacity is not listed in ``SharedMemPerCC``.
+
+    :param td: tile description of the kernel
+    :type td: cutlass_cppgen.backend.TileDescription
+    :param cc: compute capability of the device
+    :type cc: int
+
+    :return: number of CTAs per SM
+    :rtype: int
+    """
+    if not td.stages or cc not in SharedMemPerCC:
+        return 1
+
+    smem_per_cta = check.calculate_smem_usage_per_stage(td, OperationKind.Gemm) * td.stages
+    smem_limit = (SharedMemPerCC[cc] << 10) // smem_per_cta
+
+    threads_per_cta = 32 * math.prod(td.warp_count) if td.warp_count else 128
+    thread_limit = _MaxThreadsPerSM.get(cc, 2048) // threads_per_cta
+
+    return max(1, min(smem_limit, thread_limit, _MaxCtasPerSM))
+
+
+class KernelEstimate:
+    """
+    Estimated execution of an operation on a problem, as computed by a ``WaveQuantizationSelector``
+
+    :param operation: profiler operation being estimated
+    :param cta_shape: (M, N, K) extent of the tile computed by each CTA
+    :type cta_shape: tuple
+    :param ctas: number of CTAs launched
+    :type ctas: int
+    :param ctas_per_sm: number of CTAs resident on an SM at a time
+    :type ctas_per_sm: int
+    :param sm_count: number of SMs on the device
+    :type sm_count: int
+    :param cost: estimated run time in arbitrary units; only meaningful relative to other estimates
+    :type cost: float
+    :param source: how the operation was chosen ("model" or "profile")
+    :type source: str
+    """
+
+    def __init__(self, operation, cta_shape: tuple, ctas: int, ctas_per_sm: int, sm_count: int,
+                 cost: float, source: str = "model"):
+        self.operation = operation
+        self.cta_shape = cta_shape
+        self.ctas = ctas
+        self.ctas_per_sm = ctas_per_sm
+        self.sm_count = sm_count
+        self.cost = cost
+        self.source = source
+
+    @property
+    def ctas_per_wave(self) -> int:
+        return self.sm_count * self.ctas_per_sm
+
+    @property
+    def waves(self) -> int:
+        """
+        Number of waves of CTAs needed to cover the problem, counting a partial wave as a full one
+        """
+        return -(-self.ctas // self.ctas_per_wave)
+
+    @property
+    def wave_efficiency(self) -> float:
+        """
+        Fraction of the CTA slots in all waves that are occupied by CTAs of the problem
+        """
+        return self.ctas / (self.waves * self.ctas_per_wave)
+
+    def __str__(self) -> str:
+        m, n, k = self.cta_shape
+        return (f"{self.operation.procedural_name()} ({self.source}): {m}x{n}x{k} CTA tile, "
+                f"{self.ctas} CTAs, {self.ctas_per_sm} CTAs/SM, {self.waves} waves on {self.sm_count} SMs, "
+                f"{self.wave_efficiency:.0%} wave efficiency")
+
+
+def estimate(operation, problem_size, batch_count: int, split_k_slices: int, sm_count: int,
+             cc: int) -> KernelEstimate:
+    """
+    Estimates the execution of ``operation`` on a GEMM (or implicit GEMM) of ``problem_size``
+
+    The problem is covered by ``ceil(M / tile_M) * ceil(N / tile_N)`` CTAs (rounded up to whole
+    clusters) per batch and split-K slice. These execute in waves of ``sm_count * ctas_per_sm`` CTAs.
+    A full wave runs ``ctas_per_sm`` CTAs concurrently on each SM, while a single partial wave
+    places at most ``ceil(ctas / sm_count)`` on any SM. The cost of a CTA is the number of
+    multiply-accumulates in its tile, padded to whole K iterations, plus a charge for each element of
+    A and B it loads.
+
+    :param operation: profiler operation to estimate
+    :param problem_size: GEMM problem size
+    :type problem_size: cutlass_cppgen.shape.GemmCoord
+    :param batch_count: number of GEMMs in the batch
+    :type batch_count: int
+    :param split_k_slices: number of slices into which the K mode is split
+    :type split_k_slices: int
+    :param sm_count: number of SMs on the device
+    :type sm_count: int
+    :param cc: compute capability of the device
+    :type cc: int
+
+    :return: estimate of the execution of ``operation``
+    :rtype: KernelEstimate
+    """
+    td = datatypes.td_from_profiler_op(operation)
+    tile_m, tile_n, tile_k = td.blackwell_threadblock_shape
+    if td.is_2sm:
+        tile_m //= 2
+    cluster_m, cluster_n = (max(1, x) for x in td.cluster_shape[:2])
+
+    tiles_m = -(-problem_size.m // tile_m)
+    tiles_n = -(-problem_size.n // tile_n)
+    ctas_m = -(-tiles_m // cluster_m) * cluster_m
+    ctas_n = -(-tiles_n // cluster_n) * cluster_n
+    ctas = ctas_m * ctas_n * batch_count * split_k_slices
+
+    k_per_slice = -(-problem_size.k // split_k_slices)
+    k_padded = -(-k_per_slice // tile_k) * tile_k
+    cta_cost = k_padded * (tile_m * tile_n + _MacsPerLoadedElement * (tile_m + tile_n))
+
+    occupancy = ctas_per_sm(td, cc)
+    result = KernelEstimate(operation, (tile_m, tile_n, tile_k), ctas, occupancy, sm_count, 0)
+    concurrent = min(occupancy, -(-ctas // sm_count))
+    result.cost = result.waves * concurrent * cta_cost
+    return result
+
+
+class ProfilingTable:
+    """
+    Persisted run times of operations on problem shapes, used to override the analytic model
+
+    Entries are keyed by device compute capability and problem shape (M, N, K, batch count, split-K
+    slices) and map the procedural names of profiled operations to their run times. The table is
+    stored as JSON.
+
+    :param path: file from which the table is loaded (if it exists) and to which it is saved
+    :type path: str
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self.entries = {}
+        if path is not None and os.path.isfile(path):
+            with open(path, "r") as f:
+                self.entries = json.load(f)
+
+    @staticmethod
+    def _key(cc: int, problem_size, batch_count: int, split_k_slices: int) -> str:
+        return f"sm{cc}_{problem_size.m}x{problem_size.n}x{problem_size.k}_b{batch_count}_s{split_k_slices}"
+
+    def record(self, cc: int, problem_size, operation, runtime_ms: float,
+               batch_count: int = 1, split_k_slices: int = 1):
+        """
+        Records the run time of ``operation`` on a problem, keeping the fastest time seen per operation
+
+        :param cc: compute capability of the device on which the operation was profiled
+        :type cc: int
+        :param problem_size: GEMM problem size
+        :type problem_size: cutlass_cppgen.shape.GemmCoord
+        :param operation: profiler operation that was run, or its procedural name
+        :param runtime_ms: measured run time in milliseconds
+        :type runtime_ms: float
+        :param batch_count: number of GEMMs in the batch
+        :type batch_count: int
+        :param split_k_slices: number of slices into which the K mode is split
+        :type split_k_slices: int
+        """
+        name = operation if isinstance(operation, str) else operation.procedural_name()
+        times = self.entries.setdefault(self._key(cc, problem_size, batch_count, split_k_slices), {})
+        times[name] = min(runtime_ms, times.get(name, runtime_ms))
+
+    def lookup(self, cc: int, problem_size, operations: list, batch_count: int = 1, split_k_slices: int = 1):
+        """
+        Returns the fastest of ``operations`` profiled on the problem, or None if none were profiled
+
+        :param cc: compute capability of the device
+        :type cc: int
+        :param problem_size: GEMM problem size
+        :type problem_size: cutlass_cppgen.shape.GemmCoord
+        :param operations: candidate profiler operations
+        :type operations: list
+        :param batch_count: number of GEMMs in the batch
+        :type batch_count: int
+        :param split_k_slices: number of slices into which the K mode is split
+        :type split_k_slices: int
+
+        :return: fastest profiled operation among ``operations``, if any
+        """
+        times = self.entries.get(self._key(cc, problem_size, batch_count, split_k_slices))
+        if not times:
+            return None
+        profiled = [(times[op.procedural_name()], i) for i, op in enumerate(operations)
+                    if op.procedural_name() in times]
+        if not profiled:
+            return None
+        return operations[min(profiled)[1]]
+
+    def save(self, path: str = None):
+        """
+        Writes the table as JSON to ``path``, or to the path from which it was loaded
+
+        :param path: file to which the table is written
+        :type path: str
+        """
+        path = path if path is not None else self.path
+        if path is None:
+            raise Exception("No path was provided to which to save the profiling table.")
+        with open(path, "w") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+
+
+class KernelSelector:
+    """
+    Base class of the policies with which a ``Gemm`` or ``Conv2d`` chooses among the operations that
+    are compatible with the alignment of its operands
+    """
+
+    def select(self, operations: list, problem_size, cc: int, batch_count: int = 1,
+               split_k_slices: int = 1) -> KernelEstimate:
+        """
+        Returns the operation of ``operations`` with which to run the problem
+
+        :param operations: candidate profiler operations, in order of preference when tied
+        :type operations: list
+        :param problem_size: GEMM (or implicit GEMM) problem size
+        :type problem_size: cutlass_cppgen.shape.GemmCoord
+        :param cc: compute capability of the device
+        :type cc: int
+        :param batch_count: number of GEMMs in the batch
+        :type batch_count: int
+        :param split_k_slices: number of slices into which the K mode is split
+        :type split_k_slices: int
+
+        :return: estimate of the selected operation
+        :rtype: KernelEstimate
+        """
+        raise NotImplementedError()
+
+
+class WaveQuantizationSelector(KernelSelector):
+    """
+    Selects the operation with the lowest estimated cost (see ``estimate``), preferring operations
+    earlier in the candidate list when tied. Problems recorded in ``profiling_table`` instead use the
+    fastest profiled candidate.
+
+    :param sm_count: number of SMs on the device. Queried from the current device if not provided.
+    :type sm_count: int
+    :param profiling_table: measurements that override the analytic model
+    :type profiling_table: ProfilingTable
+    """
+
+    def __init__(self, sm_count: int = None, profiling_table: ProfilingTable = None):
+        self._sm_count = sm_count
+        self.profiling_table = profiling_table
+
+    @property
+    def sm_count(self) -> int:
+        if self._sm_count is None:
+            self._sm_count = device_sm_count()
+        return self._sm_count
+
+    def estimates(self, operations: list, problem_size, cc: int, batch_count: int = 1,
+                  split_k_slices: int = 1) -> list:
+        """
+        Returns the estimates of each of ``operations`` on the problem
+
+        :return: list of estimates in the order of ``operations``
+        :rtype: list
+        """
+        return [estimate(op, problem_size, batch_count, split_k_slices, self.sm_count, cc) for op in operations]
+
+    def select(self, operations: list, problem_size, cc: int, batch_count: int = 1,
+               split_k_slices: int = 1) -> KernelEstimate:
+        if self.profiling_table is not None:
+            op = self.profiling_table.lookup(cc, problem_size, operations, batch_count, split_k_slices)
+            if op is not None:
+                result = estimate(op, problem_size, batch_count, split_k_slices, self.sm_count, cc)
+                result.source = "profile"
+                return result
+
+        return min(self.estimates(operations, problem_size, cc, batch_count, split_k_slices),
+                   key=lambda e: e.cost)
@@ -34,13 +34,20 @@
 Classes containing valid operations for a given compute capability and data types.
 """
 
+import functools
+import hashlib
 from itertools import combinations_with_replacement
 import logging
+import os
+import pickle
+import tempfile
+import threading
 
 import cutlass_library
 from cutlass_library.library import ConvKind, IteratorAlgorithm, StrideSupport, GroupMode
 
 import cutlass_cppgen
+from cutlass_cppgen.utils import check, datatypes
 from cutlass_cppgen.utils.check import valid_stage_count
 from cutlass_cppgen.utils.datatypes import td_from_profiler_td, td_from_profiler_op
 
@@ -543,10 +550,46 @@ class ArchOptions:
         return self.operations_by_opclass[op_class][(datatype_comb, layout_comb)]
 
 
+def _option_cache_dir() -> str:
+    """
+    Returns the directory in which prebuilt ``ArchOptions`` are stored, or an empty string if
+    persisting them has been disabled by setting ``CUTLASS_OPTION_CACHE_DIR`` to an empty value
+    """
+    default = os.path.join(os.path.expanduser("~"), ".cache", "cutlass_cppgen", "options")
+    return os.getenv("CUTLASS_OPTION_CACHE_DIR", default)
+
+
+@functools.lru_cache(maxsize=None)
+def _generator_source_hash() -> str:
+    """
+    Returns a digest of the sources that determine the contents of ``ArchOptions``: the
+    ``cutlass_library`` package and the modules of ``cutlass_cppgen`` that filter its kernels
+    """
+    digest = hashlib.sha256()
+    library_dir = os.path.dirname(os.path.abspath(cutlass_library.__file__))
+    sources = sorted(os.path.join(library_dir, f) for f in os.listdir(library_dir) if f.endswith(".py"))
+    sources += [
+        os.path.abspath(__file__),
+        os.path.abspath(check.__file__),
+        os.path.abspath(datatypes.__file__),
+    ]
+    for source in sources:
+        digest.update(os.path.basename(source).encode())
+        with open(source, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
 class OptionRegistry:
     """
     Container of all architecture-specific options
 
+    Options for a given kernel compute capability and operation kind are built the first time
+    they are requested. Since building them runs the CUTLASS kernel generator, the result is also
+    pickled to an index under ``CUTLASS_OPTION_CACHE_DIR`` (``~/.cache/cutlass_cppgen/options`` by
+    default), keyed by a hash of the generator sources and the CUDA toolkit version, so that later
+    processes can load a prebuilt table.
+
     :param target_cc: compute capability of the device on which operations will be run
     :type target_cc: int
     """
@@ -557,13 +600,54 @@ class OptionRegistry:
         if target_cc > 100 and (target_cc not in [101, 103, 120, 121]):
             raise Exception(f"Unsupported compute capability {target_cc}. The CUTLASS Python interface only supports compute capabilities up to the Blackwell architecture.")
 
-        gemm_kinds = [cutlass_library.GemmKind.Universal, cutlass_library.GemmKind.Universal3x]
-        operation_kinds = [cutlass_library.OperationKind.Gemm, cutlass_library.OperationKind.Conv2d]
-        # Construct options for each CC
-        for kernel_cc in _generator_ccs:
-            self.registry[kernel_cc] = {}
-            for opkind in operation_kinds:
-                self.registry[kernel_cc][opkind] = ArchOptions(target_cc, kernel_cc, opkind, gemm_kinds)
+        self.target_cc = target_cc
+        self.gemm_kinds = [cutlass_library.GemmKind.Universal, cutlass_library.GemmKind.Universal3x]
+        self._lock = threading.Lock()
+
+    def _index_path(self, kernel_cc: int, op_kind) -> str:
+        cache_dir = _option_cache_dir()
+        if not cache_dir:
+            return None
+        digest = hashlib.sha256()
+        for part in [_generator_source_hash(), str(cutlass_cppgen._nvcc_version), str(self.target_cc),
+                     str(kernel_cc), op_kind.name, ",".join(kind.name for kind in self.gemm_kinds)]:
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return os.path.join(cache_dir, f"sm{self.target_cc}_sm{kernel_cc}_{op_kind.name.lower()}_{digest.hexdigest()[:32]}.pkl")
+
+    def _load_or_build(self, kernel_cc: int, op_kind) -> ArchOptions:
+        path = self._index_path(kernel_cc, op_kind)
+        if path is not None and os.path.isfile(path):
+            try:
+                with open(path, "rb") as f:
+                    options = pickle.load(f)
+                cutlass_cppgen.logger.info(f"Loaded options for SM{kernel_cc} {op_kind.name} from {path}")
+                return options
+            except Exception as e:
+                cutlass_cppgen.logger.warning(f"Ignoring unreadable option cache {path}: {e}")
+
+        options = ArchOptions(self.target_cc, kernel_cc, op_kind, self.gemm_kinds)
+
+        if path is not None:
+            tmp_path = None
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(options, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                # The table is still usable in this process, so failing to persist it is not fatal
+                cutlass_cppgen.logger.warning(f"Unable to write option cache {path}: {e}")
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        return options
 
     def options_for_cc(self, cc: int, op_kind=cutlass_library.OperationKind.Gemm) -> ArchOptions:
-        return self.registry.get(cc, None)[op_kind]
+        if cc not in _generator_ccs:
+            return None
+        with self._lock:
+            options_by_kind = self.registry.setdefault(cc, {})
+            if op_kind not in options_by_kind:
+                options_by_kind[op_kind] = self._load_or_build(cc, op_kind)
+            return options_by_kind[op_kind]
@@ -547,11 +547,15 @@ class Conv2d(OperationBase):
         alignment_A: int = None, alignment_B: int = None, alignment_C: int = None,
         iterator_algorithm: IteratorAlgorithm = None,
         stride_support = None, swizzling_functor: cutlass_cppgen.swizzle = None,
-        epilogue_functor=None) -> cutlass_cppgen.backend.Conv2dOperation:
+        epilogue_functor=None, problem_size: Conv2DProblemSize = None,
+        split_k_slices: int = 1) -> cutlass_cppgen.backend.Conv2dOperation:
         """
         Constructs a ``cutlass_cppgen.backend.Conv2dOperation`` based on the input parameters and current
         kernel specification of the ``Conv2d`` object.
 
+        If neither ``tile_description`` nor a tile description of the ``Conv2d`` object is set, the kernel
+        is chosen by ``self.kernel_selector`` for the implicit GEMM of ``problem_size`` when it is provided.
+
         :param tile_description: tile description specifying shapes and operand types to use in the kernel
         :type tile_description: cutlass_cppgen.backend.TileDescription
         :param alignment_A: alignment of operand A
@@ -567,6 +571,10 @@ class Conv2d(OperationBase):
         :param swizzling_functor: the swizzling functor
         :type swizzling_functor: cutlass_cppgen.swizzle
         :param epilogue_functor: the epilogue functor
+        :param problem_size: size of the problem for which the kernel is selected
+        :type problem_size: cutlass_cppgen.shape.Conv2DProblemSize
+        :param split_k_slices: number of split-K slices with which the kernel is run
+        :type split_k_slices: int
 
         :return: operation that was constructed
         :rtype: cutlass_cppgen.backend.Conv2dOperation
@@ -584,7 +592,9 @@ class Conv2d(OperationBase):
             if self.tile_description is not None:
                 tile_description = self.tile_description
             else:
-                op = self.possible_operations.operations(alignment_A, alignment_B, alignment_C, self._math_operation)[0]
+                gemm_size = None if problem_size is None else problem_size.implicit_gemm_size(self.conv_kind)
+                op = self._select_operation(alignment_A, alignment_B, alignment_C, gemm_size,
+                                            split_k_slices=split_k_slices)
                 tile_description = datatypes.td_from_profiler_op(op)
         else:
             valid, err_str = self._valid_tile_description(tile_description)
@@ -638,7 +648,8 @@ class Conv2d(OperationBase):
                 alignment_A: int = None, alignment_B: int = None, alignment_C: int = None,
                 iterator_algorithm: IteratorAlgorithm = None,
                 stride_support = None, swizzling_functor: cutlass_cppgen.swizzle = None,
-                epilogue_functor = None, print_module: bool = False) -> cutlass_cppgen.backend.Conv2dOperation:
+                epilogue_functor = None, print_module: bool = False, problem_size: Conv2DProblemSize = None,
+                split_k_slices: int = 1) -> cutlass_cppgen.backend.Conv2dOperation:
         """
         Emits and compiles the kernel currently specified. If ``tile_description`` and any
         of the ``alignment`` parameters are set, the kernel will be chosen using this
@@ -660,6 +671,12 @@ class Conv2d(OperationBase):
         :param swizzling_functor: the swizzling functor
         :type swizzling_functor: cutlass_cppgen.swizzle
         :param epilogue_functor: the epilogue functor
+        :param print_module: whether to print the emitted C++ code
+        :type print_module: bool
+        :param problem_size: size of the problem for which the kernel is selected
+        :type problem_size: cutlass_cppgen.shape.Conv2DProblemSize
+        :param split_k_slices: number of split-K slices with which the kernel is run
+        :type split_k_slices: int
 
         :return: operation that was compiled
         :rtype: cutlass_cppgen.backend.Conv2dOperation
@@ -667,7 +684,8 @@ class Conv2d(OperationBase):
 
         self.operation = self.construct(
             tile_description, alignment_A, alignment_B, alignment_C,
-            iterator_algorithm, stride_support, swizzling_functor, epilogue_functor)
+            iterator_algorithm, stride_support, swizzling_functor, epilogue_functor,
+            problem_size, split_k_slices)
 
         if print_module:
             print(self.operation.rt_module.emit())
@@ -837,23 +855,15 @@ class Conv2d(OperationBase):
             epilogue_functor = self.epilogue_functor
 
         # The alignment is determined by the iterator function (I believe)
-        self.compile(tile_description=self.tile_description, alignment_A=alignment_a, alignment_B=alignment_b,
-                     alignment_C=alignment_c, iterator_algorithm=iterator_algorithm, stride_support=stride_support,
-                     swizzling_functor=swizzling_functor, epilogue_functor=epilogue_functor, print_module=print_module)
+        self._compile_for_run(alignment_a, alignment_b, alignment_c, iterator_algorithm, stride_support,
+                              swizzling_functor, epilogue_functor, print_module, problem_size, split_k[1])
 
         # Create reduction operation for parallel split-k
         if split_k[0] == "parallel" and split_k[1] > 1:
-            epilogue_functor_reduction = self._reset_epilogue_functor_alignment(alignment_c, self.epilogue_functor)
-            self.reduction_operation = ReductionOperation(
-                shape=MatrixCoord(4, 32 * alignment_c), C=self.operation.C,
-                element_accumulator=self._element_accumulator,
-                element_compute=self._element_accumulator,
-                epilogue_functor=epilogue_functor_reduction,
-                count=alignment_c
-            )
-            if print_module:
-                print(self.reduction_operation.rt_module.emit())
-            compiler.add_module([self.reduction_operation,])
+            self.reduction_operation = self._memoized_compile(
+                ("reduction", alignment_c, self._epilogue_functor_key(self.epilogue_functor)),
+                lambda: self._compile_reduction(alignment_c, print_module),
+                bypass=print_module)
 
         arguments = Conv2dArguments(
             operation=self.operation, problem_size=problem_size,
@@ -892,6 +902,87 @@ class Conv2d(OperationBase):
 
         return arguments
 
+    def _compile_for_run(self, alignment_a: int, alignment_b: int, alignment_c: int,
+                         iterator_algorithm: IteratorAlgorithm, stride_support, swizzling_functor,
+                         epilogue_functor, print_module: bool = False, problem_size: Conv2DProblemSize = None,
+                         split_k_slices: int = 1) -> cutlass_cppgen.backend.Conv2dOperation:
+        """
+        Compiles the kernel used by ``run()``, reusing the operation compiled by a previous call with
+        the same alignments, iterator algorithm, stride support, swizzling functor, tile description
+        (or kernel selected for ``problem_size``), and epilogue. Parallel split-K runs use an identity
+        epilogue and thus get their own entry.
+
+        :param alignment_a: alignment of operand A
+        :type alignment_a: int
+        :param alignment_b: alignment of operand B
+        :type alignment_b: int
+        :param alignment_c: alignment of operand C
+        :type alignment_c: int
+        :param iterator_algorithm: the iterator algorithm used
+        :type iterator_algorithm: cutlass_library.library.IteratorAlgorithm
+        :param stride_support: the stride support of dgrad
+        :type stride_support: cutlass_library.library.StrideSupport
+        :param swizzling_functor: the swizzling functor
+        :type swizzling_functor: cutlass_cppgen.swizzle
+        :param epilogue_functor: the epilogue functor
+        :param print_module: whether to print the emitted C++ code
+        :type print_module: bool
+        :param problem_size: size of the problem for which the kernel is selected
+        :type problem_size: cutlass_cppgen.shape.Conv2DProblemSize
+        :param split_k_slices: number of split-K slices with which the kernel is run
+        :type split_k_slices: int
+
+        :return: operation that was compiled
+        :rtype: cutlass_cppgen.backend.Conv2dOperation
+        """
+        if self.tile_description is None:
+            # Selected operations are kept alive by the selection table or by ``possible_operations``,
+            # both of which are reset together with the memoized operations
+            gemm_size = None if problem_size is None else problem_size.implicit_gemm_size(self.conv_kind)
+            selected = self._select_operation(alignment_a, alignment_b, alignment_c, gemm_size,
+                                              split_k_slices=split_k_slices)
+            kernel_key = id(selected)
+        else:
+            kernel_key = self._tile_description_key(self.tile_description)
+        key = (
+            alignment_a, alignment_b, alignment_c, iterator_algorithm, stride_support, swizzling_functor,
+            kernel_key, self._epilogue_functor_key(epilogue_functor),
+        )
+        self.operation = self._memoized_compile(
+            key,
+            lambda: self.compile(
+                tile_description=self.tile_description, alignment_A=alignment_a, alignment_B=alignment_b,
+                alignment_C=alignment_c, iterator_algorithm=iterator_algorithm, stride_support=stride_support,
+                swizzling_functor=swizzling_functor, epilogue_functor=epilogue_functor, print_module=print_module,
+                problem_size=problem_size, split_k_slices=split_k_slices),
+            bypass=print_module)
+        return self.operation
+
+    def _compile_reduction(self, alignment_c: int, print_module: bool = False) -> ReductionOperation:
+        """
+        Emits and compiles the reduction kernel used for parallel split-K
+
+        :param alignment_c: alignment of operand C
+        :type alignment_c: int
+        :param print_module: whether to print the emitted C++ code
+        :type print_module: bool
+
+        :return: operation that was compiled
+        :rtype: cutlass_cppgen.backend.ReductionOperation
+        """
+        epilogue_functor_reduction = self._reset_epilogue_functor_alignment(alignment_c, self.epilogue_functor)
+        reduction_operation = ReductionOperation(
+            shape=MatrixCoord(4, 32 * alignment_c), C=self.operation.C,
+            element_accumulator=self._element_accumulator,
+            element_compute=self._element_accumulator,
+            epilogue_functor=epilogue_functor_reduction,
+            count=alignment_c
+        )
+        if print_module:
+            print(reduction_operation.rt_module.emit())
+        compiler.add_module([reduction_operation,])
+        return reduction_operation
+
     #
     # Helper functions
     #
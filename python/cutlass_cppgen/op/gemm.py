@@ -416,11 +416,15 @@ class Gemm(OperationBase):
 
     def construct(
         self, tile_description: TileDescription = None,
-        alignment_A: int = None, alignment_B: int = None, alignment_C: int = None) -> GemmOperationUniversal:
+        alignment_A: int = None, alignment_B: int = None, alignment_C: int = None,
+        problem_size: GemmCoord = None, batch_count: int = 1) -> GemmOperationUniversal:
         """
         Constructs a ``cutlass_cppgen.backend.GemmUniversalOperation`` based on the input parameters and current
         kernel specification of the ``Gemm`` object.
 
+        If neither ``tile_description`` nor a tile description of the ``Gemm`` object is set, the kernel is
+        chosen by ``self.kernel_selector`` for ``problem_size`` when it is provided.
+
         :param tile_description: tile description specifying shapes and operand types to use in the kernel
         :type tile_description: cutlass_cppgen.backend.TileDescription
         :param alignment_A: alignment of operand A
@@ -429,6 +433,10 @@ class Gemm(OperationBase):
         :type alignment_B: int
         :param alignment_C: alignment of operand C
         :type alignment_C: int
+        :param problem_size: size of the problem for which the kernel is selected
+        :type problem_size: cutlass_cppgen.shape.GemmCoord
+        :param batch_count: number of GEMMs in the batch
+        :type batch_count: int
 
         :return: operation that was constructed
         :rtype: cutlass_cppgen.backend.GemmOperationUniversal
@@ -448,7 +456,7 @@ class Gemm(OperationBase):
 
         if tile_description is None:
             if self._tile_description is None:
-                op = self.possible_operations.operations(alignment_A, alignment_B, alignment_C, self._math_operation)[0]
+                op = self._select_operation(alignment_A, alignment_B, alignment_C, problem_size, batch_count)
                 tile_description = datatypes.td_from_profiler_op(op)
 
                 # The selected op may have lower alignment than that determined above, so we must
@@ -477,7 +485,8 @@ class Gemm(OperationBase):
 
     def compile(self, tile_description: TileDescription = None,
                 alignment_A: int = None, alignment_B: int = None, alignment_C: int = None,
-                print_module: bool = False) -> cutlass_cppgen.backend.GemmOperationUniversal:
+                print_module: bool = False, problem_size: GemmCoord = None,
+                batch_count: int = 1) -> cutlass_cppgen.backend.GemmOperationUniversal:
         """
         Emits and compiles the kernel currently specified. If ``tile_description`` and any
         of the ``alignment`` parameters are set, the kernel will be chosen using this
@@ -494,11 +503,16 @@ class Gemm(OperationBase):
         :type alignment_C: int
         :param print_module: whether to print the emitted C++ code
         :type print_module: bool
+        :param problem_size: size of the problem for which the kernel is selected
+        :type problem_size: cutlass_cppgen.shape.GemmCoord
+        :param batch_count: number of GEMMs in the batch
+        :type batch_count: int
 
         :return: operation that was compiled
         :rtype: cutlass_cppgen.backend.GemmOperationUniversal
         """
-        self.operation = self.construct(tile_description, alignment_A, alignment_B, alignment_C)
+        self.operation = self.construct(tile_description, alignment_A, alignment_B, alignment_C,
+                                        problem_size, batch_count)
 
         if print_module:
             print(self.operation.rt_module.emit())
@@ -506,6 +520,50 @@ class Gemm(OperationBase):
         compiler.add_module([self.operation,])
         return self.operation
 
+    def _compile_for_run(self, alignment_A: int, alignment_B: int, alignment_C: int,
+                         print_module: bool = False, problem_size: GemmCoord = None,
+                         batch_count: int = 1) -> cutlass_cppgen.backend.GemmOperationUniversal:
+        """
+        Compiles the kernel used by ``run()`` for the given alignments, reusing the operation
+        compiled by a previous call with the same alignments, tile description (or kernel selected
+        for ``problem_size``), epilogue, and swizzling functor
+
+        :param alignment_A: alignment of operand A
+        :type alignment_A: int
+        :param alignment_B: alignment of operand B
+        :type alignment_B: int
+        :param alignment_C: alignment of operand C
+        :type alignment_C: int
+        :param print_module: whether to print the emitted C++ code
+        :type print_module: bool
+        :param problem_size: size of the problem for which the kernel is selected
+        :type problem_size: cutlass_cppgen.shape.GemmCoord
+        :param batch_count: number of GEMMs in the batch
+        :type batch_count: int
+
+        :return: operation that was compiled
+        :rtype: cutlass_cppgen.backend.GemmOperationUniversal
+        """
+        if self._tile_description is None:
+            # Selected operations are kept alive by the selection table or by ``possible_operations``,
+            # both of which are reset together with the memoized operations
+            selected = self._select_operation(alignment_A, alignment_B, alignment_C, problem_size, batch_count)
+            kernel_key = id(selected)
+        else:
+            kernel_key = self._tile_description_key(self._tile_description)
+        key = (
+            alignment_A, alignment_B, alignment_C, kernel_key,
+            self._epilogue_functor_key(self.epilogue_functor),
+            self._swizzling_functor,
+        )
+        self.operation = self._memoized_compile(
+            key,
+            lambda: self.compile(self._tile_description, alignment_A=alignment_A, alignment_B=alignment_B,
+                                 alignment_C=alignment_C, print_module=print_module,
+                                 problem_size=problem_size, batch_count=batch_count),
+            bypass=print_module)
+        return self.operation
+
     def _verify_rank(self, tensor):
         """
         Verifies that ``tensor`` has rank greater than 1
@@ -684,10 +742,8 @@ class Gemm(OperationBase):
         # Set C alignment based on D.shape so as to correctly get an alignment with void-C
         # kernels, for which `C` is None.
         alignment_c = self.possible_operations.find_alignment(D.shape, self._layout_c, operand="C")
-        self.compile(self._tile_description, alignment_A=alignment_a, alignment_B=alignment_b,
-                     alignment_C=alignment_c, print_module=print_module)
-
         problem_size, mode, batch_count = self._get_problem_args(A, B, C, D)
+        self._compile_for_run(alignment_a, alignment_b, alignment_c, print_module, problem_size, batch_count)
 
         if mode == GemmUniversalMode.Gemm or batch_count == 1:
             kwargs = {'split_k_slices': 1}
@@ -149,7 +149,9 @@ class GroupedGemm(Gemm):
     def construct(self, tile_description: TileDescription = None,
                   alignment_A: int = None,
                   alignment_B: int = None,
-                  alignment_C: int = None) -> GemmOperationGrouped:
+                  alignment_C: int = None,
+                  problem_size: GemmCoord = None,
+                  batch_count: int = 1) -> GemmOperationGrouped:
         """
         Constructs a ``cutlass_cppgen.backend.GemmOperationGrouped`` based on the input parameters and current
         kernel specification of the ``Gemm`` object.
@@ -162,6 +164,10 @@ class GroupedGemm(Gemm):
         :type alignment_B: int
         :param alignment_C: alignment of operand C
         :type alignment_C: int
+        :param problem_size: unused. The problems of a grouped GEMM are run by a single kernel regardless of their sizes.
+        :type problem_size: cutlass_cppgen.shape.GemmCoord
+        :param batch_count: unused
+        :type batch_count: int
 
         :return: operation that was constructed
         :rtype: cutlass_cppgen.backend.GemmOperationGrouped
@@ -177,7 +183,7 @@ class GroupedGemm(Gemm):
         tensor_C = TensorDescription(self._element_c, self._layout_c, alignment_C)
 
         if tile_description is None:
-            op = self.possible_operations.operations(alignment_A, alignment_B, alignment_C, self._math_operation)[0]
+            op = self._select_operation(alignment_A, alignment_B, alignment_C)
             tile_description = datatypes.td_from_profiler_op(op)
         else:
             valid, err_str = self._valid_tile_description(tile_description)
@@ -250,8 +256,7 @@ class GroupedGemm(Gemm):
         alignment_a = min((self.possible_operations.find_alignment(A.shape, self._layout_a, operand="A") for A in As))
         alignment_b = min((self.possible_operations.find_alignment(B.shape, self._layout_b, operand="B") for B in Bs))
         alignment_c = min((self.possible_operations.find_alignment(C.shape, self._layout_c, operand="C") for C in Cs))
-        self.compile(self.tile_description, alignment_A=alignment_a, alignment_B=alignment_b,
-                     alignment_C=alignment_c, print_module=print_module)
+        self._compile_for_run(alignment_a, alignment_b, alignment_c, print_module)
 
         arguments = GemmGroupedArguments(
             operation=self.operation,
@@ -35,6 +35,7 @@ Base operation used for defining high-level CUTLASS operations (e.g., GEMM, Conv
 """
 
 from bisect import bisect_left
+from collections import OrderedDict
 
 from cutlass_library import (
     DataType,
@@ -50,11 +51,17 @@ from cutlass_cppgen.backend.evt import EpilogueFunctorVisitor
 from cutlass_cppgen.backend.evt.passes.util import cc_map
 from cutlass_cppgen.backend.utils.device import device_cc
 from cutlass_cppgen.epilogue import get_activations, get_activation_epilogue, identity
+from cutlass_cppgen.kernel_selection import KernelSelector, WaveQuantizationSelector
 from cutlass_cppgen.library_defaults import KernelsForDataType, _generator_ccs
 from cutlass_cppgen.swizzle import get_swizzling_functors
 from cutlass_cppgen.utils import datatypes, check
 
 
+# Maximum number of kernel selections memoized per operation. Workloads with many distinct problem
+# sizes (e.g., dynamic batch or sequence lengths) evict the least recently used selections.
+SELECTED_OPERATIONS_CAPACITY = 1024
+
+
 class OperationBase:
     """
     Base operation used for defining high-level CUTLASS operations (e.g., GEMM, Conv2d)
@@ -69,6 +76,14 @@ class OperationBase:
         :param operation_kind: class of operation that will be performed (e.g., GEMM, Conv)
         :type operation_kind: cutlass_library.OperationKind
         """
+        # Operations already constructed and compiled by ``run()``, keyed by the per-call parameters
+        # that select the kernel. State not captured by the key clears this table when it changes.
+        self._compiled_operations = {}
+        # Operations chosen by the kernel selector, keyed by alignments and problem shape, in least
+        # recently used order and bounded by ``SELECTED_OPERATIONS_CAPACITY``
+        self._selected_operations = OrderedDict()
+        self._kernel_selector = WaveQuantizationSelector()
+        self.selected_kernel = None
         self.operation_kind = operation_kind
         self.cc = cc if cc is not None else device_cc()
         self.specified_kernel_cc = kernel_cc is not None
@@ -133,6 +148,128 @@ class OperationBase:
                 raise Exception(f'Invalid CC for CUTLASS kernels: {cc}.')
             self.current_cc = cc
             self.options = get_option_registry().options_for_cc(self.current_cc, self.operation_kind)
+            self._invalidate_compiled_operations()
+
+    def _invalidate_compiled_operations(self):
+        """
+        Drops the operations memoized by ``run()``. Must be called whenever the kernel specification
+        changes in a way that is not captured by the memoization key (e.g., compute capability,
+        opcode class, math operation, or epilogue)
+        """
+        self._compiled_operations.clear()
+        self._selected_operations.clear()
+
+    @property
+    def kernel_selector(self) -> KernelSelector:
+        """
+        Returns the policy used to choose among the operations compatible with the operands passed
+        to ``run()`` when no tile description has been set
+        """
+        return self._kernel_selector
+
+    @kernel_selector.setter
+    def kernel_selector(self, selector: KernelSelector):
+        """
+        Sets the policy used to choose among the operations compatible with the operands passed
+        to ``run()`` when no tile description has been set
+        """
+        self._kernel_selector = selector
+        self._invalidate_compiled_operations()
+
+    def _select_operation(self, alignment_A: int, alignment_B: int, alignment_C: int, problem_size=None,
+                          batch_count: int = 1, split_k_slices: int = 1):
+        """
+        Returns the profiler operation to use for the given alignments. If ``problem_size`` is provided,
+        the operation is chosen by ``self.kernel_selector`` and the estimate of the choice is stored in
+        ``self.selected_kernel``. Otherwise, the operation with the largest threadblock shape is used.
+
+        :param alignment_A: alignment of operand A
+        :type alignment_A: int
+        :param alignment_B: alignment of operand B
+        :type alignment_B: int
+        :param alignment_C: alignment of operand C
+        :type alignment_C: int
+        :param problem_size: GEMM (or implicit GEMM) problem size
+        :type problem_size: cutlass_cppgen.shape.GemmCoord
+        :param batch_count: number of GEMMs in the batch
+        :type batch_count: int
+        :param split_k_slices: number of slices into which the K mode is split
+        :type split_k_slices: int
+
+        :return: profiler operation
+        """
+        operations = self.possible_operations.operations(alignment_A, alignment_B, alignment_C, self._math_operation)
+        if problem_size is None:
+            return operations[0]
+
+        key = (alignment_A, alignment_B, alignment_C, problem_size.m, problem_size.n, problem_size.k,
+               batch_count, split_k_slices)
+        selected = self._selected_operations.get(key)
+        if selected is not None:
+            self._selected_operations.move_to_end(key)
+        else:
+            selected = self.kernel_selector.select(operations, problem_size, self.cc, batch_count, split_k_slices)
+            self._selected_operations[key] = selected
+            if len(self._selected_operations) > SELECTED_OPERATIONS_CAPACITY:
+                self._selected_operations.popitem(last=False)
+            cutlass_cppgen.logger.info(
+                f"Selected kernel for problem {problem_size.m}x{problem_size.n}x{problem_size.k} "
+                f"(batch {batch_count}, split-K {split_k_slices}): {selected}")
+        self.selected_kernel = selected
+        return selected.operation
+
+    @staticmethod
+    def _tile_description_key(td) -> str:
+        """
+        Returns a hashable identifier of the tile description ``td`` for use in memoization keys
+
+        :param td: tile description, or ``None`` for the default tile description
+        :type td: cutlass_cppgen.backend.TileDescription
+
+        :return: identifier of the tile description
+        :rtype: str
+        """
+        return None if td is None else str(td)
+
+    @staticmethod
+    def _epilogue_functor_key(epilogue_functor):
+        """
+        Returns a hashable identifier of ``epilogue_functor`` that covers its type, activation and
+        element types, but not its alignment, which ``construct()`` resets based on the alignment of operand C
+
+        :param epilogue_functor: epilogue functor
+        """
+        if epilogue_functor is None:
+            return None
+        if isinstance(epilogue_functor, EpilogueFunctorVisitor):
+            return id(epilogue_functor)
+        return (
+            type(epilogue_functor),
+            getattr(epilogue_functor, "activation_functor", identity),
+            getattr(epilogue_functor, "element_output", None),
+            getattr(epilogue_functor, "element_accumulator", None),
+            getattr(epilogue_functor, "element_epilogue", None),
+        )
+
+    def _memoized_compile(self, key: tuple, compile_fn, bypass: bool = False):
+        """
+        Returns the operation compiled for ``key``, calling ``compile_fn`` only if no operation has
+        been compiled for ``key`` since the kernel specification last changed. Hits leave
+        ``self.epilogue_functor`` as it is, even though ``compile_fn`` may update it on misses.
+
+        :param key: hashable description of the per-call parameters that select the kernel
+        :type key: tuple
+        :param compile_fn: callable constructing and compiling the operation
+        :param bypass: whether to always call ``compile_fn`` (e.g., to print the emitted module)
+        :type bypass: bool
+
+        :return: compiled operation
+        """
+        operation = None if bypass else self._compiled_operations.get(key)
+        if operation is None:
+            operation = compile_fn()
+            self._compiled_operations[key] = operation
+        return operation
 
     def _verify_scalar(self, scalar, ref_scalar, ref_dtype, name):
         """
@@ -228,6 +365,7 @@ class OperationBase:
                 f'layout combination ({self._layout_a}, {self._layout_b}).')
 
         # Changing the op class also changes the possible operations available. Reset these.
+        self._invalidate_compiled_operations()
         self.possible_operations = self.options.operations(
             self.op_class, self._element_a, self._element_b,
             self._element_accumulator, self._layout_a, self._layout_b, self._math_operation)
@@ -317,6 +455,7 @@ class OperationBase:
         Set the epilogue functor based on the provided activation function
         """
         self.epilogue_functor = self._create_epilogue_functor_activation(activation)
+        self._invalidate_compiled_operations()
 
     def _reset_epilogue_functor_alignment(self, alignment, epilogue_functor):
         """
@@ -387,6 +526,7 @@ class OperationBase:
         Create the epilogue visitor
         """
         self.epilogue_functor = EpilogueFunctorVisitor(cc_map[self.cc], visitor)
+        self._invalidate_compiled_operations()
 
         # The epilogue_functor may consume too much shared memory
         # Reset the possible operations
@@ -37,6 +37,7 @@ from . import conv2d_operation
 from . import conv3d_operation
 from . import emit_kernel_listing
 from . import gemm_operation
+from . import kernel_catalog
 
 if '-m' not in sys.argv:
     # Do not import generator when running python -m cutlass_library.generator to
@@ -35,6 +35,7 @@ Utilities for emitting Conv2d kernels
 """
 
 import enum
+import functools
 import logging
 import os.path
 import shutil
@@ -114,6 +115,10 @@ class Conv2dOperation:
 
   #
   def extended_name(self):
+    return self._extended_name
+
+  @functools.cached_property
+  def _extended_name(self):
     ''' Append data types if they differ from compute type. '''
     if self.C.element != self.tile_description.math_instruction.element_accumulator and \
       self.A.element != self.tile_description.math_instruction.element_accumulator:
@@ -138,6 +143,10 @@ class Conv2dOperation:
 
   #
   def configuration_name(self):
+    return self._configuration_name
+
+  @functools.cached_property
+  def _configuration_name(self):
     ''' The full procedural name indicates architecture, extended name, tile size, and layout. '''
 
     opcode_class_name = OpcodeClassNames[self.tile_description.math_instruction.opcode_class]
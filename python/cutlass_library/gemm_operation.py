@@ -201,6 +201,10 @@ class GemmOperation:
 
   # Generates a string representing the MMA instruction.
   def extended_name(self):
+    return self._extended_name
+
+  @functools.cached_property
+  def _extended_name(self):
     ''' Append data types if they differ from compute type. '''
     element_sfa = ""
     element_sfb = ""
@@ -246,6 +250,10 @@ class GemmOperation:
     return mode_name
 
   def extended_name_3x(self):
+    return self._extended_name_3x
+
+  @functools.cached_property
+  def _extended_name_3x(self):
     '''Generates a string representing the MMA atom. Assumes accumulator type is C type.'''
     extended_name = "{core_name}_{element_a}_{element_b}_{element_acc}_{element_c}_{element_d}".format(
       element_a = DataTypeNames[self.A.element],
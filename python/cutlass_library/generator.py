@@ -36,6 +36,7 @@ Utilities for enumerating CUTLASS library kernels
 
 import argparse
 import enum
+import functools
 from itertools import chain, product
 import logging
 import os.path
@@ -92,11 +93,13 @@ try:
   from cutlass_library.manifest import *
   from cutlass_library.heuristics import *
   from cutlass_library.emit_kernel_listing import emit_gemm_kernel_testlist 
+  from cutlass_library.kernel_catalog import emit_kernel_catalog
 except ImportError:
   from library import *
   from manifest import *
   from heuristics import *
   from emit_kernel_listing import emit_gemm_kernel_testlist 
+  from kernel_catalog import emit_kernel_catalog
 ###################################################################################################
 
 #
@@ -155,6 +158,8 @@ def CreateGemmOperator(manifest, layouts, tile_descriptions, data_type, \
     tile_descriptions = [tile_descriptions[0],]
     alignment_constraints = [alignment_constraints[0],]
 
+  tile_descriptions = manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm)
+
   for layout in layouts:
     for tile_description in tile_descriptions:
       for alignment in alignment_constraints:
@@ -204,6 +209,8 @@ def CreateGemmUniversal3xOperator(
       return operations
     tile_descriptions = [tile_descriptions[0]]
 
+  tile_descriptions = manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm)
+
   combinations = product(layouts, tile_descriptions, data_types, complex_transforms, schedules, tile_schedulers)
   for layout, tile_description, data_type, complex_transform, schedules, tile_scheduler in combinations:
     kernel_schedule, epilogue_schedule = schedules
@@ -292,6 +299,8 @@ def CreateSparseGemmUniversal3xOperator(
   if manifest.kernel_filter == '':
     tile_descriptions = [tile_descriptions[0]]
 
+  tile_descriptions = manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm)
+
   combinations = product(layouts, tile_descriptions, data_types, complex_transforms, schedules, tile_schedulers)
   for layout, tile_description, data_type, complex_transform, schedules, tile_scheduler in combinations:
     kernel_schedule, epilogue_schedule = schedules
@@ -335,6 +344,8 @@ def CreateSparseGemmOperator(manifest, layouts, tile_descriptions, data_type, \
     tile_descriptions = [tile_descriptions[0],]
     alignment_constraints = [alignment_constraints[0],]
 
+  tile_descriptions = manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm)
+
   for layout in layouts:
     for tile_description in tile_descriptions:
       for alignment in alignment_constraints:
@@ -370,6 +381,8 @@ def CreateGemmPlanarComplexOperator(manifest, layouts, tile_descriptions, data_t
     tile_descriptions = [tile_descriptions[0],]
     alignment_constraints = [alignment_constraints[0],]
 
+  tile_descriptions = manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm)
+
   for gemm_kind in gemm_kinds:
     for layout in layouts:
       for tile_description in tile_descriptions:
@@ -404,6 +417,8 @@ def CreateGemmGroupedOperator(manifest, layouts, tile_descriptions, data_type, \
     tile_descriptions = [tile_descriptions[0],]
     alignment_constraints = [alignment_constraints[0],]
 
+  tile_descriptions = manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm)
+
   for layout in layouts:
     for tile_description in tile_descriptions:
       for alignment in alignment_constraints:
@@ -437,6 +452,8 @@ def CreateRankKOperator(manifest, layouts, fill_modes, tile_descriptions, data_t
     tile_descriptions = [tile_descriptions[0],]
     alignment_constraints = [alignment_constraints[0],]
 
+  tile_descriptions = manifest.prune_tile_descriptions(tile_descriptions, OperationKind.RankK, OperationKind.Rank2K)
+
   for layout in layouts:
     for fill_mode in fill_modes:
       for tile_description in tile_descriptions:
@@ -487,6 +504,8 @@ def CreateTrmmOperator(manifest, layouts, side_modes, fill_modes, diag_types, ti
     tile_descriptions = [tile_descriptions[0],]
     alignment_constraints = [alignment_constraints[0],]
 
+  tile_descriptions = manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Trmm)
+
   for layout in layouts:
     for side_mode in side_modes:
       for fill_mode in fill_modes:
@@ -524,6 +543,8 @@ def CreateSymmOperator(manifest, layouts, side_modes, fill_modes, tile_descripti
     tile_descriptions = [tile_descriptions[0],]
     alignment_constraints = [alignment_constraints[0],]
 
+  tile_descriptions = manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Symm)
+
   for layout in layouts:
     for side_mode in side_modes:
       for fill_mode in fill_modes:
@@ -587,6 +608,8 @@ def CreateConv2dOperator(manifest, layout, tile_descriptions, data_type, alignme
     alignment_constraints = [alignment_constraints[0],]
     iterator_algorithms = [IteratorAlgorithm.Optimized]
 
+  tile_descriptions = manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Conv2d)
+
   operations = []
 
   for tile in tile_descriptions:
@@ -695,6 +718,8 @@ def CreateConv2dFixedChannelsOperator(manifest, layout, tile_descriptions, data_
     tile_descriptions = [tile_descriptions[0],]
     channel_counts = [channel_counts[0],]
 
+  tile_descriptions = manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Conv2d)
+
   operations = []
 
 
@@ -742,6 +767,8 @@ def CreateConv2dFewChannelsOperator(manifest, layout, tile_descriptions, data_ty
     tile_descriptions = [tile_descriptions[0],]
     channel_counts = [channel_counts[0],]
 
+  tile_descriptions = manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Conv2d)
+
   operations = []
 
   for tile in tile_descriptions:
@@ -787,6 +814,8 @@ def CreateConv3dOperator(manifest, layout, tile_descriptions, data_type, alignme
     tile_descriptions = [tile_descriptions[0],]
     iterator_algorithms = [IteratorAlgorithm.Optimized]
 
+  tile_descriptions = manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Conv3d)
+
   operations = []
 
   # All tile sizes for Conv3dFprop and Conv3dWgrad
@@ -860,6 +889,8 @@ def CreateDepthwiseConv2dOperator(manifest, layout, tile_descriptions, data_type
     tile_descriptions = [tile_descriptions[0],]
     alignment_constraints = [alignment_constraints[0],]
 
+  tile_descriptions = manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Conv2d)
+
   operations = []
 
   for tile in tile_descriptions:
@@ -1015,6 +1046,10 @@ class ConvOperation3x:
     return "%s%s%s" % (math_op_string, intermediate_type, ConvKindNames[self.conv_kind])
 
   def extended_name(self):
+    return self._extended_name
+
+  @functools.cached_property
+  def _extended_name(self):
     '''Generates a string representing the MMA atom. Assumes accumulator type is C type.'''
     extended_name = "{core_name}_{element_a}{layout_a}_{element_b}{layout_b}_{element_acc}_{element_c}_{element_d}{layout_c}".format(
       element_a = DataTypeNames[self.A.element],
@@ -1043,6 +1078,10 @@ class ConvOperation3x:
 
   # Generates the full kernel function name
   def configuration_name(self):
+    return self._configuration_name
+
+  @functools.cached_property
+  def _configuration_name(self):
     ''' The full function name indicates architecture, extended name, tile size, and layout. '''
     kernel_name_template = "cutlass3x_sm{ar}_{op}_{ex}{ct}{cs}_{l}_align{al}{t}{k}{e}"
     return kernel_name_template.format(
@@ -1183,6 +1222,12 @@ def CreateConvOperator3x(manifest: Manifest,
   # Each of A, B, and C has the form [layout, alignment].
   layouts = [dims_to_layouts(A_B_C) for A_B_C in dims_and_alignments]
 
+  # the layout determines whether a convolution is 2-D or 3-D, so disabled kinds are dropped per layout
+  layouts = [layout for layout in layouts
+             if manifest.accepts_operation_kind(convolution_tensor_layout_type_to_operation_kind(layout[0][0]))]
+  tile_descriptions = manifest.prune_tile_descriptions(
+    tile_descriptions, *[convolution_tensor_layout_type_to_operation_kind(layout[0][0]) for layout in layouts])
+
   if type(data_types) is dict:
     data_types = [data_types]
 
@@ -5256,7 +5301,7 @@ def GenerateSM90_TensorOp_16b_WGMMA_gemm(manifest, cuda_version, gemm_kind=GemmK
       is_aligned=is_aligned,
       level=instantiation_level)
 
-  for tile_desc in tile_descriptions:
+  for tile_desc in manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm):
     math_inst = tile_desc.math_instruction
     data_type_w_source = generate_data_types_from_math_instruction(math_inst)
     data_type_wo_source = generate_data_types_from_math_instruction(math_inst, element_source=DataType.void)
@@ -5326,7 +5371,7 @@ def GenerateSM90_TensorOp_16b_WGMMA_alignx_gemm(manifest, cuda_version):
       is_aligned=is_aligned,
       level=instantiation_level)
 
-  for tile_desc in tile_descriptions:
+  for tile_desc in manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm):
     math_inst = tile_desc.math_instruction
     data_type_w_source = generate_data_types_from_math_instruction(math_inst)
     data_types = [data_type_w_source]
@@ -5383,7 +5428,7 @@ def GenerateSM90_SparseTensorOp_16b_WGMMA_gemm(manifest, cuda_version):
       is_aligned=is_aligned,
       level=instantiation_level)
 
-  for tile_desc in tile_descriptions:
+  for tile_desc in manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm):
     math_inst = tile_desc.math_instruction
     data_type_w_source = generate_data_types_from_math_instruction(math_inst)
     data_type_wo_source = generate_data_types_from_math_instruction(math_inst, element_source=DataType.void)
@@ -5448,7 +5493,7 @@ def GenerateSM90_TensorOp_tf32_WGMMA_gemm(manifest, cuda_version):
       is_aligned=is_aligned,
       level=instantiation_level)
 
-  for tile_desc in tile_descriptions:
+  for tile_desc in manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm):
     math_inst = tile_desc.math_instruction
 
     for layout in layouts:
@@ -5510,7 +5555,7 @@ def GenerateSM90_TensorOp_tf32_WGMMA_alignx_gemm(manifest, cuda_version):
       is_aligned=is_aligned,
       level=instantiation_level)
 
-  for tile_desc in tile_descriptions:
+  for tile_desc in manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm):
     math_inst = tile_desc.math_instruction
 
     for layout in layouts:
@@ -5560,7 +5605,7 @@ def GenerateSM90_SparseTensorOp_tf32_WGMMA_gemm(manifest, cuda_version):
       is_aligned=is_aligned,
       level=instantiation_level)
 
-  for tile_desc in tile_descriptions:
+  for tile_desc in manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm):
     math_inst = tile_desc.math_instruction
 
     for layout in layouts:
@@ -5615,7 +5660,7 @@ def GenerateSM90_TensorOp_int8_WGMMA_gemm(manifest, cuda_version):
       is_aligned=is_aligned,
       level=instantiation_level)
 
-  for tile_desc in tile_descriptions:
+  for tile_desc in manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm):
     math_inst = tile_desc.math_instruction
     data_type_w_source = generate_data_types_from_math_instruction(math_inst)
     data_type_wo_source = generate_data_types_from_math_instruction(math_inst, element_source=DataType.void)
@@ -5668,7 +5713,7 @@ def GenerateSM90_TensorOp_int8_WGMMA_alignx_gemm(manifest, cuda_version):
       is_aligned=is_aligned,
       level=instantiation_level)
 
-  for tile_desc in tile_descriptions:
+  for tile_desc in manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm):
     math_inst = tile_desc.math_instruction
     data_type_w_source = generate_data_types_from_math_instruction(math_inst)
     data_type_int8_output = generate_data_types_from_math_instruction(
@@ -5719,7 +5764,7 @@ def GenerateSM90_SparseTensorOp_int8_WGMMA_gemm(manifest, cuda_version):
       is_aligned=is_aligned,
       level=instantiation_level)
 
-  for tile_desc in tile_descriptions:
+  for tile_desc in manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm):
     math_inst = tile_desc.math_instruction
     # s8.u8 and u8.s8 wgmma variants require PTX 8.4
     if math_inst.element_a != math_inst.element_b and not CudaToolkitVersionSatisfies(cuda_version, 12, 4):
@@ -5774,7 +5819,7 @@ def GenerateSM90_TensorOp_fp8_WGMMA_gemm(manifest, cuda_version, gemm_kind=GemmK
       is_aligned=is_aligned,
       level=instantiation_level)
 
-  for tile_desc in tile_descriptions:
+  for tile_desc in manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm):
     math_inst = tile_desc.math_instruction
     data_types = []
     fp8_types = [DataType.e4m3, DataType.e5m2]
@@ -5869,7 +5914,7 @@ def GenerateSM90_TensorOp_fp8_WGMMA_gemm_with_blockwise(manifest, cuda_version,
     desc.explicit_vector_sizes = [1, 1, desc.tile_shape[2]]
     tile_descriptions.append(copy.deepcopy(desc))
 
-  for tile_desc in tile_descriptions:
+  for tile_desc in manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm):
     math_inst = tile_desc.math_instruction
     data_types = []
     fp8_types = [DataType.e4m3, DataType.e5m2]
@@ -5940,7 +5985,7 @@ def GenerateSM90_TensorOp_fp8_WGMMA_alignx_gemm(manifest, cuda_version):
       is_aligned=is_aligned,
       level=instantiation_level)
 
-  for tile_desc in tile_descriptions:
+  for tile_desc in manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm):
     math_inst = tile_desc.math_instruction
     data_types = [generate_data_types_from_math_instruction(math_inst)]
     fp8_types = [DataType.e4m3, DataType.e5m2]
@@ -6024,7 +6069,7 @@ def GenerateSM90_TensorOp_mixed_dtype_WGMMA_gemm(manifest, cuda_version):
     is_aligned=is_aligned,
     level=instantiation_level)
 
-  for tile_desc in tile_descriptions:
+  for tile_desc in manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm):
     math_inst = tile_desc.math_instruction
     data_types = []
 
@@ -6087,7 +6132,7 @@ def GenerateSM90_SparseTensorOp_fp8_WGMMA_gemm(manifest, cuda_version):
       is_aligned=is_aligned,
       level=instantiation_level)
 
-  for tile_desc in tile_descriptions:
+  for tile_desc in manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm):
     math_inst = tile_desc.math_instruction
     data_types = []
     fp8_types = [DataType.e4m3, DataType.e5m2]
@@ -12258,8 +12303,12 @@ def define_parser():
   parser.add_argument('--heuristics-restrict-kernels', action='store_true', help='Restrict heuristics mode to use only the default set of kernels emitted by generator.py')
   parser.add_argument('--selected-kernel-list',   type=str, default=None, required=False,
                         help='Specify the output log file containing all enabled kernels in this build')
+  parser.add_argument('--kernel-catalog',   type=str, default=None, required=False,
+                        help='Write a queryable SQLite catalog of all enabled kernels to this path (see cutlass_library.kernel_catalog)')
   parser.add_argument("--interface-dir", default=None, required=False, help="Interface header to kernels")
   parser.add_argument("--disable-full-archs-compilation", action="store_true", required=False, help="Disable compilation for every archs in --architectures")
+  parser.add_argument("--incremental-emit", action="store_true", required=False, help="Only rewrite generated files whose contents changed since the previous run, and remove stale ones")
+  parser.add_argument("--emit-jobs", default=1, type=int, required=False, help="Number of processes used to write kernel configuration files. 0 uses all available cores")
   parser.add_argument("--log-level", default='info', type=numeric_log_level, required=False,
                       help='Logging level to be used by the generator script')
   parser.add_argument('--instantiation-level', type=str, default="", required=False, help="Instantiation level for SM90 kernels. Set to `max` and make sure `--kernels` is not empty to generate all possible configurations.")
@@ -12318,4 +12367,7 @@ if __name__ == "__main__":
         for line in manifest.selected_kernels:
           file_writer.write("%s\n" % line)
 
+  if args.kernel_catalog is not None:
+    emit_kernel_catalog(manifest, args.kernel_catalog)
+
 ###################################################################################################
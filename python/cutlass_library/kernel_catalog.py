@@ -0,0 +1,308 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Queryable catalog of the operations selected by a Manifest.
+
+The catalog is a SQLite database with one row per selected operation holding its structured
+attributes (tile, cluster, stages, schedules, data types, layouts, alignments, shared memory
+estimate and compute capability range). It is written by ``generator.py --kernel-catalog <path>``
+and answers queries such as "SM90 bf16 TN kernels with alignment 8 and a 2x1 cluster" without
+rerunning the generator or parsing kernel names:
+
+.. code-block:: python
+
+    from cutlass_library.kernel_catalog import KernelCatalog
+
+    with KernelCatalog("kernels.db") as catalog:
+        names = catalog.names(cc=90, element_a="bf16", layout_a="RowMajor", layout_b="ColumnMajor",
+                              alignment_a=8, cluster_m=2, cluster_n=1)
+
+Enumerated attributes are stored as the name of their enum member (``DataType.bf16`` is ``"bf16"``,
+``LayoutType.RowMajor`` is ``"RowMajor"``), and queries accept either form.
+"""
+
+import collections
+import enum
+import os
+import sqlite3
+
+try:
+  import builtins
+  if hasattr(builtins, "CUTLASS_IGNORE_PACKAGE") and CUTLASS_IGNORE_PACKAGE == True:
+    raise ImportError("Disabling attempt to import cutlass_library")
+  from cutlass_library.library import *
+except ImportError:
+  from library import *
+
+###################################################################################################
+
+# Bumped whenever the columns change so that stale catalogs are rejected instead of misread
+KERNEL_CATALOG_VERSION = 1
+
+# (column name, SQLite type) in table order
+KernelCatalogColumns = [
+  ("name", "TEXT"),
+  ("operation_kind", "TEXT"),
+  ("kind", "TEXT"),
+  ("arch", "INTEGER"),
+  ("min_cc", "INTEGER"),
+  ("max_cc", "INTEGER"),
+  ("opcode_class", "TEXT"),
+  ("math_operation", "TEXT"),
+  ("instruction_m", "INTEGER"),
+  ("instruction_n", "INTEGER"),
+  ("instruction_k", "INTEGER"),
+  ("tile_m", "INTEGER"),
+  ("tile_n", "INTEGER"),
+  ("tile_k", "INTEGER"),
+  ("cluster_m", "INTEGER"),
+  ("cluster_n", "INTEGER"),
+  ("cluster_k", "INTEGER"),
+  ("stages", "INTEGER"),
+  ("kernel_schedule", "TEXT"),
+  ("epilogue_schedule", "TEXT"),
+  ("tile_scheduler", "TEXT"),
+  ("element_a", "TEXT"),
+  ("element_b", "TEXT"),
+  ("element_c", "TEXT"),
+  ("element_d", "TEXT"),
+  ("element_accumulator", "TEXT"),
+  ("element_epilogue", "TEXT"),
+  ("layout_a", "TEXT"),
+  ("layout_b", "TEXT"),
+  ("layout_c", "TEXT"),
+  ("layout_d", "TEXT"),
+  ("alignment_a", "INTEGER"),
+  ("alignment_b", "INTEGER"),
+  ("alignment_c", "INTEGER"),
+  ("alignment_d", "INTEGER"),
+  ("smem_kib", "INTEGER"),
+]
+
+# Column groups that typical kernel-selection queries filter on
+KernelCatalogIndices = [
+  ("operation_kind", "min_cc", "max_cc"),
+  ("element_a", "element_b", "element_c", "element_d"),
+  ("layout_a", "layout_b"),
+  ("tile_m", "tile_n", "tile_k"),
+  ("cluster_m", "cluster_n", "cluster_k"),
+  ("kernel_schedule", "epilogue_schedule"),
+  ("alignment_a", "alignment_b"),
+]
+
+KernelRecord = collections.namedtuple("KernelRecord", [column for column, _ in KernelCatalogColumns])
+
+###################################################################################################
+
+#
+def _enum_name(value):
+  return value.name if isinstance(value, enum.Enum) else value
+
+#
+def _shape(shape, rank = 3):
+  if shape is None:
+    return [None,] * rank
+  return list(shape)[:rank] + [None,] * (rank - len(shape))
+
+#
+def _kind(operation):
+  for attribute in ("gemm_kind", "conv_kind", "rank_k_kind", "trmm_kind", "symm_kind"):
+    if hasattr(operation, attribute):
+      return getattr(operation, attribute)
+  return None
+
+#
+def _tensor_columns(tensor):
+  if tensor is None:
+    return [None, None, None]
+  return [tensor.element.name, tensor.layout.name, tensor.alignment]
+
+#
+def kernel_catalog_record(operation):
+  '''
+    Returns the KernelRecord describing one operation
+  '''
+  tile_description = operation.tile_description
+  math_instruction = tile_description.math_instruction
+
+  element_a, layout_a, alignment_a = _tensor_columns(operation.A)
+  element_b, layout_b, alignment_b = _tensor_columns(getattr(operation, "B", None))
+  element_c, layout_c, alignment_c = _tensor_columns(operation.C)
+  element_d, layout_d, alignment_d = _tensor_columns(getattr(operation, "D", None) or operation.C)
+
+  return KernelRecord(
+    operation.procedural_name(),
+    operation.operation_kind.name,
+    _enum_name(_kind(operation)),
+    operation.arch,
+    tile_description.minimum_compute_capability,
+    tile_description.maximum_compute_capability,
+    math_instruction.opcode_class.name,
+    math_instruction.math_operation.name,
+    *_shape(math_instruction.instruction_shape),
+    *_shape(tile_description.threadblock_shape),
+    *_shape(getattr(tile_description, "cluster_shape", None)),
+    tile_description.stages,
+    _enum_name(getattr(operation, "kernel_schedule", None)),
+    _enum_name(getattr(operation, "epilogue_schedule", None)),
+    _enum_name(getattr(operation, "tile_scheduler", None)),
+    element_a, element_b, element_c, element_d,
+    math_instruction.element_accumulator.name,
+    _enum_name(getattr(operation, "element_epilogue", None)),
+    layout_a, layout_b, layout_c, layout_d,
+    alignment_a, alignment_b, alignment_c, alignment_d,
+    # Kernels with an automatic stage count (stages == 0) size their pipeline at compile time
+    CalculateSmemUsage(operation) if tile_description.stages else None,
+  )
+
+#
+def emit_kernel_catalog(manifest, path):
+  '''
+    Writes every operation selected by manifest to a fresh SQLite catalog at path
+  '''
+  if os.path.exists(path):
+    os.remove(path)
+
+  columns = ", ".join("{} {}".format(column, sql_type) for column, sql_type in KernelCatalogColumns)
+  placeholders = ", ".join("?" for _ in KernelCatalogColumns)
+
+  connection = sqlite3.connect(path)
+  try:
+    with connection:
+      connection.execute("CREATE TABLE kernels ({}, PRIMARY KEY (name))".format(columns))
+      connection.executemany("INSERT INTO kernels VALUES ({})".format(placeholders),
+                             (kernel_catalog_record(operation) for operation in manifest.operations_by_name.values()))
+      for index_columns in KernelCatalogIndices:
+        connection.execute("CREATE INDEX idx_{} ON kernels ({})".format("_".join(index_columns), ", ".join(index_columns)))
+      connection.execute("PRAGMA user_version = {}".format(KERNEL_CATALOG_VERSION))
+  finally:
+    connection.close()
+
+###################################################################################################
+
+class KernelCatalog:
+  '''
+    Read-only view of a catalog written by emit_kernel_catalog.
+
+    Keyword criteria name catalog columns. A value matches by equality, a list/tuple/set matches
+    any of its members and None matches SQL NULL. The cc criterion selects kernels whose
+    [min_cc, max_cc] range contains the given compute capability.
+  '''
+
+  def __init__(self, path):
+    if not os.path.exists(path):
+      raise RuntimeError("Kernel catalog {} does not exist".format(path))
+    self.path = path
+    self.connection = sqlite3.connect("file:{}?mode=ro".format(path), uri=True)
+    version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+    if version != KERNEL_CATALOG_VERSION:
+      self.connection.close()
+      raise RuntimeError("Kernel catalog {} has version {}, expected {}. Regenerate it with generator.py --kernel-catalog".format(
+        path, version, KERNEL_CATALOG_VERSION))
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.close()
+
+  def __len__(self):
+    return self.count()
+
+  #
+  def close(self):
+    self.connection.close()
+
+  #
+  def _where(self, cc, criteria):
+    clauses = []
+    parameters = []
+
+    if cc is not None:
+      clauses.append("min_cc <= ? AND max_cc >= ?")
+      parameters += [cc, cc]
+
+    for column, value in criteria.items():
+      if column not in KernelRecord._fields:
+        raise RuntimeError("Unknown kernel catalog column '{}'. Valid columns are: {}".format(column, ", ".join(KernelRecord._fields)))
+      if value is None:
+        clauses.append("{} IS NULL".format(column))
+      elif isinstance(value, (list, tuple, set, frozenset)):
+        values = [_enum_name(v) for v in value]
+        clauses.append("{} IN ({})".format(column, ", ".join("?" for _ in values)))
+        parameters += values
+      else:
+        clauses.append("{} = ?".format(column))
+        parameters.append(_enum_name(value))
+
+    if not clauses:
+      return "", parameters
+    return " WHERE " + " AND ".join(clauses), parameters
+
+  #
+  def query(self, cc = None, order_by = "name", **criteria):
+    '''
+      Returns the KernelRecords matching all criteria, sorted by the order_by column
+    '''
+    if order_by not in KernelRecord._fields:
+      raise RuntimeError("Unknown kernel catalog column '{}'".format(order_by))
+    where, parameters = self._where(cc, criteria)
+    cursor = self.connection.execute("SELECT * FROM kernels{} ORDER BY {}".format(where, order_by), parameters)
+    return [KernelRecord(*row) for row in cursor]
+
+  #
+  def names(self, cc = None, **criteria):
+    '''
+      Returns the sorted names of the kernels matching all criteria
+    '''
+    where, parameters = self._where(cc, criteria)
+    cursor = self.connection.execute("SELECT name FROM kernels{} ORDER BY name".format(where), parameters)
+    return [row[0] for row in cursor]
+
+  #
+  def count(self, cc = None, **criteria):
+    '''
+      Returns the number of kernels matching all criteria
+    '''
+    where, parameters = self._where(cc, criteria)
+    return self.connection.execute("SELECT COUNT(*) FROM kernels{}".format(where), parameters).fetchone()[0]
+
+  #
+  def get(self, name):
+    '''
+      Returns the KernelRecord of the kernel with the given name, or None
+    '''
+    row = self.connection.execute("SELECT * FROM kernels WHERE name = ?", (name,)).fetchone()
+    return None if row is None else KernelRecord(*row)
+
+###################################################################################################
@@ -35,6 +35,7 @@ Data types and tags used for emitting CUTLASS C++ kernels
 """
 
 import enum
+import functools
 import re
 
 # The following block implements enum.auto() for Python 3.5 variants that don't include it such
@@ -1191,7 +1192,7 @@ SharedMemPerCC = {
 ###################################################################################################
 
 #
-def SubstituteTemplate(template, values):
+def _SubstituteTemplateFixpoint(template, values):
   text = template
   changed = True
   while changed:
@@ -1204,6 +1205,80 @@ def SubstituteTemplate(template, values):
       text = newtext
   return text
 
+_TemplatePlaceholder = re.compile(r"\$\{([^}]*)\}")
+
+#
+def _ExpandTemplateValue(value):
+  # re.sub processes backslash escapes in replacement strings, so values are expanded the same way
+  if "\\" in value:
+    return re.sub(r"\A", value, "")
+  return value
+
+#
+class CompiledTemplate:
+  """
+  A template with ${name} placeholders, parsed once into alternating literal text and
+  placeholder names so that it can be rendered in a single pass.
+  """
+
+  __slots__ = ("literals", "names")
+
+  def __init__(self, text):
+    parts = _TemplatePlaceholder.split(text)
+    self.literals = parts[0::2]
+    self.names = parts[1::2]
+
+  def render(self, values, cycles = None):
+    """
+    Substitutes values for placeholders. A value which itself contains placeholders is
+    rendered recursively; placeholders without a value are left as they are. A placeholder
+    met again while its own value is being expanded is left as literal text, and its name is
+    added to cycles if a set is given.
+    """
+    return self._render(values, frozenset(), cycles if cycles is not None else set())
+
+  def _render(self, values, expanding, cycles):
+    literals = self.literals
+    out = [literals[0]]
+    for i, name in enumerate(self.names):
+      value = values.get(name)
+      if value is None:
+        out.append("${" + name + "}")
+      elif name in expanding:
+        cycles.add(name)
+        out.append("${" + name + "}")
+      else:
+        value = _ExpandTemplateValue(value)
+        out.append(CompiledTemplate(value)._render(values, expanding | {name}, cycles) if "${" in value else value)
+      out.append(literals[i + 1])
+    return "".join(out)
+
+#
+@functools.lru_cache(maxsize=4096)
+def CompileTemplate(template):
+  """
+  Returns the parsed form of template, cached per template string
+  """
+  return CompiledTemplate(template)
+
+#
+def SubstituteTemplate(template, values):
+  # The compiled path matches the fixpoint substitution below for string values keyed by
+  # identifiers. Other keys are interpreted as regular expressions, and other values as
+  # re.sub replacements, so those fall back to it.
+  if not all(isinstance(value, str) for value in values.values()) or \
+     not all(isinstance(key, str) and key.isidentifier() for key in values):
+    return _SubstituteTemplateFixpoint(template, values)
+
+  cycles = set()
+  text = CompileTemplate(template).render(values, cycles)
+
+  # A placeholder can also be formed by text adjoining a substituted value. Values that refer
+  # to themselves never reach a fixpoint, so their placeholders are left as they are.
+  if not cycles and "${" in text and any(("${%s}" % key) in text for key in values):
+    text = _SubstituteTemplateFixpoint(text, values)
+  return text
+
 ###################################################################################################
 
 #
@@ -35,10 +35,14 @@ Utilities for filtering CUTLASS library kernels and emitting library intitializa
 and building code
 """
 
+import concurrent.futures
 import enum
+import hashlib
+import json
 import logging
 import os.path
 import shutil
+import tempfile
 
 try:
   import builtins
@@ -175,6 +179,24 @@ void initialize_all_${operation_name}_operations(Manifest &manifest) {
     self.top_level_file.close()
 
 
+def _emit_configuration(emitter_class, subclass_dir, configuration_name, operations):
+  """
+  Writes the source file of a single configuration and returns its path.
+  """
+  with emitter_class(subclass_dir, configuration_name) as configuration_emitter:
+    for operation in operations:
+      configuration_emitter.emit(operation)
+  return configuration_emitter.configuration_path
+
+
+def _emit_configurations(jobs):
+  """
+  Writes the source files of a batch of configurations and returns their paths.
+  Defined at module level so that it can run in a worker process.
+  """
+  return [_emit_configuration(*job) for job in jobs]
+
+
 class EmitOperationKindLibrary:
   """
   Emit the CUTLASS library initialization code for each OperationKind.
@@ -205,13 +227,21 @@ class EmitOperationKindLibrary:
   Those functions are defined in subdirectories.
   The mapping from OperationKind to emitter handles the details
   of what happens in each of those subdirectories.
+
+  If an executor is given, the configuration files are rendered by its workers.
+  All other files, and the order of source_files, are produced by the calling
+  process exactly as in serial mode, so the output is identical.
   """
 
-  def __init__(self, generated_path, min_cc, kind, args):
+  # Number of configurations sent to a worker at a time when rendering in parallel
+  batch_size = 16
+
+  def __init__(self, generated_path, min_cc, kind, args, executor=None):
     self.generated_path = generated_path
     self.min_cc = min_cc
     self.kind = kind
     self.args = args
+    self.executor = executor
     self.emitters = {
       OperationKind.Gemm: EmitGemmConfigurationLibrary,
       OperationKind.Conv2d: EmitConv2dConfigurationLibrary,
@@ -284,8 +314,25 @@ void initialize_all_sm${min_cc}_${subclass_name}_${operation_name}_operations(Ma
     # Configurations in each sub class
     self.subclass_configurations = {}
 
+    # Configurations waiting to be sent to the executor, and batches already sent
+    self.pending_jobs = []
+    self.pending_placeholders = []
+    self.submitted = []
+
     return self
 
+  def _submit_pending(self):
+    if len(self.pending_jobs) > 0:
+      future = self.executor.submit(_emit_configurations, self.pending_jobs)
+      self.submitted.append((future, self.pending_placeholders))
+      self.pending_jobs = []
+      self.pending_placeholders = []
+
+  def _cancel_submitted(self):
+    # Nothing will read the remaining results, so drop configurations not yet started
+    for future, _ in self.submitted:
+      future.cancel()
+
   #
   def emit(self, configuration_name, operations):
     _LOGGER.debug("*** EmitOperationKindLibrary::emit")
@@ -321,13 +368,19 @@ void initialize_all_sm${min_cc}_${subclass_name}_${operation_name}_operations(Ma
     subclass_dir = os.path.dirname(self.subclass_files[extended_name].name)
     _LOGGER.debug('***   subclass_dir: ' + str(subclass_dir))
 
-    with self.emitters[self.kind](subclass_dir, configuration_name) as configuration_emitter:
-      for operation in operations:
-        configuration_emitter.emit(operation)
-
-      _LOGGER.debug('***   configuration_emitter.configuration_path: ' +
-                    str(configuration_emitter.configuration_path))
-      self.source_files[extended_name].append(configuration_emitter.configuration_path)
+    if self.executor is not None:
+      # A placeholder is recorded in place of the path, which is resolved in __exit__
+      # once a worker has written the file
+      placeholder = [None]
+      self.source_files[extended_name].append(placeholder)
+      self.pending_jobs.append((self.emitters[self.kind], subclass_dir, configuration_name, operations))
+      self.pending_placeholders.append(placeholder)
+      if len(self.pending_jobs) == self.batch_size:
+        self._submit_pending()
+    else:
+      configuration_path = _emit_configuration(self.emitters[self.kind], subclass_dir, configuration_name, operations)
+      _LOGGER.debug('***   configuration_emitter.configuration_path: ' + str(configuration_path))
+      self.source_files[extended_name].append(configuration_path)
 
     self.subclass_configurations[extended_name].append(configuration_name)
     self.subclass_files[extended_name].write(SubstituteTemplate(self.configuration_prototype_template, {'configuration_name': configuration_name} ))
@@ -335,6 +388,20 @@ void initialize_all_sm${min_cc}_${subclass_name}_${operation_name}_operations(Ma
   #
   def __exit__(self, exception_type, exception_value, traceback):
     _LOGGER.debug("*** EmitOperationKindLibrary::__exit__")    
+    if self.executor is not None and exception_type is not None:
+      self._cancel_submitted()
+    elif self.executor is not None:
+      self._submit_pending()
+      try:
+        for future, placeholders in self.submitted:
+          for placeholder, path in zip(placeholders, future.result()):
+            placeholder[0] = path
+      except BaseException:
+        self._cancel_submitted()
+        raise
+      for files in self.source_files.values():
+        files[:] = [entry[0] if isinstance(entry, list) else entry for entry in files]
+
     for subclass_name, subclass_file in sorted(self.subclass_files.items()):
       subclass_cfg = {
         'min_cc': str(self.min_cc),
@@ -481,6 +548,79 @@ ${fn_calls}
     self.top_level_file.write(self.top_level_suffix)
     self.top_level_file.close()
 
+###################################################################################################
+
+# Name of the sidecar file in generated/ recording the files written by the last incremental emit
+EMIT_INDEX_FILE = '.emit_index.json'
+
+def _file_digest(path):
+  with open(path, 'rb') as f:
+    return hashlib.sha256(f.read()).hexdigest()
+
+def sync_generated_directory(staging_path, generated_path):
+  """
+  Moves the files emitted to staging_path into generated_path, only replacing files whose
+  contents differ from what the previous run wrote there. The previous run is described by
+  the sidecar index EMIT_INDEX_FILE, which records the digest, size and modification time of
+  each file; a file whose size or modification time no longer matches the index is rewritten.
+  Files in generated_path that were not emitted this time are deleted, along with any
+  directories left empty. The index is only rewritten if something changed.
+
+  Returns the number of files written.
+  """
+  index_path = os.path.join(generated_path, EMIT_INDEX_FILE)
+  previous_index = {}
+  if os.path.isfile(index_path):
+    try:
+      with open(index_path) as index_file:
+        previous_index = json.load(index_file)
+    except (OSError, ValueError):
+      _LOGGER.warning(f"Ignoring unreadable emit index {index_path}")
+
+  index = {}
+  files_written = 0
+  for root, _, files in os.walk(staging_path):
+    for file in files:
+      staged = os.path.join(root, file)
+      rel_path = os.path.relpath(staged, staging_path)
+      dest = os.path.join(generated_path, rel_path)
+      digest = _file_digest(staged)
+
+      previous = previous_index.get(rel_path)
+      if previous is not None and previous['sha256'] == digest and os.path.isfile(dest):
+        st = os.stat(dest)
+        if st.st_size == previous['size'] and st.st_mtime_ns == previous['mtime_ns']:
+          index[rel_path] = previous
+          continue
+
+      os.makedirs(os.path.dirname(dest), exist_ok=True)
+      os.replace(staged, dest)
+      st = os.stat(dest)
+      index[rel_path] = {'sha256': digest, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+      files_written += 1
+
+  # Remove stale files and the directories they leave empty
+  files_removed = 0
+  if os.path.isdir(generated_path):
+    for root, dirs, files in os.walk(generated_path, topdown=False):
+      for file in files:
+        path = os.path.join(root, file)
+        rel_path = os.path.relpath(path, generated_path)
+        if rel_path != EMIT_INDEX_FILE and rel_path not in index:
+          os.remove(path)
+          files_removed += 1
+      if root != generated_path and not os.listdir(root):
+        os.rmdir(root)
+
+  if files_written or files_removed or index != previous_index:
+    os.makedirs(generated_path, exist_ok=True)
+    tmp_index_path = index_path + '.tmp'
+    with open(tmp_index_path, 'w') as index_file:
+      json.dump(index, index_file, indent=1, sort_keys=True)
+    os.replace(tmp_index_path, index_path)
+
+  return files_written
+
 ###################################################################################################
 ###################################################################################################
 
@@ -511,6 +651,9 @@ class Manifest:
     self.compute_capabilities_feature_set = ['50',]
     self.curr_build_dir = '.'
     self.filter_by_cc = True
+    self.incremental_emit = False
+    self.files_written = 0
+    self.emit_jobs = 1
 
     if self.args:
       self.kernel_filter = self.args.kernels
@@ -558,6 +701,8 @@ class Manifest:
       self.operation_count = 0
       self.operations_by_name = {}
       self.disable_full_archs_compilation = args.disable_full_archs_compilation
+      self.incremental_emit = getattr(args, 'incremental_emit', False)
+      self.emit_jobs = getattr(args, 'emit_jobs', 1)
       self.is_kernel_filter_set_to_all = args.instantiation_level == "max" and args.kernels != ''
       self.instantiation_level = 0
       try:
@@ -623,32 +768,39 @@ class Manifest:
     return True
 
   #
-  def filter(self, operation):
-    ''' Filtering operations based on various criteria'''
-
-    # filter based on compute capability
-    enabled = not (self.filter_by_cc)
-
-    for cc in self.compute_capabilities_baseline:
-
-      if cc >= operation.tile_description.minimum_compute_capability and \
-         cc <= operation.tile_description.maximum_compute_capability and \
-         (cc not in SharedMemPerCC or SharedMemPerCC[cc] >= CalculateSmemUsage(operation)):
-
-        enabled = True
-        break
-
-    if not enabled:
-      return False
+  def accepts_operation_kind(self, operation_kind):
+    '''
+      Returns False if filter() rejects every operation of operation_kind. Create*Operator helpers
+      check this before building operations so that disabled kinds are never constructed.
+    '''
+    return not len(self.operations_enabled) or operation_kind in self.operations_enabled
 
-    if len(self.operations_enabled) and not operation.operation_kind in self.operations_enabled:
-      return False
+  #
+  def accepts_tile_description(self, tile_description):
+    '''
+      Returns False if filter() rejects every operation built on tile_description because no
+      targeted compute capability lies within its [minimum, maximum] range.
+    '''
+    if not self.filter_by_cc:
+      return True
+    return any(tile_description.minimum_compute_capability <= cc <= tile_description.maximum_compute_capability
+               for cc in self.compute_capabilities_baseline)
 
-    name = operation.procedural_name()
+  #
+  def prune_tile_descriptions(self, tile_descriptions, *operation_kinds):
+    '''
+      Returns the tile descriptions on which filter() may accept an operation of one of operation_kinds,
+      or an empty list if all of operation_kinds are disabled. Create*Operator helpers call this
+      before building operations so that combinations filter() would reject are never constructed.
+    '''
+    if not any(self.accepts_operation_kind(operation_kind) for operation_kind in operation_kinds):
+      return []
+    return [td for td in tile_descriptions if self.accepts_tile_description(td)]
 
-    # eliminate duplicates
-    if name in self.operations_by_name.keys():
-      return False
+  #
+  def accepts_kernel_name(self, name):
+    ''' Returns True if name passes the include, ignore, filter file and exclude lists'''
+    enabled = True
 
     # Filter based on list of valid substrings
     if len(self.kernel_names):
@@ -693,6 +845,37 @@ class Manifest:
       else:
         _LOGGER.debug(f"Kernel {name} NOT excluded due to not matching '{name_substr}'.")
 
+    return enabled
+
+  #
+  def filter(self, operation):
+    ''' Filtering operations based on various criteria'''
+
+    if not self.accepts_operation_kind(operation.operation_kind):
+      return False
+
+    name = operation.procedural_name()
+
+    # eliminate duplicates
+    if name in self.operations_by_name.keys():
+      return False
+
+    # names are checked first as the shared memory usage below is more expensive to compute
+    if not self.accepts_kernel_name(name):
+      return False
+
+    # filter based on compute capability
+    enabled = not (self.filter_by_cc)
+
+    for cc in self.compute_capabilities_baseline:
+
+      if cc >= operation.tile_description.minimum_compute_capability and \
+         cc <= operation.tile_description.maximum_compute_capability and \
+         (cc not in SharedMemPerCC or SharedMemPerCC[cc] >= CalculateSmemUsage(operation)):
+
+        enabled = True
+        break
+
     # TODO: filter based on compute data type
     return enabled
   #
@@ -827,42 +1010,67 @@ class Manifest:
 
     generated_path = os.path.join(self.curr_build_dir, 'generated')
 
-    # create generated/
-    if os.path.exists(generated_path):
-      shutil.rmtree(generated_path)
+    # In incremental mode, everything is first emitted to a staging directory and then
+    # synchronized into generated/, so that unchanged files keep their modification times.
+    if self.incremental_emit:
+      output_path = tempfile.mkdtemp(prefix='generated.staging.', dir=self.curr_build_dir)
+    else:
+      # create generated/
+      if os.path.exists(generated_path):
+        shutil.rmtree(generated_path)
 
-    os.mkdir(generated_path)
+      os.mkdir(generated_path)
+      output_path = generated_path
 
-    with interface_emitters[target](generated_path, self.operation_count, self.args) as iface_emitter:
-      top_level_path = iface_emitter.top_level_path
-      for operation_kind in self.operations.keys():
-        iface_emitter.emit(OperationKindNames[operation_kind])
+    # Paths recorded in manifest.cmake always refer to generated/
+    def final_path(path):
+      return os.path.join(generated_path, os.path.relpath(path, output_path))
 
-    source_files = {}
-    for kind in self.operations.keys():
-      source_files[kind] = {}
-      for min_cc in self.operations[kind].keys():
-        source_files[kind][min_cc] = {}
+    # Configuration files are rendered by a process pool if more than one job is requested
+    emit_jobs = self.emit_jobs if self.emit_jobs > 0 else (os.cpu_count() or 1)
+    executor = concurrent.futures.ProcessPoolExecutor(emit_jobs) if emit_jobs > 1 else None
 
-    for operation_kind, ops in self.operations.items():
-      for min_cc, configurations in sorted(ops.items()):
-        with operation_emitters[target](generated_path, min_cc, operation_kind, self.args) as operation_kind_emitter:
-          for configuration_name, operations in configurations.items():
-            _LOGGER.info(f"Emitting {configuration_name} with {len(operations)} operation{'' if len(operations) == 1 else 's'}.")
-            operation_kind_emitter.emit(configuration_name, operations)
+    try:
+      with interface_emitters[target](output_path, self.operation_count, self.args) as iface_emitter:
+        top_level_path = final_path(iface_emitter.top_level_path)
+        for operation_kind in self.operations.keys():
+          iface_emitter.emit(OperationKindNames[operation_kind])
 
+      source_files = {}
+      for kind in self.operations.keys():
+        source_files[kind] = {}
+        for min_cc in self.operations[kind].keys():
+          source_files[kind][min_cc] = {}
+
+      for operation_kind, ops in self.operations.items():
+        for min_cc, configurations in sorted(ops.items()):
+          with operation_emitters[target](output_path, min_cc, operation_kind, self.args, executor) as operation_kind_emitter:
+            for configuration_name, operations in configurations.items():
+              _LOGGER.info(f"Emitting {configuration_name} with {len(operations)} operation{'' if len(operations) == 1 else 's'}.")
+              operation_kind_emitter.emit(configuration_name, operations)
+
+          # Read after the emitter exits, which waits for any configurations rendered in parallel
           for subclass, files in operation_kind_emitter.source_files.items():
             if subclass not in source_files[operation_kind][min_cc]:
               source_files[operation_kind][min_cc][subclass] = []
-            source_files[operation_kind][min_cc][subclass].extend(operation_kind_emitter.source_files[subclass])
+            source_files[operation_kind][min_cc][subclass].extend(final_path(f) for f in files)
+
+        # Emit top level all_{gemm, conv2d, ...}_operations.cu files
+        with kind_emitters[target](output_path, operation_kind, self.args) as operation_kind_emitter:
+          operation_kind_emitter.emit(ops)
 
-      # Emit top level all_{gemm, conv2d, ...}_operations.cu files
-      with kind_emitters[target](generated_path, operation_kind, self.args) as operation_kind_emitter:
-        operation_kind_emitter.emit(ops)
+      # write the manifest.cmake file containing paths from all targets
+      manifest_path = os.path.join(output_path, "manifest.cmake")
 
-    # write the manifest.cmake file containing paths from all targets
-    manifest_path = os.path.join(generated_path, "manifest.cmake")
+      self.emit_manifest_cmake(manifest_path, top_level_path, source_files)
 
-    self.emit_manifest_cmake(manifest_path, top_level_path, source_files)
+      if self.incremental_emit:
+        self.files_written = sync_generated_directory(output_path, generated_path)
+        _LOGGER.info(f"Incremental emit updated {self.files_written} file{'' if self.files_written == 1 else 's'} in {generated_path}.")
+    finally:
+      if executor is not None:
+        executor.shutdown(wait=True)
+      if self.incremental_emit:
+        shutil.rmtree(output_path, ignore_errors=True)
 
 ###################################################################################################
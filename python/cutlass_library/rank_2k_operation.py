@@ -141,6 +141,10 @@ class Rank2KOperation:
 
   #
   def extended_name(self):
+    return self._extended_name
+
+  @functools.cached_property
+  def _extended_name(self):
     ''' Append data types if they differ from compute type. '''
     if self.is_complex():
       extended_name = "${core_name}"
@@ -176,6 +180,10 @@ class Rank2KOperation:
 
   #
   def procedural_name(self):
+    return self._procedural_name
+
+  @functools.cached_property
+  def _procedural_name(self):
     ''' The full procedural name indicates architecture, extended name, tile size, and layout. '''
     threadblock = self.tile_description.procedural_name()
 
@@ -182,6 +182,28 @@ def crd2idx(crd, shape, stride=None):
       return crd * stride
 
 
+# Vectorized crd2idx of an array of integral coordinates (requires NumPy)
+def crd2idx_batch(idx, shape, stride=None):
+  import numpy as np
+
+  if stride is None:
+    stride = prefix_product(shape)
+
+  flat_shape  = flatten(shape)
+  flat_stride = flatten(stride)
+  assert len(flat_shape) == len(flat_stride)
+
+  idx = np.asarray(idx)
+  if not np.issubdtype(idx.dtype, np.integer):
+    idx = idx.astype(np.int64)
+  result = np.zeros(idx.shape, dtype=np.result_type(idx.dtype, np.int64))
+  # Every mode but the last wraps around, the last mode takes the remaining index, as in crd2idx
+  for (s, d) in zip(flat_shape[:-1], flat_stride[:-1]):
+    result += (idx % s) * d
+    idx = idx // s
+  return result + idx * flat_stride[-1]
+
+
 # Transform crd into the dst_shape's iteration space
 def crd2crd(crd, dst_shape, src_shape=None):
   if is_tuple(crd):
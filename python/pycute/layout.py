@@ -34,6 +34,7 @@
 Definition of CuTe Layouts and functions to manipulate them
 """
 
+from functools import lru_cache, wraps
 from itertools import chain
 from typing import Union
 
@@ -41,25 +42,73 @@ from .int_tuple import *
 
 
 class LayoutBase:
-  pass
+  __slots__ = ()
 
 
 def is_layout(x):
   return isinstance(x, LayoutBase)
 
 
+# Maximum number of results kept by each memoized layout operation
+LAYOUT_CACHE_SIZE = 1 << 16
+
+# Maximum number of distinct shape/stride trees kept by _intern
+INTERN_TABLE_SIZE = 1 << 20
+
+_interned = {}
+
+
+# Return the canonical instance of an IntTuple, so that equal shapes and strides share storage
+def _intern(t):
+  if not is_tuple(t):
+    return t
+  try:
+    return _interned[t]
+  except KeyError:
+    pass
+  except TypeError:                    # unhashable leaves
+    return t
+  t = tuple(_intern(x) for x in t)
+  if len(_interned) >= INTERN_TABLE_SIZE:
+    _interned.clear()
+  return _interned.setdefault(t, t)
+
+
+# Immutable and hashable: equal layouts hash equal and may key dicts and sets
 class Layout(LayoutBase):
+  __slots__ = ("shape", "stride", "_flat", "_size", "_cosize", "_hash")
+
   def __init__(self, _shape, _stride=None):
-    self.shape  = _shape
     if _stride is None:
-      self.stride = prefix_product(self.shape)
-    else:
-      self.stride = _stride
+      _stride = prefix_product(_shape)
+    # The cached slots (_flat, _size, _cosize, _hash) are left unset until first use
+    _set_shape(self, _intern(_shape))
+    _set_stride(self, _intern(_stride))
+
+  def __setattr__(self, name, value):
+    raise AttributeError(f"Layout is immutable, cannot set '{name}'")
+
+  def __delattr__(self, name):
+    raise AttributeError(f"Layout is immutable, cannot delete '{name}'")
+
+  def __reduce__(self):
+    return (Layout, (self.shape, self.stride))
 
   # operator ==
   def __eq__(self, other):
+    if self is other:
+      return True
+    if not isinstance(other, Layout):
+      return NotImplemented
     return self.shape == other.shape and self.stride == other.stride
 
+  def __hash__(self):
+    try:
+      return self._hash
+    except AttributeError:
+      _set_hash(self, hash((Layout, self.shape, self.stride)))
+      return self._hash
+
   # operator len(L)  (len [rank] like tuples)
   def __len__(self):
     if is_tuple(self.shape):
@@ -87,21 +136,49 @@ class Layout(LayoutBase):
       else:
         return crd2idx(args, self.shape, self.stride)
 
+  # Map an array of linear indices to offsets, as layout(i) for each i (requires NumPy)
+  def map(self, indices):
+    return crd2idx_batch(indices, self.flat_shape, self.flat_stride)
+
   # operator []    (get-i like tuples)
   def __getitem__(self, i):
     if is_tuple(self.shape):
       return Layout(self.shape[i], self.stride[i])
     else:
       assert i == 0
-      return Layout(self.shape, self.stride)
+      return self
+
+  # Flattened (shape, stride), computed once
+  def _flatten(self):
+    try:
+      return self._flat
+    except AttributeError:
+      _set_flat(self, (flatten(self.shape), flatten(self.stride)))
+      return self._flat
+
+  @property
+  def flat_shape(self):
+    return self._flatten()[0]
+
+  @property
+  def flat_stride(self):
+    return self._flatten()[1]
 
   # size(layout)   Size of the domain
   def size(self):
-    return product(self.shape)
+    try:
+      return self._size
+    except AttributeError:
+      _set_size(self, product(self.shape))
+      return self._size
 
   # cosize(layout)   Size of the codomain
   def cosize(self):
-    return self(self.size() - 1) + 1
+    try:
+      return self._cosize
+    except AttributeError:
+      _set_cosize(self, self(self.size() - 1) + 1)
+      return self._cosize
 
   # print and str
   def __str__(self):
@@ -112,6 +189,39 @@ class Layout(LayoutBase):
     return f"Layout({self.shape},{self.stride})"
 
 
+# Slot setters that bypass Layout.__setattr__
+_set_shape  = Layout.shape.__set__
+_set_stride = Layout.stride.__set__
+_set_flat   = Layout._flat.__set__
+_set_size   = Layout._size.__set__
+_set_cosize = Layout._cosize.__set__
+_set_hash   = Layout._hash.__set__
+
+
+# Memoize a structural layout operation on its (hashable) arguments.
+# Calls with arguments that can't be hashed (e.g. tuples of layouts) are not memoized.
+# Layouts are immutable, so the cached results are shared between callers.
+# The uncached operation is available as __wrapped__.
+def _memoize_layout_op(op):
+  cached = lru_cache(maxsize=LAYOUT_CACHE_SIZE)(op)
+
+  @wraps(op)
+  def wrapper(*args, **kwargs):
+    try:
+      return cached(*args, **kwargs)
+    except TypeError:
+      # Only retry uncached when the arguments are unhashable, not on errors raised by op
+      try:
+        hash((args, tuple(kwargs.items())))
+      except TypeError:
+        return op(*args, **kwargs)
+      raise
+
+  wrapper.cache_info  = cached.cache_info
+  wrapper.cache_clear = cached.cache_clear
+  return wrapper
+
+
 # Make Layout from a list of layouts (each layout it's own mode in the result)
 def make_layout(*layouts):
   if len(layouts) == 1 and not is_layout(layouts[0]):
@@ -134,6 +244,7 @@ def cosize(layout):
 
 
 # Layout coalesce -- flatten and combine as many modes as possible while preserving the int-to-int function
+@_memoize_layout_op
 def coalesce(layout, profile=None):
   if is_tuple(profile):
     assert len(layout) >= len(profile)
@@ -142,7 +253,7 @@ def coalesce(layout, profile=None):
 
   result_shape  = [1]
   result_stride = [0]
-  for (shape,stride) in zip(flatten(layout.shape),flatten(layout.stride)):
+  for (shape,stride) in zip(layout.flat_shape,layout.flat_stride):
     # skip their shape-1s
     if shape == 1:
       continue
@@ -173,7 +284,7 @@ def filter(layout, profile=None):
 
   result_shape  = []
   result_stride = []
-  for (shape,stride) in zip(flatten(layout.shape),flatten(layout.stride)):
+  for (shape,stride) in zip(layout.flat_shape,layout.flat_stride):
     # skip their shape-1s and stride-0s
     if not (shape == 1 or stride == 0):
       result_shape.append(shape)
@@ -187,6 +298,7 @@ def filter(layout, profile=None):
 
 # Layout composition
 # Use tuples-of-layouts to perform this operation by-mode and None as no-op
+@_memoize_layout_op
 def composition(layoutA, layoutB):
   if layoutB is None:
     return layoutA
@@ -207,7 +319,7 @@ def composition(layoutA, layoutB):
     rest_shape    = layoutB.shape
     rest_stride   = layoutB.stride
     flat_A = coalesce(layoutA)
-    for (curr_shape, curr_stride) in zip(flatten(flat_A.shape)[:-1], flatten(flat_A.stride)[:-1]):
+    for (curr_shape, curr_stride) in zip(flat_A.flat_shape[:-1], flat_A.flat_stride[:-1]):
       assert curr_shape % rest_stride == 0 or rest_stride % curr_shape == 0
       new_shape = min(max(1, curr_shape // rest_stride), rest_shape)
 
@@ -220,7 +332,7 @@ def composition(layoutA, layoutB):
 
     if rest_shape != 1 or len(result_shape) == 0:
       result_shape.append(rest_shape)
-      result_stride.append(rest_stride * flatten(flat_A.stride)[-1])
+      result_stride.append(rest_stride * flat_A.flat_stride[-1])
 
     if len(result_shape) == 1:
       return Layout(result_shape[0], result_stride[0])
@@ -229,6 +341,7 @@ def composition(layoutA, layoutB):
 
 
 # Layout complement
+@_memoize_layout_op
 def complement(layout, max_idx=1):
   if is_int(layout):
     return complement(Layout(layout))
@@ -237,7 +350,7 @@ def complement(layout, max_idx=1):
   result_stride = []
   current_idx = 1
 
-  sorted_DS = sorted(zip(flatten(layout.stride), flatten(layout.shape)))
+  sorted_DS = sorted(zip(layout.flat_stride, layout.flat_shape))
   for (stride, shape) in sorted_DS:
     if stride == 0 or shape == 1:
       continue
@@ -257,6 +370,7 @@ def complement(layout, max_idx=1):
 
 
 # Layout right inverse
+@_memoize_layout_op
 def right_inverse(layout):
   if layout is None:
     return None
@@ -267,8 +381,8 @@ def right_inverse(layout):
   result_stride = []
   current_idx = 1
 
-  flat_shape  = flatten(layout.shape)
-  flat_stride = flatten(layout.stride)
+  flat_shape  = layout.flat_shape
+  flat_stride = layout.flat_stride
   sorted_DSA = sorted(zip(flat_stride, flat_shape, prefix_product(flat_shape)))
   for (stride,shape,rstride) in sorted_DSA:
     if shape == 1:
@@ -73,6 +73,14 @@ class Swizzle:
   def __call__(self, offset):
     return offset ^ shiftr(offset & self.yyy_msk, self.shift)
 
+  # Transform an array of integers (requires NumPy)
+  def map(self, offsets):
+    import numpy as np
+
+    offsets = np.asarray(offsets)
+    yyy = offsets & self.yyy_msk
+    return offsets ^ (yyy >> self.shift if self.shift >= 0 else yyy << -self.shift)
+
   # Size of the domain
   def size(self):
     return 1 << (self.bits + self.base + abs(self.shift))
@@ -108,6 +116,10 @@ class ComposedLayout(LayoutBase):
   def __call__(self, *args):
     return self.layoutB(self.offset + self.layoutA(*args))
 
+  # Map an array of linear indices to offsets (requires NumPy)
+  def map(self, indices):
+    return self.layoutB.map(self.offset + self.layoutA.map(indices))
+
   # operator []    (get-i like tuples)
   def __getitem__(self, i):
     return ComposedLayout(self.layoutB, self.offset, self.layoutA[i])
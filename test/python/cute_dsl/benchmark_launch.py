@@ -0,0 +1,92 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Host overhead of launching a JIT-compiled function, in microseconds per launch
+
+The compiled function is replaced by a stub capi function, so only the argument
+marshalling of ExecutionArgs and JitExecutor is measured.
+
+Example:
+
+  python benchmark_launch.py --iterations 100000
+"""
+
+import argparse
+import ctypes
+import inspect
+import time
+
+import cutlass
+from cutlass.base_dsl.jit_executor import ExecutionArgs, JitExecutor, JitModule
+
+
+def decode_kernel(
+    seq_len: cutlass.Int32,
+    num_heads: cutlass.Int32,
+    scale: cutlass.Float32,
+    eps: cutlass.Float32 = 1e-6,
+    *,
+    offset: cutlass.Int64 = 0,
+):
+    pass
+
+
+def timeit(fn, iterations):
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", default=100000, type=int)
+    args = parser.parse_args()
+
+    capi_func = ctypes.CFUNCTYPE(None, ctypes.c_void_p)(lambda packed_args: None)
+    exec_args = ExecutionArgs(inspect.getfullargspec(decode_kernel), "decode_kernel")
+    executor = JitExecutor(JitModule(None, capi_func, exec_args, []), None, False)
+
+    call_args = (cutlass.Int32(128), cutlass.Int32(32), cutlass.Float32(0.125))
+    exe_args, _ = exec_args.generate_execution_args(call_args, {})
+    results = [
+        ("stub capi call", timeit(lambda: capi_func(None), args.iterations)),
+        ("rectify args", timeit(lambda: exec_args.get_rectified_args(call_args, {"offset": 4}), args.iterations)),
+        ("execution args", timeit(lambda: exec_args.generate_execution_args(call_args, {"offset": 4}), args.iterations)),
+        ("packed args", timeit(lambda: executor._get_invoke_packed_args(exe_args), args.iterations)),
+        ("launch (Numeric args)", timeit(lambda: executor(*call_args, offset=4), args.iterations)),
+        ("launch (Python scalars)", timeit(lambda: executor(128, 32, 0.125, offset=4), args.iterations)),
+    ]
+    for (name, elapsed) in results:
+        print(f"{name:>24}: {elapsed:8.2f} us/launch")
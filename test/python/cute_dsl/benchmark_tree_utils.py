@@ -0,0 +1,119 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Microbenchmark of cutlass_dsl.tree_utils flatten and unflatten, and of the c-pointer
+extraction of kernel arguments, over representative kernel argument structures
+
+Example:
+
+  python benchmark_tree_utils.py --iterations 10000
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from typing import NamedTuple
+
+import cutlass
+from cutlass._mlir import ir
+from cutlass.cutlass_dsl.cutlass import _get_c_pointers_cutlass
+from cutlass.cutlass_dsl.tree_utils import tree_flatten, tree_unflatten
+
+
+class Problem(NamedTuple):
+    m: cutlass.Int32
+    n: cutlass.Int32
+    k: cutlass.Int32
+    l: cutlass.Int32
+
+
+@dataclass
+class Epilogue:
+    alpha: cutlass.Float32
+    beta: cutlass.Float32
+    tile: cutlass.Constexpr[tuple] = (128, 128)
+
+
+@dataclass
+class GemmParams:
+    problem: Problem
+    epilogue: Epilogue
+    strides: tuple
+    swizzle: cutlass.Int32
+
+
+def make_params(make_int, make_float):
+    return GemmParams(
+        Problem(*(make_int(x) for x in (4096, 4096, 1024, 1))),
+        Epilogue(make_float(1.0), make_float(0.0)),
+        tuple((make_int(s), make_int(1), make_int(0)) for s in (1024, 4096, 4096)),
+        make_int(8),
+    )
+
+
+def loop_carried(values):
+    # Loop-carried values of a mainloop: pipeline state and accumulator fragments
+    return [values[0], (values[1], values[2]), [tuple(values[3:11]), tuple(values[11:19])]]
+
+
+def timeit(fn, iterations):
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", default=10000, type=int)
+    args = parser.parse_args()
+
+    results = []
+    host_params = make_params(cutlass.Int32, cutlass.Float32)
+    results.append(("c pointers (GemmParams)", timeit(lambda: _get_c_pointers_cutlass(host_params), args.iterations)))
+
+    with ir.Context(), ir.Location.unknown():
+        module = ir.Module.create()
+        with ir.InsertionPoint(module.body):
+            params = make_params(
+                lambda x: cutlass.Int32(x).ir_value(), lambda x: cutlass.Float32(x).ir_value()
+            )
+            carried = loop_carried([cutlass.Int32(i).ir_value() for i in range(19)])
+            for (name, tree) in [("GemmParams", params), ("loop-carried", carried)]:
+                flat, treedef = tree_flatten(tree)
+                results.append((f"flatten ({name}, {len(flat)} values)", timeit(lambda: tree_flatten(tree), args.iterations)))
+                results.append((f"unflatten ({name})", timeit(lambda: tree_unflatten(treedef, flat), args.iterations)))
+
+    for (name, elapsed) in results:
+        print(f"{name:>40}: {elapsed:8.2f} us/call")
@@ -0,0 +1,191 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+"""
+Tests for the tuning database and ahead-of-time compilation of cute.testing.autotune_jit,
+with fake compile and benchmark functions instead of compiled kernels
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+try:
+    from cutlass.cute.testing import (
+        ExhaustiveSearch,
+        TuningDatabase,
+        _compile_ahead,
+        _get_function_identity,
+        _get_search_space_repr,
+        _TuningSession,
+    )
+except ImportError as e:
+    raise unittest.SkipTest(f"CuTe DSL is not available: {e}")
+
+
+PARAMS = {"tile": [(64, 64), (128, 64), (128, 128)], "stages": [2, 3, 4]}
+
+KEY = ("module.function:digest", "search space", "(1024, 1024)", "device", "12080/12080")
+
+
+def fake_cost(config):
+    return abs(config["tile"][0] - 128) + abs(config["tile"][1] - 64) + abs(config["stages"] - 3) + 1.0
+
+
+class CompileRecorder:
+    """Fake compile function recording how many compiled candidates are alive at once"""
+
+    def __init__(self, fail=()):
+        self.lock = threading.Lock()
+        self.fail = fail
+        self.compiled = 0
+        self.consumed = 0
+        self.max_alive = 0
+
+    def compile(self, config):
+        with self.lock:
+            self.compiled += 1
+            self.max_alive = max(self.max_alive, self.compiled - self.consumed)
+        if config in self.fail:
+            raise ValueError(f"cannot compile {config}")
+        return ("compiled", config)
+
+
+class CompileAheadTest(unittest.TestCase):
+    def check_stream(self, compile_workers):
+        recorder = CompileRecorder(fail=(3,))
+        results = []
+        for config, compiled, error in _compile_ahead(recorder.compile, range(8), compile_workers):
+            results.append((config, compiled, type(error)))
+            recorder.consumed += 1
+        expected = [(i, ("compiled", i), type(None)) for i in range(8)]
+        expected[3] = (3, None, ValueError)
+        self.assertEqual(results, expected)
+        self.assertLessEqual(recorder.max_alive, compile_workers + 1)
+
+    def test_inline(self):
+        self.check_stream(0)
+
+    def test_workers(self):
+        self.check_stream(1)
+        self.check_stream(3)
+
+    def test_close_stops_compilation(self):
+        recorder = CompileRecorder()
+        stream = _compile_ahead(recorder.compile, range(100), 2)
+        self.assertEqual(next(stream)[0], 0)
+        stream.close()
+        self.assertLessEqual(recorder.compiled, 3)
+
+
+class TuningDatabaseTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "nested", "autotune.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_store_and_lookup(self):
+        db = TuningDatabase(self.path)
+        self.assertIsNone(db.lookup(*KEY))
+        db.store(*KEY, {"tile": (128, 64), "stages": 3}, 12.5)
+        db.store(*KEY[:2], "(2048, 2048)", *KEY[3:], {"tile": (64, 64), "stages": 2}, 40.0)
+
+        # A new instance reads what the previous process stored
+        stored, time_us = TuningDatabase(self.path).lookup(*KEY)
+        self.assertEqual(stored, {"tile": "(128, 64)", "stages": "3"})
+        self.assertEqual(time_us, 12.5)
+        self.assertEqual(TuningDatabase.resolve_config(stored, PARAMS), {"tile": (128, 64), "stages": 3})
+
+        db.store(*KEY, {"tile": (128, 128), "stages": 4}, 10.0)
+        self.assertEqual(db.lookup(*KEY), ({"tile": "(128, 128)", "stages": "4"}, 10.0))
+
+        db.clear()
+        self.assertIsNone(db.lookup(*KEY))
+
+    def test_key_fields(self):
+        db = TuningDatabase(self.path)
+        db.store(*KEY, {"tile": (128, 64), "stages": 3}, 12.5)
+        for i in range(len(KEY)):
+            other = KEY[:i] + (KEY[i] + "'",) + KEY[i + 1 :]
+            self.assertIsNone(db.lookup(*other), f"field {i} of the key is ignored")
+
+    def test_resolve_config_outside_search_space(self):
+        self.assertIsNone(TuningDatabase.resolve_config({"tile": "(256, 64)", "stages": "3"}, PARAMS))
+        self.assertIsNone(TuningDatabase.resolve_config({"tile": "(128, 64)"}, PARAMS))
+
+    def test_environment_path(self):
+        previous = os.environ.get("CUTE_DSL_AUTOTUNE_DB")
+        os.environ["CUTE_DSL_AUTOTUNE_DB"] = self.path
+        try:
+            self.assertEqual(TuningDatabase().path, self.path)
+        finally:
+            if previous is None:
+                del os.environ["CUTE_DSL_AUTOTUNE_DB"]
+            else:
+                os.environ["CUTE_DSL_AUTOTUNE_DB"] = previous
+
+    def test_function_identity(self):
+        identity = _get_function_identity(fake_cost)
+        self.assertTrue(identity.startswith(f"{__name__}.fake_cost:"))
+        self.assertEqual(identity, _get_function_identity(fake_cost))
+        self.assertNotEqual(identity, _get_function_identity(CompileRecorder.compile))
+
+    def test_tuning_round_trip(self):
+        # Tune with a fake benchmark, persist the winner, then resolve it as a restarted process would
+        benchmarked = []
+
+        def benchmark(config, compiled, error, warmup_iterations, iterations):
+            if error is not None:
+                raise error
+            benchmarked.append(compiled[1])
+            return fake_cost(compiled[1])
+
+        session = _TuningSession(PARAMS, CompileRecorder().compile, benchmark, 0, 10, compile_workers=2)
+        strategy = ExhaustiveSearch()
+        strategy.search(session)
+        best_time, best_index, _ = session.best
+        best_config = session.config(best_index)
+        self.assertEqual(best_config, {"tile": (128, 64), "stages": 3})
+        self.assertEqual(len(benchmarked), 9)
+
+        key = (_get_function_identity(fake_cost), _get_search_space_repr(PARAMS, strategy, []), *KEY[2:])
+        TuningDatabase(self.path).store(*key, best_config, best_time)
+        stored, time_us = TuningDatabase(self.path).lookup(*key)
+        self.assertEqual(TuningDatabase.resolve_config(stored, PARAMS), best_config)
+        self.assertEqual(time_us, best_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
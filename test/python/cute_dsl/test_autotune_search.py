@@ -0,0 +1,195 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Tests for the search strategies of cute.testing.autotune_jit and cute.testing.tune,
+on a simulated cost model instead of compiled kernels
+"""
+
+import unittest
+from itertools import product
+
+try:
+    from cutlass.cute.testing import (
+        CoordinateDescent,
+        ExhaustiveSearch,
+        RandomSearch,
+        SuccessiveHalving,
+        _TuningSession,
+    )
+except ImportError as e:
+    raise unittest.SkipTest(f"CuTe DSL is not available: {e}")
+
+
+PARAMS = {
+    "tile_m": [64, 128, 256],
+    "tile_n": [64, 128, 256],
+    "stages": [2, 3, 4, 5],
+    "cluster": [(1, 1), (2, 1), (1, 2), (2, 2)],
+}
+
+
+def simulated_cost(config):
+    """Separable cost with its minimum at tile 128x256, 4 stages and cluster (2, 1)"""
+    return (
+        abs(config["tile_m"] - 128) / 64
+        + abs(config["tile_n"] - 256) / 64
+        + abs(config["stages"] - 4)
+        + sum(config["cluster"])
+        - (config["cluster"] == (2, 1)) * 1.5
+        + 10.0
+    )
+
+
+def fits_shared_memory(config):
+    return config["tile_m"] * config["tile_n"] * config["stages"] <= 256 * 128 * 4
+
+
+class SimulatedTuning:
+    """Records the compilations and benchmark iterations of a tuning session"""
+
+    def __init__(self, constraints=None, iterations=64, noise=0.0):
+        self.compiled = []
+        self.iterations_spent = 0
+        self.noise = noise
+        self.constraints = constraints or []
+        self.session = _TuningSession(
+            PARAMS,
+            self.compile,
+            self.benchmark,
+            warmup_iterations=0,
+            iterations=iterations,
+            compile_workers=0,
+            constraints=self.constraints,
+        )
+
+    def compile(self, config):
+        for constraint in self.constraints:
+            assert constraint(config), f"Compiled invalid configuration {config}"
+        self.compiled.append(tuple(config.values()))
+        return dict(config)
+
+    def benchmark(self, config, compiled, error, warmup_iterations, iterations):
+        if error is not None:
+            raise error
+        self.iterations_spent += iterations
+        # Short measurements are noisier, deterministically per configuration
+        jitter = (hash(tuple(config.values())) % 7 - 3) / 3
+        return simulated_cost(compiled) + self.noise * jitter / iterations**0.5
+
+    def best_config(self):
+        return self.session.config(self.session.best[1])
+
+
+def optimum(constraints=()):
+    configs = [dict(zip(PARAMS, values)) for values in product(*PARAMS.values())]
+    configs = [c for c in configs if all(constraint(c) for constraint in constraints)]
+    return min(configs, key=simulated_cost), len(configs)
+
+
+class AutotuneSearchTest(unittest.TestCase):
+    def test_exhaustive(self):
+        tuning = SimulatedTuning()
+        ExhaustiveSearch().search(tuning.session)
+        best, num_configs = optimum()
+        self.assertEqual(tuning.best_config(), best)
+        self.assertEqual(len(tuning.compiled), num_configs)
+
+    def test_constraints_prune_before_compile(self):
+        tuning = SimulatedTuning(constraints=[fits_shared_memory])
+        ExhaustiveSearch().search(tuning.session)
+        best, num_valid = optimum([fits_shared_memory])
+        self.assertEqual(tuning.best_config(), best)
+        self.assertEqual(len(tuning.compiled), num_valid)
+        self.assertLess(num_valid, tuning.session.size)
+
+    def test_random_search_budget(self):
+        for budget in (1, 10, 50, 1000):
+            tuning = SimulatedTuning(constraints=[fits_shared_memory])
+            RandomSearch(budget, seed=budget).search(tuning.session)
+            _, num_valid = optimum([fits_shared_memory])
+            self.assertEqual(len(tuning.compiled), min(budget, num_valid))
+            self.assertEqual(len(set(tuning.compiled)), len(tuning.compiled))
+            self.assertEqual(tuning.session.num_compiled, len(tuning.compiled))
+
+    def test_random_search_is_reproducible(self):
+        runs = []
+        for _ in range(2):
+            tuning = SimulatedTuning()
+            RandomSearch(20, seed=7).search(tuning.session)
+            runs.append(tuning.compiled)
+        self.assertEqual(runs[0], runs[1])
+
+    def test_successive_halving(self):
+        tuning = SimulatedTuning(noise=2.0)
+        SuccessiveHalving(eta=2).search(tuning.session)
+        best, num_configs = optimum()
+        self.assertEqual(tuning.best_config(), best)
+        # Each configuration is compiled once, across all rounds
+        self.assertEqual(len(tuning.compiled), num_configs)
+        self.assertEqual(len(set(tuning.compiled)), num_configs)
+        # Far fewer iterations than measuring every configuration fully
+        self.assertLess(tuning.iterations_spent, num_configs * 64 // 4)
+        # Survivors are released once the search is done
+        self.assertEqual(tuning.session.compiled, {})
+
+    def test_successive_halving_budget(self):
+        for budget in (1, 2, 9, 40):
+            tuning = SimulatedTuning(constraints=[fits_shared_memory])
+            SuccessiveHalving(budget=budget, eta=3, seed=0).search(tuning.session)
+            self.assertEqual(len(tuning.compiled), budget)
+            self.assertIsNotNone(tuning.session.best)
+
+    def test_coordinate_descent(self):
+        tuning = SimulatedTuning()
+        CoordinateDescent().search(tuning.session)
+        best, num_configs = optimum()
+        self.assertEqual(tuning.best_config(), best)
+        self.assertLess(len(tuning.compiled), num_configs // 4)
+        self.assertEqual(len(set(tuning.compiled)), len(tuning.compiled))
+
+    def test_coordinate_descent_budget_and_start(self):
+        for budget in (1, 3, 8):
+            tuning = SimulatedTuning(constraints=[fits_shared_memory])
+            CoordinateDescent(budget=budget, start={"tile_m": 256}).search(tuning.session)
+            self.assertLessEqual(len(tuning.compiled), budget)
+            self.assertEqual(tuning.compiled[0][0], 256)
+
+    def test_strategy_repr_is_stable(self):
+        self.assertEqual(
+            repr(SuccessiveHalving(budget=8, eta=3)),
+            "SuccessiveHalving(budget=8, eta=3, min_iterations=1, seed=None)",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,198 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Tests for the manifest of file cache entries and the host shared library it refers to
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+try:
+    from cutlass.base_dsl import cache_helpers
+    from cutlass.base_dsl.cache_helpers import (
+        CacheManifest,
+        SharedLibraryEngine,
+        dump_cache_to_path,
+        load_cache_from_path,
+    )
+except ImportError as e:
+    raise unittest.SkipTest(f"CuTe DSL is not available: {e}")
+
+
+DSL_NAME = "TEST_DSL"
+MODULE_HASH = "0123abcd"
+MODULE_BYTES = b"module bytecode"
+
+
+class FakeEngine:
+    """
+    Execution engine whose host code is a C function compiled ahead of time
+    """
+
+    def __init__(self, object_file):
+        self.object_file = object_file
+
+    def dump_to_object_file(self, file_path):
+        shutil.copyfile(self.object_file, file_path)
+
+
+def make_manifest(arch="sm_90a"):
+    return CacheManifest("toolchain", arch, "pipeline", "entry")
+
+
+def read_module(f):
+    return ("module", f.read())
+
+
+@unittest.skipIf(shutil.which("cc") is None, "A host C compiler is required")
+class TestCacheManifest(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path, ignore_errors=True)
+        self.stem = os.path.join(self.path, f"{DSL_NAME.lower()}_{MODULE_HASH}")
+
+        # Packed wrappers are looked up with the `_mlir_` prefix
+        source = os.path.join(self.path, "host.c")
+        with open(source, "w") as f:
+            f.write("void _mlir__mlir_ciface_entry(void *args) {}\n")
+        self.object_file = os.path.join(self.path, "host.o")
+        subprocess.run(
+            ["cc", "-c", "-fPIC", "-o", self.object_file, source], check=True
+        )
+        os.remove(source)
+
+    def dump(self, manifest=None, engine=True):
+        jit_function = SimpleNamespace(
+            ir_module=None,
+            engine=FakeEngine(self.object_file) if engine else None,
+        )
+        dump_cache_to_path(
+            DSL_NAME,
+            jit_function,
+            MODULE_HASH,
+            path=self.path,
+            bytecode_writer=lambda f: f.write(MODULE_BYTES),
+            manifest=manifest if manifest is not None else make_manifest(),
+        )
+
+    def load(self, manifest=None):
+        return load_cache_from_path(
+            DSL_NAME,
+            MODULE_HASH,
+            path=self.path,
+            bytecode_reader=read_module,
+            manifest=manifest if manifest is not None else make_manifest(),
+        )
+
+    def test_json_round_trip(self):
+        manifest = make_manifest()
+        manifest.add_artifact("host_library", self.object_file)
+        loaded = CacheManifest.from_json(manifest.to_json())
+        self.assertEqual(vars(loaded), vars(manifest))
+        self.assertTrue(loaded.is_compatible(manifest))
+        self.assertFalse(loaded.is_compatible(make_manifest(arch="sm_100a")))
+
+        # Manifests of another cache layout are ignored
+        data = json.loads(manifest.to_json())
+        data["format_version"] += 1
+        self.assertIsNone(CacheManifest.from_json(json.dumps(data)))
+
+    def test_round_trip(self):
+        self.dump()
+        # No temporary files are left behind
+        self.assertEqual(
+            sorted(os.listdir(self.path)),
+            sorted(
+                [os.path.basename(self.stem) + ext for ext in (".json", ".mlir", ".so")]
+                + ["host.o"]
+            ),
+        )
+
+        fn = self.load()
+        self.assertEqual(fn.ir_module, ("module", MODULE_BYTES))
+        self.assertIsInstance(fn.engine, SharedLibraryEngine)
+        self.assertIsNotNone(fn.engine.raw_lookup("_mlir_ciface_entry"))
+        self.assertIsNone(fn.engine.raw_lookup("_mlir_ciface_missing"))
+        fn.engine.lookup("entry")(None)
+
+    def test_incompatible_manifest(self):
+        self.dump()
+        self.assertIsNone(self.load(make_manifest(arch="sm_100a")))
+
+    def test_missing_manifest(self):
+        self.dump()
+        os.remove(self.stem + ".json")
+        self.assertIsNone(self.load())
+
+    def test_corrupt_manifest(self):
+        self.dump()
+        truncated = json.dumps({"format_version": cache_helpers.CACHE_FORMAT_VERSION})
+        for content in ["", "{", "[]", "not json", truncated]:
+            with open(self.stem + ".json", "w") as f:
+                f.write(content)
+            self.assertIsNone(self.load(), content)
+
+    def test_missing_library(self):
+        # The module is loaded and its host code is generated again
+        self.dump()
+        os.remove(self.stem + ".so")
+        fn = self.load()
+        self.assertEqual(fn.ir_module, ("module", MODULE_BYTES))
+        self.assertIsNone(fn.engine)
+
+    def test_corrupt_library(self):
+        self.dump()
+        with open(self.stem + ".so", "r+b") as f:
+            f.seek(-1, os.SEEK_END)
+            last = f.read(1)
+            f.seek(-1, os.SEEK_END)
+            f.write(bytes([last[0] ^ 0xFF]))
+        fn = self.load()
+        self.assertIsNotNone(fn)
+        self.assertIsNone(fn.engine)
+
+    def test_no_engine(self):
+        self.dump(engine=False)
+        self.assertFalse(os.path.exists(self.stem + ".so"))
+        fn = self.load()
+        self.assertIsNotNone(fn)
+        self.assertIsNone(fn.engine)
+
+
+if __name__ == "__main__":
+    unittest.main()
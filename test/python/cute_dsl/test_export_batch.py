@@ -0,0 +1,235 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Tests for the batch AOT export: the merged export module and the combined header with its
+dispatch table
+"""
+
+import inspect
+import unittest
+from types import SimpleNamespace
+
+try:
+    import cutlass
+    from cutlass._mlir import ir
+    from cutlass.base_dsl.common import DSLRuntimeError
+    from cutlass.base_dsl.export import (
+        CHeaderGenerator,
+        Constraint,
+        KernelRegistry,
+        get_export_module,
+        merge_export_modules,
+        generate_batch_header,
+    )
+    from cutlass.base_dsl.jit_executor import ExecutionArgs
+except ImportError as e:
+    raise unittest.SkipTest(f"CuTe DSL is not available: {e}")
+
+
+def host_func(m: cutlass.Int32, n: cutlass.Int32, alpha: cutlass.Float32):
+    pass
+
+
+def fake_jit_function(function_name):
+    return SimpleNamespace(
+        args_spec=ExecutionArgs(inspect.getfullargspec(host_func), function_name),
+        function_name=function_name,
+        kernel_info={},
+        dynamic_args=[128, 256, 1.0],
+        dynamic_kwargs={},
+    )
+
+
+MODULE = """
+module {
+  llvm.mlir.global internal constant @str("abc\\00") {addr_space = 0 : i32}
+  llvm.func @cuda_init() -> i32
+  llvm.func @helper() -> !llvm.ptr {
+    %0 = llvm.mlir.addressof @str : !llvm.ptr
+    llvm.return %0 : !llvm.ptr
+  }
+  llvm.func @entry() {
+    %0 = llvm.call @helper() : () -> !llvm.ptr
+    %1 = llvm.call @cuda_init() : () -> i32
+    llvm.return
+  }
+}
+"""
+
+
+def symbols(module):
+    return [
+        op.operation.attributes["sym_name"].value
+        for op in module.body.operations
+        if "sym_name" in op.operation.attributes
+    ]
+
+
+class TestMergeExportModules(unittest.TestCase):
+    def setUp(self):
+        self.context = ir.Context()
+        with self.context:
+            self.ir_module = ir.Module.parse(MODULE)
+
+    def export_modules(self, prefixes):
+        return [
+            get_export_module(
+                self.ir_module, prefix, context=self.context, rename_globals=True
+            )
+            for prefix in prefixes
+        ]
+
+    def test_prefixed_symbols(self):
+        merged = merge_export_modules(self.export_modules(["lib_a", "lib_b"]))
+        self.assertEqual(
+            symbols(merged),
+            [
+                "lib_a_str",
+                "cuda_init",
+                "lib_a_helper",
+                "lib_a_entry",
+                "lib_b_str",
+                "lib_b_helper",
+                "lib_b_entry",
+            ],
+        )
+        text = str(merged)
+        self.assertIn("llvm.mlir.addressof @lib_b_str", text)
+        self.assertIn("llvm.call @lib_b_helper()", text)
+        # The shared external declaration is kept once and still referenced unprefixed
+        self.assertEqual(text.count("llvm.func @cuda_init()"), 1)
+        self.assertIn("llvm.call @cuda_init()", text)
+
+    def test_conflicting_definitions(self):
+        with self.assertRaises(DSLRuntimeError):
+            merge_export_modules(self.export_modules(["lib_a", "lib_a"]))
+
+    def test_requires_shared_context(self):
+        modules = [get_export_module(self.ir_module, "lib_a")]
+        modules += self.export_modules(["lib_b"])
+        with self.assertRaises(DSLRuntimeError):
+            merge_export_modules(modules)
+
+
+class TestBatchHeader(unittest.TestCase):
+    def setUp(self):
+        self.specializations = [
+            (name, f"gemm_{name}", fake_jit_function(f"host_{name}"))
+            for name in ("m128_n256", "m64_n64", "m256_n128")
+        ]
+
+    def test_header_contents(self):
+        header = generate_batch_header(
+            "gemm", self.specializations, "CUTE_DSL", CHeaderGenerator(), max_workers=3
+        )
+        self.assertEqual(header.count("#pragma once"), 1)
+        # Kernel-less functions don't need the error check macro
+        self.assertNotIn("CUTE_DSL_CUDA_ERROR_CHECK", header)
+        for name, prefix, fn in self.specializations:
+            self.assertIn(
+                f"static inline void {prefix}_wrapper({prefix}_Kernel_Metadata_t *metadata, "
+                "int32_t m, int32_t n, float alpha)",
+                header,
+            )
+            self.assertIn(
+                f'{{"{name}", _mlir_{prefix}__mlir_ciface_{fn.function_name}}},', header
+            )
+        self.assertIn("gemm_m128_n256_ID = 0,", header)
+        self.assertIn("gemm_m256_n128_ID = 2,", header)
+        self.assertIn("gemm_NUM_SPECIALIZATIONS = 3", header)
+        self.assertIn(
+            "static const gemm_Dispatch_Entry_t gemm_dispatch_table[3]", header
+        )
+        self.assertIn("static inline int gemm_find_specialization(const char *name)", header)
+
+    def test_order_is_deterministic(self):
+        generator = CHeaderGenerator()
+        serial = generate_batch_header(
+            "gemm", self.specializations, "CUTE_DSL", generator, max_workers=1
+        )
+        parallel = generate_batch_header(
+            "gemm", self.specializations, "CUTE_DSL", generator, max_workers=8
+        )
+        self.assertEqual(serial, parallel)
+        offsets = [serial.index(f"{prefix}_wrapper(") for _, prefix, _ in self.specializations]
+        self.assertEqual(offsets, sorted(offsets))
+
+    def test_matches_single_export(self):
+        generator = CHeaderGenerator()
+        header = generate_batch_header(
+            "gemm", self.specializations[:1], "CUTE_DSL", generator
+        )
+        _, prefix, fn = self.specializations[0]
+        single = generator(
+            prefix,
+            None,
+            fn.args_spec,
+            fn.function_name,
+            fn.kernel_info,
+            fn.dynamic_args,
+            fn.dynamic_kwargs,
+            "CUTE_DSL",
+        )
+        self.assertTrue(header.startswith(single))
+
+    def test_registry_dispatch(self):
+        registry = KernelRegistry(["M", "N"])
+        registry.add("m256_n128", [Constraint("M", 256), Constraint("N", 128)])
+        registry.add("m128_n256", [Constraint("M", 128), Constraint("N", 256)])
+        registry.add("m64_n64", [])
+        header = generate_batch_header(
+            "gemm",
+            self.specializations,
+            "CUTE_DSL",
+            CHeaderGenerator(),
+            registry=registry,
+        )
+        self.assertIn("static inline int gemm_select(const int64_t *keys)", header)
+        # Ids follow the dispatch table, not the registration order
+        self.assertIn("return 2; // m256_n128", header)
+        self.assertIn("return 0; // m128_n256", header)
+        self.assertIn("return 1; // m64_n64", header)
+
+        registry.add("m32_n32", [])
+        with self.assertRaises(DSLRuntimeError):
+            generate_batch_header(
+                "gemm",
+                self.specializations,
+                "CUTE_DSL",
+                CHeaderGenerator(),
+                registry=registry,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
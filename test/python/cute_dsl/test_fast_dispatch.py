@@ -0,0 +1,179 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Tests for the fast dispatch keys, which let repeated calls with the same signature skip IR
+generation
+"""
+
+import inspect
+import unittest
+
+try:
+    import numpy as np
+
+    import cutlass
+    import cutlass.cute as cute
+    from cutlass.cute.runtime import from_dlpack
+    from cutlass.cutlass_dsl import CuTeDSL
+except ImportError as e:
+    raise unittest.SkipTest(f"CuTe DSL is not available: {e}")
+
+
+def axpy(
+    x: cute.Tensor,
+    y: cute.Tensor,
+    alpha: cutlass.Float32,
+    stages: cutlass.Constexpr[int],
+):
+    pass
+
+
+def scale(n: cutlass.Int32, mode: cutlass.Constexpr):
+    pass
+
+
+class Opaque:
+    pass
+
+
+class FakeJitFunction:
+    def __init__(self):
+        self.calls = []
+
+    def run_compiled_program(self, exe_args):
+        self.calls.append(exe_args)
+
+
+def tensor(shape, dtype=np.float16):
+    return from_dlpack(np.zeros(shape, dtype=dtype))
+
+
+class TestFastDispatch(unittest.TestCase):
+    def setUp(self):
+        self.dsl = CuTeDSL._get_dsl()
+        self.addCleanup(self.dsl.jit_dispatch_cache.clear)
+
+    def dispatch(self, func, *args, **kwargs):
+        return self.dsl._try_fast_dispatch(
+            func, func.__name__, args, kwargs, inspect.getfullargspec(func), None, {}
+        )
+
+    def key(self, func, *args, **kwargs):
+        dispatch_key, dispatched = self.dispatch(func, *args, **kwargs)
+        self.assertFalse(dispatched)
+        return dispatch_key
+
+    def axpy_key(self, shape=(4, 8), dtype=np.float16, alpha=1.0, stages=2):
+        return self.key(
+            axpy,
+            tensor(shape, dtype),
+            tensor(shape, dtype),
+            cutlass.Float32(alpha),
+            stages,
+        )
+
+    def test_same_signature(self):
+        # Different buffers and values of dynamic arguments share a key
+        key = self.axpy_key()
+        self.assertIsNotNone(key)
+        self.assertEqual(self.axpy_key(alpha=2.0), key)
+        self.assertEqual(hash(self.axpy_key(alpha=3.0)), hash(key))
+        self.assertEqual(
+            self.key(scale, cutlass.Int32(1), "a"),
+            self.key(scale, cutlass.Int32(7), "a"),
+        )
+
+    def test_dtype(self):
+        self.assertNotEqual(
+            self.axpy_key(dtype=np.float16), self.axpy_key(dtype=np.float32)
+        )
+        self.assertNotEqual(
+            self.key(scale, cutlass.Int32(1), "a"),
+            self.key(scale, cutlass.Float32(1), "a"),
+        )
+
+    def test_shape(self):
+        key = self.axpy_key(shape=(4, 8))
+        self.assertNotEqual(self.axpy_key(shape=(4, 16)), key)
+        self.assertNotEqual(self.axpy_key(shape=(8, 4)), key)
+        self.assertNotEqual(self.axpy_key(shape=(4, 8, 1)), key)
+
+    def test_constexpr(self):
+        self.assertNotEqual(self.axpy_key(stages=2), self.axpy_key(stages=3))
+        self.assertEqual(self.axpy_key(stages=3), self.axpy_key(stages=3))
+        # Equal values of different types generate different IR
+        self.assertNotEqual(
+            self.key(scale, cutlass.Int32(1), 1),
+            self.key(scale, cutlass.Int32(1), 1.0),
+        )
+        self.assertNotEqual(
+            self.key(scale, cutlass.Int32(1), (1, 2)),
+            self.key(scale, cutlass.Int32(1), [1, 2]),
+        )
+        self.assertNotEqual(
+            self.key(scale, cutlass.Int32(1), cutlass.Float16),
+            self.key(scale, cutlass.Int32(1), cutlass.Float32),
+        )
+
+    def test_function(self):
+        def other(n: cutlass.Int32, mode: cutlass.Constexpr):
+            pass
+
+        self.assertNotEqual(
+            self.key(scale, cutlass.Int32(1), "a"),
+            self.key(other, cutlass.Int32(1), "a"),
+        )
+
+    def test_not_dispatchable(self):
+        # Objects hashed by identity may change between calls
+        self.assertIsNone(self.key(scale, cutlass.Int32(1), Opaque()))
+        self.assertIsNone(self.key(scale, cutlass.Int32(1), (1, Opaque())))
+        self.assertIsNone(self.key(scale, Opaque(), "a"))
+
+    def test_hit(self):
+        key = self.key(scale, cutlass.Int32(1), "a")
+        jit_function = FakeJitFunction()
+        self.dsl.jit_dispatch_cache[key] = jit_function
+
+        dispatch_key, dispatched = self.dispatch(scale, cutlass.Int32(5), "a")
+        self.assertTrue(dispatched)
+        self.assertEqual(dispatch_key, key)
+        self.assertEqual(len(jit_function.calls), 1)
+
+        _, dispatched = self.dispatch(scale, cutlass.Int32(5), "b")
+        self.assertFalse(dispatched)
+        self.assertEqual(len(jit_function.calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,246 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Tests for the bounded in-memory JIT cache and the pruning of the file cache
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+try:
+    from cutlass.base_dsl import cache_helpers
+    from cutlass.base_dsl.cache_helpers import JitCache, prune_file_cache
+except ImportError as e:
+    raise unittest.SkipTest(f"CuTe DSL is not available: {e}")
+
+
+class FakeFunction:
+    def __init__(self, size=0):
+        self.size = size
+        self.unloaded = False
+
+    def unload(self):
+        self.unloaded = True
+
+
+class TestJitCache(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(
+            cache_helpers, "get_jit_function_size", lambda value: value.size
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.now = 1000.0
+        patcher = mock.patch.object(cache_helpers.time, "monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_cache(self, **kwargs):
+        cache = JitCache(**kwargs)
+        self.evicted = []
+        cache.eviction_callbacks.append(lambda key, value: self.evicted.append(key))
+        return cache
+
+    def test_lru(self):
+        cache = self.make_cache(max_entries=2)
+        cache["a"] = FakeFunction()
+        cache["b"] = FakeFunction()
+        self.assertIsNotNone(cache.get("a"))
+        cache["c"] = FakeFunction()
+        self.assertEqual(cache.keys(), ["a", "c"])
+        self.assertEqual(self.evicted, ["b"])
+
+    def test_lfu(self):
+        cache = self.make_cache(max_entries=2, policy="lfu")
+        cache["a"] = FakeFunction()
+        cache["b"] = FakeFunction()
+        for _ in range(3):
+            cache.get("a")
+        cache.get("b")
+        # "c" is the most recently inserted entry and is kept although it was never used
+        cache["c"] = FakeFunction()
+        self.assertEqual(self.evicted, ["b"])
+        # Ties are broken in least recently used order
+        cache.get("c")
+        cache["d"] = FakeFunction()
+        self.assertEqual(self.evicted, ["b", "c"])
+        self.assertEqual(sorted(cache.keys()), ["a", "d"])
+
+    def test_max_age(self):
+        cache = self.make_cache(max_age=10)
+        cache["a"] = FakeFunction()
+        self.now += 5
+        cache["b"] = FakeFunction()
+        self.now += 6
+        self.assertNotIn("a", cache)
+        self.assertIn("b", cache)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(self.evicted, ["a"])
+        self.now += 5
+        with self.assertRaises(KeyError):
+            cache["b"]
+        self.assertEqual(len(cache), 0)
+
+    def test_max_bytes(self):
+        cache = self.make_cache(max_bytes=100)
+        cache["a"] = FakeFunction(40)
+        cache["b"] = FakeFunction(40)
+        self.assertEqual(self.evicted, [])
+        cache["c"] = FakeFunction(40)
+        self.assertEqual(self.evicted, ["a"])
+        self.assertEqual(cache.stats().bytes, 80)
+        # An entry larger than the limit is still kept as the most recent one
+        cache["d"] = FakeFunction(200)
+        self.assertEqual(cache.keys(), ["d"])
+        self.assertEqual(cache.stats().bytes, 200)
+        # Replacing an entry accounts for the size of the new value only
+        cache["d"] = FakeFunction(10)
+        self.assertEqual(cache.stats().bytes, 10)
+
+    def test_evicted_function_is_not_unloaded(self):
+        cache = self.make_cache(max_entries=1)
+        held = FakeFunction()
+        cache["a"] = held
+        cache["b"] = FakeFunction()
+        cache.clear()
+        self.assertEqual(self.evicted, ["a", "b"])
+        self.assertFalse(held.unloaded)
+
+    def test_stats(self):
+        cache = self.make_cache(max_entries=1)
+        cache["a"] = FakeFunction()
+        cache.get("a")
+        cache.get("b")
+        cache["b"] = FakeFunction()
+        stats = cache.stats()
+        self.assertEqual(
+            (stats.hits, stats.misses, stats.evictions, stats.entries),
+            (1, 1, 1, 1),
+        )
+
+    def test_unknown_policy(self):
+        with self.assertRaises(cache_helpers.DSLRuntimeError):
+            JitCache(policy="fifo")
+
+
+class TestPruneFileCache(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path, ignore_errors=True)
+        self.now = time.time()
+
+    def add_entry(self, stem, age, size=10, exts=(".mlir", ".so", ".json")):
+        for ext in exts:
+            file_path = os.path.join(self.path, stem + ext)
+            with open(file_path, "wb") as f:
+                f.write(b"x" * size)
+            os.utime(file_path, (self.now - age, self.now - age))
+
+    def stems(self):
+        return sorted({os.path.splitext(name)[0] for name in os.listdir(self.path)})
+
+    def test_max_entries(self):
+        for i, age in enumerate([30, 10, 20]):
+            self.add_entry(f"cute_dsl_{i}", age)
+        self.assertEqual(prune_file_cache(self.path, max_entries=1), 2)
+        self.assertEqual(self.stems(), ["cute_dsl_1"])
+
+    def test_max_bytes(self):
+        for i, age in enumerate([30, 10, 20]):
+            self.add_entry(f"cute_dsl_{i}", age)
+        self.assertEqual(prune_file_cache(self.path, max_bytes=60), 1)
+        self.assertEqual(self.stems(), ["cute_dsl_1", "cute_dsl_2"])
+
+    def test_max_age(self):
+        self.add_entry("cute_dsl_0", 100)
+        self.add_entry("cute_dsl_1", 10)
+        self.assertEqual(prune_file_cache(self.path, max_age=50), 1)
+        self.assertEqual(self.stems(), ["cute_dsl_1"])
+
+    def test_remove_all_of_dsl(self):
+        self.add_entry("cute_dsl_0", 10)
+        self.add_entry("other_dsl_0", 10)
+        with open(os.path.join(self.path, "notes.txt"), "w") as f:
+            f.write("kept")
+        self.assertEqual(
+            prune_file_cache(self.path, dsl_name="CUTE_DSL", remove_all=True), 1
+        )
+        self.assertEqual(
+            sorted(os.listdir(self.path)),
+            ["notes.txt", "other_dsl_0.json", "other_dsl_0.mlir", "other_dsl_0.so"],
+        )
+
+    def test_manifest_removed_first(self):
+        self.add_entry("cute_dsl_0", 10)
+        removed = []
+        original = cache_helpers._remove_file
+
+        def remove_file(file_path):
+            removed.append(os.path.basename(file_path))
+            original(file_path)
+
+        with mock.patch.object(cache_helpers, "_remove_file", remove_file):
+            prune_file_cache(self.path, remove_all=True)
+        self.assertEqual(removed[0], "cute_dsl_0.json")
+        self.assertEqual(sorted(removed[1:]), ["cute_dsl_0.mlir", "cute_dsl_0.so"])
+
+    def test_stale_temp_files(self):
+        self.add_entry("cute_dsl_0", 10, exts=(".so",))
+        stale = os.path.join(self.path, "cute_dsl_1.so.tmp.pid_1_stale")
+        recent = os.path.join(self.path, "cute_dsl_2.so.tmp.pid_1_recent")
+        stale_dir = os.path.join(self.path, "tmp.pid_1_stale")
+        for file_path in (stale, recent):
+            open(file_path, "w").close()
+        os.mkdir(stale_dir)
+        age = cache_helpers._STALE_TEMP_FILE_AGE + 10
+        for file_path in (stale, stale_dir):
+            os.utime(file_path, (self.now - age, self.now - age))
+        # Temporary files are not entries of their own
+        self.assertEqual(prune_file_cache(self.path), 0)
+        self.assertEqual(
+            sorted(os.listdir(self.path)),
+            ["cute_dsl_0.so", os.path.basename(recent)],
+        )
+
+    def test_missing_directory(self):
+        self.assertEqual(
+            prune_file_cache(os.path.join(self.path, "missing"), remove_all=True), 0
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Tests for the kernel registry selecting exported specializations from runtime shape classes,
+in Python and in the generated C dispatch code
+"""
+
+import os
+import random
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+try:
+    from cutlass.base_dsl.common import DSLRuntimeError
+    from cutlass.base_dsl.export import Constraint, KernelRegistry
+except ImportError as e:
+    raise unittest.SkipTest(f"CuTe DSL is not available: {e}")
+
+
+def make_registry():
+    registry = KernelRegistry(["M", "N", "K", "a_ptr"])
+    registry.add(
+        "decode",
+        [Constraint("M", max_value=64), Constraint("N", 128), Constraint("K", 64)],
+    )
+    registry.add(
+        "tile_128x128_align16",
+        [
+            Constraint("M", 128),
+            Constraint("N", 128),
+            Constraint("K", 64),
+            Constraint("a_ptr", 16),
+        ],
+    )
+    registry.add("static_k4096", [Constraint("N", 8), Constraint("K", equals=4096)])
+    registry.add("generic", [])
+    return registry
+
+
+class TestKernelRegistry(unittest.TestCase):
+    def test_select(self):
+        registry = make_registry()
+        self.assertEqual(
+            registry.select(M=32, N=256, K=128, a_ptr=4).name, "decode"
+        )
+        self.assertEqual(
+            registry.select(M=256, N=512, K=128, a_ptr=1024).name,
+            "tile_128x128_align16",
+        )
+        # Misaligned pointer falls through
+        self.assertEqual(
+            registry.select(M=256, N=512, K=4096, a_ptr=1032).name, "static_k4096"
+        )
+        self.assertEqual(registry.select(M=100, N=100, K=100, a_ptr=0).name, "generic")
+
+    def test_no_fallback(self):
+        registry = KernelRegistry(["M"])
+        registry.add("m16", [Constraint("M", 16)])
+        self.assertIsNone(registry.select(M=8))
+        self.assertEqual(registry.select(M=32).name, "m16")
+
+    def test_shared_predicates(self):
+        registry = make_registry()
+        # "N % 128" and "K % 64" are shared by two specializations
+        self.assertEqual(len(registry.predicates), 7)
+
+    def test_invalid(self):
+        registry = make_registry()
+        with self.assertRaises(DSLRuntimeError):
+            registry.add("generic", [])
+        with self.assertRaises(DSLRuntimeError):
+            registry.add("unknown_key", [Constraint("L", 2)])
+        with self.assertRaises(DSLRuntimeError):
+            Constraint("M", 0)
+        with self.assertRaises(DSLRuntimeError):
+            KernelRegistry(["M", "M"])
+
+    def test_generated_c(self):
+        source = make_registry().generate_c_dispatch(
+            "gemm", {"decode": 3, "tile_128x128_align16": 2, "static_k4096": 1, "generic": 0}
+        )
+        self.assertIn("gemm_KEY_a_ptr = 3,", source)
+        self.assertIn("gemm_NUM_KEYS = 4", source)
+        self.assertIn("static inline int gemm_select(const int64_t *keys)", source)
+        self.assertIn("if (keys[3] % 16 == 0) shape_class |= 1ull << 4;", source)
+        self.assertIn("return 0; // generic", source)
+
+    @unittest.skipIf(shutil.which("cc") is None, "no C compiler")
+    def test_c_matches_python(self):
+        registry = make_registry()
+        ids = {name: idx for idx, name in enumerate(registry.names)}
+        rng = random.Random(0)
+        queries = [
+            [rng.choice([1, 8, 64, 128, 4096, 8192]) * rng.choice([1, 3]) for _ in range(4)]
+            for _ in range(200)
+        ]
+        program = (
+            "#include <stdint.h>\n#include <stdio.h>\n"
+            + registry.generate_c_dispatch("gemm", ids)
+            + "int main(void) {\n    int64_t keys[4];\n"
+            + "".join(
+                f"    keys[0] = {m}; keys[1] = {n}; keys[2] = {k}; keys[3] = {p};"
+                ' printf("%d\\n", gemm_select(keys));\n'
+                for m, n, k, p in queries
+            )
+            + "    return 0;\n}\n"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "dispatch.c")
+            exe = os.path.join(tmp, "dispatch")
+            with open(src, "w") as f:
+                f.write(program)
+            subprocess.run(["cc", "-std=c99", "-o", exe, src], check=True)
+            output = subprocess.run([exe], check=True, capture_output=True, text=True)
+        expected = [
+            ids[registry.select(M=m, N=n, K=k, a_ptr=p).name] for m, n, k, p in queries
+        ]
+        self.assertEqual([int(x) for x in output.stdout.split()], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
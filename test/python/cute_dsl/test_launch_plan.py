@@ -0,0 +1,133 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Tests for the launch plan of ExecutionArgs and the packed args of JitExecutor,
+launching a stub capi function instead of a compiled one
+"""
+
+import ctypes
+import inspect
+import unittest
+
+try:
+    import cutlass
+    from cutlass.base_dsl.common import DSLRuntimeError
+    from cutlass.base_dsl.jit_executor import ExecutionArgs, JitExecutor, JitModule
+    from cutlass.base_dsl.runtime.jit_arg_adapters import JitArgAdapterRegistry
+except ImportError as e:
+    raise unittest.SkipTest(f"CuTe DSL is not available: {e}")
+
+
+def kernel(
+    a: cutlass.Int32,
+    b: cutlass.Float32,
+    c: cutlass.Int32 = 3,
+    *,
+    d: cutlass.Int64 = 4,
+    e: cutlass.Int32,
+):
+    pass
+
+
+class StubCapiFunc:
+    """Records the arguments of each launch, read back from the packed args."""
+
+    restype = None
+
+    def __init__(self):
+        self.launches = []
+
+    def __call__(self, packed_args):
+        self.launches.append((id(packed_args), [packed_args[i] for i in range(len(packed_args))]))
+
+
+def read_int(pointer, ctype=ctypes.c_int32):
+    return ctypes.cast(pointer, ctypes.POINTER(ctype)).contents.value
+
+
+class TestLaunchPlan(unittest.TestCase):
+    def setUp(self):
+        self.exec_args = ExecutionArgs(inspect.getfullargspec(kernel), "kernel")
+
+    def test_rectified_args(self):
+        rectify = self.exec_args.get_rectified_args
+        self.assertEqual(rectify((1, 2.0), {"e": 5}), [1, 2.0, 3, 4, 5])
+        self.assertEqual(rectify((1,), {"e": 5, "d": 6, "b": 2.0}), [1, 2.0, 3, 6, 5])
+        # Keyword arguments are placed in declaration order
+        self.assertEqual(rectify((), {"c": 7, "e": 5, "b": 2.0, "a": 1}), [1, 2.0, 7, 4, 5])
+
+    def test_rectified_args_mismatch(self):
+        rectify = self.exec_args.get_rectified_args
+        for (args, kwargs) in [((1, 2.0), {}), ((1, 2.0, 3, 4), {"e": 5}), ((1, 2.0), {"e": 5, "f": 6})]:
+            with self.assertRaises(DSLRuntimeError):
+                rectify(args, kwargs)
+
+    def test_execution_args(self):
+        exe_args, adapted_args = self.exec_args.generate_execution_args((1, 2.0), {"e": 5, "d": 6})
+        self.assertEqual(len(exe_args), 5)
+        self.assertEqual(adapted_args, [])
+        self.assertEqual(read_int(exe_args[0]), 1)
+        self.assertEqual(read_int(exe_args[3], ctypes.c_int64), 6)
+        self.assertEqual(read_int(exe_args[4]), 5)
+
+    def test_adapter_registered_after_plan(self):
+        class Scalar:
+            def __init__(self, value):
+                self.value = value
+
+        def kernel_with_scalar(x):
+            pass
+
+        exec_args = ExecutionArgs(inspect.getfullargspec(kernel_with_scalar), "kernel_with_scalar")
+        self.assertEqual(exec_args.generate_execution_args((Scalar(1),), {}), ([], []))
+        JitArgAdapterRegistry.jit_arg_adapter_registry[Scalar] = lambda s: cutlass.Int32(s.value)
+        try:
+            exe_args, adapted_args = exec_args.generate_execution_args((Scalar(9),), {})
+            self.assertEqual(read_int(exe_args[0]), 9)
+            self.assertEqual(len(adapted_args), 1)
+        finally:
+            del JitArgAdapterRegistry.jit_arg_adapter_registry[Scalar]
+
+    def test_packed_args_reused(self):
+        capi_func = StubCapiFunc()
+        executor = JitExecutor(JitModule(None, capi_func, self.exec_args, []), None, False)
+        for value in range(3):
+            executor(value, 2.0, e=value + 1)
+        buffers = set(buffer for (buffer, _) in capi_func.launches)
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual([read_int(args[0]) for (_, args) in capi_func.launches], [0, 1, 2])
+        self.assertEqual([read_int(args[4]) for (_, args) in capi_func.launches], [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Tests for the on-disk cache of AST-preprocessed code objects and of the module imports
+collected by the preprocessor
+"""
+
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+try:
+    from cutlass.base_dsl import dsl as dsl_module
+    from cutlass.base_dsl.ast_preprocessor import DSLPreprocessor, ImportInfo
+    from cutlass.base_dsl.dsl import BaseDSL
+except ImportError as e:
+    raise unittest.SkipTest(f"CuTe DSL is not available: {e}")
+
+
+# Stands in for the decorators of a DSL, which the preprocessor recognizes by name
+stub_dsl = SimpleNamespace(jit=lambda f: f)
+
+
+@stub_dsl.jit
+def scale_sum(n, factor):
+    total = 0
+    for i in range(n):
+        if i % 2 == 0:
+            total += i * factor
+    return total
+
+
+@stub_dsl.jit
+def apply_twice(n):
+    def step(x):
+        return x + n
+
+    acc = 0
+    for _ in range(n):
+        acc = step(step(acc))
+    return acc
+
+
+class PreprocessingDSL:
+    """
+    The parts of ``BaseDSL`` used to preprocess a function, without an MLIR backend
+    """
+
+    name = "TEST_DSL"
+    preprocess_function = BaseDSL.preprocess_function
+    run_preprocessor = BaseDSL.run_preprocessor
+    compile_transformed_ast = BaseDSL.compile_transformed_ast
+
+    def __init__(self):
+        self.envar = SimpleNamespace(
+            disable_preprocessor_caching=False, print_after_preprocessor=False
+        )
+        self.preprocessor = DSLPreprocessor(["cutlass"])
+
+    def _get_globals(self):
+        return dict(globals())
+
+
+class TestPreprocessorCache(unittest.TestCase):
+    functions = [scale_sum, apply_twice]
+
+    def setUp(self):
+        self.cache_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_path, ignore_errors=True)
+        patcher = mock.patch.object(
+            dsl_module, "get_preprocessor_cache_path", lambda name: self.cache_path
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.reset_functions)
+
+    def reset_functions(self):
+        for function in self.functions:
+            if hasattr(function, "_preprocessed"):
+                del function._preprocessed
+
+    def preprocess_all(self):
+        """Preprocess the functions in order as a new process would."""
+        self.reset_functions()
+        dsl = PreprocessingDSL()
+        code_objects = [dsl.preprocess_function(f) for f in self.functions]
+        preprocessor = dsl.preprocessor
+        state = (
+            preprocessor.counter,
+            preprocessor.function_counter,
+            preprocessor.import_top_module,
+            sorted(preprocessor.local_closures),
+            preprocessor.processed_functions,
+        )
+        return code_objects, state
+
+    def test_round_trip(self):
+        cold_code, cold_state = self.preprocess_all()
+        self.assertGreater(len(os.listdir(self.cache_path)), 0)
+        self.assertGreater(cold_state[0], 0)
+        self.assertEqual(cold_state[3], ["step"])
+
+        with mock.patch.object(
+            PreprocessingDSL, "run_preprocessor", side_effect=AssertionError("cache miss")
+        ):
+            warm_code, warm_state = self.preprocess_all()
+        self.assertEqual(warm_code, cold_code)
+        self.assertEqual(warm_state, cold_state)
+
+    def test_uncached_run_matches(self):
+        cached_code, cached_state = self.preprocess_all()
+        with mock.patch.object(
+            dsl_module, "load_preprocessed_code", return_value=None
+        ), mock.patch.object(dsl_module, "dump_preprocessed_code"):
+            uncached_code, uncached_state = self.preprocess_all()
+        self.assertEqual(cached_code, uncached_code)
+        self.assertEqual(cached_state, uncached_state)
+
+    def test_corrupt_entry_is_rebuilt(self):
+        cold_code, cold_state = self.preprocess_all()
+        for name in os.listdir(self.cache_path):
+            with open(os.path.join(self.cache_path, name), "wb") as f:
+                f.write(b"corrupt")
+        code, state = self.preprocess_all()
+        self.assertEqual(code, cold_code)
+        self.assertEqual(state, cold_state)
+
+    def test_disabled(self):
+        dsl = PreprocessingDSL()
+        dsl.envar.disable_preprocessor_caching = True
+        self.reset_functions()
+        dsl.preprocess_function(scale_sum)
+        self.assertEqual(os.listdir(self.cache_path), [])
+
+
+class TestModuleImports(unittest.TestCase):
+    module_name = "preprocessor_cache_sample"
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path, ignore_errors=True)
+        sys.path.insert(0, self.path)
+        self.addCleanup(sys.path.remove, self.path)
+        self.addCleanup(sys.modules.pop, self.module_name, None)
+
+    def write_module(self, imports, mtime):
+        file_path = os.path.join(self.path, f"{self.module_name}.py")
+        with open(file_path, "w") as f:
+            f.write(imports + "\n\n\ndef kernel():\n    pass\n")
+        os.utime(file_path, (mtime, mtime))
+
+    def test_reload(self):
+        preprocessor = DSLPreprocessor(["cutlass"])
+        self.write_module("import os", 1_000_000)
+        module = importlib.import_module(self.module_name)
+        self.assertEqual(
+            preprocessor._get_module_imports(module.kernel),
+            [ImportInfo("os", None, "os")],
+        )
+        # Unchanged modules are parsed once
+        with mock.patch.object(
+            preprocessor, "_get_imports_from_ast", side_effect=AssertionError("parsed")
+        ):
+            preprocessor._get_module_imports(module.kernel)
+
+        self.write_module("import os\nfrom math import pi as PI", 2_000_000)
+        module = importlib.reload(module)
+        self.assertEqual(
+            preprocessor._get_module_imports(module.kernel),
+            [ImportInfo("os", None, "os"), ImportInfo("math", "pi", "PI")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Tests for @lru_cache_static, the IR-context-independent cache of static CuTe algebra
+"""
+
+import unittest
+
+try:
+    from cutlass._mlir import ir
+    from cutlass.base_dsl._mlir_helpers.lru_cache_ir import (
+        is_static_value,
+        lru_cache_static,
+    )
+    from cutlass.cute.core import ceil_div, shape_div, size
+except ImportError as e:
+    raise unittest.SkipTest(f"CuTe DSL is not available: {e}")
+
+
+def transform(a, factor):
+    return tuple(transform(x, factor) for x in a) if isinstance(a, tuple) else a * factor
+
+
+class TestStaticCache(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        @lru_cache_static(maxsize=2)
+        def scale(a, factor=2, *, loc=None, ip=None):
+            self.calls.append((a, factor))
+            self.assertIsNotNone(loc)
+            if a == -1:
+                raise ValueError("negative")
+            if a == -2:
+                return object()
+            return transform(a, factor)
+
+        self.scale = scale
+
+    def test_is_static_value(self):
+        self.assertTrue(is_static_value((1, (2, None), ())))
+        self.assertFalse(is_static_value((1, True)))
+        self.assertFalse(is_static_value((1, 2.0)))
+        self.assertFalse(is_static_value([1, 2]))
+
+    def test_hits_independent_of_context(self):
+        for _ in range(2):
+            with ir.Context(), ir.Location.unknown():
+                self.assertEqual(self.scale((1, (2, 3))), (2, (4, 6)))
+                self.assertEqual(self.scale((1, (2, 3)), factor=3), (3, (6, 9)))
+        # Outside of any context
+        self.assertEqual(self.scale((1, (2, 3))), (2, (4, 6)))
+        self.assertEqual(self.calls, [((1, (2, 3)), 2), ((1, (2, 3)), 3)])
+        info = self.scale.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (3, 2, 2))
+
+    def test_bounded(self):
+        with ir.Context(), ir.Location.unknown():
+            for a in [1, 2, 3, 1]:
+                self.scale(a)
+        self.assertEqual(self.scale.cache_info().currsize, 2)
+        self.assertEqual(len(self.calls), 4)
+
+    def test_bypass(self):
+        with ir.Context(), ir.Location.unknown():
+            # Non-static arguments and results are never cached
+            for a in [(1, 2.0), (1, 2.0), -2, -2]:
+                self.scale(a)
+            # Exceptions are neither cached nor suppressed
+            for _ in range(2):
+                with self.assertRaises(ValueError):
+                    self.scale(-1)
+        self.assertEqual(len(self.calls), 6)
+        info = self.scale.cache_info()
+        self.assertEqual((info.hits, info.bypassed, info.currsize), (0, 2, 0))
+        self.scale.cache_clear()
+        self.assertEqual(self.scale.cache_info().misses, 0)
+
+    def test_cute_algebra(self):
+        for op, args, expected in [
+            (shape_div, ((8, 16), (2, 4)), (4, 4)),
+            (ceil_div, ((10, 6), (3, 4)), (4, 2)),
+            (size, ((4, (2, 8)),), 64),
+        ]:
+            op.cache_clear()
+            for _ in range(2):
+                with ir.Context(), ir.Location.unknown():
+                    module = ir.Module.create()
+                    with ir.InsertionPoint(module.body):
+                        self.assertEqual(op(*args), expected)
+            self.assertEqual(op.cache_info().hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
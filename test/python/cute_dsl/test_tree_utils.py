@@ -0,0 +1,159 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Tests for the per-type flatten plans of cutlass_dsl.tree_utils and of the c-pointer
+extraction of kernel arguments
+"""
+
+import unittest
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import NamedTuple
+
+try:
+    import cutlass
+    from cutlass._mlir import ir
+    from cutlass.cutlass_dsl import tree_utils
+    from cutlass.cutlass_dsl.cutlass import _get_c_pointers_cutlass
+    from cutlass.cutlass_dsl.tree_utils import (
+        check_tree_equal,
+        register_pytree_node,
+        tree_flatten,
+        tree_unflatten,
+    )
+except ImportError as e:
+    raise unittest.SkipTest(f"CuTe DSL is not available: {e}")
+
+
+@dataclass
+class Params:
+    m: cutlass.Int32
+    scale: cutlass.Float32
+    stages: cutlass.Constexpr[int] = 2
+
+
+class Extent(NamedTuple):
+    m: cutlass.Int32
+    n: cutlass.Int32
+
+
+class Opaque:
+    pass
+
+
+class TestTreeUtils(unittest.TestCase):
+    def setUp(self):
+        self.context = ir.Context()
+        self.context.__enter__()
+        self.location = ir.Location.unknown()
+        self.location.__enter__()
+        self.module = ir.Module.create()
+        self.ip = ir.InsertionPoint(self.module.body)
+        self.ip.__enter__()
+
+    def tearDown(self):
+        self.ip.__exit__(None, None, None)
+        self.location.__exit__(None, None, None)
+        self.context.__exit__(None, None, None)
+
+    def values(self, n):
+        return [cutlass.Int32(i).ir_value() for i in range(n)]
+
+    def test_sequence_roundtrip(self):
+        a, b, c = self.values(3)
+        tree = (a, [b, None, (c,)], ())
+        flat, treedef = tree_flatten(tree)
+        self.assertEqual(len(flat), 3)
+        result = tree_unflatten(treedef, flat)
+        self.assertEqual(result[1][1], None)
+        self.assertIsInstance(result[1], list)
+        self.assertEqual(len(result[1][2]), 1)
+
+    def test_unchanged_structure_reuses_treedef(self):
+        a, b, c, d = self.values(4)
+        _, treedef0 = tree_flatten((a, [b, None]))
+        _, treedef1 = tree_flatten((c, [d, None]))
+        self.assertIs(treedef0, treedef1)
+        _, treedef2 = tree_flatten((c, [d, d]))
+        self.assertIsNot(treedef0, treedef2)
+        self.assertEqual(check_tree_equal(treedef0, treedef2), 1)
+
+    def test_dataclass_namedtuple_dict(self):
+        tree = {
+            "params": Params(cutlass.Int32(4), cutlass.Float32(0.5), stages=3),
+            "extent": Extent(cutlass.Int32(8), cutlass.Int32(16)),
+            "ns": SimpleNamespace(k=cutlass.Int32(1)),
+        }
+        for _ in range(2):
+            flat, treedef = tree_flatten(tree)
+            self.assertEqual(len(flat), 5)
+            result = tree_unflatten(treedef, flat)
+            self.assertEqual(result["params"].stages, 3)
+            self.assertIsInstance(result["extent"], Extent)
+            self.assertEqual(result["extent"]._fields, ("m", "n"))
+
+    def test_register_after_plan(self):
+        with self.assertRaises(tree_utils.DSLTreeFlattenError):
+            tree_flatten((Opaque(),))
+        register_pytree_node(
+            Opaque,
+            lambda x: (SimpleNamespace(original_obj=x), []),
+            lambda metadata, _: metadata.original_obj,
+        )
+        try:
+            flat, treedef = tree_flatten((Opaque(),))
+            self.assertEqual(flat, [])
+            self.assertIsInstance(tree_unflatten(treedef, flat)[0], Opaque)
+        finally:
+            tree_utils._node_types.pop(Opaque)
+            tree_utils._flatten_plans.clear()
+
+
+class TestCPointers(unittest.TestCase):
+    def test_c_pointers(self):
+        m, n, scale = cutlass.Int32(8), cutlass.Int32(16), cutlass.Float32(0.5)
+        args = (Params(m, scale), Extent(m, n), {"n": n}, SimpleNamespace(s=scale), [None])
+        expected = [m, scale, m, n, n, scale]
+        for _ in range(2):
+            c_pointers = _get_c_pointers_cutlass(args)
+            self.assertEqual(len(c_pointers), len(expected))
+            for (pointer, value) in zip(c_pointers, expected):
+                self.assertEqual(type(pointer), type(value.__c_pointers__()[0]))
+
+    def test_set_is_rejected(self):
+        with self.assertRaises(Exception):
+            _get_c_pointers_cutlass({cutlass.Int32(1)})
+
+
+if __name__ == "__main__":
+    unittest.main()
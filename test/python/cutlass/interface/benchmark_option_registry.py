@@ -0,0 +1,97 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Benchmark of the latency of constructing the first ``Gemm`` in a process, which includes building
+the kernel options of the ``OptionRegistry``
+
+Three setups are compared:
+
+  * eager: options are built for every generator CC and operation kind, as ``OptionRegistry`` did
+    before options were built on demand
+  * cold: options are built on demand and persisted to an empty ``CUTLASS_OPTION_CACHE_DIR``
+  * warm: options are loaded from the tables persisted by the cold setup
+
+The setups run in this order in a single process, so only the first one pays for importing the
+kernel generator. No device or nvcc is required.
+
+Example:
+
+  python benchmark_option_registry.py --cc 80
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import cutlass_library
+
+import cutlass_cppgen
+from cutlass_cppgen.library_defaults import OptionRegistry, _generator_ccs
+
+
+def first_gemm(cc, eager=False):
+    start = time.perf_counter()
+    cutlass_cppgen._option_registry = OptionRegistry(cc)
+    if eager:
+        for kernel_cc in _generator_ccs:
+            for op_kind in [cutlass_library.OperationKind.Gemm, cutlass_library.OperationKind.Conv2d]:
+                cutlass_cppgen._option_registry.options_for_cc(kernel_cc, op_kind)
+    cutlass_cppgen.op.Gemm(element=cutlass_cppgen.DataType.f16, layout=cutlass_cppgen.LayoutType.RowMajor, cc=cc)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cc", type=int, default=80, help="Compute capability whose kernel options are used")
+    parser.add_argument("--skip-eager", action="store_true", help="Do not measure the eager setup, which takes the longest")
+    args = parser.parse_args()
+
+    if cutlass_cppgen._nvcc_version is None:
+        cutlass_cppgen._nvcc_version = "12.8"
+
+    cache_dir = tempfile.mkdtemp()
+    try:
+        timings = []
+        if not args.skip_eager:
+            os.environ["CUTLASS_OPTION_CACHE_DIR"] = ""
+            timings.append(("eager", first_gemm(args.cc, eager=True)))
+        os.environ["CUTLASS_OPTION_CACHE_DIR"] = cache_dir
+        timings.append(("cold", first_gemm(args.cc)))
+        timings.append(("warm", first_gemm(args.cc)))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    for label, elapsed in timings:
+        print(f"{label:>5}: {elapsed:8.3f} s  {timings[0][1] / elapsed:7.1f}x")
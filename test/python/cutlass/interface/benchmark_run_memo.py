@@ -0,0 +1,114 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Host-overhead benchmark of the operation memoization used by ``Gemm.run()`` and ``Conv2d.run()``
+
+The compiler is replaced by a stub that only emits the module source (as ``compiler.add_module``
+does to form its cache key), so no device or nvcc is required. Each iteration cycles through a
+set of alignments and compares building the operation on every call against the memoized path.
+
+Example:
+
+  python benchmark_run_memo.py --cc 80 --iterations 2000
+"""
+
+import argparse
+import time
+
+from cutlass_library import IteratorAlgorithm, StrideSupport
+
+import cutlass_cppgen
+from cutlass_cppgen.backend import compiler
+from cutlass_cppgen.library_defaults import OptionRegistry
+
+
+def stub_add_module(operations, compile_options=None, bypass_cache=False):
+    for operation in operations:
+        operation.rt_module.emit()
+
+
+def time_calls(fn, iterations, alignments):
+    start = time.perf_counter()
+    for i in range(iterations):
+        fn(alignments[i % len(alignments)])
+    return time.perf_counter() - start
+
+
+def gemm_calls(cc):
+    plan = cutlass_cppgen.op.Gemm(element=cutlass_cppgen.DataType.f16,
+                                  layout=cutlass_cppgen.LayoutType.RowMajor, cc=cc)
+
+    def uncached(alignment):
+        plan.compile(alignment_A=alignment, alignment_B=alignment, alignment_C=alignment)
+
+    def memoized(alignment):
+        plan._compile_for_run(alignment, alignment, alignment)
+
+    return uncached, memoized
+
+
+def conv2d_calls(cc):
+    plan = cutlass_cppgen.op.Conv2d(kind="fprop", element=cutlass_cppgen.DataType.f16, cc=cc)
+    swizzle = plan._propose_swizzling_functor((1, 1))
+
+    def uncached(alignment):
+        plan.compile(alignment_A=alignment, alignment_B=alignment, alignment_C=alignment,
+                     iterator_algorithm=IteratorAlgorithm.Optimized, stride_support=StrideSupport.Strided,
+                     swizzling_functor=swizzle)
+
+    def memoized(alignment):
+        plan._compile_for_run(alignment, alignment, alignment, IteratorAlgorithm.Optimized,
+                              StrideSupport.Strided, swizzle, plan.epilogue_functor)
+
+    return uncached, memoized
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cc", type=int, default=80, help="Compute capability whose kernel options are used")
+    parser.add_argument("--iterations", type=int, default=2000, help="Number of simulated run() calls")
+    args = parser.parse_args()
+
+    if cutlass_cppgen._nvcc_version is None:
+        cutlass_cppgen._nvcc_version = "12.8"
+    cutlass_cppgen._option_registry = OptionRegistry(args.cc)
+    compiler.add_module = stub_add_module
+
+    alignments = [8, 4, 2]
+    for name, make_calls in [("Gemm", gemm_calls), ("Conv2d", conv2d_calls)]:
+        uncached, memoized = make_calls(args.cc)
+        before = time_calls(uncached, args.iterations, alignments)
+        after = time_calls(memoized, args.iterations, alignments)
+        for label, elapsed in [("uncached", before), ("memoized", after)]:
+            print(f"{name:>6} {label:>9}: {elapsed:8.3f} s  {elapsed / args.iterations * 1e6:9.2f} us/call  "
+                  f"{before / elapsed:7.1f}x")
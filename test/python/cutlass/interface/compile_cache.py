@@ -0,0 +1,337 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Tests for sharing the compiled-operation cache between processes
+"""
+
+import contextlib
+import hashlib
+import importlib
+import logging
+import multiprocessing
+import os
+import shutil
+import sqlite3
+import stat
+import tempfile
+import time
+import types
+import unittest
+from unittest import mock
+
+import cutlass_cppgen
+from cutlass_cppgen.backend.compiler import ArtifactManager, CACHE_SCHEMA_VERSION, CompiledOperationCache
+
+# cutlass_cppgen.backend.compiler is also the name of the process-wide ArtifactManager
+compiler = importlib.import_module("cutlass_cppgen.backend.compiler")
+
+_LOGGER = logging.getLogger(__name__)
+
+
+STUB_NVCC = """#!/bin/sh
+# Stand-in for nvcc: records the operations of each device compilation and emits the source as the
+# "cubin". Host sources, which the stub operations write in plain C, are built with the C compiler.
+while [ $# -gt 0 ]; do
+  case "$1" in
+    -o) dst="$2"; shift ;;
+    -shared) shared=1 ;;
+    *.cu) src="$1" ;;
+  esac
+  shift
+done
+sleep 0.2
+if [ -n "$shared" ]; then
+  grep -v "#include" "$src" | cc -shared -fPIC -x c - -o "$dst"
+else
+  sed -n "s#^// kernel ##p" "$src" >> "$STUB_NVCC_LOG"
+  cp "$src" "$dst"
+fi
+"""
+
+
+class StubOperation:
+    """
+    Operation whose device source names it and whose host source is plain C, for the stub nvcc
+    """
+    KernelTemplate = "// kernel ${operation_name}\n"
+    HostTemplate = """
+int ${operation_name}_get_param_size(void) { return 16; }
+char *${operation_name}_get_params(void *arguments) { static char params[16]; return params; }
+int ${operation_name}_shared_memory_size(void) { return 0; }
+"""
+    argtype = None
+
+    def __init__(self, name, broken=False):
+        self._name = name
+        self.broken = broken
+        self.rt_module = self
+        self.emitter = types.SimpleNamespace(includes=[], operation_suffix="")
+
+    def emit(self):
+        return "#error broken operation\n" if self.broken else ""
+
+    def name(self):
+        return self._name
+
+    def procedural_name(self):
+        return self._name
+
+    def initialize(self):
+        pass
+
+
+@contextlib.contextmanager
+def stub_toolchain(workdir, db_path):
+    """
+    Points ArtifactManager at the stub nvcc in ``workdir/bin`` and at a CUDA driver that treats
+    cubins as opaque modules, so that ``add_module`` runs end to end without a GPU
+    """
+    fake_cuda = types.SimpleNamespace(
+        CUresult=types.SimpleNamespace(CUDA_SUCCESS=0),
+        cuModuleLoadData=lambda cubin: (0, bytes(cubin)),
+        cuModuleGetFunction=lambda module, name: (0, (module, name.decode())),
+    )
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        with mock.patch.object(compiler, "cuda", fake_cuda), \
+             mock.patch.object(compiler, "cuda_install_path", lambda: workdir), \
+             mock.patch.object(compiler, "device_cc", lambda: 80), \
+             mock.patch.object(compiler, "CACHE_FILE", db_path), \
+             mock.patch.object(cutlass_cppgen, "nvcc_version", lambda: "12.8"), \
+             mock.patch.object(cutlass_cppgen, "initialize_cuda_context", lambda: None):
+            yield
+    finally:
+        os.chdir(cwd)
+
+
+def _compile_all(db_path, workdir, names, queue):
+    """
+    Worker that adds one stub operation per name through ``ArtifactManager.add_module``, which
+    compiles the operations it leases with the stub nvcc and waits for the others
+    """
+    operations = [StubOperation(name) for name in names]
+    with stub_toolchain(workdir, db_path):
+        manager = ArtifactManager()
+        manager.cache = CompiledOperationCache(db_path, poll_interval=0.01)
+        manager.add_module(operations)
+    queue.put({operation.name(): operation.kernel[0] for operation in operations})
+
+
+class CompileCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.workdir, "compiled_cache.db")
+        self.log = os.path.join(self.workdir, "nvcc.log")
+        os.mkdir(os.path.join(self.workdir, "bin"))
+        nvcc = os.path.join(self.workdir, "bin", "nvcc")
+        with open(nvcc, "w") as f:
+            f.write(STUB_NVCC)
+        os.chmod(nvcc, os.stat(nvcc).st_mode | stat.S_IEXEC)
+        environ = mock.patch.dict(os.environ, {"STUB_NVCC_LOG": self.log})
+        environ.start()
+        self.addCleanup(environ.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def test_compile_once_across_processes(self):
+        """
+        Tests that concurrent processes requesting the same operations compile each one only once
+        and all observe the same published result
+        """
+        keys = [f"k{i}" for i in range(4)]
+        num_procs = 8
+        queue = multiprocessing.Queue()
+        procs = [
+            multiprocessing.Process(target=_compile_all, args=(self.db_path, self.workdir, keys[i % 2:] + keys[:i % 2], queue))
+            for i in range(num_procs)
+        ]
+        for p in procs:
+            p.start()
+        results = [queue.get(timeout=120) for _ in procs]
+        for p in procs:
+            p.join()
+            assert p.exitcode == 0
+
+        with open(self.log) as f:
+            invocations = [line.strip() for line in f]
+        assert sorted(invocations) == sorted(keys), f"Expected one compilation per key, got {invocations}"
+
+        for result in results:
+            for key in keys:
+                assert f"// kernel {key}\n".encode() in result[key]
+
+    def test_sharded_compilation(self):
+        """
+        Tests that operations split over several shards are each compiled once, bound and published,
+        without changing the process-wide temporary directory
+        """
+        operations = [StubOperation(f"op_{i}") for i in range(6)]
+        tempdir = tempfile.tempdir
+        with stub_toolchain(self.workdir, self.db_path):
+            manager = ArtifactManager()
+            manager.num_compile_workers = 3
+            manager.add_module(operations)
+        assert tempfile.tempdir == tempdir
+
+        with open(self.log) as f:
+            compiled = sorted(line.strip() for line in f)
+        assert compiled == sorted(operation.name() for operation in operations)
+        assert len(set(operation.kernel[0] for operation in operations)) == 3
+        for operation in operations:
+            module, name = operation.kernel
+            assert name == operation.name()
+            assert f"// kernel {name}".encode() in module
+            assert operation.shared_memory_capacity == 0
+
+        cache = CompiledOperationCache(self.db_path)
+        for key in manager.compiled_cache_device:
+            assert cache.fetch(key) is not None
+        assert len(manager.compiled_cache_device) == len(operations)
+
+    def test_sharded_compilation_errors(self):
+        """
+        Tests that each failing shard reports to its own error file and that no lease is left behind
+        """
+        operations = [StubOperation(f"op_{i}", broken=i < 2) for i in range(4)]
+        with stub_toolchain(self.workdir, self.db_path):
+            manager = ArtifactManager()
+            manager.num_compile_workers = 2
+            with self.assertRaisesRegex(Exception, "Invalid Kernel"):
+                manager.add_module(operations)
+
+            for shard in range(2):
+                with open(f"cutlass_python_compilation_host_error_{shard}.txt") as f:
+                    error_log = f.read()
+                assert f"op_{shard}_get_params" in error_log
+                assert f"op_{shard + 2}_get_params" in error_log
+
+            # The leases were released, so the operations are compiled again once fixed
+            for operation in operations:
+                operation.broken = False
+            manager.add_module(operations)
+        assert all(operation.kernel is not None for operation in operations)
+
+    def test_expired_lease_is_taken_over(self):
+        """
+        Tests that a lease left behind by a process that never publishes is taken over once it expires
+        """
+        stale = CompiledOperationCache(self.db_path, lease_timeout=0.1)
+        assert stale.acquire("k") == CompiledOperationCache.LEASE_ACQUIRED
+
+        cache = CompiledOperationCache(self.db_path, poll_interval=0.01)
+        assert cache.acquire("k") == CompiledOperationCache.LEASE_BUSY
+        assert cache.wait("k") is None
+        assert cache.acquire("k") == CompiledOperationCache.LEASE_ACQUIRED
+        cache.publish([("k", b"cubin", b"host", "op_k", [16])])
+        assert stale.acquire("k") == CompiledOperationCache.COMPILED
+        assert cache.fetch("k")[1] == b"cubin"
+
+    def test_release_without_publish(self):
+        """
+        Tests that releasing a lease lets another process compile the operation
+        """
+        first = CompiledOperationCache(self.db_path)
+        assert first.acquire("k") == CompiledOperationCache.LEASE_ACQUIRED
+        first.release(["k"])
+
+        second = CompiledOperationCache(self.db_path)
+        assert second.acquire("k") == CompiledOperationCache.LEASE_ACQUIRED
+
+    def _populate_legacy(self, sources):
+        """
+        Writes rows keyed by full source strings, as caches did before keys were hashed
+        """
+        connection = sqlite3.connect(self.db_path)
+        connection.execute("""
+        CREATE TABLE IF NOT EXISTS compiled_operations(op_key TEXT NOT NULL UNIQUE, cubin BLOB NOT NULL,
+                                                        hostbin BLOB NOT NULL, op_name TEXT NOT NULL,
+                                                        op_attrs TEXT NOT NULL)
+        """)
+        connection.executemany("INSERT INTO compiled_operations VALUES (?, ?, ?, ?, ?)",
+                               [(src, b"cubin", b"host", "op", "[16]") for src in sources])
+        connection.commit()
+        connection.close()
+
+    def test_adopt_legacy_keys(self):
+        """
+        Tests that rows keyed by full source strings are re-keyed to hashed keys on first use
+        """
+        sources = [f"// kernel {i}\n" * 8 + "nvcc" for i in range(3)]
+        self._populate_legacy(sources)
+
+        cache = CompiledOperationCache(self.db_path)
+        new_keys = [hashlib.sha256(src.encode()).hexdigest() for src in sources]
+        assert cache.adopt_legacy(sources[0], new_keys[0])
+        assert cache.fetch(new_keys[0]) is not None
+        assert cache.fetch(sources[0]) is None
+        assert not cache.adopt_legacy("missing", new_keys[1])
+
+        assert cache.purge_legacy() == 2
+        assert cache.fetch(sources[1]) is None
+        assert not cache.adopt_legacy(sources[2], new_keys[2])
+        assert cache.connection().execute("PRAGMA user_version").fetchone()[0] == CACHE_SCHEMA_VERSION
+
+    def test_lookup_latency(self):
+        """
+        Reports lookup latency in a 10k-entry cache under legacy and hashed keys
+        """
+        num_entries = 10000
+        num_lookups = 2000
+        sources = [f"template_{i}<" + "cutlass::gemm::GemmShape<128, 128, 32>, " * 100 + ">" for i in range(num_entries)]
+        keys = [hashlib.sha256(src.encode()).hexdigest() for src in sources]
+
+        def measure(lookup_keys):
+            cache = CompiledOperationCache(self.db_path)
+            start = time.perf_counter()
+            for key in lookup_keys[:num_lookups]:
+                assert cache.fetch(key) is not None
+            elapsed = time.perf_counter() - start
+            cache.close()
+            os.remove(self.db_path)
+            return elapsed / num_lookups * 1e6
+
+        self._populate_legacy(sources)
+        legacy_us = measure(sources)
+
+        cache = CompiledOperationCache(self.db_path)
+        cache.publish([(key, b"cubin", b"host", "op", [16]) for key in keys])
+        cache.close()
+        hashed_us = measure(keys)
+
+        _LOGGER.info(f"Cache lookup over {num_entries} entries: legacy keys {legacy_us:.1f} us, hashed keys {hashed_us:.1f} us")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,232 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Tests for the wave-quantization model used to select kernels for a problem shape
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import cutlass_library
+
+import cutlass_cppgen
+from cutlass_cppgen.kernel_selection import (
+    ProfilingTable,
+    WaveQuantizationSelector,
+    ctas_per_sm,
+    estimate,
+)
+from cutlass_cppgen.library_defaults import OptionRegistry
+from cutlass_cppgen.op import op as op_module
+from cutlass_cppgen.shape import GemmCoord
+from cutlass_cppgen.utils.datatypes import td_from_profiler_op
+
+
+CC = 80
+SM_COUNT = 108
+
+
+def setUpModule():
+    # Build the kernel options for a fixed CC instead of querying the device
+    if cutlass_cppgen._nvcc_version is None:
+        cutlass_cppgen._nvcc_version = "12.8"
+    if cutlass_cppgen._option_registry is None:
+        cutlass_cppgen._option_registry = OptionRegistry(CC)
+
+
+def f16_operation(threadblock_shape, stages, warp_count):
+    """
+    Returns an SM80 F16 Tensor Core GEMM with the provided tile shape, stage count, and warp count
+    """
+    math_inst = cutlass_library.MathInstruction(
+        [16, 8, 16], cutlass_library.DataType.f16, cutlass_library.DataType.f16, cutlass_library.DataType.f32,
+        cutlass_library.OpcodeClass.TensorOp, cutlass_library.MathOperation.multiply_add)
+    td = cutlass_library.TileDescription(threadblock_shape, stages, warp_count, math_inst, 80, 1024)
+    A = cutlass_library.TensorDescription(cutlass_library.DataType.f16, cutlass_library.LayoutType.RowMajor, 8)
+    B = cutlass_library.TensorDescription(cutlass_library.DataType.f16, cutlass_library.LayoutType.RowMajor, 8)
+    C = cutlass_library.TensorDescription(cutlass_library.DataType.f16, cutlass_library.LayoutType.RowMajor, 8)
+    return cutlass_library.manifest.GemmOperation(
+        cutlass_library.GemmKind.Universal, 80, td, A, B, C, cutlass_library.DataType.f32,
+        cutlass_library.EpilogueFunctor.LinearCombination, cutlass_library.SwizzlingFunctor.Identity8)
+
+
+# In the order in which ``KernelsForDataType`` sorts them (descending threadblock shape)
+OP_256x128 = f16_operation([256, 128, 64], 3, [4, 2, 1])
+OP_128x128 = f16_operation([128, 128, 32], 3, [2, 2, 1])
+OP_64x64 = f16_operation([64, 64, 64], 5, [2, 2, 1])
+OPERATIONS = [OP_256x128, OP_128x128, OP_64x64]
+
+
+class WaveModelTest(unittest.TestCase):
+    def test_ctas_per_sm(self):
+        # 163 KB of shared memory on SM80. Each stage holds an M x K tile of A and a K x N tile of B
+        # in F16, plus 32 bytes of barriers.
+        #   256x128x64: 3 * (2*256*64 + 2*64*128 + 32) = 147552 B -> 1 CTA
+        #   128x128x32: 3 * (2*128*32 + 2*32*128 + 32) =  49248 B -> 3 CTAs
+        #   64x64x64:   5 * (2*64*64  + 2*64*64  + 32) =  82080 B -> 2 CTAs
+        self.assertEqual(ctas_per_sm(td_from_profiler_op(OP_256x128), CC), 1)
+        self.assertEqual(ctas_per_sm(td_from_profiler_op(OP_128x128), CC), 3)
+        self.assertEqual(ctas_per_sm(td_from_profiler_op(OP_64x64), CC), 2)
+
+    def test_thread_limit(self):
+        # SM75 supports 1024 threads per SM. A 2-stage 64x64x16 kernel fits 7 CTAs in 64 KB of shared
+        # memory (2 * (2*64*16 + 2*16*64 + 32) = 8256 B), but with 8 warps only 4 CTAs fit by threads.
+        td = td_from_profiler_op(f16_operation([64, 64, 16], 2, [2, 2, 2]))
+        self.assertEqual(ctas_per_sm(td, 75), 4)
+
+    def test_waves(self):
+        # 4096x4096: 32 x 32 = 1024 CTAs of 128x128 in waves of 3 * 108 = 324 -> 4 waves
+        e = estimate(OP_128x128, GemmCoord(4096, 4096, 4096), 1, 1, SM_COUNT, CC)
+        self.assertEqual(e.ctas, 1024)
+        self.assertEqual(e.ctas_per_wave, 324)
+        self.assertEqual(e.waves, 4)
+        self.assertAlmostEqual(e.wave_efficiency, 1024 / 1296)
+
+        # 16 x 32 = 512 CTAs of 256x128 in waves of 108 -> 5 waves
+        e = estimate(OP_256x128, GemmCoord(4096, 4096, 4096), 1, 1, SM_COUNT, CC)
+        self.assertEqual(e.ctas, 512)
+        self.assertEqual(e.waves, 5)
+
+        # Partial tiles round up: 1 x 32 CTAs of 256x128 for M = 64 fill a single wave
+        e = estimate(OP_256x128, GemmCoord(64, 4096, 4096), 1, 1, SM_COUNT, CC)
+        self.assertEqual(e.ctas, 32)
+        self.assertEqual(e.waves, 1)
+        self.assertAlmostEqual(e.wave_efficiency, 32 / 108)
+
+    def test_batch_and_split_k(self):
+        # 4 batches x 2 slices x (8 x 8) CTAs of 64x64 = 512 CTAs in waves of 216 -> 3 waves
+        e = estimate(OP_64x64, GemmCoord(512, 512, 4096), 4, 2, SM_COUNT, CC)
+        self.assertEqual(e.ctas, 512)
+        self.assertEqual(e.waves, 3)
+
+    def test_selection(self):
+        selector = WaveQuantizationSelector(sm_count=SM_COUNT)
+
+        # Decode-like GEMM: the 256x128 tile launches 32 CTAs on 108 SMs, while 64x64 spreads the
+        # same work over 64 SMs
+        chosen = selector.select(OPERATIONS, GemmCoord(64, 4096, 4096), CC)
+        self.assertIs(chosen.operation, OP_64x64)
+        self.assertEqual(chosen.source, "model")
+
+        # Large square GEMM: all tiles fill the device, so the tile with the most reuse wins
+        #   256x128: 19 waves x 1 CTA/SM  x (256*128 + 64*384) = 1089536
+        #   128x128: 13 waves x 3 CTAs/SM x (128*128 + 64*256) = 1277952
+        #   64x64:   76 waves x 2 CTAs/SM x (64*64  + 64*128)  = 1867776
+        costs = [e.cost // 8192 for e in selector.estimates(OPERATIONS, GemmCoord(8192, 8192, 8192), CC)]
+        self.assertEqual(costs, [1089536, 1277952, 1867776])
+        self.assertIs(selector.select(OPERATIONS, GemmCoord(8192, 8192, 8192), CC).operation, OP_256x128)
+
+    def test_ties_keep_candidate_order(self):
+        selector = WaveQuantizationSelector(sm_count=SM_COUNT)
+        duplicate = f16_operation([128, 128, 32], 3, [2, 2, 1])
+        chosen = selector.select([OP_128x128, duplicate], GemmCoord(1024, 1024, 1024), CC)
+        self.assertIs(chosen.operation, OP_128x128)
+
+
+class ProfilingTableTest(unittest.TestCase):
+    def test_override_and_persist(self):
+        problem = GemmCoord(64, 4096, 4096)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "profile.json")
+            table = ProfilingTable(path)
+            table.record(CC, problem, OP_256x128, 0.020)
+            table.record(CC, problem, OP_64x64, 0.030)
+            table.record(CC, problem, OP_256x128, 0.025)
+            table.save()
+
+            selector = WaveQuantizationSelector(sm_count=SM_COUNT, profiling_table=ProfilingTable(path))
+            chosen = selector.select(OPERATIONS, problem, CC)
+            self.assertIs(chosen.operation, OP_256x128)
+            self.assertEqual(chosen.source, "profile")
+
+            # Problems and devices that were not profiled fall back to the model
+            self.assertEqual(selector.select(OPERATIONS, GemmCoord(64, 4096, 2048), CC).source, "model")
+            self.assertEqual(selector.select(OPERATIONS, problem, 90).source, "model")
+
+            # Profiled operations that are not candidates are ignored
+            self.assertIs(selector.select([OP_128x128, OP_64x64], problem, CC).operation, OP_64x64)
+
+
+class GemmSelectionTest(unittest.TestCase):
+    def setUp(self):
+        self.plan = cutlass_cppgen.op.Gemm(element=cutlass_cppgen.DataType.f16,
+                                           layout=cutlass_cppgen.LayoutType.RowMajor, cc=CC)
+        self.plan.kernel_selector = WaveQuantizationSelector(sm_count=SM_COUNT)
+
+    def test_selects_per_problem(self):
+        default = self.plan.construct(alignment_A=8, alignment_B=8, alignment_C=8)
+        self.assertIsNone(self.plan.selected_kernel)
+
+        square = self.plan.construct(alignment_A=8, alignment_B=8, alignment_C=8,
+                                     problem_size=GemmCoord(8192, 8192, 8192))
+        self.assertEqual(square.tile_description.threadblock_shape, default.tile_description.threadblock_shape)
+
+        decode = self.plan.construct(alignment_A=8, alignment_B=8, alignment_C=8,
+                                     problem_size=GemmCoord(64, 4096, 4096))
+        self.assertIsNotNone(self.plan.selected_kernel)
+        self.assertEqual(self.plan.selected_kernel.waves, 1)
+        tb = decode.tile_description.threadblock_shape
+        default_tb = default.tile_description.threadblock_shape
+        self.assertLess(tb[0] * tb[1], default_tb[0] * default_tb[1])
+
+    def test_selection_memo_is_bounded(self):
+        calls = []
+        select = self.plan.kernel_selector.select
+
+        def counting_select(*args, **kwargs):
+            calls.append(args[1].m)
+            return select(*args, **kwargs)
+
+        def construct(m):
+            self.plan.construct(alignment_A=8, alignment_B=8, alignment_C=8, problem_size=GemmCoord(m, 4096, 4096))
+
+        with mock.patch.object(op_module, "SELECTED_OPERATIONS_CAPACITY", 2), \
+             mock.patch.object(self.plan.kernel_selector, "select", side_effect=counting_select):
+            for m in [64, 128, 64, 256, 64, 128]:
+                construct(m)
+        self.assertLessEqual(len(self.plan._selected_operations), 2)
+        # 64 stays selected as the most recently used problem, while 128 is evicted by 256
+        self.assertEqual(calls, [64, 128, 256, 128])
+
+    def test_explicit_tile_description_bypasses_selection(self):
+        td = self.plan.tile_descriptions()[-1]
+        self.plan.tile_description = td
+        op = self.plan.construct(alignment_A=8, alignment_B=8, alignment_C=8, problem_size=GemmCoord(64, 4096, 4096))
+        self.assertEqual(str(op.tile_description), str(td))
+        self.assertIsNone(self.plan.selected_kernel)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Tests for the lazy construction and on-disk persistence of ``OptionRegistry`` tables, with the
+kernel generator replaced by a stub
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import cutlass_library
+
+import cutlass_cppgen
+from cutlass_cppgen import library_defaults
+from cutlass_cppgen.library_defaults import OptionRegistry
+
+
+CC = 80
+GEMM = cutlass_library.OperationKind.Gemm
+CONV2D = cutlass_library.OperationKind.Conv2d
+
+
+class OptionRegistryCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir, ignore_errors=True)
+        for patcher in [
+            mock.patch.dict(os.environ, {"CUTLASS_OPTION_CACHE_DIR": self.cache_dir}),
+            mock.patch.object(cutlass_cppgen, "_nvcc_version", "12.8"),
+            mock.patch.object(library_defaults, "ArchOptions", side_effect=self.build),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.built = []
+        self.make_options = lambda target_cc, kernel_cc, op_kind: {"cc": kernel_cc, "kind": op_kind.name}
+
+    def build(self, target_cc, kernel_cc, op_kind, gemm_kinds):
+        self.built.append((kernel_cc, op_kind))
+        return self.make_options(target_cc, kernel_cc, op_kind)
+
+    def cache_files(self):
+        return sorted(os.listdir(self.cache_dir))
+
+    def test_lazy(self):
+        registry = OptionRegistry(CC)
+        self.assertEqual(self.built, [])
+        self.assertEqual(registry.options_for_cc(CC, GEMM), {"cc": CC, "kind": "Gemm"})
+        self.assertIs(registry.options_for_cc(CC, GEMM), registry.options_for_cc(CC, GEMM))
+        self.assertEqual(self.built, [(CC, GEMM)])
+        self.assertIsNone(registry.options_for_cc(42, GEMM))
+
+    def test_reload(self):
+        OptionRegistry(CC).options_for_cc(CC, GEMM)
+        OptionRegistry(CC).options_for_cc(CC, CONV2D)
+        self.assertEqual(len(self.cache_files()), 2)
+
+        # A later process loads the tables without running the generator
+        self.built.clear()
+        registry = OptionRegistry(CC)
+        self.assertEqual(registry.options_for_cc(CC, GEMM), {"cc": CC, "kind": "Gemm"})
+        self.assertEqual(registry.options_for_cc(CC, CONV2D), {"cc": CC, "kind": "Conv2d"})
+        self.assertEqual(self.built, [])
+
+    def test_keyed_by_nvcc_version(self):
+        OptionRegistry(CC).options_for_cc(CC, GEMM)
+        with mock.patch.object(cutlass_cppgen, "_nvcc_version", "12.9"):
+            OptionRegistry(CC).options_for_cc(CC, GEMM)
+        self.assertEqual(len(self.built), 2)
+        self.assertEqual(len(self.cache_files()), 2)
+
+    def test_unreadable_cache_is_rebuilt(self):
+        OptionRegistry(CC).options_for_cc(CC, GEMM)
+        path = os.path.join(self.cache_dir, self.cache_files()[0])
+        with open(path, "wb") as f:
+            f.write(b"not a pickle")
+
+        self.assertEqual(OptionRegistry(CC).options_for_cc(CC, GEMM), {"cc": CC, "kind": "Gemm"})
+        self.assertEqual(len(self.built), 2)
+        self.built.clear()
+        OptionRegistry(CC).options_for_cc(CC, GEMM)
+        self.assertEqual(self.built, [])
+
+    def test_failed_write_leaves_no_file(self):
+        # Pickling fails with an error other than OSError
+        self.make_options = lambda target_cc, kernel_cc, op_kind: (lambda: None)
+        options = OptionRegistry(CC).options_for_cc(CC, GEMM)
+        self.assertTrue(callable(options))
+        self.assertEqual(self.cache_files(), [])
+
+    def test_disabled(self):
+        with mock.patch.dict(os.environ, {"CUTLASS_OPTION_CACHE_DIR": ""}):
+            OptionRegistry(CC).options_for_cc(CC, GEMM)
+            OptionRegistry(CC).options_for_cc(CC, GEMM)
+        self.assertEqual(len(self.built), 2)
+        self.assertEqual(self.cache_files(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Tests for the memoization of compiled operations across calls to ``run()``, using a stubbed
+compiler so that no device or nvcc is needed
+"""
+
+import unittest
+from unittest import mock
+
+from cutlass_library import IteratorAlgorithm, StrideSupport
+
+import cutlass_cppgen
+from cutlass_cppgen.backend import compiler
+from cutlass_cppgen.epilogue import get_activation_epilogue
+from cutlass_cppgen.kernel_selection import WaveQuantizationSelector
+from cutlass_cppgen.library_defaults import OptionRegistry
+from cutlass_cppgen.shape import GemmCoord
+
+
+CC = 80
+
+
+def setUpModule():
+    # Build the kernel options for a fixed CC instead of querying the device
+    if cutlass_cppgen._nvcc_version is None:
+        cutlass_cppgen._nvcc_version = "12.8"
+    if cutlass_cppgen._option_registry is None:
+        cutlass_cppgen._option_registry = OptionRegistry(CC)
+
+
+class StubCompiler:
+    """
+    Stand-in for ``compiler.add_module`` that only records the operations it is given
+    """
+    def __init__(self):
+        self.operations = []
+
+    def add_module(self, operations, compile_options=None, bypass_cache=False):
+        self.operations.extend(operations)
+
+
+class GemmRunMemoizationTest(unittest.TestCase):
+    def setUp(self):
+        self.stub = StubCompiler()
+        patcher = mock.patch.object(compiler, "add_module", self.stub.add_module)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.plan = cutlass_cppgen.op.Gemm(element=cutlass_cppgen.DataType.f16,
+                                           layout=cutlass_cppgen.LayoutType.RowMajor, cc=CC)
+
+    def test_reuses_operation(self):
+        op = self.plan._compile_for_run(8, 8, 8)
+        self.assertIs(self.plan._compile_for_run(8, 8, 8), op)
+        self.assertIs(self.plan.operation, op)
+        self.assertEqual(len(self.stub.operations), 1)
+
+    def test_keyed_by_alignment(self):
+        op_8 = self.plan._compile_for_run(8, 8, 8)
+        op_4 = self.plan._compile_for_run(4, 4, 4)
+        epilogue_4 = self.plan.epilogue_functor
+        self.assertIsNot(op_4, op_8)
+        self.assertEqual(op_4.A.alignment, 4)
+
+        # Switching back reuses the first operation without touching the plan's epilogue
+        self.assertIs(self.plan._compile_for_run(8, 8, 8), op_8)
+        self.assertIs(self.plan.epilogue_functor, epilogue_4)
+        self.assertEqual(len(self.stub.operations), 2)
+
+    def test_keyed_by_epilogue_element_types(self):
+        op = self.plan._compile_for_run(8, 8, 8)
+        f16, f32 = cutlass_cppgen.DataType.f16, cutlass_cppgen.DataType.f32
+        identity = cutlass_cppgen.epilogue.identity
+
+        # A functor equal up to alignment reuses the operation and is kept as the user set it
+        same = get_activation_epilogue(identity, f16, 4, f16, f16)
+        self.plan.epilogue_functor = same
+        self.assertIs(self.plan._compile_for_run(8, 8, 8), op)
+        self.assertIs(self.plan.epilogue_functor, same)
+
+        self.plan.epilogue_functor = get_activation_epilogue(identity, f16, 8, f16, f32)
+        self.assertIsNot(self.plan._compile_for_run(8, 8, 8), op)
+        self.assertEqual(len(self.stub.operations), 2)
+
+    def test_keyed_by_swizzle_and_tile(self):
+        op = self.plan._compile_for_run(8, 8, 8)
+        self.plan.swizzling_functor = cutlass_cppgen.swizzle.IdentitySwizzle2
+        op_swizzle = self.plan._compile_for_run(8, 8, 8)
+        self.assertIsNot(op_swizzle, op)
+
+        td = self.plan.tile_descriptions()[-1]
+        self.plan.tile_description = td
+        op_tile = self.plan._compile_for_run(8, 8, 8)
+        self.assertIsNot(op_tile, op_swizzle)
+        self.assertEqual(str(op_tile.tile_description), str(td))
+        self.assertEqual(len(self.stub.operations), 3)
+
+    def test_invalidated_by_activation(self):
+        op = self.plan._compile_for_run(8, 8, 8)
+        self.plan.activation = cutlass_cppgen.epilogue.relu
+        op_relu = self.plan._compile_for_run(8, 8, 8)
+        self.assertIsNot(op_relu, op)
+        self.assertIs(op_relu.epilogue_functor.activation_functor, cutlass_cppgen.epilogue.relu)
+
+    def test_invalidated_by_opclass(self):
+        op = self.plan._compile_for_run(8, 8, 8)
+        self.plan.opclass = cutlass_cppgen.OpcodeClass.Simt
+        self.plan.opclass = cutlass_cppgen.OpcodeClass.TensorOp
+        self.assertIsNot(self.plan._compile_for_run(8, 8, 8), op)
+        self.assertEqual(len(self.stub.operations), 2)
+
+    def test_keyed_by_selected_kernel(self):
+        self.plan.kernel_selector = WaveQuantizationSelector(sm_count=108)
+        square, decode = GemmCoord(8192, 8192, 8192), GemmCoord(64, 4096, 4096)
+        op_square = self.plan._compile_for_run(8, 8, 8, problem_size=square)
+        op_decode = self.plan._compile_for_run(8, 8, 8, problem_size=decode)
+        self.assertIsNot(op_decode, op_square)
+        self.assertIs(self.plan._compile_for_run(8, 8, 8, problem_size=square), op_square)
+        self.assertEqual(len(self.stub.operations), 2)
+
+    def test_print_module_bypasses(self):
+        op = self.plan._compile_for_run(8, 8, 8)
+        with mock.patch("builtins.print"):
+            op_printed = self.plan._compile_for_run(8, 8, 8, print_module=True)
+        self.assertIsNot(op_printed, op)
+        self.assertEqual(len(self.stub.operations), 2)
+
+
+class Conv2dRunMemoizationTest(unittest.TestCase):
+    def setUp(self):
+        self.stub = StubCompiler()
+        patcher = mock.patch.object(compiler, "add_module", self.stub.add_module)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.plan = cutlass_cppgen.op.Conv2d(kind="fprop", element=cutlass_cppgen.DataType.f16, cc=CC)
+
+    def compile_for_run(self, alignment, iterator_algorithm=IteratorAlgorithm.Optimized):
+        return self.plan._compile_for_run(
+            alignment, alignment, alignment, iterator_algorithm, StrideSupport.Strided,
+            self.plan._propose_swizzling_functor((1, 1)), self.plan.epilogue_functor)
+
+    def test_reuses_operation(self):
+        op = self.compile_for_run(8)
+        self.assertIs(self.compile_for_run(8), op)
+        self.assertIsNot(self.compile_for_run(4), op)
+        self.assertIsNot(self.compile_for_run(8, IteratorAlgorithm.Analytic), op)
+        self.assertIs(self.compile_for_run(8), op)
+        self.assertEqual(len(self.stub.operations), 3)
+
+    def test_invalidated_by_activation(self):
+        op = self.compile_for_run(8)
+        self.plan.activation = cutlass_cppgen.epilogue.relu
+        self.assertIsNot(self.compile_for_run(8), op)
+
+
+if __name__ == '__main__':
+    unittest.main()
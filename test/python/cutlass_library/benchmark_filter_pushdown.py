@@ -0,0 +1,102 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Measures generator.py wall time against the selectivity of the kernel filter
+
+Kinds and compute capabilities excluded by --operations and --architectures are pruned inside the
+Create*Operator helpers, and kernel names are matched before the shared memory usage is computed,
+so narrow filters should run in a fraction of the time of --kernels all.
+Pass --baseline-generator to compare against another checkout of generator.py.
+
+Example:
+
+  python benchmark_filter_pushdown.py --architectures 100a --operations gemm,conv2d,all --level 1422
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def run_generator(generator, build_dir, architectures, operations, kernels, level):
+  kernel_list = os.path.join(build_dir, "selected_kernels.txt")
+  cmd = [
+    sys.executable, generator,
+    "--curr-build-dir", build_dir,
+    "--generator-target", "none",
+    "--architectures", architectures,
+    "--operations", operations,
+    "--kernels", kernels,
+    "--instantiation-level", level,
+    "--cuda-version", "12.9",
+    "--selected-kernel-list", kernel_list,
+    "--log-level", "error",
+  ]
+  start = time.perf_counter()
+  subprocess.run(cmd, check=True, cwd=os.path.dirname(generator), stdout=subprocess.DEVNULL)
+  elapsed = time.perf_counter() - start
+
+  selected = 0
+  if os.path.exists(kernel_list):
+    with open(kernel_list) as kernel_list_file:
+      selected = sum(1 for _ in kernel_list_file)
+  return selected, elapsed
+
+
+if __name__ == "__main__":
+  default_generator = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   "..", "..", "..", "python", "cutlass_library", "generator.py")
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--generator", default=os.path.normpath(default_generator), help="Path to generator.py")
+  parser.add_argument("--baseline-generator", default=None, help="Optional path to a generator.py to compare against")
+  parser.add_argument("--architectures", default="100a", help="Value of --architectures passed to the generator")
+  parser.add_argument("--operations", default="gemm,conv2d,all", help="Comma-delimited --operations values to measure")
+  parser.add_argument("--kernels", default="*256x128x64*;all",
+                      help="Semicolon-delimited --kernels values to measure, from narrowest to broadest")
+  parser.add_argument("--level", default="0", help="Value of --instantiation-level passed to the generator")
+  args = parser.parse_args()
+
+  generators = [("pushdown", args.generator)]
+  if args.baseline_generator is not None:
+    generators.append(("baseline", args.baseline_generator))
+
+  print(f"{'generator':>10} {'operations':>10} {'kernels':>20} {'selected':>9} {'seconds':>9}")
+  for operations in args.operations.split(","):
+    for kernels in args.kernels.split(";"):
+      for label, generator in generators:
+        with tempfile.TemporaryDirectory() as build_dir:
+          selected, elapsed = run_generator(generator, build_dir, args.architectures, operations, kernels, args.level)
+        print(f"{label:>10} {operations:>10} {kernels:>20} {selected:>9} {elapsed:>9.2f}")
@@ -0,0 +1,90 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Measures end-to-end wall time of generator.py with serial and parallel emission
+
+Example:
+
+  python benchmark_generator.py --architectures 90a --levels 0,1111 --jobs 1,8
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def run_generator(generator, build_dir, architectures, kernels, level, jobs):
+  cmd = [
+    sys.executable, generator,
+    "--curr-build-dir", build_dir,
+    "--architectures", architectures,
+    "--kernels", kernels,
+    "--instantiation-level", level,
+    "--cuda-version", "12.9",
+    "--emit-jobs", str(jobs),
+    "--log-level", "error",
+  ]
+  start = time.perf_counter()
+  subprocess.run(cmd, check=True, cwd=os.path.dirname(generator), stdout=subprocess.DEVNULL)
+  return time.perf_counter() - start
+
+
+def count_files(path):
+  return sum(len(files) for _, _, files in os.walk(path))
+
+
+if __name__ == "__main__":
+  default_generator = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   "..", "..", "..", "python", "cutlass_library", "generator.py")
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--generator", default=os.path.normpath(default_generator), help="Path to generator.py")
+  parser.add_argument("--architectures", default="90a", help="Value of --architectures passed to the generator")
+  parser.add_argument("--kernels", default="*", help="Value of --kernels passed to the generator")
+  parser.add_argument("--levels", default="0,1111", help="Comma-delimited instantiation levels to measure")
+  parser.add_argument("--jobs", default=f"1,{os.cpu_count()}", help="Comma-delimited --emit-jobs values to measure")
+  args = parser.parse_args()
+
+  print(f"{'level':>8} {'jobs':>5} {'files':>7} {'seconds':>9}")
+  for level in args.levels.split(","):
+    for jobs in [int(j) for j in args.jobs.split(",")]:
+      build_dir = tempfile.mkdtemp()
+      try:
+        elapsed = run_generator(args.generator, build_dir, args.architectures, args.kernels, level, jobs)
+        files = count_files(os.path.join(build_dir, "generated"))
+      finally:
+        shutil.rmtree(build_dir, ignore_errors=True)
+      print(f"{level:>8} {jobs:>5} {files:>7} {elapsed:>9.2f}")
@@ -0,0 +1,101 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Compares answering a kernel query by rerunning generator.py against loading its kernel catalog
+
+Example:
+
+  python benchmark_kernel_catalog.py --architectures "80;90a;100a" --kernels all
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from cutlass_library.kernel_catalog import KernelCatalog
+
+
+def run_generator(generator, build_dir, architectures, kernels, catalog):
+  cmd = [
+    sys.executable, generator,
+    "--curr-build-dir", build_dir,
+    "--generator-target", "none",
+    "--architectures", architectures,
+    "--kernels", kernels,
+    "--cuda-version", "12.9",
+    "--kernel-catalog", catalog,
+    "--log-level", "error",
+  ]
+  start = time.perf_counter()
+  subprocess.run(cmd, check=True, cwd=os.path.dirname(generator), stdout=subprocess.DEVNULL)
+  return time.perf_counter() - start
+
+
+def load_and_query(catalog, criteria):
+  start = time.perf_counter()
+  with KernelCatalog(catalog) as kernel_catalog:
+    names = kernel_catalog.names(**criteria)
+  return names, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+  default_generator = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   "..", "..", "..", "python", "cutlass_library", "generator.py")
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--generator", default=os.path.normpath(default_generator), help="Path to generator.py")
+  parser.add_argument("--architectures", default="80;90a", help="Value of --architectures passed to the generator")
+  parser.add_argument("--kernels", default="all", help="Value of --kernels passed to the generator")
+  parser.add_argument("--iterations", default=20, type=int, help="Number of timed catalog loads")
+  args = parser.parse_args()
+
+  criteria = dict(cc=90, element_a="bf16", layout_a="RowMajor", layout_b="ColumnMajor",
+                  alignment_a=8, cluster_m=2, cluster_n=1)
+
+  with tempfile.TemporaryDirectory() as build_dir:
+    catalog = os.path.join(build_dir, "kernels.db")
+    generate_seconds = run_generator(args.generator, build_dir, args.architectures, args.kernels, catalog)
+    with KernelCatalog(catalog) as kernel_catalog:
+      total = len(kernel_catalog)
+
+    timings = []
+    for _ in range(args.iterations):
+      names, elapsed = load_and_query(catalog, criteria)
+      timings.append(elapsed)
+    load_seconds = min(timings)
+
+  print(f"catalog: {total} kernels, query matched {len(names)}")
+  print(f"generate + emit catalog: {generate_seconds:9.3f} s")
+  print(f"load catalog + query:    {load_seconds:9.5f} s ({generate_seconds / load_seconds:.0f}x faster)")
@@ -0,0 +1,104 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Microbenchmark of SubstituteTemplate over the templates used by the kernel emitters
+
+The (template, values) pairs passed to SubstituteTemplate while emitting a set of kernels are
+recorded, then replayed through the compiled and the fixpoint implementations.
+
+Example:
+
+  python benchmark_substitute_template.py --architectures 90a --kernels '*128x128x64*'
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+
+from cutlass_library import generator
+from cutlass_library import library
+from cutlass_library.library import SubstituteTemplate, _SubstituteTemplateFixpoint
+from cutlass_library.manifest import Manifest
+
+
+def record_calls(architectures, kernels):
+  calls = []
+  original = library.SubstituteTemplate
+  modules = [m for m in list(sys.modules.values()) if getattr(m, "SubstituteTemplate", None) is original]
+
+  def record(template, values):
+    calls.append((template, dict(values)))
+    return original(template, values)
+
+  build_dir = tempfile.mkdtemp()
+  args = generator.define_parser().parse_args([
+    "--architectures", architectures, "--kernels", kernels,
+    "--curr-build-dir", build_dir, "--log-level", "error"])
+  manifest = Manifest(args)
+  try:
+    for module in modules:
+      module.SubstituteTemplate = record
+    getattr(generator, "GenerateSM" + architectures.rstrip("af"))(manifest, "12.9")
+    manifest.emit()
+  finally:
+    for module in modules:
+      module.SubstituteTemplate = original
+    shutil.rmtree(build_dir, ignore_errors=True)
+  return calls
+
+
+def time_calls(fn, calls):
+  start = time.perf_counter()
+  for template, values in calls:
+    fn(template, values)
+  return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--architectures", default="80", help="Single architecture whose generator is run")
+  parser.add_argument("--kernels", default="cutlass_tensorop_*16816*", help="Kernel filter passed to the generator")
+  args = parser.parse_args()
+
+  calls = record_calls(args.architectures, args.kernels)
+  chars = sum(len(template) for template, _ in calls)
+  print(f"{len(calls)} calls, {chars / len(calls):.0f} template characters on average")
+
+  library.CompileTemplate.cache_clear()
+  cold = time_calls(SubstituteTemplate, calls)
+  warm = time_calls(SubstituteTemplate, calls)
+  fixpoint = time_calls(_SubstituteTemplateFixpoint, calls)
+  for name, elapsed in [("fixpoint", fixpoint), ("compiled (cold cache)", cold), ("compiled (warm cache)", warm)]:
+    print(f"{name:>24}: {elapsed:8.3f} s  {elapsed / len(calls) * 1e6:8.2f} us/call  {fixpoint / elapsed:6.1f}x")
@@ -0,0 +1,152 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Unit tests for the SQLite kernel catalog in cutlass_library.kernel_catalog
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from cutlass_library import generator
+from cutlass_library.kernel_catalog import KERNEL_CATALOG_VERSION, KernelCatalog, emit_kernel_catalog
+from cutlass_library.library import DataType, LayoutType
+from cutlass_library.manifest import Manifest
+
+
+def _generate(architectures, kernels):
+  args = [
+    "--architectures", architectures,
+    "--kernels", kernels,
+    "--cuda-version", "12.9",
+    "--log-level", "error",
+  ]
+  manifest = Manifest(generator.define_parser().parse_args(args))
+  generator.GenerateSM80(manifest, "12.9")
+  generator.GenerateSM90(manifest, "12.9")
+  return manifest
+
+
+class TestKernelCatalog(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls):
+    cls.build_dir = tempfile.mkdtemp()
+    cls.path = os.path.join(cls.build_dir, "kernels.db")
+    cls.manifest = _generate("80;90a", "cutlass_tensorop_s16816gemm_bf16_*,cutlass3x_sm90_tensorop_gemm_bf16_bf16_f32_*")
+    emit_kernel_catalog(cls.manifest, cls.path)
+    cls.catalog = KernelCatalog(cls.path)
+
+  @classmethod
+  def tearDownClass(cls):
+    cls.catalog.close()
+    shutil.rmtree(cls.build_dir, ignore_errors=True)
+
+  def test_contains_every_selected_operation(self):
+    self.assertGreater(len(self.manifest.operations_by_name), 0)
+    self.assertEqual(self.catalog.names(), sorted(self.manifest.operations_by_name))
+
+  def test_record_matches_operation(self):
+    for name, operation in self.manifest.operations_by_name.items():
+      record = self.catalog.get(name)
+      self.assertEqual([record.tile_m, record.tile_n, record.tile_k], list(operation.tile_description.threadblock_shape))
+      self.assertEqual([record.cluster_m, record.cluster_n, record.cluster_k], list(operation.tile_description.cluster_shape))
+      self.assertEqual(record.stages, operation.tile_description.stages)
+      self.assertEqual((record.element_a, record.layout_a, record.alignment_a),
+                       (operation.A.element.name, operation.A.layout.name, operation.A.alignment))
+      self.assertEqual((record.element_d, record.layout_d, record.alignment_d),
+                       (operation.D.element.name, operation.D.layout.name, operation.D.alignment))
+      self.assertEqual((record.kernel_schedule, record.epilogue_schedule),
+                       (operation.kernel_schedule.name, operation.epilogue_schedule.name))
+      self.assertEqual((record.min_cc, record.max_cc),
+                       (operation.tile_description.minimum_compute_capability,
+                        operation.tile_description.maximum_compute_capability))
+    self.assertIsNone(self.catalog.get("not_a_kernel"))
+
+  def test_query_matches_python_filter(self):
+    expected = sorted(
+      name for name, operation in self.manifest.operations_by_name.items()
+      if operation.tile_description.minimum_compute_capability <= 90 <= operation.tile_description.maximum_compute_capability and
+         operation.A.element == DataType.bf16 and
+         operation.A.layout == LayoutType.RowMajor and operation.B.layout == LayoutType.ColumnMajor and
+         operation.A.alignment == 8 and list(operation.tile_description.cluster_shape[:2]) == [2, 1]
+    )
+    self.assertGreater(len(expected), 0)
+
+    criteria = dict(cc=90, element_a="bf16", layout_a="RowMajor", layout_b="ColumnMajor",
+                    alignment_a=8, cluster_m=2, cluster_n=1)
+    self.assertEqual(self.catalog.names(**criteria), expected)
+    self.assertEqual(self.catalog.count(**criteria), len(expected))
+    self.assertEqual([record.name for record in self.catalog.query(**criteria)], expected)
+
+    # Enum members are accepted in place of their names
+    criteria.update(element_a=DataType.bf16, layout_a=LayoutType.RowMajor, layout_b=LayoutType.ColumnMajor)
+    self.assertEqual(self.catalog.names(**criteria), expected)
+
+  def test_membership_and_null_criteria(self):
+    sm80 = self.catalog.count(min_cc=80)
+    sm90 = self.catalog.count(min_cc=90)
+    self.assertGreater(sm80, 0)
+    self.assertGreater(sm90, 0)
+    self.assertEqual(self.catalog.count(min_cc=[80, 90]), sm80 + sm90)
+    self.assertEqual(self.catalog.count(cc=80), sm80)
+
+    # Stage counts of automatically staged kernels are only known at compile time
+    self.assertEqual(self.catalog.count(smem_kib=None), self.catalog.count(stages=0))
+
+  def test_unknown_column(self):
+    with self.assertRaises(RuntimeError):
+      self.catalog.names(tile_x=128)
+    with self.assertRaises(RuntimeError):
+      self.catalog.query(order_by="tile_x")
+
+  def test_version_mismatch(self):
+    path = os.path.join(self.build_dir, "stale.db")
+    shutil.copy(self.path, path)
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA user_version = {}".format(KERNEL_CATALOG_VERSION + 1))
+    connection.close()
+    with self.assertRaises(RuntimeError):
+      KernelCatalog(path)
+
+  def test_emit_replaces_existing_catalog(self):
+    path = os.path.join(self.build_dir, "replaced.db")
+    shutil.copy(self.path, path)
+    emit_kernel_catalog(_generate("80", "cutlass_tensorop_s16816gemm_bf16_128x128_32x3_tn_align8"), path)
+    with KernelCatalog(path) as catalog:
+      self.assertEqual(catalog.names(), ["cutlass_tensorop_s16816gemm_bf16_128x128_32x3_tn_align8"])
+
+
+if __name__ == "__main__":
+  unittest.main()
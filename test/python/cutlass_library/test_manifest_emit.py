@@ -0,0 +1,183 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Unit tests for incremental and parallel emission in cutlass_library.manifest
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from cutlass_library import generator
+from cutlass_library import manifest as manifest_module
+from cutlass_library.manifest import EMIT_INDEX_FILE, Manifest
+
+
+def _emit(build_dir, kernels, incremental=True, jobs=1):
+  args = [
+    "--curr-build-dir", build_dir,
+    "--architectures", "80",
+    "--kernels", kernels,
+    "--cuda-version", "12.8",
+    "--log-level", "error",
+    "--emit-jobs", str(jobs),
+  ]
+  if incremental:
+    args.append("--incremental-emit")
+  manifest = Manifest(generator.define_parser().parse_args(args))
+  generator.GenerateSM80(manifest, "12.8")
+  manifest.emit()
+  return manifest
+
+
+def _snapshot(path):
+  """
+  Returns a mapping from relative file path to (contents, modification time) for all files under path
+  """
+  snapshot = {}
+  for root, _, files in os.walk(path):
+    for file in files:
+      full_path = os.path.join(root, file)
+      with open(full_path, "rb") as f:
+        snapshot[os.path.relpath(full_path, path)] = (f.read(), os.stat(full_path).st_mtime_ns)
+  return snapshot
+
+
+class TestIncrementalEmit(unittest.TestCase):
+  kernels = "cutlass_tensorop_h16816gemm_128x128_32x3_nn_align8,cutlass_tensorop_s16816gemm_bf16_128x128_32x3_nn_align8"
+
+  def setUp(self):
+    self.build_dir = tempfile.mkdtemp()
+    self.generated_path = os.path.join(self.build_dir, "generated")
+
+  def tearDown(self):
+    shutil.rmtree(self.build_dir, ignore_errors=True)
+
+  def test_matches_full_emit(self):
+    full_dir = tempfile.mkdtemp()
+    try:
+      _emit(full_dir, self.kernels, incremental=False)
+      _emit(self.build_dir, self.kernels)
+      full = {k: v[0] for k, v in _snapshot(os.path.join(full_dir, "generated")).items()}
+      incremental = {k: v[0] for k, v in _snapshot(self.generated_path).items() if k != EMIT_INDEX_FILE}
+      # manifest.cmake lists absolute paths, which differ between build directories
+      self.assertEqual(full.pop("manifest.cmake").replace(full_dir.encode(), b""),
+                       incremental.pop("manifest.cmake").replace(self.build_dir.encode(), b""))
+      self.assertEqual(full, incremental)
+    finally:
+      shutil.rmtree(full_dir, ignore_errors=True)
+
+  def test_noop_regeneration_writes_nothing(self):
+    manifest = _emit(self.build_dir, self.kernels)
+    self.assertGreater(manifest.files_written, 0)
+    before = _snapshot(self.generated_path)
+
+    manifest = _emit(self.build_dir, self.kernels)
+    self.assertEqual(manifest.files_written, 0)
+    self.assertEqual(_snapshot(self.generated_path), before)
+    self.assertEqual([p for p in os.listdir(self.build_dir) if p != "generated"], [])
+
+  def test_stale_files_removed(self):
+    _emit(self.build_dir, self.kernels)
+    before = _snapshot(self.generated_path)
+
+    # Dropping the second filter removes its configuration file and changes the files listing it
+    _emit(self.build_dir, self.kernels.split(",")[0])
+    after = _snapshot(self.generated_path)
+
+    removed = set(before) - set(after)
+    self.assertTrue(len(removed) > 0)
+    self.assertTrue(all("bf16" in path for path in removed))
+    self.assertEqual(set(after) - set(before), set())
+    self.assertNotEqual(after["manifest.cmake"], before["manifest.cmake"])
+    for path, (contents, mtime) in after.items():
+      if path not in [EMIT_INDEX_FILE, "manifest.cmake"] and before[path][0] == contents:
+        self.assertEqual(before[path][1], mtime, f"{path} was rewritten with identical contents")
+
+  def test_modified_file_is_restored(self):
+    _emit(self.build_dir, self.kernels)
+    before = _snapshot(self.generated_path)
+    target = os.path.join(self.generated_path, "initialize_all.cpp")
+    with open(target, "a") as f:
+      f.write("// local edit\n")
+
+    manifest = _emit(self.build_dir, self.kernels)
+    self.assertEqual(manifest.files_written, 1)
+    with open(target, "rb") as f:
+      self.assertEqual(f.read(), before["initialize_all.cpp"][0])
+
+
+class TestParallelEmit(unittest.TestCase):
+  kernels = "cutlass_tensorop_*16816gemm_*128x128_32x3_*align8,cutlass_tensorop_*16816fprop_*64x64_*"
+
+  def test_matches_serial_emit(self):
+    serial_dir = tempfile.mkdtemp()
+    parallel_dir = tempfile.mkdtemp()
+    try:
+      _emit(serial_dir, self.kernels, incremental=False, jobs=1)
+      _emit(parallel_dir, self.kernels, incremental=False, jobs=4)
+      serial = {k: v[0] for k, v in _snapshot(os.path.join(serial_dir, "generated")).items()}
+      parallel = {k: v[0] for k, v in _snapshot(os.path.join(parallel_dir, "generated")).items()}
+      self.assertGreater(len(serial), 10)
+      self.assertEqual(serial.pop("manifest.cmake").replace(serial_dir.encode(), b""),
+                       parallel.pop("manifest.cmake").replace(parallel_dir.encode(), b""))
+      self.assertEqual(serial, parallel)
+    finally:
+      shutil.rmtree(serial_dir, ignore_errors=True)
+      shutil.rmtree(parallel_dir, ignore_errors=True)
+
+  def test_error_propagates(self):
+    # An error part way through emission cancels the pending configurations and surfaces as is
+    build_dir = tempfile.mkdtemp()
+    original = manifest_module.EmitOperationKindLibrary.emit
+    calls = []
+
+    def failing_emit(emitter, configuration_name, operations):
+      calls.append(configuration_name)
+      if len(calls) == 3:
+        raise ValueError("emit failed")
+      return original(emitter, configuration_name, operations)
+
+    try:
+      with mock.patch.object(manifest_module.EmitOperationKindLibrary, "emit", failing_emit):
+        with self.assertRaisesRegex(ValueError, "emit failed"):
+          _emit(build_dir, self.kernels, incremental=False, jobs=4)
+    finally:
+      shutil.rmtree(build_dir, ignore_errors=True)
+    self.assertEqual(len(calls), 3)
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,117 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Unit tests for the filter predicates that cutlass_library.manifest exposes to the generator
+"""
+
+import unittest
+from unittest import mock
+
+from cutlass_library import generator
+from cutlass_library.library import OperationKind
+from cutlass_library.manifest import Manifest
+
+
+def _manifest(architectures="80", kernels="all", operations="all", ignore_kernels="", exclude_kernels=""):
+  args = [
+    "--architectures", architectures,
+    "--kernels", kernels,
+    "--operations", operations,
+    "--ignore-kernels", ignore_kernels,
+    "--exclude-kernels", exclude_kernels,
+    "--cuda-version", "12.9",
+    "--log-level", "error",
+  ]
+  return Manifest(generator.define_parser().parse_args(args))
+
+
+def _selected(manifest):
+  generator.GenerateSM80(manifest, "12.9")
+  generator.GenerateSM90(manifest, "12.9")
+  return sorted(manifest.selected_kernels)
+
+
+class TestManifestFilter(unittest.TestCase):
+
+  def test_accepts_kernel_name(self):
+    manifest = _manifest(kernels="cutlass_tensorop_*gemm*_128x128_,cutlass3x_sm90", ignore_kernels="f16_s16816gemm")
+    self.assertTrue(manifest.accepts_kernel_name("cutlass_tensorop_s16816gemm_bf16_128x128_32x3_nn_align8"))
+    self.assertFalse(manifest.accepts_kernel_name("cutlass_tensorop_s16816gemm_bf16_256x128_32x3_nn_align8"))
+    self.assertFalse(manifest.accepts_kernel_name("cutlass_tensorop_f16_s16816gemm_f16_128x128_32x3_nn_align8"))
+    self.assertTrue(manifest.accepts_kernel_name("cutlass3x_sm90_tensorop_gemm_f16_f16_f32_f16_f16_128x128x64"))
+
+    # the exclude list applies even without an include list, while the ignore list does not
+    manifest = _manifest(ignore_kernels="bf16", exclude_kernels="align1")
+    self.assertTrue(manifest.accepts_kernel_name("cutlass_tensorop_s16816gemm_bf16_128x128_32x3_nn_align8"))
+    self.assertFalse(manifest.accepts_kernel_name("cutlass_tensorop_s16816gemm_bf16_128x128_32x3_nn_align1"))
+
+    manifest.add_kernel_filter("^cutlass_simt")
+    self.assertFalse(manifest.accepts_kernel_name("cutlass_tensorop_s16816gemm_bf16_128x128_32x3_nn_align8"))
+    self.assertTrue(manifest.accepts_kernel_name("cutlass_simt_sgemm_128x128_8x2_nn_align4"))
+
+  def test_prune_tile_descriptions(self):
+    manifest = _manifest(architectures="80", operations="conv2d")
+    math_instruction = generator.MathInstruction([16, 8, 16], generator.DataType.f16, generator.DataType.f16,
+                                                 generator.DataType.f32, generator.OpcodeClass.TensorOp,
+                                                 generator.MathOperation.multiply_add)
+    tile_descriptions = [
+      generator.TileDescription([128, 128, 32], 3, [2, 2, 1], math_instruction, min_cc, max_cc)
+      for min_cc, max_cc in [(80, 1024), (90, 90), (75, 80)]
+    ]
+    self.assertEqual(manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm), [])
+    self.assertEqual(manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Gemm, OperationKind.Conv2d),
+                     [tile_descriptions[0], tile_descriptions[2]])
+
+    manifest.filter_by_cc = False
+    self.assertEqual(manifest.prune_tile_descriptions(tile_descriptions, OperationKind.Conv2d), tile_descriptions)
+
+  def test_pruning_preserves_selection(self):
+    # The kernels selected must not depend on whether the Create*Operator helpers prune early
+    cases = [
+      dict(architectures="80", operations="gemm", kernels="cutlass_tensorop_*gemm_*64x64_*"),
+      dict(architectures="80", operations="conv2d,conv3d", kernels="cutlass_tensorop_*fprop*"),
+      dict(architectures="90a", operations="gemm", kernels="cutlass3x_sm90_tensorop_gemm_f16_f16_f32_void_f16_128x128x64*",
+           exclude_kernels="epi_tma"),
+      dict(architectures="80;90a", operations="all", kernels="", ignore_kernels="", exclude_kernels="align1"),
+    ]
+    for case in cases:
+      with self.subTest(**case):
+        pruned = _selected(_manifest(**case))
+        with mock.patch.object(Manifest, "prune_tile_descriptions", lambda self, tile_descriptions, *kinds: tile_descriptions):
+          unpruned = _selected(_manifest(**case))
+        self.assertGreater(len(pruned), 0)
+        self.assertEqual(pruned, unpruned)
+
+
+if __name__ == "__main__":
+  unittest.main()
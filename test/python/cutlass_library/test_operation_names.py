@@ -0,0 +1,127 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Unit tests for the names memoized on cutlass_library operations
+"""
+
+import copy
+import functools
+import unittest
+
+from cutlass_library import generator
+from cutlass_library.library import OperationKind
+from cutlass_library.manifest import Manifest
+
+
+def _generate(architectures, kernels):
+  args = [
+    "--architectures", architectures,
+    "--kernels", kernels,
+    "--cuda-version", "12.9",
+    "--log-level", "error",
+  ]
+  manifest = Manifest(generator.define_parser().parse_args(args))
+  generator.GenerateSM80(manifest, "12.9")
+  generator.GenerateSM90(manifest, "12.9")
+  return manifest
+
+
+def _names(operation):
+  names = [operation.procedural_name(), operation.configuration_name(), operation.extended_name()]
+  if hasattr(operation, "extended_name_3x"):
+    names.append(operation.extended_name_3x())
+  return names
+
+
+def _rebuilt_names(operation):
+  # A shallow copy shares the descriptors but starts without memoized names
+  fresh = copy.copy(operation)
+  for attribute in list(vars(fresh)):
+    if isinstance(getattr(type(fresh), attribute, None), functools.cached_property):
+      del vars(fresh)[attribute]
+  return _names(fresh)
+
+
+class TestOperationNames(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls):
+    cls.manifest = _generate("80;90a", "cutlass_tensorop_s16816gemm_bf16_128x128_32x3_*,"
+                                       "cutlass_tensorop_s16816fprop_optimized_bf16_128x128_32x3_*,"
+                                       "cutlass_tensorop_s16816dgrad3d_*,"
+                                       "cutlass_tensorop_s1688tf32trmm_*,"
+                                       "cutlass3x_sm90_tensorop_gemm_bf16_bf16_f32_bf16_bf16_128x128x64_1x1x1_*")
+    cls.operations = list(cls.manifest.operations_by_name.values())
+
+  def test_covers_operation_kinds(self):
+    kinds = {operation.operation_kind for operation in self.operations}
+    self.assertEqual(kinds, {OperationKind.Gemm, OperationKind.Conv2d, OperationKind.Conv3d, OperationKind.Trmm})
+
+  def test_memoized_names_match_rebuilt_names(self):
+    for operation in self.operations:
+      self.assertEqual(_names(operation), _rebuilt_names(operation))
+
+  def test_names_are_computed_once(self):
+    operation = self.operations[0]
+    self.assertIs(operation.procedural_name(), operation.procedural_name())
+    self.assertIs(operation.configuration_name(), operation.configuration_name())
+    self.assertIs(operation.extended_name(), operation.extended_name())
+
+  def test_generator_c_alignment_fixups_keep_names(self):
+    # The generator sets C alignments of GEMMs and 2-D convolutions after construction, which
+    # is the only mutation of an operation after its name is memoized. It must not appear in
+    # their names.
+    for operation in self.operations:
+      if operation.operation_kind not in [OperationKind.Gemm, OperationKind.Conv2d]:
+        continue
+      memoized = _names(operation)
+      alignment = operation.C.alignment
+      try:
+        operation.C.alignment = alignment * 2
+        self.assertEqual(_rebuilt_names(operation), memoized)
+      finally:
+        operation.C.alignment = alignment
+
+  def test_names_do_not_follow_later_mutation(self):
+    for operation in self.operations:
+      name = operation.procedural_name()
+      stages = operation.tile_description.stages
+      try:
+        operation.tile_description.stages = stages + 1
+        self.assertEqual(operation.procedural_name(), name)
+        self.assertNotEqual(_rebuilt_names(operation)[0], name)
+      finally:
+        operation.tile_description.stages = stages
+
+
+if __name__ == "__main__":
+  unittest.main()
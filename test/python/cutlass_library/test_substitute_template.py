@@ -0,0 +1,126 @@
+#################################################################################################
+#
+# Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Unit tests for cutlass_library.library.SubstituteTemplate
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+
+from cutlass_library import generator
+from cutlass_library import library
+from cutlass_library.library import SubstituteTemplate, _SubstituteTemplateFixpoint
+from cutlass_library.manifest import Manifest
+
+
+class TestSubstituteTemplate(unittest.TestCase):
+  def check(self, template, values, expected=None):
+    result = SubstituteTemplate(template, values)
+    self.assertEqual(result, _SubstituteTemplateFixpoint(template, values))
+    if expected is not None:
+      self.assertEqual(result, expected)
+
+  def test_basic(self):
+    self.check("a ${x} b ${y} ${x}", {"x": "1", "y": "2"}, "a 1 b 2 1")
+    self.check("no placeholders", {"x": "1"}, "no placeholders")
+    self.check("${x}${x}", {}, "${x}${x}")
+
+  def test_missing_values_left_in_place(self):
+    self.check("${x} ${unknown} ${}", {"x": "1"}, "1 ${unknown} ${}")
+
+  def test_nested_values(self):
+    # Values may refer to keys that come before or after them
+    self.check("${outer}", {"inner": "v", "outer": "<${inner}>"}, "<v>")
+    self.check("${outer}", {"outer": "<${inner}>", "inner": "[${leaf}]", "leaf": "x"}, "<[x]>")
+    self.check("${outer}", {"outer": "<${missing}>"}, "<${missing}>")
+
+  def test_backslash_escapes(self):
+    self.check("${x}", {"x": "a\\nb"}, "a\nb")
+    self.check("${x}", {"x": "a\\\\b"}, "a\\b")
+    self.check("${x} ${y}", {"x": "\\t${y}", "y": "\\\\"}, "\t\\ \\")
+
+  def test_adjoining_placeholder(self):
+    # Substitution can form a placeholder from the surrounding text
+    self.check("${a}{b}", {"a": "$", "b": "x"}, "x")
+    self.check("${${a}}", {"a": "b", "b": "x"}, "x")
+
+  def test_cyclic_values(self):
+    # A value that refers to itself is a fixpoint of the old substitution
+    self.check("x${a}y", {"a": "${a}"}, "x${a}y")
+    # Self-referencing and mutually recursive values never reach a fixpoint, so the placeholder
+    # that closes the cycle is left as literal text
+    self.assertEqual(SubstituteTemplate("x${a}y", {"a": "p${a}q"}), "xp${a}qy")
+    self.assertEqual(SubstituteTemplate("x${a}y", {"a": "<${b}>", "b": "[${a}]"}), "x<[${a}]>y")
+    self.assertEqual(SubstituteTemplate("${a} ${b}", {"a": "${b}", "b": "${a}", "c": "1"}), "${a} ${b}")
+
+  def test_fallback(self):
+    # Keys that are not identifiers are interpreted as regular expressions
+    self.check("${a.b} ${aXb}", {"a.b": "1"})
+    self.check("${x}", {"x": lambda match: "called"}, "called")
+
+  def test_generator_templates(self):
+    """
+    Compares the compiled and fixpoint substitution for every call made while emitting a set of kernels
+    """
+    calls = []
+    original = library.SubstituteTemplate
+    modules = [m for m in list(sys.modules.values()) if getattr(m, "SubstituteTemplate", None) is original]
+
+    def record(template, values):
+      calls.append((template, dict(values)))
+      return original(template, values)
+
+    build_dir = tempfile.mkdtemp()
+    args = generator.define_parser().parse_args([
+      "--architectures", "80", "--kernels", "cutlass_tensorop_*16816*128x128_32x3*",
+      "--curr-build-dir", build_dir, "--log-level", "error"])
+    manifest = Manifest(args)
+    try:
+      for module in modules:
+        module.SubstituteTemplate = record
+      generator.GenerateSM80(manifest, "12.8")
+      manifest.emit()
+    finally:
+      for module in modules:
+        module.SubstituteTemplate = original
+      shutil.rmtree(build_dir, ignore_errors=True)
+
+    self.assertGreater(len(calls), 0)
+    for template, values in calls:
+      self.assertEqual(SubstituteTemplate(template, values), _SubstituteTemplateFixpoint(template, values))
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,134 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Memory and speed benchmark of pycute.Layout against the previous mutable, unhashable class
+
+Layouts are generated the way a layout sweep does: many distinct layouts built from freshly
+constructed shape/stride tuples drawn from a smaller set of shapes. Each layout is queried for
+its size and cosize a few times, and deduplicated through a set.
+
+Example:
+
+  python benchmark_layout.py --count 1000000
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from pycute import Layout, crd2idx, prefix_product, product
+
+
+# pycute.Layout before shapes and strides were interned and size/cosize cached
+class BaselineLayout:
+  def __init__(self, _shape, _stride=None):
+    self.shape  = _shape
+    if _stride is None:
+      self.stride = prefix_product(self.shape)
+    else:
+      self.stride = _stride
+
+  def __call__(self, idx):
+    return crd2idx(idx, self.shape, self.stride)
+
+  def size(self):
+    return product(self.shape)
+
+  def cosize(self):
+    return self(self.size() - 1) + 1
+
+
+def generate(count, seed):
+  rng = random.Random(seed)
+
+  def shape(depth):
+    if depth == 0 or rng.random() < 0.5:
+      return rng.choice([1, 2, 4, 8])
+    return [shape(depth - 1) for _ in range(rng.randint(1, 3))]
+
+  def stride(s):
+    return [stride(x) for x in s] if isinstance(s, list) else rng.choice([0, 1, 2, 8, 64])
+
+  shapes = [shape(3) for _ in range(max(1, count // 100))]
+  return [(s, stride(s)) for s in (rng.choice(shapes) for _ in range(count))]
+
+
+def to_tuple(x):
+  return tuple(to_tuple(a) for a in x) if isinstance(x, list) else x
+
+
+def measure_memory(cls, specs):
+  gc.collect()
+  tracemalloc.start()
+  layouts = [cls(to_tuple(s), to_tuple(d)) for (s, d) in specs]
+  memory = tracemalloc.get_traced_memory()[0]
+  tracemalloc.stop()
+  return memory
+
+
+def run(cls, specs, queries):
+  gc.collect()
+  start = time.perf_counter()
+  layouts = [cls(to_tuple(s), to_tuple(d)) for (s, d) in specs]
+  built = time.perf_counter()
+
+  for _ in range(queries):
+    for layout in layouts:
+      layout.size()
+      layout.cosize()
+  queried = time.perf_counter()
+
+  if cls is Layout:
+    unique = len(set(layouts))
+  else:
+    unique = len(set((layout.shape, layout.stride) for layout in layouts))
+  done = time.perf_counter()
+  return (built - start, queried - built, done - queried, unique)
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser()
+  parser.add_argument("--count", default=1000000, type=int, help="Number of layouts generated")
+  parser.add_argument("--queries", default=4, type=int, help="Number of size/cosize queries per layout")
+  parser.add_argument("--seed", default=0, type=int)
+  args = parser.parse_args()
+
+  specs = generate(args.count, args.seed)
+  print(f"{args.count} layouts, {args.queries} size/cosize queries each")
+  print(f"{'':>10} {'build (s)':>10} {'memory (MB)':>12} {'query (s)':>10} {'dedup (s)':>10} {'unique':>8}")
+  for (name, cls) in [("baseline", BaselineLayout), ("Layout", Layout)]:
+    (build, query, dedup, unique) = run(cls, specs, args.queries)
+    memory = measure_memory(cls, specs)
+    print(f"{name:>10} {build:10.3f} {memory / 2**20:12.1f} {query:10.3f} {dedup:10.3f} {unique:8}")
@@ -0,0 +1,139 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Unit tests for the batched evaluation of pycute layouts and swizzles, and for the
+memoization of the structural layout operations
+"""
+
+import logging
+import random
+import unittest
+
+from pycute import *
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def random_shape(rng, depth=2):
+  if depth == 0 or rng.random() < 0.4:
+    return rng.choice([1, 2, 3, 4, 8])
+  return tuple(random_shape(rng, depth - 1) for _ in range(rng.randint(1, 3)))
+
+
+def random_layout(rng):
+  shape = random_shape(rng)
+  if rng.random() < 0.5:
+    return Layout(shape)
+  stride = tuple(rng.choice([0, 1, 2, 4, 16, 64]) for _ in flatten(shape))
+  # Rebuild a stride congruent to the shape
+  def unflatten(s, it):
+    return tuple(unflatten(x, it) for x in s) if is_tuple(s) else next(it)
+  return Layout(shape, unflatten(shape, iter(stride)))
+
+
+@unittest.skipIf(np is None, "NumPy is not available")
+class TestBatched(unittest.TestCase):
+  def test_layout_map(self):
+    rng = random.Random(0)
+    for _ in range(500):
+      layout = random_layout(rng)
+      if size(layout) > 1024:
+        continue
+      # Include indices beyond the size, which extend the last mode
+      indices = np.arange(size(layout) * 2)
+      _LOGGER.debug(f"{layout}")
+      self.assertEqual(layout.map(indices).tolist(), [layout(int(i)) for i in indices])
+
+  def test_layout_map_preserves_shape(self):
+    layout = Layout((4, (2, 3)), (3, (1, 12)))
+    indices = np.arange(24).reshape(2, 3, 4)
+    self.assertEqual(layout.map(indices).shape, (2, 3, 4))
+    self.assertEqual(layout.map(indices).ravel().tolist(), [layout(i) for i in range(24)])
+
+  def test_swizzle_map(self):
+    offsets = np.arange(1 << 12)
+    for (bits, base, shift) in [(0, 0, 0), (1, 2, 3), (2, 4, 3), (3, 3, 3), (3, 4, -3), (2, 0, -4)]:
+      swizzle = Swizzle(bits, base, shift)
+      expected = [swizzle(int(o)) for o in offsets] if shift != 0 else offsets.tolist()
+      self.assertEqual(swizzle.map(offsets).tolist(), expected)
+
+  def test_composed_layout_map(self):
+    layout = ComposedLayout(Swizzle(3, 3, 3), 16, Layout((8, 64), (64, 1)))
+    indices = np.arange(size(layout))
+    self.assertEqual(layout.map(indices).tolist(), [layout(int(i)) for i in indices])
+
+
+class TestMemoized(unittest.TestCase):
+  def test_matches_uncached(self):
+    rng = random.Random(1)
+    for _ in range(300):
+      layoutA = random_layout(rng)
+      layoutB = Layout(rng.choice([1, 2, 4]), rng.choice([1, 2]))
+      cases = [
+        (coalesce, (layoutA,)),
+        (complement, (layoutA, rng.choice([1, 64, 1024]))),
+        (right_inverse, (layoutA,)),
+        (composition, (coalesce(layoutA), layoutB)),
+      ]
+      for (op, args) in cases:
+        try:
+          expected = op.__wrapped__(*args)
+        except AssertionError:
+          continue
+        # Twice, to compare both the computed and the cached result
+        for _ in range(2):
+          self.assertEqual(op(*args), expected, f"{op.__name__}{args}")
+
+  def test_shares_results(self):
+    layout = Layout((4, 8), (8, 1))
+    self.assertIs(coalesce(layout), coalesce(layout))
+    hits = coalesce.cache_info().hits
+    coalesce(Layout((4, 8), (8, 1)))
+    self.assertEqual(coalesce.cache_info().hits, hits + 1)
+
+  def test_layout_and_tuple_arguments_are_distinct(self):
+    layoutA = Layout((8, 8), (8, 1))
+    self.assertEqual(composition(layoutA, Layout(2, 1)), composition.__wrapped__(layoutA, Layout(2, 1)))
+    self.assertEqual(composition(layoutA, (2, 1)), composition.__wrapped__(layoutA, (2, 1)))
+    # Tuples of layouts are not hashable and are computed without the cache
+    tiler = (Layout(2, 4), Layout(4, 1))
+    self.assertEqual(composition(layoutA, tiler), composition.__wrapped__(layoutA, tiler))
+
+
+if __name__ == "__main__":
+  unittest.main()
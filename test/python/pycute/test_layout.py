@@ -0,0 +1,93 @@
+#################################################################################################
+#
+# Copyright (c) 2023 - 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+# list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#################################################################################################
+
+"""
+Unit tests for pycute.Layout hashing, immutability and cached properties
+"""
+
+import copy
+import logging
+import pickle
+import unittest
+
+from pycute import *
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TestLayout(unittest.TestCase):
+  def test_hash_eq(self):
+    layouts = [Layout((4, 8), (8, 1)), Layout((4, 8), (8, 1)), Layout((4, 8)), Layout(((2, 2), 8))]
+    self.assertEqual(layouts[0], layouts[1])
+    self.assertEqual(hash(layouts[0]), hash(layouts[1]))
+    self.assertNotEqual(layouts[0], layouts[2])
+    self.assertEqual(len(set(layouts)), 3)
+    self.assertEqual({layouts[0]: 1}[layouts[1]], 1)
+    # A layout never compares equal to its shape or to a plain tuple
+    self.assertNotEqual(Layout(4, 1), (4, 1))
+    self.assertNotEqual(Layout(4, 1), 4)
+
+  def test_interned(self):
+    layoutA = Layout(((2, 4), 8), ((1, 16), 2))
+    layoutB = Layout(tuple([(2, 4), 8]), tuple([(1, 16), 2]))
+    self.assertIs(layoutA.shape, layoutB.shape)
+    self.assertIs(layoutA.stride, layoutB.stride)
+    self.assertIs(layoutA.shape[0], Layout((2, 4)).shape)
+
+  def test_immutable(self):
+    layout = Layout((4, 8))
+    with self.assertRaises(AttributeError):
+      layout.shape = (8, 4)
+    with self.assertRaises(AttributeError):
+      layout.extra = 1
+    self.assertEqual(layout.shape, (4, 8))
+
+  def test_cached_properties(self):
+    layout = Layout(((2, 4), 8), ((1, 16), 2))
+    for _ in range(2):
+      self.assertEqual(layout.flat_shape, (2, 4, 8))
+      self.assertEqual(layout.flat_stride, (1, 16, 2))
+      self.assertEqual(size(layout), 64)
+      self.assertEqual(cosize(layout), layout(63) + 1)
+    self.assertEqual(len(layout), 2)
+
+  def test_copy_pickle(self):
+    layout = Layout(((2, 4), 8), ((1, 16), 2))
+    size(layout)
+    for other in [copy.copy(layout), copy.deepcopy(layout), pickle.loads(pickle.dumps(layout))]:
+      _LOGGER.debug(f"{other}")
+      self.assertEqual(other, layout)
+      self.assertEqual(hash(other), hash(layout))
+
+
+if __name__ == "__main__":
+  unittest.main()